@@ -22,8 +22,9 @@ A. Remote execution.
 B. Local execution.
 
 A. Remote Execution
-Remote execution can be performed only when an AST has been constructed with a client. Check
-syft/core/node to be familiar with the roles of clients and nodes. Each valid action on the AST
+Remote execution can be performed only when an AST has been constructed with a client, or is
+seen by a client through a `ClientView`, which is how all clients share the AST of the supported
+frameworks. Check syft/core/node to be familiar with the roles of clients and nodes. Each valid action on the AST
 triggers an Action (GetSetStaticAttributeAction, GetSetPropertyAction, etc). This kind of actions
 requires: The path on resolving the required node (on the above example, the path is
 `syft.lib.List.append`), the object on which to perform it (given by the `__self` attribute and from
@@ -73,6 +74,7 @@ from . import klass  # noqa: F401
 from . import module  # noqa: F401
 from . import property  # noqa: F401
 from . import static_attr  # noqa: F401
+from . import view  # noqa: F401
 
 
 def get_parent(
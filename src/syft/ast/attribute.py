@@ -203,6 +203,19 @@ class Attribute:
         """
         traceback_and_raise(NotImplementedError)
 
+    def bind(self, client: AbstractNodeClient) -> "ast.view.ClientView":
+        """
+        Create the view through which a client sees this node, so nodes can be shared by
+        all clients instead of being built for each of them.
+
+        Args:
+            client: The client for which all computation is being executed.
+
+        Returns:
+            The client's view of the node.
+        """
+        return ast.view.ClientView(node=self, client=client)
+
     def fetch_live_object(self) -> Any:
         return getattr(self.parent.object_ref, self.name)
 
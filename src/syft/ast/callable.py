@@ -2,6 +2,7 @@
 from types import ModuleType
 from typing import Any
 from typing import Callable as CallableT
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -68,43 +69,7 @@ class Callable(ast.attribute.Attribute):
         self.apply_node_changes()
 
         if self.client is not None:
-            return_tensor_type_pointer_type = self.client.lib_ast.query(
-                path=self.return_type_name
-            ).pointer_type
-
-            ptr = return_tensor_type_pointer_type(client=self.client)
-
-            # first downcast anything primitive which is not already PyPrimitive
-            (
-                downcast_args,
-                downcast_kwargs,
-            ) = lib.python.util.downcast_args_and_kwargs(args=args, kwargs=kwargs)
-
-            # then we convert anything which isn't a pointer into a pointer
-            pointer_args, pointer_kwargs = ast.klass.pointerize_args_and_kwargs(
-                args=downcast_args, kwargs=downcast_kwargs, client=self.client
-            )
-
-            if self.path_and_name is not None:
-                msg = RunFunctionOrConstructorAction(
-                    path=self.path_and_name,
-                    args=pointer_args,
-                    kwargs=pointer_kwargs,
-                    id_at_location=ptr.id_at_location,
-                    address=self.client.address,
-                    is_static=self.is_static,
-                )
-
-                self.client.send_immediate_msg_without_reply(msg=msg)
-
-                inherit_tags(
-                    attr_path_and_name=self.path_and_name,
-                    result=ptr,
-                    self_obj=None,
-                    args=args,
-                    kwargs=kwargs,
-                )
-                return ptr
+            return self.call_remote(client=self.client, args=args, kwargs=kwargs)
 
         if "path" not in kwargs or "index" not in kwargs:
             traceback_and_raise(
@@ -120,6 +85,63 @@ class Callable(ast.attribute.Attribute):
         else:
             return self.attrs[path[index]](path=path, index=index + 1)
 
+    def call_remote(
+        self,
+        client: AbstractNodeClient,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Optional[Union["Callable", CallableT]]:
+        """
+        Execute the function for the client and return the appropriate pointer given the
+        `return_type_name`.
+
+        Args:
+            client: The client on whose node the function is executed.
+            args: The arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            A pointer to the result of the call.
+        """
+        return_tensor_type_pointer_type = client.lib_ast.query(
+            path=self.return_type_name
+        ).pointer_type
+
+        ptr = return_tensor_type_pointer_type(client=client)
+
+        # first downcast anything primitive which is not already PyPrimitive
+        (
+            downcast_args,
+            downcast_kwargs,
+        ) = lib.python.util.downcast_args_and_kwargs(args=args, kwargs=kwargs)
+
+        # then we convert anything which isn't a pointer into a pointer
+        pointer_args, pointer_kwargs = ast.klass.pointerize_args_and_kwargs(
+            args=downcast_args, kwargs=downcast_kwargs, client=client
+        )
+
+        if self.path_and_name is not None:
+            msg = RunFunctionOrConstructorAction(
+                path=self.path_and_name,
+                args=pointer_args,
+                kwargs=pointer_kwargs,
+                id_at_location=ptr.id_at_location,
+                address=client.address,
+                is_static=self.is_static,
+            )
+
+            client.send_immediate_msg_without_reply(msg=msg)
+
+            inherit_tags(
+                attr_path_and_name=self.path_and_name,
+                result=ptr,
+                self_obj=None,
+                args=args,
+                kwargs=kwargs,
+            )
+            return ptr
+        return None
+
     def add_path(
         self,
         path: Union[str, List[str]],
@@ -37,10 +37,15 @@ class EnumAttribute(ast.attribute.Attribute):
             parent=parent,
         )
 
-    def get_remote_enum_attribute(self) -> AbstractPointer:
+    def get_remote_enum_attribute(
+        self, client: Optional[AbstractNodeClient] = None
+    ) -> AbstractPointer:
         """
         Remote getter on an `Enum` attribute in the AST.
 
+        Args:
+            client: The client to get the attribute for, defaults to the client of the AST.
+
         Returns:
             A pointer to the remote enum attribute.
         """
@@ -53,7 +58,8 @@ class EnumAttribute(ast.attribute.Attribute):
                 )
             )
 
-        if self.client is None:
+        client = client if client is not None else self.client
+        if client is None:
             traceback_and_raise(
                 ValueError(
                     "Can't get remote enum attribute if there is no client"
@@ -61,18 +67,18 @@ class EnumAttribute(ast.attribute.Attribute):
                 )
             )
 
-        return_tensor_type_pointer_type = self.client.lib_ast.query(
+        return_tensor_type_pointer_type = client.lib_ast.query(
             path=self.return_type_name
         ).pointer_type
 
-        ptr = return_tensor_type_pointer_type(client=self.client)
+        ptr = return_tensor_type_pointer_type(client=client)
 
         msg = EnumAttributeAction(
             path=self.path_and_name,
             id_at_location=ptr.id_at_location,
-            address=self.client.address,
+            address=client.address,
         )
-        self.client.send_immediate_msg_without_reply(msg=msg)
+        client.send_immediate_msg_without_reply(msg=msg)
         return ptr
 
     def solve_get_enum_attribute(self) -> Enum:
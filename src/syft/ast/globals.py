@@ -8,7 +8,6 @@ from typing import Optional
 from typing import Union
 
 # syft relative
-from ..core.common.uid import UID
 from ..logger import traceback_and_raise
 from .attribute import Attribute
 from .callable import Callable
@@ -16,10 +15,12 @@ from .module import Module
 
 
 class Globals(Module):
-    """The collection of frameworks held in the global namespace"""
+    """The collection of frameworks held in the global namespace
 
-    registered_clients: Dict[UID, Any] = {}
-    loaded_lib_constructors: Dict[str, CallableT] = {}
+    Nodes and pointer types resolved from dotted paths are cached, so executing
+    an action does not walk the AST level by level. The cache is cleared when paths
+    are added to the AST.
+    """
 
     def __init__(
         self,
@@ -36,6 +37,10 @@ class Globals(Module):
             path_and_name=path_and_name,
             return_type_name=return_type_name,
         )
+        self._resolved_nodes: Dict[str, Attribute] = {}
+        self._resolved_calls: Dict[str, List[Attribute]] = {}
+        self._resolved_pointer_types: Dict[str, type] = {}
+        self._path_cache_stats = {"hits": 0, "misses": 0}
 
     def __call__(
         self,
@@ -44,6 +49,20 @@ class Globals(Module):
         obj_type: Optional[type] = None,
     ) -> Optional[Union[Callable, CallableT]]:
 
+        if (
+            isinstance(path, str)
+            and index == 0
+            and obj_type is None
+            and self.client is None
+        ):
+            nodes = self._resolve_call(path=path)
+            if nodes is not None:
+                # the objects along the path may have been replaced since the nodes
+                # were resolved, they are checked top down like the walk below does
+                for node in nodes:
+                    node.apply_node_changes()
+                return nodes[-1].object_ref
+
         self.apply_node_changes()
 
         _path: List[str] = (
@@ -89,14 +108,99 @@ class Globals(Module):
 
         attr = self.attrs[framework_name]
         attr.add_path(path=path, index=1, return_type_name=return_type_name)
+        self.clear_path_cache()
 
-    def register_updates(self, client: Any) -> None:
-        # any previously loaded libs need to be applied
-        for _, update_ast in self.loaded_lib_constructors.items():
-            update_ast(ast_or_client=client)
-
-        # make sure to get any future updates
-        self.registered_clients[client.id] = client
+    def add_attr(
+        self,
+        attr_name: str,
+        attr: Optional[Union[Callable, CallableT]],
+        is_static: bool = False,
+    ) -> None:
+        super().add_attr(attr_name=attr_name, attr=attr, is_static=is_static)
+        self.clear_path_cache()
+
+    def query(
+        self, path: Union[List[str], str], obj_type: Optional[type] = None
+    ) -> Attribute:
+        if not isinstance(path, str) or obj_type is not None:
+            return super().query(path=path, obj_type=obj_type)
+
+        if path in self._resolved_nodes:
+            self._path_cache_stats["hits"] += 1
+        else:
+            self._path_cache_stats["misses"] += 1
+        return self._resolve_node(path=path)
+
+    def _resolve_node(self, path: str) -> Attribute:
+        node = self._resolved_nodes.get(path, None)
+        if node is None:
+            node = super().query(path=path)
+            self._resolved_nodes[path] = node
+        return node
+
+    def _resolve_call(self, path: str) -> Optional[List[Attribute]]:
+        nodes = self._resolved_calls.get(path, None)
+        if nodes is not None:
+            self._path_cache_stats["hits"] += 1
+            return nodes
+
+        self._path_cache_stats["misses"] += 1
+        node = self._resolve_node(path=path)
+        if not isinstance(node, Callable):
+            return None
+
+        nodes = []
+        parent: Optional[Attribute] = node
+        while parent is not None and parent is not self:
+            nodes.append(parent)
+            parent = parent._parent
+        nodes.reverse()
+        self._resolved_calls[path] = nodes
+        return nodes
+
+    def return_pointer_type(self, path: str) -> type:
+        """
+        Resolve the pointer class for the result of the node at the given path.
+
+        Args:
+            path: The path for the node in the AST, e.g. `torch.Tensor.add`
+
+        Returns:
+            The pointer class of the node's return type, e.g. `TensorPointer`.
+        """
+        pointer_type = self._resolved_pointer_types.get(path, None)
+        if pointer_type is not None:
+            self._path_cache_stats["hits"] += 1
+            return pointer_type
+
+        self._path_cache_stats["misses"] += 1
+        return_type_name = self._resolve_node(path=path).return_type_name
+        if return_type_name is None:
+            traceback_and_raise(ValueError(f"Path {path} has no return type."))
+        return_type = self._resolve_node(path=str(return_type_name))
+        pointer_type = getattr(return_type, "pointer_type")
+        self._resolved_pointer_types[path] = pointer_type
+        return pointer_type
+
+    def clear_path_cache(self) -> None:
+        """Forget the resolved paths, after the nodes at some paths have changed"""
+        self._resolved_nodes.clear()
+        self._resolved_calls.clear()
+        self._resolved_pointer_types.clear()
+
+    def path_cache_stats(self) -> Dict[str, float]:
+        """Return the hit and miss counters of the path cache and its hit rate"""
+        hits = self._path_cache_stats["hits"]
+        misses = self._path_cache_stats["misses"]
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total > 0 else 0.0,
+            "size": len(self._resolved_nodes)
+            + len(self._resolved_calls)
+            + len(self._resolved_pointer_types),
+        }
 
     def apply_node_changes(self) -> None:
         pass
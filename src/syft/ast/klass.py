@@ -1,5 +1,6 @@
 # stdlib
 import inspect
+import threading
 from types import ModuleType
 from typing import Any
 from typing import Callable as CallableT
@@ -7,6 +8,7 @@ from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
 import warnings
@@ -15,6 +17,7 @@ import warnings
 from .. import ast
 from .. import lib
 from ..ast.callable import Callable
+from ..ast.module import NODE_FIELDS
 from ..core.common.group import VERIFYALL
 from ..core.common.uid import UID
 from ..core.node.common.action.get_or_set_property_action import GetOrSetPropertyAction
@@ -96,15 +99,11 @@ def get_run_class_method(attr_path_and_name: str) -> CallableT:
         *args: Tuple[Any, ...],
         **kwargs: Any,
     ) -> object:
-        # we want to get the return type which matches the attr_path_and_name
-        # so we ask lib_ast for the return type name that matches out
-        # attr_path_and_name and then use that to get the actual pointer klass
+        # we want to get the pointer klass of the return type which matches the
+        # attr_path_and_name, lib_ast caches it for each attr_path_and_name
         # then set the result to that pointer klass
-        return_type_name = __self.client.lib_ast.query(
-            attr_path_and_name
-        ).return_type_name
-        resolved_pointer_type = __self.client.lib_ast.query(return_type_name)
-        result = resolved_pointer_type.pointer_type(client=__self.client)
+        pointer_type = __self.client.lib_ast.return_pointer_type(attr_path_and_name)
+        result = pointer_type(client=__self.client)
 
         # QUESTION can the id_at_location be None?
         result_id_at_location = getattr(result, "id_at_location", None)
@@ -147,15 +146,11 @@ def generate_class_property_function(
     attr_path_and_name: str, action: PropertyActions
 ) -> CallableT:
     def class_property_function(__self: Any, *args: Any, **kwargs: Any) -> CallableT:
-        # we want to get the return type which matches the attr_path_and_name
-        # so we ask lib_ast for the return type name that matches out
-        # attr_path_and_name and then use that to get the actual pointer klass
+        # we want to get the pointer klass of the return type which matches the
+        # attr_path_and_name, lib_ast caches it for each attr_path_and_name
         # then set the result to that pointer klass
-        return_type_name = __self.client.lib_ast.query(
-            attr_path_and_name
-        ).return_type_name
-        resolved_pointer_type = __self.client.lib_ast.query(return_type_name)
-        result = resolved_pointer_type.pointer_type(client=__self.client)
+        pointer_type = __self.client.lib_ast.return_pointer_type(attr_path_and_name)
+        result = pointer_type(client=__self.client)
         # QUESTION can the id_at_location be None?
         result_id_at_location = getattr(result, "id_at_location", None)
         if result_id_at_location is not None:
@@ -284,6 +279,11 @@ def attach_tags(obj: object, tags: List[str]) -> None:
         warning(f"can't attach new attribute `tags` to {type(obj)} object.")
 
 
+# held while the lazy paths of a class are added, so other threads do not see
+# the class half built
+_LAZY_PATHS_LOCK = threading.RLock()
+
+
 def attach_description(obj: object, description: str) -> None:
     try:
         obj.description = description  # type: ignore
@@ -300,6 +300,8 @@ class Class(Callable):
         return_type_name: Optional[str],
         client: Optional[Any],
     ):
+        # paths recorded with `add_lazy_path`, set first as `attrs` reads it
+        self._lazy_paths: List[Tuple[List[str], Optional[str]]] = []
         super().__init__(
             path_and_name=path_and_name,
             object_ref=object_ref,
@@ -310,8 +312,73 @@ class Class(Callable):
         if self.path_and_name is not None:
             self.pointer_name = self.path_and_name.split(".")[-1] + "Pointer"
 
+    @property  # type: ignore
+    def attrs(self) -> Dict[str, ast.attribute.Attribute]:  # type: ignore
+        self._add_lazy_paths()
+        return ast.attribute.Attribute.attrs.__get__(self)  # type: ignore
+
+    @attrs.setter
+    def attrs(self, attrs: Dict[str, ast.attribute.Attribute]) -> None:
+        ast.attribute.Attribute.attrs.__set__(self, attrs)  # type: ignore
+
+    def add_lazy_path(
+        self, path: List[str], return_type_name: Optional[str] = None
+    ) -> None:
+        """
+        Record a path below the class without adding its node. The nodes of all the
+        recorded paths are added on the first access of `attrs`, which happens on the
+        first query or call going through the class and when its pointer class is
+        created.
+
+        Args:
+            path: The path for the node to be added, e.g. ["torch", "Tensor", "add"]
+            return_type_name: The return type name of the given action as a string with its full path.
+        """
+        self._lazy_paths.append((path, return_type_name))
+
+    def _add_lazy_paths(self) -> None:
+        lazy_paths = self.__dict__.get("_lazy_paths", None)
+        if not lazy_paths:
+            return
+
+        with _LAZY_PATHS_LOCK:
+            # the paths are only cleared once they were all added, add_path reading
+            # `attrs` while they are added returns here
+            lazy_paths = self.__dict__["_lazy_paths"]
+            if not lazy_paths or self.__dict__.get("_adding_lazy_paths", False):
+                return
+
+            self.__dict__["_adding_lazy_paths"] = True
+            try:
+                index = len(self.path_and_name.split(".")) if self.path_and_name else 0
+                for path, return_type_name in lazy_paths:
+                    self.add_path(
+                        path=path, index=index, return_type_name=return_type_name
+                    )
+            finally:
+                self.__dict__["_lazy_paths"] = []
+                self.__dict__["_adding_lazy_paths"] = False
+
+    @property
+    def attr_names(self) -> Set[str]:
+        """
+        The names of the attributes of the class, including the ones recorded with
+        `add_lazy_path` whose nodes have not been added yet.
+        """
+        names = set(ast.attribute.Attribute.attrs.__get__(self))  # type: ignore
+        names.update(path[-1] for path, _ in self._lazy_paths)
+        return names
+
+    @property
+    def classes(self) -> List["Class"]:
+        # classes hold no other classes, so the lazy paths do not have to be added
+        return [self]
+
     @property
     def pointer_type(self) -> Union[Callable, CallableT]:
+        if self.pointer_name not in self.__dict__:
+            # the pointer class is created on first use if it was deferred
+            self.create_pointer_class()
         return getattr(self, self.pointer_name)
 
     def create_pointer_class(self) -> None:
@@ -409,7 +476,7 @@ class Class(Callable):
             id_at_location = UID()
 
             # Step 1: create pointer which will point to result
-            ptr = getattr(outer_self, outer_self.pointer_name)(
+            ptr = outer_self.pointer_type(
                 client=client,
                 id_at_location=id_at_location,
                 tags=tags,
@@ -515,6 +582,9 @@ class Class(Callable):
         try:
             target_object = super().__getattribute__(item)
 
+            if item in NODE_FIELDS:
+                return target_object
+
             if isinstance(target_object, ast.static_attr.StaticAttribute):
                 return target_object.get_remote_value()
 
@@ -533,6 +603,10 @@ class Class(Callable):
             traceback_and_raise(e)
 
     def __getattr__(self, item: str) -> Any:
+        if item == self.__dict__.get("pointer_name", None):
+            return self.pointer_type
+
+        self._add_lazy_paths()
         attrs = super().__getattribute__("attrs")
         if item not in attrs:
             if item == "__name__":
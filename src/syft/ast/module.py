@@ -30,6 +30,10 @@ def is_static_method(host_object, attr):  # type: ignore
     return False
 
 
+# the fields of the nodes themselves are never remote attributes
+NODE_FIELDS = frozenset(ast.attribute.Attribute.__slots__)
+
+
 class Module(ast.attribute.Attribute):
     """A module which contains other modules or callables."""
 
@@ -211,6 +215,8 @@ class Module(ast.attribute.Attribute):
 
     def __getattribute__(self, item: str) -> Any:
         target_object = super().__getattribute__(item)
+        if item in NODE_FIELDS:
+            return target_object
         if isinstance(target_object, ast.static_attr.StaticAttribute):
             return target_object.get_remote_value()
         return target_object
@@ -36,34 +36,35 @@ class StaticAttribute(ast.attribute.Attribute):
             parent=parent,
         )
 
-    def get_remote_value(self) -> AbstractPointer:
+    def get_remote_value(self, client: Optional[Any] = None) -> AbstractPointer:
         if self.path_and_name is None:
             traceback_and_raise(
                 ValueError("Can't execute remote get if path is not specified.")
             )
 
-        if self.client is None:
-            if self.client is None:
-                traceback_and_raise(
-                    ValueError(
-                        "Can't get remote enum attribute if there is no client"
-                        "set to get it from"
-                    )
+        # a client viewing the shared AST passes itself in
+        client = client if client is not None else self.client
+        if client is None:
+            traceback_and_raise(
+                ValueError(
+                    "Can't get remote enum attribute if there is no client"
+                    "set to get it from"
                 )
+            )
 
-        return_tensor_type_pointer_type = self.client.lib_ast.query(
+        return_tensor_type_pointer_type = client.lib_ast.query(
             path=self.return_type_name
         ).pointer_type
 
-        ptr = return_tensor_type_pointer_type(client=self.client)
+        ptr = return_tensor_type_pointer_type(client=client)
 
         msg = GetSetStaticAttributeAction(
             path=self.path_and_name,
             id_at_location=ptr.id_at_location,
-            address=self.client.address,
+            address=client.address,
             action=StaticAttributeAction.GET,
         )
-        self.client.send_immediate_msg_without_reply(msg=msg)
+        client.send_immediate_msg_without_reply(msg=msg)
         return ptr
 
     def solve_get_value(self) -> Any:
@@ -82,8 +83,9 @@ class StaticAttribute(ast.attribute.Attribute):
 
         setattr(self.parent.object_ref, self.path_and_name.rsplit(".")[-1], set_value)
 
-    def set_remote_value(self, set_arg: Any) -> None:
-        if self.client is None:
+    def set_remote_value(self, set_arg: Any, client: Optional[Any] = None) -> None:
+        client = client if client is not None else self.client
+        if client is None:
             raise ValueError(
                 "MAKE PROPER SCHEMA - Can't get remote value if there is no remote "
                 "client"
@@ -92,21 +94,21 @@ class StaticAttribute(ast.attribute.Attribute):
         if self.path_and_name is None:
             raise ValueError("MAKE PROPER SCHEMA")
 
-        resolved_pointer_type = self.client.lib_ast.query(self.return_type_name)
-        result = resolved_pointer_type.pointer_type(client=self.client)
+        resolved_pointer_type = client.lib_ast.query(self.return_type_name)
+        result = resolved_pointer_type.pointer_type(client=client)
         result_id_at_location = getattr(result, "id_at_location", None)
 
         downcasted_set_arg = lib.python.util.downcast(set_arg)
-        downcasted_set_arg_ptr = downcasted_set_arg.send(self.client)
+        downcasted_set_arg_ptr = downcasted_set_arg.send(client)
 
         cmd = GetSetStaticAttributeAction(
             path=self.path_and_name,
             id_at_location=result_id_at_location,
-            address=self.client.address,
+            address=client.address,
             action=StaticAttributeAction.SET,
             set_arg=downcasted_set_arg_ptr,
         )
-        self.client.send_immediate_msg_without_reply(msg=cmd)
+        client.send_immediate_msg_without_reply(msg=cmd)
         return result
 
     def __call__(  # type: ignore
@@ -0,0 +1,114 @@
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+# syft relative
+from .. import ast
+from ..core.node.abstract.node import AbstractNodeClient
+
+
+class ClientView:
+    """
+    A client's view of a node of the AST shared by all clients.
+
+    The AST of the supported frameworks is built once, without a client. Each client
+    sees it through views which pass the client to the nodes executing remotely, so
+    creating a client does not rebuild the AST or its pointer classes.
+
+    Views of child nodes are created on first access and always follow the current
+    node of the shared AST, so libraries added with `sy.load()` are seen by every
+    client. Attributes set on a view are kept on the view (copy-on-write), apart from
+    static attributes which are set remotely.
+    """
+
+    __slots__ = ["_node", "_client", "_children", "_overrides"]
+
+    def __init__(
+        self, node: "ast.attribute.Attribute", client: AbstractNodeClient
+    ) -> None:
+        """
+        Args:
+            node: The node of the shared AST.
+            client: The client for which all computation is being executed.
+        """
+        object.__setattr__(self, "_node", node)
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_children", {})
+        object.__setattr__(self, "_overrides", {})
+
+    def _child(self, name: str) -> "ClientView":
+        child = self._node.attrs[name]
+        view = self._children.get(name, None)
+        if view is None or view._node is not child:
+            view = ClientView(node=child, client=self._client)
+            self._children[name] = view
+        return view
+
+    def __getattr__(self, name: str) -> Any:
+        # the slots are unset while copying or unpickling a view
+        if name in ClientView.__slots__:
+            raise AttributeError(name)
+
+        if name in self._overrides:
+            return self._overrides[name]
+
+        attrs = self._node.attrs
+        if name in attrs:
+            child = attrs[name]
+            if isinstance(child, ast.static_attr.StaticAttribute):
+                return child.get_remote_value(client=self._client)
+
+            if isinstance(child, ast.enum.EnumAttribute):
+                ptr = child.get_remote_enum_attribute(client=self._client)
+                ptr.is_enum = True
+                return ptr
+
+            return self._child(name=name)
+
+        return getattr(self._node, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        child = self._node.attrs.get(name, None)
+        if isinstance(child, ast.static_attr.StaticAttribute):
+            child.set_remote_value(value, client=self._client)
+            return
+
+        self._overrides[name] = value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(self._node, ast.callable.Callable):
+            self._node.apply_node_changes()
+            return self._node.call_remote(client=self._client, args=args, kwargs=kwargs)
+
+        return self._node(*args, **kwargs)
+
+    def query(
+        self, path: Union[List[str], str], obj_type: Optional[type] = None
+    ) -> "ClientView":
+        """
+        Query the shared AST and return the client's view of the node at path.
+
+        Args:
+            path: The path for the node in the AST to be queried,
+                e.g. `syft.lib.python.List` or ["syft", "lib", "python", "List"]
+            obj_type: The type of the object that we want to call, whose path is resolved from the `lookup_cache`.
+
+        Returns:
+            The view of the attribute in the AST at the given path.
+        """
+        node = self._node.query(path=path, obj_type=obj_type)
+        # the shared node may have been built before its object was reloaded
+        node.apply_node_changes()
+        return ClientView(node=node, client=self._client)
+
+    def __dir__(self) -> List[str]:
+        names: Dict[str, None] = dict.fromkeys(dir(self._node))
+        names.update(dict.fromkeys(self._node.attrs))
+        names.update(dict.fromkeys(self._overrides))
+        return list(names)
+
+    def __repr__(self) -> str:
+        return repr(self._node)
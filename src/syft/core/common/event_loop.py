@@ -2,7 +2,9 @@
 import asyncio
 import atexit
 import os
+import threading
 from typing import Any as TypeAny
+from typing import Awaitable
 from typing import Dict as TypeDict
 from typing import Optional
 
@@ -48,6 +50,20 @@ asyncio._set_running_loop(loop)
 nest_asyncio.apply(loop)
 
 
+def run_coroutine(coro: Awaitable, event_loop: TypeAny = loop) -> TypeAny:
+    """
+    Run a coroutine on an event loop and wait for its result.
+
+    If the loop runs in another thread, the coroutine is handed over to that thread.
+    Otherwise the loop is run from here, which is allowed even if it is already
+    running (e.g. in Jupyter) because nest_asyncio patches the loop.
+    """
+    loop_thread_id = getattr(event_loop, "_thread_id", None)
+    if event_loop.is_running() and loop_thread_id != threading.get_ident():
+        return asyncio.run_coroutine_threadsafe(coro, event_loop).result()
+    return event_loop.run_until_complete(coro)
+
+
 def loop_in_thread(loop: TypeAny) -> None:
     asyncio.set_event_loop(loop)
     loop.run_forever()
@@ -63,9 +79,6 @@ class EventLoopThread:
         if "thread" not in self.__shared_state:
             info("Starting Event Loop Thread")
             # daemon=True needed to allow REPL exit() to terminate the thread
-            # stdlib
-            import threading
-
             t = threading.Thread(target=loop_in_thread, args=(loop,), daemon=True)
             self.__shared_state["thread"] = t
             t.start()
@@ -108,4 +121,4 @@ if not is_jupyter and is_interactive and SYFT_USE_EVENT_LOOP_THREAD:
 
     atexit.register(exit_handler)
 
-__all__ = ["loop", "event_loop_thread"]
+__all__ = ["loop", "event_loop_thread", "run_coroutine"]
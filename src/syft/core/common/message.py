@@ -1,5 +1,4 @@
 # stdlib
-import sys
 from typing import Generic
 from typing import Optional
 from typing import Type
@@ -23,6 +22,7 @@ from ...util import get_fully_qualified_name
 from ...util import validate_type
 from ..common.serde.deserialize import _deserialize
 from ..common.serde.serializable import bind_protobuf
+from ..common.serde.type_registry import lookup_type
 
 # this generic type for SignedMessage
 SignedMessageT = TypeVar("SignedMessageT")
@@ -53,7 +53,7 @@ class AbstractMessage(ObjectWithID, Generic[SignedMessageT]):
         init_reason = "Creating"
         if "signed" in self.class_name.lower():
             init_reason += " Signed"
-        debug(f"> {init_reason} {self.pprint} {self.id.emoji()}")
+        debug(lambda: f"> {init_reason} {self.pprint} {self.id.emoji()}")
 
 
 class SyftMessage(AbstractMessage):
@@ -87,7 +87,9 @@ class SyftMessage(AbstractMessage):
             A :class:`SignedMessage`
 
         """
-        debug(f"> Signing with {self.address.key_emoji(key=signing_key.verify_key)}")
+        debug(
+            lambda: f"> Signing with {self.address.key_emoji(key=signing_key.verify_key)}"
+        )
         signed_message = signing_key.sign(serialize(self, to_bytes=True))
 
         # signed_type will be the final subclass callee's closest parent signed_type
@@ -144,6 +146,15 @@ class SignedMessage(SyftMessage):
             _syft_msg = validate_type(
                 _deserialize(blob=self.serialized_message, from_bytes=True), SyftMessage
             )
+            # the outer address is used for routing but is not covered by the
+            # signature so it has to agree with the signed message
+            if _syft_msg.address != self.address:
+                traceback_and_raise(
+                    ValueError(
+                        f"Address {self.address} of {self} does not match the "
+                        + f"signed message address {_syft_msg.address}"
+                    )
+                )
             self.cached_deseralized_message = _syft_msg
 
         if self.cached_deseralized_message is None:
@@ -165,7 +176,7 @@ class SignedMessage(SyftMessage):
         return True
 
     def _object2proto(self) -> SignedMessage_PB:
-        debug(f"> {self.icon} -> Proto 🔢 {self.id}")
+        debug(lambda: f"> {self.icon} -> Proto 🔢 {self.id}")
 
         # obj_type will be the final subclass callee for example ReprMessage
         return SignedMessage_PB(
@@ -174,24 +185,28 @@ class SignedMessage(SyftMessage):
             signature=bytes(self.signature),
             verify_key=bytes(self.verify_key),
             message=self.serialized_message,
+            address=serialize(self.address, to_proto=True),
         )
 
     @staticmethod
     def _proto2object(proto: SignedMessage_PB) -> SignedMessageT:
-        # TODO: horrible temp hack, need to rethink address on SignedMessage
-        sub_message = validate_type(
-            _deserialize(blob=proto.message, from_bytes=True), SyftMessage
-        )
-
-        address = sub_message.address
+        sub_message: Optional[SyftMessage] = None
+        if proto.HasField("address"):
+            address = _deserialize(blob=proto.address)
+        else:
+            # older payloads only carry the address inside the signed message, the
+            # parsed message is kept so it is not deserialized a second time
+            legacy_message = validate_type(
+                _deserialize(blob=proto.message, from_bytes=True), SyftMessage
+            )
+            address = legacy_message.address
+            sub_message = legacy_message
 
         # proto.obj_type is final subclass callee for example ReprMessage
         # but we want the associated signed_type which is
         # ReprMessage -> ImmediateSyftMessageWithoutReply.signed_type
         # == SignedImmediateSyftMessageWithoutReply
-        module_parts = proto.obj_type.split(".")
-        klass = module_parts.pop()
-        obj_type = getattr(sys.modules[".".join(module_parts)], klass)
+        obj_type = lookup_type(proto.obj_type).obj_type
         obj = obj_type.signed_type(
             msg_id=_deserialize(blob=proto.msg_id),
             address=address,
@@ -200,6 +215,7 @@ class SignedMessage(SyftMessage):
             verify_key=VerifyKey(proto.verify_key),
             message=proto.message,
         )
+        obj.cached_deseralized_message = sub_message
 
         icon = "🤷🏾‍♀️"
         if hasattr(obj, "icon"):
@@ -8,7 +8,7 @@ from google.protobuf.message import Message
 # syft relative
 from ....logger import traceback_and_raise
 from ....proto.util.data_message_pb2 import DataMessage
-from ....util import index_syft_by_module_name
+from .type_registry import lookup_type
 
 
 def _deserialize(
@@ -54,13 +54,11 @@ def _deserialize(
     if from_bytes:
         data_message = DataMessage()
         data_message.ParseFromString(blob)
-        obj_type = index_syft_by_module_name(fully_qualified_name=data_message.obj_type)
-        get_protobuf_schema = getattr(obj_type, "get_protobuf_schema", None)
+        protobuf_type = lookup_type(data_message.obj_type).protobuf_schema
 
-        if not callable(get_protobuf_schema):
+        if protobuf_type is None:
             traceback_and_raise(deserialization_error)
 
-        protobuf_type = get_protobuf_schema()
         blob = protobuf_type()
 
         if not isinstance(blob, Message):
@@ -76,7 +74,7 @@ def _deserialize(
         obj_type = getattr(blob, "obj_type", None)
         if obj_type is None:
             traceback_and_raise(deserialization_error)
-        obj_type = index_syft_by_module_name(fully_qualified_name=obj_type)  # type: ignore
+        obj_type = lookup_type(obj_type).obj_type
         obj_type = getattr(obj_type, "_sy_serializable_wrapper_type", obj_type)
 
     if not isinstance(obj_type, type):
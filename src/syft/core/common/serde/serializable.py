@@ -9,6 +9,7 @@ from google.protobuf.reflection import GeneratedProtocolMessageType
 # syft relative
 from ....logger import traceback_and_raise
 from ....util import random_name
+from .type_registry import register_type
 
 
 def bind_protobuf(cls: Any) -> Any:
@@ -20,6 +21,11 @@ def bind_protobuf(cls: Any) -> Any:
     else:
         protobuf_schema.schema2type = cls
 
+    # classes created inside a function like the GenerateWrapper wrappers only
+    # get their final name afterwards, so they register themselves
+    if "<locals>" not in cls.__qualname__:
+        register_type(obj_type=cls)
+
     return cls
 
 
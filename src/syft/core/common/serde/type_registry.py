@@ -0,0 +1,95 @@
+"""A registry from fully qualified names to the types used by deserialization.
+
+Every serialized blob names the type it should be deserialized into with a
+fully qualified name like ``syft.lib.python.List``. Resolving this name means
+walking the syft module tree attribute by attribute, which is done for every
+element of every container. The registry below is filled at import time by
+:py:func:`bind_protobuf` and :py:func:`GenerateWrapper` and lazily by every
+name that had to be walked once, so lookups are a single dict access.
+"""
+
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+
+# syft relative
+from ....util import index_syft_by_module_name
+
+
+class TypeRegistryEntry(NamedTuple):
+    obj_type: Any
+    protobuf_schema: Optional[Any]
+
+
+TYPE_REGISTRY: Dict[str, TypeRegistryEntry] = {}
+
+# lookups served from the registry and lookups which had to walk the modules
+TYPE_REGISTRY_STATS = {"hits": 0, "misses": 0}
+
+
+def _create_entry(obj_type: Any) -> TypeRegistryEntry:
+    protobuf_schema = None
+    get_protobuf_schema = getattr(obj_type, "get_protobuf_schema", None)
+    if callable(get_protobuf_schema):
+        try:
+            protobuf_schema = get_protobuf_schema()
+        except Exception:  # nosec
+            # abstract classes raise NotImplementedError here
+            pass
+
+    return TypeRegistryEntry(obj_type=obj_type, protobuf_schema=protobuf_schema)
+
+
+def register_type(obj_type: type, fully_qualified_name: Optional[str] = None) -> None:
+    """Add a type to the registry, replacing any type registered under its name
+
+    Args:
+        obj_type: the class to register
+        fully_qualified_name: the name to register it under, defaults to the
+            module and name of the class
+    """
+    if fully_qualified_name is None:
+        fully_qualified_name = f"{obj_type.__module__}.{obj_type.__name__}"
+    TYPE_REGISTRY[fully_qualified_name] = _create_entry(obj_type=obj_type)
+
+
+def lookup_type(fully_qualified_name: str) -> TypeRegistryEntry:
+    """Look up a type by name, walking the syft modules once on a miss
+
+    Args:
+        fully_qualified_name: the name of a syft class, module or function
+
+    Returns:
+        the registry entry for the object at that path
+    """
+    entry = TYPE_REGISTRY.get(fully_qualified_name, None)
+    if entry is not None:
+        TYPE_REGISTRY_STATS["hits"] += 1
+        return entry
+
+    TYPE_REGISTRY_STATS["misses"] += 1
+    entry = _create_entry(
+        obj_type=index_syft_by_module_name(fully_qualified_name=fully_qualified_name)
+    )
+    TYPE_REGISTRY[fully_qualified_name] = entry
+    return entry
+
+
+def type_registry_stats() -> Dict[str, float]:
+    """Return the hit and miss counters of the registry and its hit rate"""
+    hits = TYPE_REGISTRY_STATS["hits"]
+    misses = TYPE_REGISTRY_STATS["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total > 0 else 0.0,
+        "size": len(TYPE_REGISTRY),
+    }
+
+
+def reset_type_registry_stats() -> None:
+    TYPE_REGISTRY_STATS["hits"] = 0
+    TYPE_REGISTRY_STATS["misses"] = 0
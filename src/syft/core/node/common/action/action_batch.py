@@ -0,0 +1,89 @@
+# stdlib
+from typing import List
+from typing import Optional
+from typing import Union
+
+# third party
+from google.protobuf.reflection import GeneratedProtocolMessageType
+from nacl.signing import VerifyKey
+
+# syft relative
+from ..... import serialize
+from .....logger import traceback_and_raise
+from .....proto.core.node.common.action.action_batch_pb2 import (
+    ActionBatch as ActionBatch_PB,
+)
+from ....common.serde.deserialize import _deserialize
+from ....common.serde.serializable import bind_protobuf
+from ....common.uid import UID
+from ....io.address import Address
+from ...abstract.node import AbstractNode
+from .common import EventualActionWithoutReply
+from .common import ImmediateActionWithoutReply
+
+ActionWithoutReply = Union[ImmediateActionWithoutReply, EventualActionWithoutReply]
+
+
+@bind_protobuf
+class ActionBatch(ImmediateActionWithoutReply):
+    """
+    Many actions without a reply sent to a node in a single signed message.
+
+    The node executes the actions in order with the verify key of the batch, as if
+    they had been signed and sent one by one. Only the signature of the batch is
+    checked, so every action must be addressed to the node the batch is sent to.
+    """
+
+    def __init__(
+        self,
+        actions: List[ActionWithoutReply],
+        address: Address,
+        msg_id: Optional[UID] = None,
+    ):
+        super().__init__(address=address, msg_id=msg_id)
+        self.actions = actions
+
+    def __repr__(self) -> str:
+        return f"ActionBatch of {len(self.actions)} actions"
+
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        for action in self.actions:
+            # the signature only covers the batch, it can't carry actions for others
+            if action.address != self.address:
+                traceback_and_raise(
+                    ValueError(
+                        f"Address {action.address} of {action} does not match the "
+                        + f"address {self.address} of the batch"
+                    )
+                )
+            action.execute_action(node=node, verify_key=verify_key)
+
+    def _object2proto(self) -> ActionBatch_PB:
+        return ActionBatch_PB(
+            actions=[serialize(action, to_bytes=True) for action in self.actions],
+            address=serialize(self.address),
+            msg_id=serialize(self.id),
+        )
+
+    @staticmethod
+    def _proto2object(proto: ActionBatch_PB) -> "ActionBatch":
+        actions: List[ActionWithoutReply] = []
+        for blob in proto.actions:
+            action = _deserialize(blob=blob, from_bytes=True)
+            if not isinstance(
+                action, (ImmediateActionWithoutReply, EventualActionWithoutReply)
+            ):
+                traceback_and_raise(
+                    TypeError(f"ActionBatch can't contain {type(action)} messages")
+                )
+            actions.append(action)
+
+        return ActionBatch(
+            actions=actions,
+            address=_deserialize(blob=proto.address),
+            msg_id=_deserialize(blob=proto.msg_id),
+        )
+
+    @staticmethod
+    def get_protobuf_schema() -> GeneratedProtocolMessageType:
+        return ActionBatch_PB
@@ -80,6 +80,14 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
         # left and right have the same keys
         return {k: left[k] for k in intersection}
 
+    @staticmethod
+    def is_mutating(path: str) -> bool:
+        # if the method changes the object it is called on, like the inplace
+        # methods of torch.Tensor
+        if path.startswith("torch.Tensor"):
+            return path.endswith("_") and not path.endswith("__call__")
+        return path.endswith("__call__")
+
     @property
     def pprint(self) -> str:
         return f"RunClassMethodAction({self.path})"
@@ -94,17 +102,7 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         method = node.lib_ast(self.path)
 
-        mutating_internal = False
-        if (
-            self.path.startswith("torch.Tensor")
-            and self.path.endswith("_")
-            and not self.path.endswith("__call__")
-        ):
-            mutating_internal = True
-        elif not self.path.startswith("torch.Tensor") and self.path.endswith(
-            "__call__"
-        ):
-            mutating_internal = True
+        mutating_internal = self.is_mutating(self.path)
 
         resolved_self = None
         if not self.is_static:
@@ -209,6 +207,8 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
         if mutating_internal:
             if isinstance(resolved_self, StorableObject):
                 resolved_self.read_permissions = result_read_permissions
+                # write back so the permission indexes of the store are updated
+                node.store[self._self.id_at_location] = resolved_self
         if not isinstance(result, StorableObject):
             result = StorableObject(
                 id=self.id_at_location,
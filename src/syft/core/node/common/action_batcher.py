@@ -0,0 +1,131 @@
+# stdlib
+import threading
+from types import TracebackType
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Type
+
+# syft relative
+from ....logger import error
+from ...io.address import Address
+from .action.action_batch import ActionBatch
+from .action.action_batch import ActionWithoutReply
+from .action.common import EventualActionWithoutReply
+
+if TYPE_CHECKING:
+    # syft relative
+    from .client import Client
+
+
+class ActionBatcher:
+    """
+    Coalesces the consecutive actions without a reply sent by a client into an
+    ActionBatch, which is signed and sent to the node as a single message.
+
+    The actions are buffered until max_size of them are waiting, the first of them
+    has waited for max_delay seconds, or the client sends any other message, so the
+    node always executes them in the order they were sent.
+    """
+
+    def __init__(
+        self, client: "Client", max_size: int = 100, max_delay: Optional[float] = 0.01
+    ) -> None:
+        """
+        :param client: the client whose actions are batched.
+        :param max_size: the number of actions sent in a single batch.
+        :param max_delay: how long in seconds an action can wait to be sent, None
+            waits until the batch is full or flushed.
+        """
+        self.client = client
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.actions: List[ActionWithoutReply] = []
+        self.address: Optional[Address] = None
+        self.route_index = 0
+        # the timer flushes from its own thread
+        self.lock = threading.RLock()
+        self.timer: Optional[threading.Timer] = None
+        self.sending = False
+
+    def add(self, action: ActionWithoutReply, route_index: int = 0) -> None:
+        with self.lock:
+            # a batch is signed once, so all its actions go to the same node
+            if self.actions and (
+                action.address != self.address or route_index != self.route_index
+            ):
+                self.flush()
+
+            if not self.actions:
+                self.address = action.address
+                self.route_index = route_index
+                self._start_timer()
+            self.actions.append(action)
+
+            # actions added while a batch is sent, by the garbage collection of
+            # pointers for example, wait for the next one to keep them in order
+            if len(self.actions) >= self.max_size and not self.sending:
+                self.flush()
+
+    def flush(self) -> None:
+        """Send the buffered actions to the node"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.actions or self.sending:
+                return
+
+            actions, self.actions = self.actions, []
+            # a single action is sent as it is
+            msg = (
+                actions[0]
+                if len(actions) == 1
+                else ActionBatch(actions=actions, address=self.address)  # type: ignore
+            )
+
+            self.sending = True
+            try:
+                signing_key = self.client.signing_key
+                route = self.client.routes[self.route_index]
+                if isinstance(msg, EventualActionWithoutReply):
+                    route.send_eventual_msg_without_reply(
+                        msg=msg.sign(signing_key=signing_key)
+                    )
+                else:
+                    route.send_immediate_msg_without_reply(
+                        msg=msg.sign(signing_key=signing_key)
+                    )
+            finally:
+                self.sending = False
+
+    def _start_timer(self) -> None:
+        if self.max_delay is None:
+            return
+        self.timer = threading.Timer(self.max_delay, self._flush_on_timer)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            # nobody waits for this thread, so the exception can only be logged
+            error(f"Failed to send a batch of actions. {e}")
+
+    def close(self) -> None:
+        """Send the buffered actions and stop batching the actions of the client"""
+        self.flush()
+        if self.client.action_batcher is self:
+            self.client.action_batcher = None
+
+    def __enter__(self) -> "ActionBatcher":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -15,8 +15,7 @@ import pandas as pd
 
 # syft relative
 from .... import serialize
-from ....lib import create_lib_ast
-from ....logger import critical
+from ....lib import lib_ast
 from ....logger import debug
 from ....logger import error
 from ....logger import traceback_and_raise
@@ -41,8 +40,12 @@ from ...node.common.service.obj_search_service import ObjectSearchMessage
 from ...pointer.garbage_collection import GarbageCollection
 from ...pointer.garbage_collection import gc_get_default_strategy
 from ...pointer.pointer import Pointer
+from ...store.store_index import type_name
 from ..abstract.node import AbstractNodeClient
+from .action.common import EventualActionWithoutReply
+from .action.common import ImmediateActionWithoutReply
 from .action.exception_action import ExceptionMessage
+from .action_batcher import ActionBatcher
 from .service.child_node_lifecycle_service import RegisterChildNodeMessage
 
 
@@ -76,6 +79,9 @@ class Client(AbstractNodeClient):
         gc_strategy_name = gc_get_default_strategy()
         self.gc = GarbageCollection(gc_strategy_name)
 
+        # set by batch_actions to send the actions without a reply in batches
+        self.action_batcher: Optional[ActionBatcher] = None
+
         # create a signing key if one isn't provided
         if signing_key is None:
             self.signing_key = SigningKey.generate()
@@ -121,26 +127,24 @@ class Client(AbstractNodeClient):
         return meta.node, meta.name, meta.id
 
     def install_supported_frameworks(self) -> None:
-        self.lib_ast = create_lib_ast(client=self)
-
-        # first time we want to register for future updates
-        self.lib_ast.register_updates(self)
-
-        if self.lib_ast is not None:
-            for attr_name, attr in self.lib_ast.attrs.items():
-                setattr(self, attr_name, attr)
+        # all clients share one AST, the client is bound to its nodes by a view
+        self.lib_ast = lib_ast.bind(client=self)
 
-        # shortcut syft.lib.python to just python
-        if hasattr(self.lib_ast, "syft"):
-            try:
-                lib_attr = getattr(self.lib_ast.syft, "lib", None)
+    def __getattr__(self, name: str) -> Any:
+        # the frameworks of the AST are exposed as attributes of the client, they are
+        # resolved on every access so libraries loaded later are found as well
+        view = self.__dict__.get("lib_ast", None)
+        if view is not None and not name.startswith("__"):
+            if name in view.attrs:
+                return getattr(view, name)
 
-                if lib_attr is not None:
-                    python_attr = getattr(lib_attr, "python", None)
-                    setattr(self, "python", python_attr)
+            # shortcut syft.lib.python to just python
+            if name == "python":
+                return view.syft.lib.python
 
-            except Exception as e:
-                critical(f"Failed to set python attribute on client. {e}")
+        traceback_and_raise(
+            AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        )
 
     def add_me_to_my_address(self) -> None:
         traceback_and_raise(NotImplementedError)
@@ -208,6 +212,33 @@ class Client(AbstractNodeClient):
         """This client points to an node, this returns the id of that node."""
         traceback_and_raise(NotImplementedError)
 
+    def batch_actions(
+        self, max_size: int = 100, max_delay: Optional[float] = 0.01
+    ) -> ActionBatcher:
+        """Send the actions without a reply of this client in batches, each signed
+        and sent as a single message, until the returned ActionBatcher is closed.
+        It can be used as a context manager.
+
+        Args:
+            max_size: the number of actions sent in a single batch.
+            max_delay: how long in seconds an action can wait to be sent, None waits
+                until the batch is full or another message is sent.
+
+        Returns:
+            The :class:`ActionBatcher` of the client.
+        """
+        if self.action_batcher is not None:
+            self.action_batcher.close()
+        self.action_batcher = ActionBatcher(
+            client=self, max_size=max_size, max_delay=max_delay
+        )
+        return self.action_batcher
+
+    def flush_actions(self) -> None:
+        """Send the actions waiting to be sent in a batch"""
+        if self.action_batcher is not None:
+            self.action_batcher.flush()
+
     # TODO fix the msg type but currently tensor needs SyftMessage
 
     def send_immediate_msg_with_reply(
@@ -216,13 +247,14 @@ class Client(AbstractNodeClient):
         route_index: int = 0,
     ) -> SyftMessage:
         route_index = route_index or self.default_route_index
+        # the node must have executed the actions sent before
+        self.flush_actions()
 
         if isinstance(msg, ImmediateSyftMessageWithReply):
-            output = (
-                f"> {self.pprint} Signing {msg.pprint} with "
+            debug(
+                lambda: f"> {self.pprint} Signing {msg.pprint} with "
                 + f"{self.key_emoji(key=self.signing_key.verify_key)}"
             )
-            debug(output)
             msg = msg.sign(signing_key=self.signing_key)
 
         response = self.routes[route_index].send_immediate_msg_with_reply(msg=msg)
@@ -252,25 +284,36 @@ class Client(AbstractNodeClient):
     ) -> None:
         route_index = route_index or self.default_route_index
 
+        if self.action_batcher is not None:
+            if isinstance(msg, ImmediateActionWithoutReply):
+                self.action_batcher.add(action=msg, route_index=route_index)
+                return
+            self.flush_actions()
+
         if isinstance(msg, ImmediateSyftMessageWithoutReply):
-            output = (
-                f"> {self.pprint} Signing {msg.pprint} with "
+            debug(
+                lambda: f"> {self.pprint} Signing {msg.pprint} with "
                 + f"{self.key_emoji(key=self.signing_key.verify_key)}"
             )
-            debug(output)
             msg = msg.sign(signing_key=self.signing_key)
-        debug(f"> Sending {msg.pprint} {self.pprint} ➡️  {msg.address.pprint}")
+        debug(lambda: f"> Sending {msg.pprint} {self.pprint} ➡️  {msg.address.pprint}")
         self.routes[route_index].send_immediate_msg_without_reply(msg=msg)
 
     def send_eventual_msg_without_reply(
         self, msg: EventualSyftMessageWithoutReply, route_index: int = 0
     ) -> None:
         route_index = route_index or self.default_route_index
-        output = (
-            f"> {self.pprint} Signing {msg.pprint} with "
+
+        if self.action_batcher is not None:
+            if isinstance(msg, EventualActionWithoutReply):
+                self.action_batcher.add(action=msg, route_index=route_index)
+                return
+            self.flush_actions()
+
+        debug(
+            lambda: f"> {self.pprint} Signing {msg.pprint} with "
             + f"{self.key_emoji(key=self.signing_key.verify_key)}"
         )
-        debug(output)
         signed_msg: SignedEventualSyftMessageWithoutReply = msg.sign(
             signing_key=self.signing_key
         )
@@ -375,15 +418,28 @@ class StoreClient:
     def __init__(self, client: Client) -> None:
         self.client = client
 
-    @property
-    def store(self) -> List[Pointer]:
+    def _search(
+        self,
+        tag: Optional[str] = None,
+        obj_type: Optional[Union[type, str]] = None,
+        description: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        count_only: bool = False,
+    ) -> Tuple[List[Pointer], int]:
         msg = ObjectSearchMessage(
-            address=self.client.address, reply_to=self.client.address
+            address=self.client.address,
+            reply_to=self.client.address,
+            tag=tag,
+            obj_type=type_name(obj_type) if obj_type is not None else None,
+            description=description,
+            offset=offset,
+            limit=limit,
+            count_only=count_only,
         )
 
-        results = getattr(
-            self.client.send_immediate_msg_with_reply(msg=msg), "results", None
-        )
+        reply = self.client.send_immediate_msg_with_reply(msg=msg)
+        results = getattr(reply, "results", None)
         if results is None:
             traceback_and_raise(ValueError("TODO"))
 
@@ -393,25 +449,45 @@ class StoreClient:
             result.gc_enabled = False
             result.client = self.client
 
+        return results, getattr(reply, "count", len(results))
+
+    def search(
+        self,
+        tag: Optional[str] = None,
+        obj_type: Optional[Union[type, str]] = None,
+        description: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Pointer]:
+        """Return the objects in the store we're allowed to know about which match all
+        of the given filters. The filtering and pagination happen on the node."""
+
+        results, _ = self._search(
+            tag=tag,
+            obj_type=obj_type,
+            description=description,
+            offset=offset,
+            limit=limit,
+        )
         return results
 
+    @property
+    def store(self) -> List[Pointer]:
+        return self.search()
+
     def __len__(self) -> int:
         """Return the number of items in the object store we're allowed to know about"""
 
-        return len(self.store)
+        _, count = self._search(count_only=True)
+        return count
 
     def __getitem__(self, key: Union[str, int]) -> Pointer:
         if isinstance(key, str):
-            matches = 0
-            match_obj: Optional[Pointer] = None
-
-            for obj in self.store:
-                if key in obj.tags:
-                    matches += 1
-                    match_obj = obj
-            if matches == 1 and match_obj is not None:
-                return match_obj
-            elif matches > 1:
+            # two results are enough to tell that a tag is ambiguous
+            matches = self.search(tag=key, limit=2)
+            if len(matches) == 1:
+                return matches[0]
+            elif len(matches) > 1:
                 traceback_and_raise(KeyError("More than one item with tag:" + str(key)))
             else:
                 # If key does not math with any tags, we then try to match it with id string.
@@ -432,7 +508,11 @@ class StoreClient:
 
             traceback_and_raise(KeyError("No such item found for id:" + str(key)))
         if isinstance(key, int):
-            return self.store[key]
+            index = key if key >= 0 else len(self) + key
+            results = self.search(offset=index, limit=1) if index >= 0 else []
+            if len(results) == 0:
+                traceback_and_raise(IndexError("list index out of range"))
+            return results[0]
         else:
             traceback_and_raise(KeyError("Please pass in a string or int key"))
 
@@ -44,6 +44,7 @@ from ...io.route import SoloRoute
 from ...io.virtual import create_virtual_connection
 from ...store import DiskObjectStore
 from ...store import MemoryStore
+from ...store import TieredStore
 from ..abstract.node import AbstractNode
 from .action.exception_action import ExceptionMessage
 from .action.exception_action import UnknownPrivateException
@@ -104,6 +105,7 @@ class Node(AbstractNode):
         signing_key: Optional[SigningKey] = None,
         verify_key: Optional[VerifyKey] = None,
         db_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
     ):
 
         # The node has a name - it exists purely to help the
@@ -129,6 +131,11 @@ class Node(AbstractNode):
             except Exception as e:
                 log = f"Failed to open DiskObjectStore at {db_path}. {e}"
                 critical(log)
+        elif memory_budget is not None:
+            # objects over the budget are spilled to disk in LRU order
+            self.store = TieredStore(max_resident_bytes=memory_budget)
+            log = f"Created TieredStore with a budget of {memory_budget} bytes."
+            debug(log)
         else:
             self.store = MemoryStore()
             log = "Created MemoryStore."
@@ -343,7 +350,8 @@ class Node(AbstractNode):
         # message reply
         try:
             debug(
-                f"> Received with Reply {msg.message.pprint} {msg.message.id} @ {self.pprint}"
+                lambda: f"> Received with Reply {msg.message.pprint} {msg.message.id} "
+                + f"@ {self.pprint}"
             )
             # try to process message
             response = self.process_message(
@@ -382,18 +390,18 @@ class Node(AbstractNode):
         # maybe I shouldn't have created process_message because it screws up
         # all the type inference.
         res_msg = response.sign(signing_key=self.signing_key)  # type: ignore
-        output = (
-            f"> {self.pprint} Signing {res_msg.pprint} with "
+        debug(
+            lambda: f"> {self.pprint} Signing {res_msg.pprint} with "
             + f"{self.key_emoji(key=self.signing_key.verify_key)}"  # type: ignore
         )
-        debug(output)
         return res_msg
 
     def recv_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
     ) -> None:
         debug(
-            f"> Received without Reply {msg.message.pprint} {msg.message.id} @ {self.pprint}"
+            lambda: f"> Received without Reply {msg.message.pprint} {msg.message.id} "
+            + f"@ {self.pprint}"
         )
 
         self.process_message(msg=msg, router=self.immediate_msg_without_reply_router)
@@ -456,10 +464,11 @@ class Node(AbstractNode):
 
         self.message_counter += 1
 
-        debug(f"> Processing 📨 {msg.pprint} @ {self.pprint} {msg.message}")
+        debug(lambda: f"> Processing 📨 {msg.pprint} @ {self.pprint} {msg.message}")
         if self.message_is_for_me(msg=msg):
             debug(
-                f"> Recipient Found {msg.pprint}{msg.address.target_emoji()} == {self.pprint}"
+                lambda: f"> Recipient Found {msg.pprint}{msg.address.target_emoji()} "
+                + f"== {self.pprint}"
             )
             # Process Message here
             if not msg.is_valid:
@@ -487,7 +496,8 @@ class Node(AbstractNode):
 
         else:
             debug(
-                f"> Recipient Not Found ↪️ {msg.pprint}{msg.address.target_emoji()} != {self.pprint}"
+                lambda: f"> Recipient Not Found ↪️ {msg.pprint}{msg.address.target_emoji()} "
+                + f"!= {self.pprint}"
             )
             # Forward message onwards
             if issubclass(type(msg), SignedImmediateSyftMessageWithReply):
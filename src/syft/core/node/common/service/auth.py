@@ -28,14 +28,13 @@ def service_auth(
         def process(
             node: AbstractNode, msg: SyftMessage, verify_key: VerifyKey
         ) -> Optional[SyftMessage]:
-            debug(f"> Checking {msg.pprint} 🔑 Matches {node.pprint} root 🗝")
+            debug(lambda: f"> Checking {msg.pprint} 🔑 Matches {node.pprint} root 🗝")
 
             if root_only:
-                keys = (
-                    f"> Matching 🔑 {node.key_emoji(key=verify_key)}  == "
+                debug(
+                    lambda: f"> Matching 🔑 {node.key_emoji(key=verify_key)}  == "
                     + f"{node.key_emoji(key=node.root_verify_key)}  🗝"
                 )
-                debug(keys)
                 if verify_key != node.root_verify_key:
                     debug(f"> ❌ Auth FAILED {msg.pprint}")
                     traceback_and_raise(
@@ -44,7 +43,7 @@ def service_auth(
                         )
                     )
                 else:
-                    debug(f"> ✅ Auth Succeeded {msg.pprint} 🔑 == 🗝")
+                    debug(lambda: f"> ✅ Auth Succeeded {msg.pprint} 🔑 == 🗝")
 
             elif admin_only:
                 if (
@@ -144,6 +144,8 @@ class ImmediateObjectSearchPermissionUpdateService(ImmediateNodeServiceWithoutRe
             storable_object.search_permissions[target_verify_key] = msg.id
         else:
             storable_object.search_permissions.pop(target_verify_key, None)
+        # write the object back so stores which don't hold it in memory persist it
+        node.store[msg.target_object_id] = storable_object
 
     @staticmethod
     def message_handler_types() -> List[Type[ObjectSearchPermissionUpdateMessage]]:
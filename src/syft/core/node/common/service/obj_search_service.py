@@ -8,6 +8,7 @@
 from typing import List
 from typing import Optional
 from typing import Type
+from typing import TypeVar
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -26,7 +27,6 @@ from .....proto.core.node.common.service.object_search_message_pb2 import (
 )
 from .....util import obj2pointer_type
 from .....util import traceback_and_raise
-from ....common.group import VERIFYALL
 from ....common.message import ImmediateSyftMessageWithReply
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.serde.deserialize import _deserialize
@@ -41,12 +41,29 @@ from .node_service import ImmediateNodeServiceWithReply
 @final
 class ObjectSearchMessage(ImmediateSyftMessageWithReply):
     def __init__(
-        self, address: Address, reply_to: Address, msg_id: Optional[UID] = None
+        self,
+        address: Address,
+        reply_to: Address,
+        msg_id: Optional[UID] = None,
+        tag: Optional[str] = None,
+        obj_type: Optional[str] = None,
+        description: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        count_only: bool = False,
     ):
         super().__init__(address=address, msg_id=msg_id, reply_to=reply_to)
         """By default this message just returns pointers to all the objects
-        the sender is allowed to see. In the future we'll add support so that
-        we can query for subsets."""
+        the sender is allowed to see. The objects can be filtered by a tag, by the
+        fully qualified name of a type their data is an instance of and by a part
+        of their description, and the matches paginated with offset and limit.
+        With count_only the reply only carries the number of matches."""
+        self.tag = tag
+        self.obj_type = obj_type
+        self.description = description
+        self.offset = offset
+        self.limit = limit
+        self.count_only = count_only
 
     def _object2proto(self) -> ObjectSearchMessage_PB:
         """Returns a protobuf serialization of self.
@@ -67,6 +84,16 @@ class ObjectSearchMessage(ImmediateSyftMessageWithReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             reply_to=serialize(self.reply_to),
+            tag=self.tag if self.tag is not None else "",
+            has_tag=self.tag is not None,
+            obj_type=self.obj_type if self.obj_type is not None else "",
+            has_obj_type=self.obj_type is not None,
+            description=self.description if self.description is not None else "",
+            has_description=self.description is not None,
+            offset=self.offset,
+            limit=self.limit if self.limit is not None else 0,
+            has_limit=self.limit is not None,
+            count_only=self.count_only,
         )
 
     @staticmethod
@@ -88,6 +115,12 @@ class ObjectSearchMessage(ImmediateSyftMessageWithReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             reply_to=_deserialize(blob=proto.reply_to),
+            tag=proto.tag if proto.has_tag else None,
+            obj_type=proto.obj_type if proto.has_obj_type else None,
+            description=proto.description if proto.has_description else None,
+            offset=proto.offset,
+            limit=proto.limit if proto.has_limit else None,
+            count_only=proto.count_only,
         )
 
     @staticmethod
@@ -119,12 +152,14 @@ class ObjectSearchReplyMessage(ImmediateSyftMessageWithoutReply):
         results: List[Pointer],
         address: Address,
         msg_id: Optional[UID] = None,
+        count: Optional[int] = None,
     ):
         super().__init__(address=address, msg_id=msg_id)
         """By default this message just returns pointers to all the objects
-        the sender is allowed to see. In the future we'll add support so that
-        we can query for subsets."""
+        the sender is allowed to see. count is the number of objects matching
+        the search before it was paginated."""
         self.results = results
+        self.count = count if count is not None else len(results)
 
     def _object2proto(self) -> ObjectSearchReplyMessage_PB:
         """Returns a protobuf serialization of self.
@@ -145,6 +180,7 @@ class ObjectSearchReplyMessage(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             results=list(map(lambda x: serialize(x), self.results)),
+            count=self.count,
         )
 
     @staticmethod
@@ -166,6 +202,7 @@ class ObjectSearchReplyMessage(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             results=[_deserialize(blob=x) for x in proto.results],
+            count=proto.count,
         )
 
     @staticmethod
@@ -189,6 +226,25 @@ class ObjectSearchReplyMessage(ImmediateSyftMessageWithoutReply):
         return ObjectSearchReplyMessage_PB
 
 
+T = TypeVar("T")
+
+
+def _intersect(keys: Optional[List[UID]], other: List[UID]) -> List[UID]:
+    # keeps the order of keys, None stands for all keys
+    if keys is None:
+        return other
+    allowed = set(other)
+    return [key for key in keys if key in allowed]
+
+
+def _paginate(items: List[T], msg: ObjectSearchMessage) -> List[T]:
+    if msg.count_only:
+        return []
+    start = msg.offset
+    stop = start + msg.limit if msg.limit is not None else None
+    return items[start:stop]
+
+
 class ImmediateObjectSearchService(ImmediateNodeServiceWithReply):
     @staticmethod
     def process(
@@ -204,31 +260,54 @@ class ImmediateObjectSearchService(ImmediateNodeServiceWithReply):
                 "verification key."
             )
 
+        count = 0
         try:
-            for obj in node.store.get_objects_of_type(obj_type=object):
-                # if this tensor allows anyone to search for it, then one of its keys
-                # has a VERIFYALL in it.
-                contains_all_in_permissions = any(
-                    key is VERIFYALL for key in obj.search_permissions.keys()
+            # every filter narrows the keys through an index of the store, None
+            # stands for all keys
+            keys: Optional[List[UID]] = None
+            if msg.tag is not None:
+                keys = node.store.get_keys_with_tag(tag=msg.tag)
+            if msg.obj_type is not None:
+                keys = _intersect(keys, node.store.get_keys_of_type(msg.obj_type))
+            # the root user can search for everything, everyone else only for the
+            # objects they or everyone (VERIFYALL) were given search permission on
+            if verify_key != node.root_verify_key:
+                keys = _intersect(
+                    keys, node.store.get_keys_searchable_by(verify_key=verify_key)
                 )
-                if (
-                    verify_key in obj.search_permissions.keys()
-                    or verify_key == node.root_verify_key
-                    or contains_all_in_permissions
-                ):
-                    ptr_type = obj2pointer_type(obj=obj.data)
-                    ptr = ptr_type(
-                        client=node,
-                        id_at_location=obj.id,
-                        object_type=obj.object_type,
-                        tags=obj.tags,
-                        description=obj.description,
-                    )
-                    results.append(ptr)
+            if keys is None:
+                keys = list(node.store.keys())
+
+            # descriptions are not indexed so those objects have to be loaded first
+            if msg.description is not None:
+                objects = [node.store[key] for key in keys]
+                objects = [
+                    obj
+                    for obj in objects
+                    if obj.description and msg.description in obj.description
+                ]
+                count = len(objects)
+                objects = _paginate(objects, msg=msg)
+            else:
+                count = len(keys)
+                objects = [node.store[key] for key in _paginate(keys, msg=msg)]
+
+            for obj in objects:
+                ptr_type = obj2pointer_type(obj=obj.data)
+                ptr = ptr_type(
+                    client=node,
+                    id_at_location=obj.id,
+                    object_type=obj.object_type,
+                    tags=obj.tags,
+                    description=obj.description,
+                )
+                results.append(ptr)
         except Exception as e:
             error(f"Error searching store. {e}")
 
-        return ObjectSearchReplyMessage(address=msg.reply_to, results=results)
+        return ObjectSearchReplyMessage(
+            address=msg.reply_to, results=results, count=count
+        )
 
     @staticmethod
     def message_handler_types() -> List[Type[ObjectSearchMessage]]:
@@ -1,5 +1,8 @@
 # stdlib
 import asyncio
+import heapq
+import itertools
+import threading
 import time
 from typing import Any
 from typing import Dict
@@ -47,6 +50,10 @@ class Domain(Node):
     client_type = DomainClient
     child_type_client_type = DeviceClient
 
+    # a handled request which is still pending after this many seconds is handled
+    # again, in case the handler failed to accept or deny it
+    handled_request_retry_secs = 5
+
     def __init__(
         self,
         name: Optional[str],
@@ -58,6 +65,7 @@ class Domain(Node):
         verify_key: Optional[VerifyKey] = None,
         root_key: Optional[VerifyKey] = None,
         db_path: Optional[str] = None,
+        memory_budget: Optional[int] = None,
     ):
         super().__init__(
             name=name,
@@ -68,6 +76,7 @@ class Domain(Node):
             signing_key=signing_key,
             verify_key=verify_key,
             db_path=db_path,
+            memory_budget=memory_budget,
         )
         # specific location with name
         self.domain = SpecificLocation(name=self.name)
@@ -91,10 +100,17 @@ class Domain(Node):
         self._register_services()
         self.request_handlers: List[Dict[Union[str, String], Any]] = []
         self.handled_requests: Dict[Any, float] = {}
+        # (deadline, sequence, kind, request or handler) of the handlers and requests
+        # which time out and of the handled requests to retry
+        self._expiries: List[Tuple[float, int, str, Any]] = []
+        self._expiry_sequence = itertools.count()
+        self._handlers_lock = threading.RLock()
+        self._handlers_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handlers_wakeup: Optional[asyncio.Event] = None
 
         self.post_init()
 
-        # run the handlers in an asyncio future
+        # expire the handlers and requests in an asyncio future
         asyncio.ensure_future(self.run_handlers())
 
     @property
@@ -132,23 +148,18 @@ class Domain(Node):
         return False
 
     def get_request_status(self, message_request_id: UID) -> RequestStatus:
+        # the handlers loop might not be running, an expired request is rejected
+        self.expire_handlers_and_requests()
+
         # is it still pending
         for req in self.requests:
             if req.request_id == message_request_id:
                 return RequestStatus.Pending
 
-        # check if it was accepted
-        # TODO remove brute search of all store objects
-        # Currently theres no way to find which object to check the permissions
-        # to find the stored request_id
-        for obj_id in self.store.keys():
-            for _, request_id in self.store[obj_id].read_permissions.items():
-                if request_id == message_request_id:
-                    return RequestStatus.Accepted
-
-            for _, request_id in self.store[obj_id].search_permissions.items():
-                if request_id == message_request_id:
-                    return RequestStatus.Accepted
+        # check if it was accepted, the store indexes the request ids of the
+        # permissions it granted
+        if len(self.store.get_keys_with_request_id(request_id=message_request_id)) > 0:
+            return RequestStatus.Accepted
 
         # must have been rejected
         return RequestStatus.Rejected
@@ -277,63 +288,115 @@ class Domain(Node):
             self.handled_requests[request.id] = time.time()
         return handled
 
-    def clean_up_handlers(self) -> None:
-        # this makes sure handlers with timeout expire
+    def _schedule(self, deadline: float, kind: str, item: Any) -> None:
+        entry = (deadline, next(self._expiry_sequence), kind, item)
+        heapq.heappush(self._expiries, entry)
+
+        # wake up the handlers loop in case it sleeps past the new deadline
+        loop = self._handlers_loop
+        wakeup = self._handlers_wakeup
+        if loop is not None and wakeup is not None and loop.is_running():
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def _handle_request(self, request: RequestMessage) -> bool:
+        # we only want to accept or deny once, until the retry deadline is reached
+        if request.id in self.handled_requests:
+            return False
+
+        for handler in list(self.request_handlers):
+            if self.check_handler(handler=handler, request=request):
+                retry_time = (
+                    self.handled_requests[request.id] + self.handled_request_retry_secs
+                )
+                self._schedule(deadline=retry_time, kind="handled", item=request)
+                return True
+
+        return False
+
+    def expire_handlers_and_requests(self) -> None:
+        """Remove the handlers and requests which timed out and handle again the
+        requests which are still pending after being handled."""
         now = time.time()
-        alive_handlers = []
-        if len(self.request_handlers) > 0:
-            for handler in self.request_handlers:
+        retry: List[RequestMessage] = []
+        with self._handlers_lock:
+            while len(self._expiries) > 0 and self._expiries[0][0] <= now:
+                _, _, kind, item = heapq.heappop(self._expiries)
+                if kind == "handler":
+                    self.request_handlers = [
+                        handler
+                        for handler in self.request_handlers
+                        if handler is not item
+                    ]
+                elif kind == "request":
+                    self.requests = [req for req in self.requests if req is not item]
+                elif kind == "handled":
+                    handle_time = self.handled_requests.get(item.id, None)
+                    if (
+                        handle_time is not None
+                        and now - handle_time >= self.handled_request_retry_secs
+                    ):
+                        del self.handled_requests[item.id]
+                        retry.append(item)
+
+            for request in retry:
+                if any(req is request for req in self.requests):
+                    self._handle_request(request=request)
+
+    def request_arrived(self, request: RequestMessage) -> None:
+        """Schedule the expiry of a request added to the requests and check it
+        against the handlers."""
+        try:
+            with self._handlers_lock:
+                self.expire_handlers_and_requests()
+                if request.timeout_secs is not None and request.timeout_secs > -1:
+                    if request.arrival_time is None:
+                        critical(f"HANDLER Request has no arrival time. {request.id}")
+                        request.set_arrival_time(arrival_time=time.time())
+                    arrival_time = getattr(request, "arrival_time", time.time())
+                    self._schedule(
+                        deadline=arrival_time + request.timeout_secs,
+                        kind="request",
+                        item=request,
+                    )
+                self._handle_request(request=request)
+        except Exception as excp2:
+            traceback(excp2)
+
+    def request_handler_added(self, handler: Dict[Union[str, String], Any]) -> None:
+        """Schedule the expiry of a handler added to the request handlers and check
+        the pending requests against it."""
+        try:
+            with self._handlers_lock:
+                self.expire_handlers_and_requests()
                 timeout_secs = handler.get("timeout_secs", -1)
                 if timeout_secs != -1:
                     created_time = handler.get("created_time", 0)
-                    if now - created_time > timeout_secs:
-                        continue
-                alive_handlers.append(handler)
-        self.request_handlers = alive_handlers
-
-    def clean_up_requests(self) -> None:
-        # this allows a request to be re-handled if the handler somehow failed
-        now = time.time()
-        processing_wait_secs = 5
-        reqs_to_remove = []
-        for req in self.handled_requests.keys():
-            handle_time = self.handled_requests[req]
-            if now - handle_time > processing_wait_secs:
-                reqs_to_remove.append(req)
-
-        for req in reqs_to_remove:
-            self.handled_requests.__delitem__(req)
-
-        alive_requests: List[RequestMessage] = []
-        for request in self.requests:
-            if request.timeout_secs is not None and request.timeout_secs > -1:
-                if request.arrival_time is None:
-                    critical(f"HANDLER Request has no arrival time. {request.id}")
-                    request.set_arrival_time(arrival_time=time.time())
-                arrival_time = getattr(request, "arrival_time", float(now))
-                if now - arrival_time > request.timeout_secs:
-                    # this request has expired
-                    continue
-            alive_requests.append(request)
-
-        self.requests = alive_requests
+                    self._schedule(
+                        deadline=created_time + timeout_secs,
+                        kind="handler",
+                        item=handler,
+                    )
+                for request in list(self.requests):
+                    self._handle_request(request=request)
+        except Exception as excp2:
+            traceback(excp2)
 
     async def run_handlers(self) -> None:
+        # the handlers run when a request arrives or a handler is added, this loop
+        # only wakes up at the next deadline to expire handlers and requests
+        self._handlers_loop = asyncio.get_event_loop()
+        self._handlers_wakeup = asyncio.Event()
         while True:
-            await asyncio.sleep(0.01)
             try:
-                self.clean_up_handlers()
-                self.clean_up_requests()
-                if len(self.request_handlers) > 0:
-                    for request in self.requests:
-                        # check if we have previously already handled this in an earlier iter
-                        if request.id not in self.handled_requests:
-                            for handler in self.request_handlers:
-                                handled = self.check_handler(
-                                    handler=handler, request=request
-                                )
-                                if handled:
-                                    # we handled the request so we can exit the loop
-                                    break
+                self.expire_handlers_and_requests()
             except Exception as excp2:
                 traceback(excp2)
+
+            timeout: Optional[float] = None
+            if len(self._expiries) > 0:
+                timeout = max(0.0, self._expiries[0][0] - time.time())
+            try:
+                await asyncio.wait_for(self._handlers_wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._handlers_wakeup.clear()
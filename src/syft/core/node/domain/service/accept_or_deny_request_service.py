@@ -140,9 +140,9 @@ class AcceptOrDenyRequestService(ImmediateNodeServiceWithoutReply):
                 if request_id == req.id:
                     # you must be a root user to accept a request
                     if verify_key == node.root_verify_key:
-                        node.store[req.object_id].read_permissions[
-                            req.requester_verify_key
-                        ] = req.id
+                        obj = node.store[req.object_id]
+                        obj.read_permissions[req.requester_verify_key] = req.id
+                        node.store[req.object_id] = obj
                         node.requests.remove(req)
 
                         debug(f"> Accepting Request:{request_id} {request_id.emoji()}")
@@ -326,6 +326,11 @@ class UpdateRequestHandlerService(ImmediateNodeServiceWithoutReply):
                     debug(f"> Removing a Request Handler with: {msg.handler}")
 
                 setattr(node, "request_handlers", replacement_handlers)
+
+                # the pending requests are checked as soon as a handler is added
+                request_handler_added = getattr(node, "request_handler_added", None)
+                if msg.keep and request_handler_added is not None:
+                    request_handler_added(handler=msg.handler)
                 debug(f"> Finished Updating Request Handlers with: {existing_handlers}")
             else:
                 error(f"> Node has no Request Handlers attribute: {type(node)}")
@@ -222,3 +222,8 @@ class RequestService(ImmediateNodeServiceWithoutReply):
         msg.object_tags.extend(node.store[msg.object_id]._tags)
 
         node.requests.append(msg)
+
+        # the handlers of a domain are checked as soon as the request arrives
+        request_arrived = getattr(node, "request_arrived", None)
+        if request_arrived is not None:
+            request_arrived(request=msg)
@@ -0,0 +1,378 @@
+"""
+A CompiledPlan executes the actions of a Plan without going through the store of
+the node for every intermediate result.
+
+The callables of the actions are resolved in the AST of the node once, and every
+object the plan reads or writes gets a slot in a list of registers. A call loads
+the inputs of the plan, and the objects it reads from the store, into their slots,
+runs the actions on the registers and only writes the declared outputs back to the
+store. The slots of the intermediate results are cleared after their last use, and
+reused by the next results.
+"""
+# stdlib
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TYPE_CHECKING
+from typing import Tuple
+
+# third party
+from nacl.signing import VerifyKey
+import numpy as np
+
+# syft relative
+from ... import lib
+from ...logger import traceback_and_raise
+from ..common.uid import UID
+from ..node.abstract.node import AbstractNode
+from ..node.common.action.common import Action
+from ..node.common.action.function_or_constructor_action import (
+    RunFunctionOrConstructorAction,
+)
+from ..node.common.action.get_or_set_property_action import GetOrSetPropertyAction
+from ..node.common.action.get_or_set_property_action import PropertyActions
+from ..node.common.action.run_class_method_action import RunClassMethodAction
+from ..node.common.action.save_object_action import SaveObjectAction
+from ..pointer.pointer import Pointer
+from ..store.storeable_object import StorableObject
+
+if TYPE_CHECKING:
+    # syft relative
+    from .plan import Plan
+
+Permissions = Dict[VerifyKey, Optional[UID]]
+Tags = List[List[str]]
+Step = Callable[[List[Any], Tags, AbstractNode, VerifyKey, Permissions], None]
+
+# nested plans resolve their inputs from the store
+PLAN_CALL_PATH = "syft.core.plan.Plan.__call__"
+
+
+def intersect_keys(left: Optional[Permissions], right: Permissions) -> Permissions:
+    if left is None:
+        return right
+    return {k: left[k] for k in left.keys() & right.keys()}
+
+
+def inherit_slot_tags(
+    tags: Tags, out: int, path: str, self_slot: Optional[int], slots: List[int]
+) -> None:
+    """inherit_tags on the tags of the registers"""
+    inherited = [] if self_slot is None else list(tags[self_slot])
+    for slot in slots:
+        inherited.extend([tag for tag in tags[slot] if tag not in inherited])
+    # only generate new tags if the result actually inherit some tags.
+    if inherited:
+        inherited.append(path.split(".")[-1])
+    tags[out] = inherited
+
+
+def wrap_result(result: Any, id_at_location: UID) -> Any:
+    """Give the result of an action the id it would have in the store"""
+    if isinstance(result, np.generic):
+        # TODO: add numpy support https://github.com/OpenMined/PySyft/issues/5164
+        result = result.item()
+
+    if lib.python.primitive_factory.isprimitive(value=result):
+        return lib.python.primitive_factory.PrimitiveFactory.generate_primitive(
+            value=result, id=id_at_location
+        )
+
+    if hasattr(result, "id"):
+        try:
+            if hasattr(result, "_id"):
+                result._id = id_at_location
+            else:
+                result.id = id_at_location
+        except AttributeError as e:
+            traceback_and_raise(
+                Exception(f"Unable to set id on result {type(result)}. {e}")
+            )
+    return result
+
+
+class CompiledPlan:
+    """The actions of a Plan compiled for a node, see Plan.compile"""
+
+    def __init__(self, plan: "Plan", node: AbstractNode) -> None:
+        self.node = node
+        # the slots of the live objects
+        self.slots: Dict[UID, int] = {}
+        self.n_registers = 0
+        self.free_slots: List[int] = []
+        self.input_slots: Dict[str, int] = {}
+        # objects read from the store without being an input of the plan
+        self.store_slots: Dict[UID, int] = {}
+        # the slots of the objects of the store changed in place by the plan
+        self.mutated_slots: Set[int] = set()
+        # the slots which hold the objects loaded at the start of the call
+        self.loaded_slots: Set[int] = set()
+        self.has_constants = False
+
+        for name, pointer in plan.inputs.items():
+            self.input_slots[name] = self._slot(pointer.id_at_location, reuse=False)
+            self.loaded_slots.add(self.input_slots[name])
+
+        free_after = plan.free_after
+        if len(free_after) != len(plan.actions):
+            free_after = plan.find_dead_intermediates()
+        self.steps: List[Step] = []
+        self.dead_slots: List[List[int]] = []
+        for action, dead_ids in zip(plan.actions, free_after):
+            self.steps.append(self._compile(action))
+            self.dead_slots.append([self._free(uid) for uid in dead_ids])
+        self.output_slots: List[Tuple[UID, int]] = [
+            (output.id_at_location, self._read(output)) for output in plan.outputs
+        ]
+
+    def _slot(self, id_at_location: UID, reuse: bool = True) -> int:
+        if id_at_location not in self.slots:
+            if reuse and self.free_slots:
+                self.slots[id_at_location] = self.free_slots.pop()
+            else:
+                self.slots[id_at_location] = self.n_registers
+                self.n_registers += 1
+        return self.slots[id_at_location]
+
+    def _free(self, id_at_location: UID) -> int:
+        slot = self.slots.pop(id_at_location)
+        self.free_slots.append(slot)
+        return slot
+
+    def _read(self, pointer: Pointer) -> int:
+        id_at_location = pointer.id_at_location
+        if id_at_location not in self.slots:
+            # loaded when the call starts, so a register freed by an earlier
+            # action would be overwritten before the object is read
+            self.store_slots[id_at_location] = self._slot(id_at_location, reuse=False)
+            self.loaded_slots.add(self.store_slots[id_at_location])
+        return self.slots[id_at_location]
+
+    def _write(self, id_at_location: UID) -> int:
+        slot = self._slot(id_at_location)
+        self.loaded_slots.discard(slot)
+        return slot
+
+    def _compile(self, action: Action) -> Step:
+        if isinstance(action, RunClassMethodAction) and action.path != PLAN_CALL_PATH:
+            return self._compile_method(action)
+        if isinstance(action, RunFunctionOrConstructorAction):
+            return self._compile_function(action)
+        if (
+            isinstance(action, GetOrSetPropertyAction)
+            and action.action != PropertyActions.DEL
+        ):
+            return self._compile_property(action)
+        if isinstance(action, SaveObjectAction):
+            return self._compile_save(action)
+        return self._compile_fallback(action)
+
+    def _compile_method(self, action: RunClassMethodAction) -> Step:
+        method = self.node.lib_ast(action.path)
+        method_name = action.path.split(".")[-1]
+        args = [self._read(arg) for arg in action.args]
+        kwargs = {k: self._read(v) for k, v in action.kwargs.items()}
+        self_slot = None if action.is_static else self._read(action._self)
+        tag_slots = args + list(kwargs.values())
+        path = action.path
+        if (
+            self_slot is not None
+            and RunClassMethodAction.is_mutating(action.path)
+            and self_slot in self.loaded_slots
+        ):
+            self.mutated_slots.add(self_slot)
+        id_at_location = action.id_at_location
+        out = self._write(id_at_location)
+
+        def step(
+            registers: List[Any],
+            tags: Tags,
+            node: AbstractNode,
+            verify_key: VerifyKey,
+            permissions: Permissions,
+        ) -> None:
+            (upcasted_args, upcasted_kwargs,) = lib.python.util.upcast_args_and_kwargs(
+                [registers[i] for i in args],
+                {k: registers[i] for k, i in kwargs.items()},
+            )
+            if self_slot is None:
+                result = method(*upcasted_args, **upcasted_kwargs)
+            else:
+                # the method of the object itself, like RunClassMethodAction
+                target_method = getattr(registers[self_slot], method_name)
+                result = target_method(*upcasted_args, **upcasted_kwargs)
+            registers[out] = wrap_result(result, id_at_location)
+            inherit_slot_tags(tags, out, path, self_slot, tag_slots)
+
+        return step
+
+    def _compile_function(self, action: RunFunctionOrConstructorAction) -> Step:
+        method = self.node.lib_ast(action.path)
+        args = [self._read(arg) for arg in action.args]
+        kwargs = {k: self._read(v) for k, v in action.kwargs.items()}
+        tag_slots = args + list(kwargs.values())
+        path = action.path
+        id_at_location = action.id_at_location
+        out = self._write(id_at_location)
+
+        def step(
+            registers: List[Any],
+            tags: Tags,
+            node: AbstractNode,
+            verify_key: VerifyKey,
+            permissions: Permissions,
+        ) -> None:
+            (upcasted_args, upcasted_kwargs,) = lib.python.util.upcast_args_and_kwargs(
+                [registers[i] for i in args],
+                {k: registers[i] for k, i in kwargs.items()},
+            )
+            result = method(*upcasted_args, **upcasted_kwargs)
+            registers[out] = wrap_result(result, id_at_location)
+            inherit_slot_tags(tags, out, path, None, tag_slots)
+
+        return step
+
+    def _compile_property(self, action: GetOrSetPropertyAction) -> Step:
+        prop = self.node.lib_ast.query(action.path).object_ref
+        if not inspect.isdatadescriptor(prop):
+            traceback_and_raise(ValueError(f"{prop} not an actual property!"))
+        accessor = (
+            prop.__set__ if action.action == PropertyActions.SET else prop.__get__
+        )
+        args = [self._read(arg) for arg in action.args]
+        kwargs = {k: self._read(v) for k, v in action.kwargs.items()}
+        self_slot = self._read(action._self)
+        if action.action == PropertyActions.SET and self_slot in self.loaded_slots:
+            self.mutated_slots.add(self_slot)
+        # like GetOrSetPropertyAction, only the result of a GET inherits tags
+        is_get = action.action == PropertyActions.GET
+        tag_slots = args + list(kwargs.values())
+        path = action.path
+        id_at_location = action.id_at_location
+        out = self._write(id_at_location)
+
+        def step(
+            registers: List[Any],
+            tags: Tags,
+            node: AbstractNode,
+            verify_key: VerifyKey,
+            permissions: Permissions,
+        ) -> None:
+            (upcasted_args, upcasted_kwargs,) = lib.python.util.upcast_args_and_kwargs(
+                [registers[i] for i in args],
+                {k: registers[i] for k, i in kwargs.items()},
+            )
+            result = accessor(registers[self_slot], *upcasted_args, **upcasted_kwargs)
+            registers[out] = wrap_result(result, id_at_location)
+            if is_get:
+                inherit_slot_tags(tags, out, path, self_slot, tag_slots)
+            else:
+                tags[out] = []
+
+        return step
+
+    def _compile_save(self, action: SaveObjectAction) -> Step:
+        self.has_constants = True
+        obj = action.obj
+        out = self._write(obj.id)
+
+        def step(
+            registers: List[Any],
+            tags: Tags,
+            node: AbstractNode,
+            verify_key: VerifyKey,
+            permissions: Permissions,
+        ) -> None:
+            registers[out] = obj.data
+            tags[out] = list(obj.tags) if obj.tags else []
+
+        return step
+
+    def _compile_fallback(self, action: Action) -> Step:
+        """Actions that can't be compiled are executed against the store, so the
+        inputs and the intermediate results before them are written to the store"""
+        spilled = [
+            (uid, slot)
+            for uid, slot in self.slots.items()
+            if uid not in self.store_slots or slot not in self.loaded_slots
+        ]
+        id_at_location = getattr(action, "id_at_location", None)
+        out = None if id_at_location is None else self._write(id_at_location)
+
+        def step(
+            registers: List[Any],
+            tags: Tags,
+            node: AbstractNode,
+            verify_key: VerifyKey,
+            permissions: Permissions,
+        ) -> None:
+            for uid, slot in spilled:
+                node.store[uid] = StorableObject(
+                    id=uid,
+                    data=registers[slot],
+                    read_permissions=dict(permissions),
+                    tags=tags[slot],
+                )
+            action.execute_action(node, verify_key)
+            if out is not None:
+                result = node.store[id_at_location]
+                registers[out] = result.data
+                tags[out] = list(result.tags) if result.tags else []
+
+        return step
+
+    def __call__(
+        self, node: AbstractNode, verify_key: VerifyKey, **kwargs: Any
+    ) -> List[Any]:
+        registers: List[Any] = [None] * self.n_registers
+        tags: Tags = [[] for _ in range(self.n_registers)]
+        loaded: Dict[int, Tuple[UID, StorableObject]] = {}
+        permissions: Optional[Permissions] = None
+
+        for name, slot in self.input_slots.items():
+            pointer = kwargs[name]
+            if not issubclass(type(pointer), Pointer):
+                traceback_and_raise(
+                    f"Calling Plan without a Pointer. {name} == {type(pointer)} "
+                )
+            loaded[slot] = (pointer.id_at_location, node.store[pointer.id_at_location])
+        for id_at_location, slot in self.store_slots.items():
+            loaded[slot] = (id_at_location, node.store[id_at_location])
+
+        # the results can be read by whoever can read all the objects they come from
+        for slot, (_, obj) in loaded.items():
+            registers[slot] = obj.data
+            tags[slot] = list(obj.tags) if obj.tags else []
+            permissions = intersect_keys(permissions, obj.read_permissions)
+        if self.has_constants:
+            permissions = intersect_keys(
+                permissions, {node.verify_key: node.id, verify_key: None}
+            )
+        if permissions is None:
+            permissions = {}
+
+        for step, dead_slots in zip(self.steps, self.dead_slots):
+            step(registers, tags, node, verify_key, permissions)
+            for slot in dead_slots:
+                registers[slot] = None
+                tags[slot] = []
+
+        for slot in self.mutated_slots:
+            id_at_location, obj = loaded[slot]
+            obj.read_permissions = intersect_keys(obj.read_permissions, permissions)
+            node.store[id_at_location] = obj
+
+        outputs = []
+        for id_at_location, slot in self.output_slots:
+            node.store[id_at_location] = StorableObject(
+                id=id_at_location,
+                data=registers[slot],
+                read_permissions=dict(permissions),
+                tags=tags[slot],
+            )
+            outputs.append(registers[slot])
+        return outputs
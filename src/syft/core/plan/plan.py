@@ -10,6 +10,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Union
 
 # third party
@@ -20,9 +21,11 @@ from nacl.signing import VerifyKey
 from ... import serialize
 from ...logger import traceback_and_raise
 from ...proto.core.node.common.action.action_pb2 import Action as Action_PB
+from ...proto.core.plan.plan_pb2 import FreeIds as FreeIds_PB
 from ...proto.core.plan.plan_pb2 import Plan as Plan_PB
 from ..common.object import Serializable
 from ..common.serde.serializable import bind_protobuf
+from ..common.uid import UID
 from ..node.abstract.node import AbstractNode
 from ..node.common import client
 from ..node.common.action.common import Action
@@ -30,9 +33,35 @@ from ..node.common.util import listify
 from ..pointer.pointer import Pointer
 from ..store.storeable_object import StorableObject
 
+if TYPE_CHECKING:
+    # syft relative
+    from .compiled_plan import CompiledPlan
+
 CAMEL_TO_SNAKE_PAT = re.compile(r"(?<!^)(?=[A-Z])")
 
 
+def _pointers(value: Any) -> List[Pointer]:
+    """The pointers in an attribute of an action"""
+    if isinstance(value, Pointer):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [p for v in value for p in _pointers(v)]
+    if isinstance(value, dict):
+        return [p for v in value.values() for p in _pointers(v)]
+    return []
+
+
+def _read_ids(action: Action) -> List[UID]:
+    return [p.id_at_location for v in vars(action).values() for p in _pointers(v)]
+
+
+def _written_id(action: Action) -> Optional[UID]:
+    obj = getattr(action, "obj", None)
+    if isinstance(obj, StorableObject):
+        return obj.id
+    return getattr(action, "id_at_location", None)
+
+
 @bind_protobuf
 class Plan(Serializable):
     """
@@ -41,6 +70,8 @@ class Plan(Serializable):
     Attributes:
         actions: list of actions
         inputs: Pointers to the inputs. Defaults to None.
+        free_after: the ids of the intermediate results deleted from the store after
+            each action. Defaults to None.
     """
 
     def __init__(
@@ -50,6 +81,8 @@ class Plan(Serializable):
         outputs: Union[Pointer, List[Pointer], None] = None,
         code: Optional[str] = None,
         max_calls: Optional[int] = None,
+        compiled: bool = False,
+        free_after: Optional[List[List[UID]]] = None,
     ):
         """
         Initialize the Plan with actions, inputs and outputs
@@ -60,6 +93,9 @@ class Plan(Serializable):
         self.code = code
         self.max_calls = max_calls
         self.n_calls = 0
+        self.compiled = compiled
+        self.free_after: List[List[UID]] = free_after if free_after is not None else []
+        self._compiled_plan: Optional["CompiledPlan"] = None
 
     def __call__(
         self,
@@ -90,6 +126,9 @@ class Plan(Serializable):
         if node is None:
             return self.execute_locally(**kwargs)
 
+        if self.compiled:
+            return self._get_compiled_plan(node)(node, verify_key, **kwargs)
+
         new_inputs: Dict[str, Pointer] = {}
         for k, current_input in self.inputs.items():
             new_input = kwargs[k]
@@ -105,8 +144,14 @@ class Plan(Serializable):
             new_inputs[k] = new_input  # type: ignore
         self.inputs = new_inputs
 
-        for a in self.actions:
+        # plans which are not built don't delete their intermediate results
+        free_after = self.free_after
+        if len(free_after) != len(self.actions):
+            free_after = [[]] * len(self.actions)
+        for a, dead_ids in zip(self.actions, free_after):
             a.execute_action(node, verify_key)
+            for id_at_location in dead_ids:
+                node.store.delete(key=id_at_location)
 
         if len(self.outputs):
             resolved_outputs = []
@@ -117,6 +162,57 @@ class Plan(Serializable):
         else:
             return []
 
+    def find_dead_intermediates(self) -> List[List[UID]]:
+        """Find the intermediate results of the plan that no later action reads.
+
+        An intermediate result is written by an action, it's not an input or an
+        output of the plan, or an object of the store the plan reads before writing.
+
+        Returns:
+            List[List[UID]]: the ids of the intermediate results whose last use is
+                each action, see free_after
+        """
+        keep = {p.id_at_location for p in self.inputs.values()}
+        keep.update(p.id_at_location for p in self.outputs)
+        written = set()
+        last_use: Dict[UID, int] = {}
+        for i, action in enumerate(self.actions):
+            for id_at_location in _read_ids(action):
+                if id_at_location not in written:
+                    keep.add(id_at_location)
+                last_use[id_at_location] = i
+            written_id = _written_id(action)
+            if written_id is not None:
+                written.add(written_id)
+                last_use[written_id] = i
+
+        free_after: List[List[UID]] = [[] for _ in self.actions]
+        for id_at_location, i in last_use.items():
+            if id_at_location in written and id_at_location not in keep:
+                free_after[i].append(id_at_location)
+        return free_after
+
+    def compile(self) -> "Plan":
+        """Execute the plan compiled, the nodes calling it resolve its actions once
+        and run them without storing the intermediate results. Only the outputs of
+        the plan are written to the store of the node.
+
+        Returns:
+            Plan: the plan itself, which stays compiled when it is sent
+        """
+        self.compiled = True
+        self._compiled_plan = None
+        return self
+
+    def _get_compiled_plan(self, node: AbstractNode) -> "CompiledPlan":
+        # prevent circular dependency
+        # syft relative
+        from .compiled_plan import CompiledPlan
+
+        if self._compiled_plan is None or self._compiled_plan.node is not node:
+            self._compiled_plan = CompiledPlan(plan=self, node=node)
+        return self._compiled_plan
+
     def __repr__(self) -> str:
         obj_str = "Plan"
 
@@ -207,7 +303,16 @@ class Plan(Serializable):
         inputs_pb = {k: v._object2proto() for k, v in self.inputs.items()}
         outputs_pb = [out._object2proto() for out in self.outputs]
 
-        return Plan_PB(actions=actions_pb, inputs=inputs_pb, outputs=outputs_pb)
+        return Plan_PB(
+            actions=actions_pb,
+            inputs=inputs_pb,
+            outputs=outputs_pb,
+            compiled=self.compiled,
+            free_after=[
+                FreeIds_PB(ids=[serialize(uid) for uid in ids])
+                for ids in self.free_after
+            ],
+        )
 
     @staticmethod
     def _proto2object(proto: Plan_PB) -> "Plan":
@@ -239,4 +344,14 @@ class Plan(Serializable):
             Pointer._proto2object(pointer_proto) for pointer_proto in proto.outputs
         ]
 
-        return Plan(actions=actions, inputs=inputs, outputs=outputs)
+        free_after = [
+            [UID._proto2object(uid) for uid in ids.ids] for ids in proto.free_after
+        ]
+
+        return Plan(
+            actions=actions,
+            inputs=inputs,
+            outputs=outputs,
+            compiled=proto.compiled,
+            free_after=free_after,
+        )
@@ -38,6 +38,8 @@ def make_plan(func: Callable) -> Plan:
     res = func(**inputs)
     vm.stop_recording()
     plan = Plan(actions=vm.recorded_actions, inputs=inputs, outputs=res, code=code)
+    # the intermediate results are deleted from the store once they are used
+    plan.free_after = plan.find_dead_intermediates()
     # cleanup
     vm.recorded_actions = []
     return plan
@@ -61,6 +63,7 @@ class PlanBuilder:
         res = self.forward(**inputs)
         self.vm.stop_recording()
         plan: Plan = Plan(actions=self.vm.recorded_actions, inputs=inputs, outputs=res)
+        plan.free_after = plan.find_dead_intermediates()
         self.vm.recorded_actions = []
         return plan
 
@@ -424,9 +424,6 @@ class Pointer(AbstractPointer):
 
         self.client.send_immediate_msg_without_reply(msg=msg)
 
-        # wait long enough for it to arrive and trigger a handler
-        time.sleep(0.1)
-
         if not block:
             return None
         else:
@@ -447,43 +444,38 @@ class Pointer(AbstractPointer):
             status = None
             start = time.time()
 
-            last_check: float = 0.0
+            # the handlers of the domain run as soon as the request arrives so the
+            # status is checked straight away, and then less and less often
+            wait_secs = 0.01
             while True:
-                now = time.time()
                 try:
-                    # won't run on the first pass because status is None which allows
-                    # for remote request handlers to auto respond before timeout
-                    if now - start > timeout_secs:
+                    status_msg = RequestAnswerMessage(
+                        request_id=msg.id,
+                        address=self.client.address,
+                        reply_to=self.client.address,
+                    )
+                    response = self.client.send_immediate_msg_with_reply(msg=status_msg)
+                    status = response.status
+                    if response.status != RequestStatus.Pending:
+                        # accepted or rejected lets exit
+                        status_text = "REJECTED"
+                        if status == RequestStatus.Accepted:
+                            status_text = "ACCEPTED"
+                        log = f" {status_text}"
+                        debug(log)
+                        return status
+
+                    elapsed = time.time() - start
+                    if elapsed > timeout_secs:
                         log = (
                             f"\n> Blocking Request Timeout after {timeout_secs} seconds"
                         )
                         debug(log)
                         return status
 
-                    # only check once every second
-                    if now - last_check > 1:
-                        last_check = now
-                        debug(f"> Sending another Request Message {now - start}")
-                        status_msg = RequestAnswerMessage(
-                            request_id=msg.id,
-                            address=self.client.address,
-                            reply_to=self.client.address,
-                        )
-                        response = self.client.send_immediate_msg_with_reply(
-                            msg=status_msg
-                        )
-                        status = response.status
-                        if response.status == RequestStatus.Pending:
-                            time.sleep(0.1)
-                            continue
-                        else:
-                            # accepted or rejected lets exit
-                            status_text = "REJECTED"
-                            if status == RequestStatus.Accepted:
-                                status_text = "ACCEPTED"
-                            log = f" {status_text}"
-                            debug(log)
-                            return status
+                    debug(f"> Sending another Request Message {elapsed}")
+                    time.sleep(min(wait_secs, max(0.0, timeout_secs - elapsed)))
+                    wait_secs = min(wait_secs * 2, 1.0)
                 except Exception as e:
                     error(f"Exception while running blocking request. {e}")
                     # escape the while loop
@@ -3,5 +3,6 @@ from .dataset import Dataset
 from .store_disk import DiskObjectStore
 from .store_interface import ObjectStore
 from .store_memory import MemoryStore
+from .store_tiered import TieredStore
 
-__all__ = ["DiskObjectStore", "ObjectStore", "MemoryStore", "Dataset"]
+__all__ = ["DiskObjectStore", "ObjectStore", "MemoryStore", "TieredStore", "Dataset"]
@@ -1,12 +1,21 @@
 # stdlib
+from collections import OrderedDict
 from pathlib import Path
+import sqlite3
 import tempfile
-from typing import Iterable
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
+from typing import Union
+import weakref
 
 # third party
-from sqlitedict import SqliteDict
-from typing_extensions import Final
+from nacl.signing import VerifyKey
 
 # syft relative
 from ... import serialize
@@ -14,85 +23,378 @@ from ...logger import critical
 from ...logger import trace
 from ...logger import traceback_and_raise
 from ...util import validate_type
+from ..common.group import VERIFYALL
 from ..common.serde.deserialize import _deserialize
 from ..common.uid import UID
+from .store_index import type_name
+from .store_index import type_names
 from .store_interface import ObjectStore
 from .storeable_object import StorableObject
 
+# rows read from sqlite at once when iterating over the store
+PAGE_SIZE = 1000
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS objects "
+    + "(key TEXT PRIMARY KEY, object_type TEXT, description TEXT, blob BLOB)",
+    # every class in the mro of the data, so isinstance checks become lookups
+    "CREATE TABLE IF NOT EXISTS types (key TEXT, type_name TEXT)",
+    "CREATE INDEX IF NOT EXISTS types_by_name ON types (type_name)",
+    "CREATE INDEX IF NOT EXISTS types_by_key ON types (key)",
+    "CREATE TABLE IF NOT EXISTS tags (key TEXT, tag TEXT)",
+    "CREATE INDEX IF NOT EXISTS tags_by_tag ON tags (tag)",
+    "CREATE INDEX IF NOT EXISTS tags_by_key ON tags (key)",
+    # kind is either "read" or "search"
+    "CREATE TABLE IF NOT EXISTS permissions "
+    + "(key TEXT, kind TEXT, verify_key TEXT, request_id TEXT)",
+    "CREATE INDEX IF NOT EXISTS permissions_by_verify_key "
+    + "ON permissions (kind, verify_key)",
+    "CREATE INDEX IF NOT EXISTS permissions_by_request_id ON permissions (request_id)",
+    "CREATE INDEX IF NOT EXISTS permissions_by_key ON permissions (key)",
+]
+
+
+class DiskRow(NamedTuple):
+    """A serialized StorableObject together with the metadata kept next to it"""
+
+    key: str
+    object_type: str
+    description: str
+    blob: bytes
+    type_names: List[str]
+    tags: List[str]
+    permissions: List[Tuple[str, str, str]]
+
+
+def verify_key_name(verify_key: Any) -> str:
+    return "all" if verify_key is VERIFYALL else bytes(verify_key).hex()
+
+
+def request_id_name(request_id: Any) -> str:
+    return str(request_id.value) if isinstance(request_id, UID) else str(request_id)
+
+
+def _permission_rows(obj: StorableObject) -> List[Tuple[str, str, str]]:
+    rows = []
+    for kind, permissions in [
+        ("read", obj.read_permissions),
+        ("search", obj.search_permissions),
+    ]:
+        for verify_key, request_id in permissions.items():
+            rows.append(
+                (kind, verify_key_name(verify_key), request_id_name(request_id))
+            )
+    return rows
+
+
+def _write_pending(
+    conn: sqlite3.Connection,
+    lock: threading.RLock,
+    pending: "OrderedDict[str, Optional[DiskRow]]",
+) -> None:
+    # module level so the weakref finalizer of a store can call it
+    with lock:
+        if len(pending) == 0:
+            return
+        rows = list(pending.items())
+        pending.clear()
+
+        keys = [(key,) for key, _ in rows]
+        written = [row for _, row in rows if row is not None]
+        with conn:
+            conn.executemany("DELETE FROM types WHERE key = ?", keys)
+            conn.executemany("DELETE FROM tags WHERE key = ?", keys)
+            conn.executemany("DELETE FROM permissions WHERE key = ?", keys)
+            conn.executemany(
+                "DELETE FROM objects WHERE key = ?",
+                [(key,) for key, row in rows if row is None],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?)",
+                [
+                    (row.key, row.object_type, row.description, row.blob)
+                    for row in written
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO types VALUES (?, ?)",
+                [(row.key, name) for row in written for name in row.type_names],
+            )
+            conn.executemany(
+                "INSERT INTO tags VALUES (?, ?)",
+                [(row.key, tag) for row in written for tag in row.tags],
+            )
+            conn.executemany(
+                "INSERT INTO permissions VALUES (?, ?, ?, ?)",
+                [(row.key, *perm) for row in written for perm in row.permissions],
+            )
+
 
-# NOTE: This should not be used yet, this API will be done after the pygrid integration.
 class DiskObjectStore(ObjectStore):
-    def __init__(self, db_path: Optional[str] = None):
+    """
+    Class that implements an ObjectStore backed by a sqlite database.
+
+    Serialized objects are kept in one table and their data types, tags and
+    permissions in indexed tables next to it, so filtering the store never has to
+    deserialize objects which do not match. Writes are queued and committed in
+    groups of commit_batch_size, and recently used objects are kept decoded in a
+    read cache of at most cache_bytes serialized bytes.
+
+    Objects handed out by the store are shared with the read cache, changes to them
+    have to be written back with __setitem__ to be persisted.
+
+    Attributes:
+        db_path (str): the path of the sqlite database.
+        cache_bytes (int): the budget of the read cache.
+        commit_batch_size (int): the number of queued writes which triggers a commit.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        cache_bytes: int = 64 * 1024 * 1024,
+        commit_batch_size: int = 64,
+    ):
         super().__init__()
 
         if db_path is None:
             db_path = str(Path(f"{tempfile.gettempdir()}") / "test.sqlite")
 
-        self.db: Final = SqliteDict(db_path)
+        self.db_path = db_path
+        self.cache_bytes = cache_bytes
+        self.commit_batch_size = commit_batch_size
         self.search_engine = None
 
-    def get_objects_of_type(self, obj_type: type) -> Iterable[StorableObject]:
-        # TODO: this wont fly long term
-        obj_types = []
-        for value in self.values():
-            if isinstance(value.data, obj_type):
-                obj_types.append(value)
-        return obj_types
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+
+        self._pending: OrderedDict[str, Optional[DiskRow]] = OrderedDict()
+        self._cache: OrderedDict[str, Tuple[StorableObject, int]] = OrderedDict()
+        self._cached_bytes = 0
+
+        # queued writes are committed when the store is garbage collected or the
+        # interpreter exits
+        self._finalizer = weakref.finalize(
+            self, _write_pending, self._conn, self._lock, self._pending
+        )
+
+    def flush(self) -> None:
+        """Commit all queued writes"""
+        _write_pending(conn=self._conn, lock=self._lock, pending=self._pending)
+
+    def close(self) -> None:
+        self._finalizer()
+        self._conn.close()
+
+    def _cache_get(self, key: str) -> Optional[StorableObject]:
+        entry = self._cache.get(key, None)
+        if entry is None:
+            return None
+        self._cache.move_to_end(key)
+        return entry[0]
+
+    def _cache_put(self, key: str, value: StorableObject, size: int) -> None:
+        self._cache_pop(key=key)
+        if size > self.cache_bytes:
+            return
+        self._cache[key] = (value, size)
+        self._cached_bytes += size
+        while self._cached_bytes > self.cache_bytes:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self._cached_bytes -= evicted_size
+
+    def _cache_pop(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._cached_bytes -= entry[1]
+
+    @staticmethod
+    def _decode(blob: bytes) -> StorableObject:
+        return validate_type(_deserialize(blob=blob, from_bytes=True), StorableObject)
+
+    def _load(self, key: str) -> Optional[StorableObject]:
+        with self._lock:
+            value = self._cache_get(key=key)
+            if value is not None:
+                return value
+
+            if key in self._pending:
+                row = self._pending[key]
+                blob = row.blob if row is not None else None
+            else:
+                result = self._conn.execute(
+                    "SELECT blob FROM objects WHERE key = ?", (key,)
+                ).fetchone()
+                blob = result[0] if result is not None else None
+
+            if blob is None:
+                return None
+
+            value = self._decode(blob=blob)
+            self._cache_put(key=key, value=value, size=len(blob))
+            return value
+
+    def _paged(self, sql: str, params: Tuple = ()) -> Iterator[Tuple]:
+        # sql selects the rowid first and takes the last seen rowid and the page
+        # size as its final parameters, the lock is only held for one page
+        self.flush()
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    sql, (*params, last_rowid, PAGE_SIZE)
+                ).fetchall()
+            yield from rows
+            if len(rows) < PAGE_SIZE:
+                return
+            last_rowid = rows[-1][0]
+
+    def _values(self, rows: Iterator[Tuple]) -> Iterator[StorableObject]:
+        # iterating does not fill the read cache so a full scan can't evict it
+        for _, key, blob in rows:
+            with self._lock:
+                value = self._cache_get(key=key)
+            yield value if value is not None else self._decode(blob=blob)
+
+    def get_objects_of_type(self, obj_type: Union[type, str]) -> List[StorableObject]:
+        rows = self._paged(
+            "SELECT objects.rowid, objects.key, objects.blob FROM objects "
+            + "JOIN types ON types.key = objects.key "
+            + "WHERE types.type_name = ? AND objects.rowid > ? "
+            + "ORDER BY objects.rowid LIMIT ?",
+            (type_name(obj_type),),
+        )
+        return list(self._values(rows=rows))
+
+    def _keys_where(self, subquery: str, params: Tuple = ()) -> List[UID]:
+        # subquery selects the keys of the matching objects from a metadata table
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key FROM objects WHERE key IN ({subquery}) ORDER BY rowid",  # nosec
+                params,
+            ).fetchall()
+        return [UID.from_string(key) for key, in rows]
+
+    def get_keys_with_tag(self, tag: str) -> List[UID]:
+        return self._keys_where("SELECT key FROM tags WHERE tag = ?", (tag,))
+
+    def get_keys_of_type(self, obj_type: Union[type, str]) -> List[UID]:
+        return self._keys_where(
+            "SELECT key FROM types WHERE type_name = ?",
+            (type_name(obj_type),),
+        )
+
+    def get_keys_searchable_by(self, verify_key: VerifyKey) -> List[UID]:
+        return self._keys_where(
+            "SELECT key FROM permissions "
+            + "WHERE kind = 'search' AND verify_key IN (?, 'all')",
+            (verify_key_name(verify_key),),
+        )
+
+    def get_keys_readable_by(self, verify_key: VerifyKey) -> List[UID]:
+        return self._keys_where(
+            "SELECT key FROM permissions WHERE kind = 'read' AND verify_key = ?",
+            (verify_key_name(verify_key),),
+        )
+
+    def get_keys_with_request_id(self, request_id: UID) -> List[UID]:
+        return self._keys_where(
+            "SELECT key FROM permissions WHERE request_id = ?",
+            (request_id_name(request_id),),
+        )
 
     def __getitem__(self, key: UID) -> StorableObject:
         try:
-            blob = self.db[str(key.value)]
-            value = validate_type(
-                _deserialize(blob=blob, from_bytes=True), StorableObject
-            )
-            return value
+            value = self._load(key=str(key.value))
         except Exception as e:
             trace(f"{type(self)} get item error {key} {e}")
             traceback_and_raise(e)
 
+        if value is None:
+            trace(f"{type(self)} get item error {key}")
+            traceback_and_raise(KeyError(key))
+        return value
+
     def get_object(self, key: UID) -> Optional[StorableObject]:
-        if str(key.value) in self.db:
-            return self.__getitem__(key)
-        return None
+        return self._load(key=str(key.value))
 
     def __setitem__(self, key: UID, value: StorableObject) -> None:
         try:
-            blob = serialize(value, to_bytes=True)
-            self.db[str(key.value)] = blob
-            self.db.commit(blocking=False)
+            blob = validate_type(serialize(value, to_bytes=True), bytes)
         except Exception as e:
             trace(f"{type(self)} set item error {key} {type(value)} {e}")
             traceback_and_raise(e)
 
+        row = DiskRow(
+            key=str(key.value),
+            object_type=value.object_type,
+            description=value.description if value.description else "",
+            blob=blob,
+            type_names=type_names(value.data),
+            tags=list(value.tags) if value.tags else [],
+            permissions=_permission_rows(obj=value),
+        )
+        with self._lock:
+            self._pending.pop(row.key, None)
+            self._pending[row.key] = row
+            self._cache_put(key=row.key, value=value, size=len(blob))
+            if len(self._pending) >= self.commit_batch_size:
+                self.flush()
+
     def __sizeof__(self) -> int:
-        return self.db.__sizeof__()
+        self.flush()
+        return Path(self.db_path).stat().st_size
 
     def __str__(self) -> str:
-        return str(self.db)
+        return f"{type(self).__name__}({self.db_path})"
 
     def __len__(self) -> int:
-        return self.db.__len__()
-
-    def keys(self) -> Iterable[UID]:
-        key_strings = self.db.keys()
-        return [UID.from_string(key_string) for key_string in key_strings]
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
 
-    def values(self) -> Iterable[StorableObject]:
-        values = []
-        for blob in self.db.values():
-            value = _deserialize(blob=blob, from_bytes=True)
-            values.append(value)
+    def keys(self) -> Iterator[UID]:
+        rows = self._paged(
+            "SELECT rowid, key FROM objects WHERE rowid > ? ORDER BY rowid LIMIT ?"
+        )
+        for _, key in rows:
+            yield UID.from_string(key)
 
-        return values
+    def values(self) -> Iterator[StorableObject]:
+        rows = self._paged(
+            "SELECT rowid, key, blob FROM objects WHERE rowid > ? "
+            + "ORDER BY rowid LIMIT ?"
+        )
+        return self._values(rows=rows)
 
     def __contains__(self, item: UID) -> bool:
-        return str(item.value) in self.db
+        key = str(item.value)
+        with self._lock:
+            if key in self._cache:
+                return True
+            if key in self._pending:
+                return self._pending[key] is not None
+            result = self._conn.execute(
+                "SELECT 1 FROM objects WHERE key = ?", (key,)
+            ).fetchone()
+            return result is not None
 
     def delete(self, key: UID) -> None:
         try:
-            obj = self.get_object(key=key)
-            if obj is not None:
-                del self.db[str(key.value)]
+            if key in self:
+                key_str = str(key.value)
+                with self._lock:
+                    self._cache_pop(key=key_str)
+                    self._pending.pop(key_str, None)
+                    self._pending[key_str] = None
+                    if len(self._pending) >= self.commit_batch_size:
+                        self.flush()
             else:
                 critical(f"{type(self)} delete error {key}.")
         except Exception as e:
@@ -102,4 +404,18 @@ class DiskObjectStore(ObjectStore):
         self.delete(key=key)
 
     def clear(self) -> None:
-        self.db.clear()
+        with self._lock:
+            self._pending.clear()
+            self._cache.clear()
+            self._cached_bytes = 0
+            with self._conn:
+                for table in ["objects", "types", "tags", "permissions"]:
+                    self._conn.execute(f"DELETE FROM {table}")  # nosec
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return the size of the read cache and the number of queued writes"""
+        return {
+            "cached_objects": len(self._cache),
+            "cached_bytes": self._cached_bytes,
+            "pending_writes": len(self._pending),
+        }
@@ -0,0 +1,103 @@
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# third party
+from nacl.signing import VerifyKey
+
+# syft relative
+from ..common.group import VERIFYALL
+from ..common.uid import UID
+from .storeable_object import StorableObject
+
+# the index entries of one object, as (index name, index key) pairs
+IndexEntries = List[Tuple[str, Hashable]]
+
+
+def type_name(obj_type: Union[type, str]) -> str:
+    """The fully qualified name types are indexed by, names are passed through"""
+    if isinstance(obj_type, str):
+        return obj_type
+    return f"{obj_type.__module__}.{obj_type.__qualname__}"
+
+
+def type_names(data: Any) -> List[str]:
+    """Fully qualified names of all classes data is an instance of"""
+    return [type_name(klass) for klass in type(data).__mro__]
+
+
+def index_entries(obj: StorableObject) -> IndexEntries:
+    """Collect the secondary index keys of a StorableObject"""
+    entries: IndexEntries = []
+    entries.extend(("tag", tag) for tag in (obj.tags if obj.tags else []))
+    entries.extend(("type", name) for name in type_names(obj.data))
+    for kind, permissions in [
+        ("read", obj.read_permissions),
+        ("search", obj.search_permissions),
+    ]:
+        for verify_key, request_id in permissions.items():
+            entries.append((kind, verify_key))
+            if isinstance(request_id, UID):
+                entries.append(("request_id", request_id))
+    return entries
+
+
+class StoreIndex:
+    """
+    Secondary indexes from tags, data types, read and search permissions and
+    request ids to the keys of the objects in a store.
+
+    The keys of each index entry are kept in a dict used as an ordered set, so
+    lookups return keys in the order the objects were stored.
+    """
+
+    __slots__ = ["_index", "_entries"]
+
+    def __init__(self) -> None:
+        self._index: Dict[Tuple[str, Hashable], Dict[UID, None]] = {}
+        self._entries: Dict[UID, IndexEntries] = {}
+
+    def add(self, key: UID, obj: StorableObject) -> None:
+        self.remove(key=key)
+        entries = index_entries(obj=obj)
+        self._entries[key] = entries
+        for entry in entries:
+            self._index.setdefault(entry, {})[key] = None
+
+    def remove(self, key: UID) -> None:
+        for entry in self._entries.pop(key, []):
+            keys = self._index.get(entry, None)
+            if keys is None:
+                continue
+            keys.pop(key, None)
+            if len(keys) == 0:
+                del self._index[entry]
+
+    def clear(self) -> None:
+        self._index.clear()
+        self._entries.clear()
+
+    def lookup(self, name: str, value: Any) -> List[UID]:
+        return list(self._index.get((name, value), {}).keys())
+
+    def keys_with_tag(self, tag: str) -> List[UID]:
+        return self.lookup(name="tag", value=tag)
+
+    def keys_of_type(self, obj_type: Union[type, str]) -> List[UID]:
+        return self.lookup(name="type", value=type_name(obj_type))
+
+    def keys_readable_by(self, verify_key: VerifyKey) -> List[UID]:
+        return self.lookup(name="read", value=verify_key)
+
+    def keys_searchable_by(self, verify_key: VerifyKey) -> List[UID]:
+        # objects everyone can search for are included
+        keys = dict.fromkeys(self.lookup(name="search", value=verify_key))
+        keys.update(dict.fromkeys(self.lookup(name="search", value=VERIFYALL)))
+        return list(keys)
+
+    def keys_with_request_id(self, request_id: UID) -> List[UID]:
+        return self.lookup(name="request_id", value=request_id)
@@ -1,8 +1,13 @@
 # stdlib
 from abc import ABC
 from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Type
+from typing import Union
+
+# third party
+from nacl.signing import VerifyKey
 
 # syft relative
 from ...logger import debug
@@ -144,7 +149,72 @@ class ObjectStore(ABC):
     def delete_object(self) -> None:
         traceback_and_raise(NotImplementedError)
 
-    def get_objects_of_type(self, obj_type: Type) -> Iterable[AbstractStorableObject]:
+    def get_objects_of_type(
+        self, obj_type: Union[Type, str]
+    ) -> Iterable[AbstractStorableObject]:
+        traceback_and_raise(NotImplementedError)
+
+    def get_keys_with_tag(self, tag: str) -> List[UID]:
+        """
+        Method to return the keys of the objects carrying a tag, without scanning the store.
+
+        Args:
+            tag (str): the tag to be searched for.
+
+        Returns:
+            List[UID]: the keys of the tagged objects.
+        """
+        traceback_and_raise(NotImplementedError)
+
+    def get_keys_of_type(self, obj_type: Union[Type, str]) -> List[UID]:
+        """
+        Method to return the keys of the objects whose data is an instance of obj_type.
+
+        Args:
+            obj_type (Union[Type, str]): the type to be searched for, or its fully
+            qualified name such as "torch.Tensor".
+
+        Returns:
+            List[UID]: the keys of the matching objects.
+        """
+        traceback_and_raise(NotImplementedError)
+
+    def get_keys_searchable_by(self, verify_key: VerifyKey) -> List[UID]:
+        """
+        Method to return the keys of the objects a verify key is allowed to search for,
+        including the objects everyone is allowed to search for.
+
+        Args:
+            verify_key (VerifyKey): the key of the user searching the store.
+
+        Returns:
+            List[UID]: the keys of the searchable objects.
+        """
+        traceback_and_raise(NotImplementedError)
+
+    def get_keys_readable_by(self, verify_key: VerifyKey) -> List[UID]:
+        """
+        Method to return the keys of the objects a verify key was given read permission on.
+
+        Args:
+            verify_key (VerifyKey): the key of the user reading the store.
+
+        Returns:
+            List[UID]: the keys of the readable objects.
+        """
+        traceback_and_raise(NotImplementedError)
+
+    def get_keys_with_request_id(self, request_id: UID) -> List[UID]:
+        """
+        Method to return the keys of the objects with a read or search permission that was
+        granted by accepting the request with request_id.
+
+        Args:
+            request_id (UID): the id of the accepted request.
+
+        Returns:
+            List[UID]: the keys of the objects the request was accepted on.
+        """
         traceback_and_raise(NotImplementedError)
 
     @property
@@ -2,17 +2,21 @@
 from collections import OrderedDict
 from typing import Iterable
 from typing import KeysView
+from typing import List
 from typing import Optional
+from typing import Union
 from typing import ValuesView
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
+from nacl.signing import VerifyKey
 
 # syft relative
 from . import ObjectStore
 from ...logger import critical
 from ...logger import traceback_and_raise
 from ..common.uid import UID
+from .store_index import StoreIndex
 from .storeable_object import StorableObject
 
 
@@ -22,23 +26,42 @@ class MemoryStore(ObjectStore):
 
     Attributes:
         _objects (dict): the dict that backs the storage of the MemoryStorage.
+        _index (StoreIndex): the secondary indexes by tag, type, permission and request id.
         _search_engine (ObjectSearchEngine): the objects that handles searching by using tags or
         description.
     """
 
-    __slots__ = ["_objects", "_search_engine"]
+    __slots__ = ["_objects", "_index", "_search_engine"]
 
     def __init__(self) -> None:
         super().__init__()
         self._objects: OrderedDict[UID, StorableObject] = OrderedDict()
+        self._index = StoreIndex()
         self._search_engine = None
         self.post_init()
 
     def get_object(self, key: UID) -> Optional[StorableObject]:
         return self._objects.get(key, None)
 
-    def get_objects_of_type(self, obj_type: type) -> Iterable[StorableObject]:
-        return [obj for obj in self.values() if isinstance(obj.data, obj_type)]
+    def get_objects_of_type(
+        self, obj_type: Union[type, str]
+    ) -> Iterable[StorableObject]:
+        return [self._objects[key] for key in self._index.keys_of_type(obj_type)]
+
+    def get_keys_with_tag(self, tag: str) -> List[UID]:
+        return self._index.keys_with_tag(tag=tag)
+
+    def get_keys_of_type(self, obj_type: Union[type, str]) -> List[UID]:
+        return self._index.keys_of_type(obj_type=obj_type)
+
+    def get_keys_searchable_by(self, verify_key: VerifyKey) -> List[UID]:
+        return self._index.keys_searchable_by(verify_key=verify_key)
+
+    def get_keys_readable_by(self, verify_key: VerifyKey) -> List[UID]:
+        return self._index.keys_readable_by(verify_key=verify_key)
+
+    def get_keys_with_request_id(self, request_id: UID) -> List[UID]:
+        return self._index.keys_with_request_id(request_id=request_id)
 
     def __sizeof__(self) -> int:
         return self._objects.__sizeof__()
@@ -67,12 +90,14 @@ class MemoryStore(ObjectStore):
 
     def __setitem__(self, key: UID, value: StorableObject) -> None:
         self._objects[key] = value
+        self._index.add(key=key, obj=value)
 
     def delete(self, key: UID) -> None:
         try:
             obj = self.get_object(key=key)
             if obj is not None:
                 self._objects.__delitem__(key)
+                self._index.remove(key=key)
             else:
                 critical(f"{type(self)} __delitem__ error {key}.")
         except Exception as e:
@@ -80,6 +105,7 @@ class MemoryStore(ObjectStore):
 
     def clear(self) -> None:
         self._objects.clear()
+        self._index.clear()
 
     def _object2proto(self) -> GeneratedProtocolMessageType:
         pass
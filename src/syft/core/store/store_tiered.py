@@ -0,0 +1,267 @@
+# stdlib
+from collections import OrderedDict
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Union
+import weakref
+
+# third party
+from google.protobuf.reflection import GeneratedProtocolMessageType
+from nacl.signing import VerifyKey
+
+# syft relative
+from ...logger import critical
+from ...logger import traceback_and_raise
+from ...logger import warning
+from ..common.uid import UID
+from .store_disk import DiskObjectStore
+from .store_index import StoreIndex
+from .store_interface import ObjectStore
+from .storeable_object import StorableObject
+
+
+def estimate_size(obj: StorableObject) -> int:
+    """Estimate how many bytes the data of a StorableObject keeps resident
+
+    Tensors and arrays report the size of their buffer, everything else falls back
+    to sys.getsizeof which does not follow references.
+    """
+    data = obj.data
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    element_size = getattr(data, "element_size", None)
+    nelement = getattr(data, "nelement", None)
+    if callable(element_size) and callable(nelement):
+        try:
+            return int(element_size() * nelement())
+        except Exception:  # nosec
+            pass
+
+    return sys.getsizeof(data)
+
+
+def _close_spill(disk: DiskObjectStore, spill_dir: Optional[str]) -> None:
+    # module level so the weakref finalizer of a store can call it
+    disk.close()
+    if spill_dir is not None:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+
+
+class TieredStore(ObjectStore):
+    """
+    Class that implements an ObjectStore which keeps objects in memory up to a byte
+    budget. Once the budget is exceeded, the least recently used objects are spilled
+    to a DiskObjectStore and moved back into memory when they are accessed again.
+
+    Objects handed out by the store should not be modified after other objects were
+    stored, the modification is lost if the object was spilled in the meantime.
+
+    Without a spill_path the objects are spilled to a temporary directory, which is
+    removed when the store is closed or garbage collected.
+
+    Attributes:
+        max_resident_bytes (int): the budget for the objects kept in memory.
+        resident_bytes (int): the estimated size of the objects kept in memory.
+        stats (Dict[str, int]): hits and misses of reads and the number of spilled
+        objects.
+    """
+
+    __slots__ = [
+        "max_resident_bytes",
+        "resident_bytes",
+        "stats",
+        "_objects",
+        "_sizes",
+        "_disk",
+        "_index",
+        "_search_engine",
+        "_finalizer",
+    ]
+
+    def __init__(self, max_resident_bytes: int, spill_path: Optional[str] = None):
+        super().__init__()
+        spill_dir = None
+        if spill_path is None:
+            spill_dir = tempfile.mkdtemp(prefix="syft_spill_")
+            spill_path = str(Path(spill_dir) / "spill.sqlite")
+
+        self.max_resident_bytes = max_resident_bytes
+        self.resident_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "spills": 0}
+        self._objects: OrderedDict[UID, StorableObject] = OrderedDict()
+        self._sizes: Dict[UID, int] = {}
+        # spilled objects must not be kept in memory by the read cache
+        self._disk = DiskObjectStore(db_path=spill_path, cache_bytes=0)
+        # covers both tiers, spilling an object does not change its index entries
+        self._index = StoreIndex()
+        self._search_engine = None
+        self._finalizer = weakref.finalize(self, _close_spill, self._disk, spill_dir)
+        self.post_init()
+
+    def close(self) -> None:
+        """Close the spill database, and remove it if the store created it"""
+        self._finalizer()
+
+    def _add_resident(self, key: UID, value: StorableObject) -> None:
+        self._remove_resident(key=key)
+        size = estimate_size(obj=value)
+        self._objects[key] = value
+        self._sizes[key] = size
+        self.resident_bytes += size
+        self._spill()
+
+    def _remove_resident(self, key: UID) -> Optional[StorableObject]:
+        value = self._objects.pop(key, None)
+        self.resident_bytes -= self._sizes.pop(key, 0)
+        return value
+
+    def _spill(self) -> None:
+        if self.resident_bytes <= self.max_resident_bytes:
+            return
+
+        # the most recently used object always stays in memory, otherwise an
+        # object larger than the budget would be written out on every access
+        most_recent = next(reversed(self._objects))
+        excess = self.resident_bytes - self.max_resident_bytes
+        evict: List[UID] = []
+        for key in self._objects:
+            if excess <= 0 or key == most_recent:
+                break
+            evict.append(key)
+            excess -= self._sizes[key]
+
+        for key in evict:
+            try:
+                self._disk[key] = self._objects[key]
+            except Exception as e:
+                warning(f"{type(self)} could not spill {key}, keeping it. {e}")
+                continue
+            self._remove_resident(key=key)
+            self.stats["spills"] += 1
+
+    def _discard_spilled(self, key: UID) -> bool:
+        if key not in self._disk:
+            return False
+        self._disk.delete(key=key)
+        return True
+
+    def _load(self, key: UID) -> Optional[StorableObject]:
+        value = self._objects.get(key, None)
+        if value is not None:
+            self.stats["hits"] += 1
+            self._objects.move_to_end(key)
+            return value
+
+        value = self._disk.get_object(key=key)
+        if value is not None:
+            self.stats["misses"] += 1
+            self._discard_spilled(key=key)
+            self._add_resident(key=key, value=value)
+        return value
+
+    def get_object(self, key: UID) -> Optional[StorableObject]:
+        return self._load(key=key)
+
+    def get_objects_of_type(
+        self, obj_type: Union[type, str]
+    ) -> Iterable[StorableObject]:
+        # like values(), spilled objects are not moved back into memory
+        objects = []
+        for key in self._index.keys_of_type(obj_type=obj_type):
+            value = self._objects.get(key, None)
+            if value is None:
+                value = self._disk.get_object(key=key)
+            if value is not None:
+                objects.append(value)
+        return objects
+
+    def get_keys_with_tag(self, tag: str) -> List[UID]:
+        return self._index.keys_with_tag(tag=tag)
+
+    def get_keys_of_type(self, obj_type: Union[type, str]) -> List[UID]:
+        return self._index.keys_of_type(obj_type=obj_type)
+
+    def get_keys_searchable_by(self, verify_key: VerifyKey) -> List[UID]:
+        return self._index.keys_searchable_by(verify_key=verify_key)
+
+    def get_keys_readable_by(self, verify_key: VerifyKey) -> List[UID]:
+        return self._index.keys_readable_by(verify_key=verify_key)
+
+    def get_keys_with_request_id(self, request_id: UID) -> List[UID]:
+        return self._index.keys_with_request_id(request_id=request_id)
+
+    def __sizeof__(self) -> int:
+        return self.resident_bytes
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({list(self.keys())})"
+
+    def __len__(self) -> int:
+        return len(self._objects) + len(self._disk)
+
+    def keys(self) -> List[UID]:
+        return list(self._objects.keys()) + list(self._disk.keys())
+
+    def values(self) -> List[StorableObject]:
+        # spilled objects are read without moving them back into memory
+        return list(self._objects.values()) + list(self._disk.values())
+
+    def __contains__(self, key: UID) -> bool:
+        return key in self._objects or key in self._disk
+
+    def __getitem__(self, key: UID) -> StorableObject:
+        value = self._load(key=key)
+        if value is None:
+            critical(f"{type(self)} __getitem__ error {key}")
+            traceback_and_raise(KeyError(key))
+        return value
+
+    def __setitem__(self, key: UID, value: StorableObject) -> None:
+        self._discard_spilled(key=key)
+        self._index.add(key=key, obj=value)
+        self._add_resident(key=key, value=value)
+
+    def delete(self, key: UID) -> None:
+        try:
+            removed = self._remove_resident(key=key) is not None
+            if not removed and not self._discard_spilled(key=key):
+                critical(f"{type(self)} __delitem__ error {key}.")
+            self._index.remove(key=key)
+        except Exception as e:
+            critical(f"{type(self)} Exception in __delitem__ error {key}. {e}")
+
+    def clear(self) -> None:
+        self._objects.clear()
+        self._sizes.clear()
+        self.resident_bytes = 0
+        self._disk.clear()
+        self._index.clear()
+
+    def stats_summary(self) -> Dict[str, Any]:
+        """Return the read and spill counters together with the memory accounting"""
+        return {
+            **self.stats,
+            "resident_objects": len(self._objects),
+            "spilled_objects": len(self._disk),
+            "resident_bytes": self.resident_bytes,
+            "max_resident_bytes": self.max_resident_bytes,
+        }
+
+    def _object2proto(self) -> GeneratedProtocolMessageType:
+        pass
+
+    @staticmethod
+    def _proto2object(proto: GeneratedProtocolMessageType) -> "TieredStore":
+        pass
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -13,11 +13,11 @@ import syft as sy
 from ...logger import traceback_and_raise
 from ...proto.core.store.store_object_pb2 import StorableObject as StorableObject_PB
 from ...util import get_fully_qualified_name
-from ...util import index_syft_by_module_name
 from ...util import key_emoji
 from ..common.serde.deserialize import _deserialize
 from ..common.serde.serializable import Serializable
 from ..common.serde.serializable import bind_protobuf
+from ..common.serde.type_registry import lookup_type
 from ..common.storeable_object import AbstractStorableObject
 from ..common.uid import UID
 
@@ -170,10 +170,11 @@ class StorableObject(AbstractStorableObject):
             traceback_and_raise(ValueError("TODO"))
 
         # Step 2: get the type of wrapper to use to deserialize
-        data_type = index_syft_by_module_name(fully_qualified_name=proto.data_type)
+        data_type_entry = lookup_type(proto.data_type)
+        data_type = data_type_entry.obj_type
 
         # Step 3: get the protobuf type we deserialize for .data
-        schematic_type = data_type.get_protobuf_schema()  # type: ignore
+        schematic_type = data_type_entry.protobuf_schema
 
         # Step 4: Deserialize data from protobuf
         data = None
@@ -182,7 +183,7 @@ class StorableObject(AbstractStorableObject):
             descriptor = getattr(schematic_type, "DESCRIPTOR", None)
             if descriptor is not None and proto.data.Is(descriptor):
                 proto.data.Unpack(data)
-            data = data_type._proto2object(proto=data)  # type: ignore
+            data = data_type._proto2object(proto=data)
 
         # Step 5: get the description from proto
         description = proto.description if proto.description else ""
@@ -10,7 +10,9 @@ from .model_centric_fl_worker import ModelCentricFLWorker
 
 
 class FLClient:
-    def __init__(self, url: str, auth_token: str, secure: bool = True) -> None:
+    def __init__(
+        self, url: str, auth_token: str, secure: bool = True, binary: bool = False
+    ) -> None:
         self.url = url
         self.auth_token = auth_token
         self.worker_id: Optional[
@@ -26,6 +28,7 @@ class FLClient:
         self.grid_worker = ModelCentricFLWorker(
             address=url_fragments.netloc,
             secure=secure,
+            binary=binary,
         )
 
     def new_job(self, model_name: str, model_version: str) -> FLJob:
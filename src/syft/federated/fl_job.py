@@ -10,6 +10,7 @@ from ..federated import JSONDict
 from ..logger import traceback_and_raise
 from .model_centric_fl_base import GridError
 from .model_centric_fl_worker import ModelCentricFLWorker
+from .model_serialization.diff_codec import diff_codec_from_config
 
 
 class EventEmitter:
@@ -121,4 +122,5 @@ class FLJob(EventEmitter):
             worker_id=self.worker_id,
             request_key=self.cycle_params["request_key"],
             diff=diff_params,
+            codec=diff_codec_from_config(self.client_config),
         )
@@ -2,8 +2,11 @@
 import binascii
 import json
 from typing import Any as TypeAny
+from typing import Callable
 from typing import Dict as TypeDict
+from typing import List as TypeList
 from typing import Optional
+from typing import Tuple as TypeTuple
 from typing import Union as TypeUnion
 
 # third party
@@ -11,6 +14,7 @@ from google.protobuf.message import Message
 from google.protobuf.reflection import GeneratedProtocolMessageType
 import requests
 import websocket
+from websocket import ABNF
 
 # syft relative
 from ..core.common.serde.deserialize import _deserialize as deserialize
@@ -18,6 +22,37 @@ from ..core.common.serde.serialize import _serialize as serialize
 from ..federated import JSONDict
 
 TIMEOUT_INTERVAL = 60
+FRAME_CHUNK_SIZE = 1048576  # 1MB
+
+# the path of a value in the data of a message, like ["plans", "training_plan"]
+FramePath = TypeList[str]
+
+
+def split_frames(
+    data: JSONDict, path: Optional[FramePath] = None
+) -> TypeTuple[JSONDict, TypeList[TypeTuple[FramePath, bytes]]]:
+    """Split the bytes values out of the data of a message, they are replaced by
+    None and returned with their path in the data"""
+    path = [] if path is None else path
+    header: JSONDict = {}
+    frames: TypeList[TypeTuple[FramePath, bytes]] = []
+    for k, v in data.items():
+        if isinstance(v, (bytes, bytearray, memoryview)):
+            header[k] = None
+            frames.append((path + [k], v))
+        elif isinstance(v, dict):
+            header[k], sub_frames = split_frames(data=v, path=path + [k])
+            frames.extend(sub_frames)
+        else:
+            header[k] = v
+    return header, frames
+
+
+def join_frame(data: JSONDict, path: FramePath, frame: bytes) -> None:
+    """Put a frame back at its path in the data of a message"""
+    for k in path[:-1]:
+        data = data[k]
+    data[path[-1]] = frame
 
 
 class GridError(BaseException):
@@ -32,10 +67,20 @@ class GridError(BaseException):
 
 
 class ModelCentricFLBase:
-    def __init__(self, address: str, secure: bool = False):
+    def __init__(self, address: str, secure: bool = False, binary: bool = False):
+        """
+        :param address: the address of the PyGrid server.
+        :param secure: use wss and https to connect to the server.
+        :param binary: send the serialized objects of the websocket messages as raw
+            binary frames after a JSON header, instead of hex encoded in the JSON.
+            The server must accept this framing.
+        """
         self.address = address
         self.secure = secure
+        self.binary = binary
         self.ws: Optional[websocket._core.WebSocket] = None
+        # keep-alive connections for the HTTP requests, shared by threads
+        self.session = requests.Session()
 
     @property
     def ws_url(self) -> str:
@@ -63,8 +108,12 @@ class ModelCentricFLBase:
             self.connect()
 
         if self.ws is not None:
-            self.ws.send(json.dumps(message))
-            json_response = json.loads(self.ws.recv())
+            if self.binary:
+                self._send_binary_msg(message)
+                json_response = self._recv_binary_msg()
+            else:
+                self.ws.send(json.dumps(message))
+                json_response = json.loads(self.ws.recv())
 
             # Look for error in root and under "data"
             error = None
@@ -80,6 +129,38 @@ class ModelCentricFLBase:
         else:
             raise GridError("Websocket connection unavailable", None)
 
+    def _send_binary_msg(self, message: TypeDict[str, TypeAny]) -> None:
+        """Send a JSON header with the bytes values of the data replaced by None and
+        the list of their paths in "frames", followed by one binary message with each
+        of these values, streamed in chunks of FRAME_CHUNK_SIZE."""
+        data, frames = split_frames(data=message.get("data", {}))
+        header = {**message, "data": data, "frames": [path for path, _ in frames]}
+        self.ws.send(json.dumps(header))  # type: ignore
+
+        for _, frame in frames:
+            view = memoryview(frame)
+            opcode = ABNF.OPCODE_BINARY
+            for start in range(0, max(len(view), 1), FRAME_CHUNK_SIZE):
+                end = start + FRAME_CHUNK_SIZE
+                # websocket only masks bytes efficiently, a chunk is copied anyway
+                chunk = bytes(view[start:end])
+                self.ws.send_frame(  # type: ignore
+                    ABNF.create_frame(
+                        data=chunk, opcode=opcode, fin=int(end >= len(view))
+                    )
+                )
+                opcode = ABNF.OPCODE_CONT
+
+    def _recv_binary_msg(self) -> JSONDict:
+        """Receive a JSON header and the binary messages of its "frames" """
+        json_response = json.loads(self.ws.recv())  # type: ignore
+        for path in json_response.pop("frames", []):
+            opcode, frame = self.ws.recv_data()  # type: ignore
+            if opcode != ABNF.OPCODE_BINARY:
+                raise GridError(f"Expected a binary frame for {path}", None)
+            join_frame(data=json_response["data"], path=path, frame=frame)
+        return json_response
+
     def _send_http_req(
         self,
         method: str,
@@ -88,9 +169,9 @@ class ModelCentricFLBase:
         body: Optional[JSONDict] = None,
     ) -> bytes:
         if method == "GET":
-            res = requests.get(self.http_url + path, params)
+            res = self.session.get(self.http_url + path, params=params)
         elif method == "POST":
-            res = requests.post(self.http_url + path, params=params, data=body)
+            res = self.session.post(self.http_url + path, params=params, data=body)
 
         if not res.ok:
             error = "HTTP response is not OK"
@@ -110,9 +191,18 @@ class ModelCentricFLBase:
     def _serialize_dict_values(self, obj: JSONDict) -> JSONDict:
         serialized_object = {}
         for k, v in obj.items():
-            serialized_object[k] = binascii.hexlify(self._serialize(v)).decode()
+            serialized_object[k] = self._wrap_blob(self._serialize(v))
         return serialized_object
 
+    def _wrap_blob(
+        self, blob: bytes, encode: Callable[[bytes], bytes] = binascii.hexlify
+    ) -> TypeUnion[bytes, str]:
+        """Keep a blob as it is to send it as a binary frame, or encode it as text to
+        embed it in the JSON of a message"""
+        if self.binary:
+            return blob
+        return encode(blob).decode("ascii")
+
     def _unserialize(
         self, serialized_obj: bytes, obj_protobuf_type: GeneratedProtocolMessageType
     ) -> TypeAny:
@@ -123,6 +213,7 @@ class ModelCentricFLBase:
     def close(self) -> None:
         if self.ws is not None:
             self.ws.shutdown()
+        self.session.close()
 
     def hex_serialize(self, x: object) -> str:
         return binascii.hexlify(self._serialize(x)).decode()
@@ -25,11 +25,11 @@ class ModelCentricFLClient(ModelCentricFLBase):
         model_parameters = model.parameters()
         if model_parameters is not None:
             params = [getattr(p, "data", None) for p in model_parameters]
-        serialized_model = self.hex_serialize(wrap_model_params(params))
+        serialized_model = self._wrap_blob(self._serialize(wrap_model_params(params)))
 
         serialized_plans = self._serialize_dict_values(client_plans)
         serialized_protocols = self._serialize_dict_values(client_protocols)
-        serialized_avg_plan = self.hex_serialize(server_averaging_plan)
+        serialized_avg_plan = self._wrap_blob(self._serialize(server_averaging_plan))
 
         # "model-centric/host-training" request body
         message = {
@@ -1,11 +1,18 @@
 # stdlib
+import asyncio
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import secrets
+import time
 from timeit import timeit
 from typing import Any as TypeAny
+from typing import Callable
 from typing import Dict as TypeDict
 from typing import Generator
 from typing import List as TypeList
+from typing import Optional
+from typing import Tuple as TypeTuple
 from typing import Union
 
 # third party
@@ -20,11 +27,14 @@ from ..lib.python.list import List
 from ..proto.core.plan.plan_pb2 import Plan as PlanPB
 from .model_serialization import deserialize_model_params
 from .model_serialization import wrap_model_params
+from .model_serialization.diff_codec import DiffCodec
+from .model_serialization.diff_codec import encode_diff
 
 CHUNK_SIZE = 655360  # 640KB
 SPEED_MULT_FACTOR = 10
 MAX_BUFFER_SIZE = 1048576 * 64  # 64 MB
 MAX_SPEED_TESTS = 3
+SPEED_TEST_TTL = 600.0  # 10 minutes
 
 
 class ModelCentricFLWorker(ModelCentricFLBase):
@@ -33,6 +43,21 @@ class ModelCentricFLWorker(ModelCentricFLBase):
     PLAN_TYPE_LIST = "list"
     PLAN_TYPE_TORCHSCRIPT = "torchscript"
 
+    def __init__(
+        self,
+        address: str,
+        secure: bool = False,
+        binary: bool = False,
+        speed_test_ttl: float = SPEED_TEST_TTL,
+    ) -> None:
+        """
+        :param speed_test_ttl: how long in seconds the connection speed measured for
+            a worker is reused by the next cycles.
+        """
+        super().__init__(address=address, secure=secure, binary=binary)
+        self.speed_test_ttl = speed_test_ttl
+        self._speed_cache: TypeDict[str, TypeTuple[float, TypeDict[str, TypeAny]]] = {}
+
     def _yield_chunk_from_request(
         self, request: requests.Response, chunk_size: int
     ) -> Generator:
@@ -61,9 +86,12 @@ class ModelCentricFLWorker(ModelCentricFLBase):
     def _get_upload_speed(self, worker_id: str, random_id: int) -> float:
         buffer_size = CHUNK_SIZE
         speed_history = []
+        # the sample is only built again when it grows
+        data_sample = b""
 
         for _ in range(MAX_SPEED_TESTS):
-            data_sample = b"x" * buffer_size
+            if len(data_sample) != buffer_size:
+                data_sample = b"x" * buffer_size
             params = {"worker_id": worker_id, "random": random_id}
             body = {"upload_data": data_sample}
             time_taken = timeit(
@@ -72,9 +100,9 @@ class ModelCentricFLWorker(ModelCentricFLBase):
                 ),
                 number=1,
             )
+            new_speed = buffer_size / (time_taken * 1024)
             if time_taken < 0.5:
                 buffer_size = min(buffer_size * SPEED_MULT_FACTOR, MAX_BUFFER_SIZE)
-            new_speed = buffer_size / (time_taken * 1024)
 
             if new_speed != float("inf"):
                 speed_history.append(new_speed)
@@ -91,8 +119,8 @@ class ModelCentricFLWorker(ModelCentricFLBase):
             "random": random_id,
         }
         speed_history = []
-        with requests.get(
-            self.http_url + "/model-centric/speed-test", params, stream=True
+        with self.session.get(
+            self.http_url + "/model-centric/speed-test", params=params, stream=True
         ) as r:
             r.raise_for_status()
             buffer_size = CHUNK_SIZE
@@ -104,9 +132,9 @@ class ModelCentricFLWorker(ModelCentricFLBase):
                     ),
                     number=1,
                 )
+                new_speed = buffer_size / (time_taken * 1024)
                 if time_taken < 0.5:
                     buffer_size = min(buffer_size * SPEED_MULT_FACTOR, MAX_BUFFER_SIZE)
-                new_speed = buffer_size / (time_taken * 1024)
 
                 if new_speed != float("inf"):
                     speed_history.append(new_speed)
@@ -155,9 +183,16 @@ class ModelCentricFLWorker(ModelCentricFLBase):
             "request_key": request_key,
             "model_id": model_id,
         }
-        serialized_model = self._send_http_req(
-            "GET", "/model-centric/get-model", params_dict
-        )
+        if self.binary:
+            # the model is streamed as a binary frame over the websocket
+            response = self._send_msg(
+                {"type": "model-centric/get-model", "data": params_dict}
+            )
+            serialized_model = response["data"]["model"]
+        else:
+            serialized_model = self._send_http_req(
+                "GET", "/model-centric/get-model", params_dict
+            )
         # TODO migrate to syft-core protobufs
         params: List = deserialize_model_params(serialized_model)
         return params.upcast()
@@ -181,24 +216,81 @@ class ModelCentricFLWorker(ModelCentricFLBase):
             return self._unserialize(serialized_plan, PlanPB)
 
     def report(
-        self, worker_id: str, request_key: str, diff: TypeList
+        self,
+        worker_id: str,
+        request_key: str,
+        diff: TypeList,
+        codec: Optional[DiffCodec] = None,
     ) -> TypeDict[str, TypeAny]:
-        # TODO migrate to syft-core protobufs
-        diff_serialized = self._serialize(wrap_model_params(diff))
-        diff_base64 = base64.b64encode(diff_serialized).decode("ascii")
+        if codec is None:
+            # TODO migrate to syft-core protobufs
+            diff_serialized = self._serialize(wrap_model_params(diff))
+        else:
+            diff_serialized = encode_diff(diff=diff, codec=codec)
+
         params = {
             "type": "model-centric/report",
             "data": {
                 "worker_id": worker_id,
                 "request_key": request_key,
-                "diff": diff_base64,
+                "diff": self._wrap_blob(diff_serialized, encode=base64.b64encode),
             },
         }
+        if codec is not None:
+            # the server decodes the diff with diff_codec.decode_diff
+            params["data"]["diff_codec"] = codec.name  # type: ignore
         return self._send_msg(params)
 
-    def get_connection_speed(self, worker_id: str) -> TypeDict[str, TypeAny]:
+    def _speed_tests(self, worker_id: str) -> TypeList[Callable[[], float]]:
         random_num = secrets.randbits(128)
-        ping = self._get_ping(worker_id, random_num)
-        upload_speed = self._get_upload_speed(worker_id, random_num)
-        download_speed = self._get_download_speed(worker_id, random_num)
-        return {"ping": ping, "download": download_speed, "upload": upload_speed}
+        return [
+            partial(test, worker_id, random_num)
+            for test in [
+                self._get_ping,
+                self._get_download_speed,
+                self._get_upload_speed,
+            ]
+        ]
+
+    def _cached_speed(self, worker_id: str) -> Optional[TypeDict[str, TypeAny]]:
+        if worker_id in self._speed_cache:
+            measured_at, speed_info = self._speed_cache[worker_id]
+            if time.monotonic() - measured_at < self.speed_test_ttl:
+                return speed_info
+        return None
+
+    def _cache_speed(
+        self, worker_id: str, ping: float, download: float, upload: float
+    ) -> TypeDict[str, TypeAny]:
+        speed_info = {"ping": ping, "download": download, "upload": upload}
+        self._speed_cache[worker_id] = (time.monotonic(), speed_info)
+        return speed_info
+
+    def get_connection_speed(
+        self, worker_id: str, refresh: bool = False
+    ) -> TypeDict[str, TypeAny]:
+        """Measure the ping, download and upload speeds of the worker concurrently.
+        The result is reused for speed_test_ttl seconds unless refresh is True."""
+        speed_info = None if refresh else self._cached_speed(worker_id)
+        if speed_info is not None:
+            return speed_info
+
+        tests = self._speed_tests(worker_id)
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            ping, download, upload = executor.map(lambda test: test(), tests)
+        return self._cache_speed(worker_id, ping, download, upload)
+
+    async def async_get_connection_speed(
+        self, worker_id: str, refresh: bool = False
+    ) -> TypeDict[str, TypeAny]:
+        """get_connection_speed as a coroutine, the measurements run in the default
+        executor of the event loop"""
+        speed_info = None if refresh else self._cached_speed(worker_id)
+        if speed_info is not None:
+            return speed_info
+
+        loop = asyncio.get_event_loop()
+        ping, download, upload = await asyncio.gather(
+            *[loop.run_in_executor(None, test) for test in self._speed_tests(worker_id)]
+        )
+        return self._cache_speed(worker_id, ping, download, upload)
@@ -0,0 +1,196 @@
+"""Codecs to compress the model parameter diffs that workers report.
+
+A DiffCodec encodes every tensor of a diff into an EncodedTensor, and
+decode_diff is the reference decoder of the EncodedDiff reported. The codec of a
+worker is selected with the "diff_codec" key of the client_config of a cycle, and
+its arguments with "diff_codec_args", for example:
+
+    client_config = {"diff_codec": "topk", "diff_codec_args": {"ratio": 0.01}}
+
+Available codecs:
+  - "fp16": the values as float16
+  - "int8" and "int4": the values quantized with a per-tensor scale
+  - "topk": only the values of the largest magnitude, with their indices
+"""
+# stdlib
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+# third party
+import numpy as np
+import torch as th
+
+# syft relative
+from .. import JSONDict
+from ...proto.federated.model_diff_pb2 import EncodedDiff as EncodedDiff_PB
+from ...proto.federated.model_diff_pb2 import EncodedTensor as EncodedTensor_PB
+
+
+def _to_bytes(tensor: th.Tensor, dtype: str) -> bytes:
+    """The values of a tensor as a little endian numpy dtype, like "<f2" """
+    return tensor.detach().cpu().numpy().astype(dtype, copy=False).tobytes()
+
+
+def _from_bytes(data: bytes, dtype: str) -> th.Tensor:
+    values = np.frombuffer(data, dtype=dtype)
+    return th.from_numpy(values.astype(values.dtype.newbyteorder("=")))
+
+
+class DiffCodec(ABC):
+    """The codec that all the diff codecs should inherit, they are registered with
+    their name."""
+
+    REGISTERED_DIFF_CODECS: Dict[str, Type["DiffCodec"]] = {}
+
+    name: str
+
+    def __init_subclass__(cls: Type["DiffCodec"]) -> None:
+        super().__init_subclass__()
+        if cls.name in DiffCodec.REGISTERED_DIFF_CODECS:
+            raise ValueError(f"{cls.name} already registered!")
+        DiffCodec.REGISTERED_DIFF_CODECS[cls.name] = cls
+
+    @abstractmethod
+    def encode(self, tensor: th.Tensor) -> EncodedTensor_PB:
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def decode(encoded: EncodedTensor_PB) -> th.Tensor:
+        """Decoders don't depend on the arguments of the codec"""
+        pass
+
+
+class FP16Codec(DiffCodec):
+    name = "fp16"
+
+    def encode(self, tensor: th.Tensor) -> EncodedTensor_PB:
+        return EncodedTensor_PB(
+            shape=tensor.shape, data=_to_bytes(tensor.half(), "<f2")
+        )
+
+    @staticmethod
+    def decode(encoded: EncodedTensor_PB) -> th.Tensor:
+        values = _from_bytes(encoded.data, dtype="<f2")
+        return values.float().reshape(tuple(encoded.shape))
+
+
+class Int8Codec(DiffCodec):
+    """Quantizes the values to signed integers of `bits` bits, scaled by the largest
+    magnitude of the tensor."""
+
+    name = "int8"
+    bits = 8
+
+    @property
+    def levels(self) -> int:
+        return 2 ** (self.bits - 1) - 1
+
+    def quantize(self, tensor: th.Tensor) -> Tuple[th.Tensor, float]:
+        tensor = tensor.detach().float()
+        max_abs = tensor.abs().max().item() if tensor.numel() else 0.0
+        scale = max_abs / self.levels if max_abs > 0 else 1.0
+        q = th.clamp(th.round(tensor / scale), -self.levels, self.levels)
+        return q, scale
+
+    def encode(self, tensor: th.Tensor) -> EncodedTensor_PB:
+        q, scale = self.quantize(tensor)
+        return EncodedTensor_PB(
+            shape=tensor.shape, data=_to_bytes(q, "i1"), scale=scale
+        )
+
+    @staticmethod
+    def decode(encoded: EncodedTensor_PB) -> th.Tensor:
+        q = _from_bytes(encoded.data, dtype="i1")
+        return (q.float() * encoded.scale).reshape(tuple(encoded.shape))
+
+
+class Int4Codec(Int8Codec):
+    """Quantizes the values to 4 bits, two values are packed in every byte."""
+
+    name = "int4"
+    bits = 4
+
+    def encode(self, tensor: th.Tensor) -> EncodedTensor_PB:
+        q, scale = self.quantize(tensor)
+        # from [-7, 7] to [1, 15], with a padding 0 for odd sizes
+        nibbles = (q.flatten() + 8).to(th.uint8)
+        if nibbles.numel() % 2:
+            nibbles = th.cat([nibbles, th.zeros(1, dtype=th.uint8)])
+        pairs = nibbles.reshape(-1, 2)
+        packed = pairs[:, 0] | (pairs[:, 1] << 4)
+        return EncodedTensor_PB(
+            shape=tensor.shape, data=_to_bytes(packed, "u1"), scale=scale
+        )
+
+    @staticmethod
+    def decode(encoded: EncodedTensor_PB) -> th.Tensor:
+        packed = _from_bytes(encoded.data, dtype="u1")
+        nibbles = th.stack([packed & 0x0F, packed >> 4], dim=1).flatten()
+        size = int(np.prod(encoded.shape))
+        q = nibbles[:size].to(th.int8) - 8
+        return (q.float() * encoded.scale).reshape(tuple(encoded.shape))
+
+
+class TopKCodec(DiffCodec):
+    """Keeps the `ratio` of the values of the largest magnitude, the others are 0."""
+
+    name = "topk"
+
+    def __init__(self, ratio: float = 0.01) -> None:
+        if not 0 < ratio <= 1:
+            raise ValueError(f"The ratio of {self.name} must be in (0, 1], not {ratio}")
+        self.ratio = ratio
+
+    def encode(self, tensor: th.Tensor) -> EncodedTensor_PB:
+        flat = tensor.detach().float().flatten()
+        k = min(flat.numel(), max(1, int(flat.numel() * self.ratio)))
+        indices = th.topk(flat.abs(), k, sorted=False).indices
+        return EncodedTensor_PB(
+            shape=tensor.shape,
+            data=_to_bytes(flat[indices], "<f4"),
+            indices=_to_bytes(indices, "<i4"),
+        )
+
+    @staticmethod
+    def decode(encoded: EncodedTensor_PB) -> th.Tensor:
+        flat = th.zeros(int(np.prod(encoded.shape)))
+        indices = _from_bytes(encoded.indices, dtype="<i4").long()
+        flat[indices] = _from_bytes(encoded.data, dtype="<f4")
+        return flat.reshape(tuple(encoded.shape))
+
+
+def get_diff_codec(name: str, **kwargs: Any) -> DiffCodec:
+    if name not in DiffCodec.REGISTERED_DIFF_CODECS:
+        raise ValueError(f"{name} not registered!")
+    return DiffCodec.REGISTERED_DIFF_CODECS[name](**kwargs)  # type: ignore
+
+
+def diff_codec_from_config(client_config: JSONDict) -> Optional[DiffCodec]:
+    """The codec selected by the client_config of a cycle, None sends dense diffs"""
+    name = client_config.get("diff_codec", None)
+    if name is None:
+        return None
+    return get_diff_codec(name, **client_config.get("diff_codec_args", {}))
+
+
+def encode_diff(diff: List[th.Tensor], codec: DiffCodec) -> bytes:
+    encoded = EncodedDiff_PB(codec=codec.name)
+    encoded.tensors.extend([codec.encode(tensor) for tensor in diff])
+    return encoded.SerializeToString()
+
+
+def decode_diff(blob: bytes) -> List[th.Tensor]:
+    """The reference decoder of the diffs encoded by encode_diff, with any codec"""
+    encoded = EncodedDiff_PB()
+    encoded.ParseFromString(blob)
+    if encoded.codec not in DiffCodec.REGISTERED_DIFF_CODECS:
+        raise ValueError(f"{encoded.codec} not registered!")
+    codec = DiffCodec.REGISTERED_DIFF_CODECS[encoded.codec]
+    return [codec.decode(tensor) for tensor in encoded.tensors]
@@ -11,6 +11,7 @@ import syft
 # syft relative
 from .core.common.serde.serializable import Serializable
 from .core.common.serde.serializable import bind_protobuf
+from .core.common.serde.type_registry import register_type
 from .util import aggressive_set_attr
 
 module_type = type(syft)
@@ -60,6 +61,7 @@ def GenerateWrapper(
         parent = parent.__dict__[n]
     # finally add our wrapper class to the end of the path
     parent.__dict__[Wrapper.__name__] = Wrapper
+    register_type(obj_type=Wrapper)
 
     aggressive_set_attr(
         obj=wrapped_type, name="_sy_serializable_wrapper_type", attr=Wrapper
@@ -9,17 +9,31 @@ import requests
 
 # syft relative
 from ...core.common.message import SyftMessage
-from ...core.common.serde.serialize import _serialize
 from ...proto.core.node.common.metadata_pb2 import Metadata as Metadata_PB
 from ..connections.http_connection import HTTPConnection
+from ..connections.http_connection import Timeout
+from ..connections.http_connection import encode_body
 
 
 class GridHTTPConnection(HTTPConnection):
     LOGIN_ROUTE = "/users/login"
     SYFT_ROUTE = "/pysyft"
 
-    def __init__(self, url: str) -> None:
-        self.base_url = url
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 10,
+        timeout: Timeout = None,
+        retries: int = 3,
+        compression: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            url=url,
+            pool_size=pool_size,
+            timeout=timeout,
+            retries=retries,
+            compression=compression,
+        )
         self.session_token: Optional[Dict[str, str]] = None
 
     def _send_msg(self, msg: SyftMessage) -> requests.Response:
@@ -31,19 +45,17 @@ class GridHTTPConnection(HTTPConnection):
         :rtype: requests.Response
         """
 
-        header = {}
+        msg_bytes, header = encode_body(msg=msg, compression=self.compression)
 
         if self.session_token:
-            header["token"] = self.session_token
-
-        header["Content-Type"] = "application/octet-stream"  # type: ignore
+            header["token"] = self.session_token  # type: ignore
 
         # Perform HTTP request using base_url as a root address
-        msg_bytes: bytes = _serialize(obj=msg, to_bytes=True)  # type: ignore
-        r = requests.post(
+        r = self.session.post(
             url=self.base_url + GridHTTPConnection.SYFT_ROUTE,
             data=msg_bytes,
             headers=header,
+            timeout=self.timeout,
         )
 
         # Return request's response object
@@ -52,8 +64,10 @@ class GridHTTPConnection(HTTPConnection):
 
     def login(self, credentials: Dict) -> Tuple:
         # Login request
-        response = requests.post(
-            url=self.base_url + GridHTTPConnection.LOGIN_ROUTE, json=credentials
+        response = self.session.post(
+            url=self.base_url + GridHTTPConnection.LOGIN_ROUTE,
+            json=credentials,
+            timeout=self.timeout,
         )
 
         # Response
@@ -79,7 +93,7 @@ class GridHTTPConnection(HTTPConnection):
         :return: returns node metadata
         :rtype: str of bytes
         """
-        response = requests.get(self.base_url + "/metadata")
+        response = self.session.get(self.base_url + "/metadata", timeout=self.timeout)
         content = json.loads(response.text)
 
         metadata = content["metadata"].encode("ISO-8859-1")
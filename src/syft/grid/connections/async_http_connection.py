@@ -0,0 +1,149 @@
+# stdlib
+import asyncio
+from typing import Any
+from typing import Awaitable
+from typing import Dict
+from typing import Optional
+
+# third party
+import aiohttp
+
+# syft relative
+from ...core.common.event_loop import loop
+from ...core.common.event_loop import run_coroutine
+from ...core.common.message import SignedEventualSyftMessageWithoutReply
+from ...core.common.message import SignedImmediateSyftMessageWithReply
+from ...core.common.message import SignedImmediateSyftMessageWithoutReply
+from ...core.common.message import SyftMessage
+from ...core.common.serde.deserialize import _deserialize
+from ...core.io.connection import ClientConnection
+from ...logger import traceback_and_raise
+from ...proto.core.node.common.metadata_pb2 import Metadata as Metadata_PB
+from .http_connection import check_compression
+from .http_connection import encode_body
+
+
+class AsyncHTTPConnection(ClientConnection):
+    """
+    An HTTPConnection on top of aiohttp, to send many messages concurrently from a
+    single thread.
+
+    The async_* coroutines send the messages through a pool of keep-alive
+    connections. The ClientConnection methods run them on the event loop of syft
+    and wait for their result, so this connection can be used in a route like
+    HTTPConnection. It needs aiohttp, installed with the http extra of syft.
+    """
+
+    loop: Any
+
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 10,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        :param url: the url of the node.
+        :param pool_size: the number of connections kept open to the node.
+        :param timeout: the timeout of every request in seconds, None waits forever.
+        :param retries: how many times a request is retried if the node can not be
+            reached. Messages are only sent again if the node did not receive them.
+        :param compression: "gzip" or "zstd" to compress the messages sent, the node
+            must accept this Content-Encoding.
+        """
+        check_compression(compression=compression)
+
+        self.base_url = url
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.retries = retries
+        self.compression = compression
+        self.loop = loop
+        # created on first use, from a coroutine running on the loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=self.timeout,
+            )
+        return self._session
+
+    def _run(self, coro: Awaitable) -> Any:
+        return run_coroutine(coro, event_loop=self.loop)
+
+    async def _request(
+        self, method: str, url: str, data: Optional[bytes], headers: Dict[str, str]
+    ) -> bytes:
+        attempt = 0
+        while True:
+            try:
+                async with self._get_session().request(
+                    method, url, data=data, headers=headers
+                ) as response:
+                    return await response.read()
+            except aiohttp.ClientConnectorError as e:
+                # the node could not be reached, so the message was not sent
+                if attempt >= self.retries:
+                    traceback_and_raise(e)
+                await asyncio.sleep(0.1 * 2 ** attempt)
+                attempt += 1
+
+    async def _send_msg(self, msg: SyftMessage) -> bytes:
+        data_bytes, headers = encode_body(msg=msg, compression=self.compression)
+        return await self._request(
+            method="POST", url=self.base_url, data=data_bytes, headers=headers
+        )
+
+    async def async_send_immediate_msg_with_reply(
+        self, msg: SignedImmediateSyftMessageWithReply
+    ) -> SignedImmediateSyftMessageWithoutReply:
+        blob = await self._send_msg(msg=msg)
+        return _deserialize(blob=blob, from_bytes=True)
+
+    async def async_send_immediate_msg_without_reply(
+        self, msg: SignedImmediateSyftMessageWithoutReply
+    ) -> None:
+        await self._send_msg(msg=msg)
+
+    async def async_send_eventual_msg_without_reply(
+        self, msg: SignedEventualSyftMessageWithoutReply
+    ) -> None:
+        await self._send_msg(msg=msg)
+
+    async def async_get_metadata(self) -> Metadata_PB:
+        data = await self._request(
+            method="GET", url=self.base_url + "/metadata", data=None, headers={}
+        )
+        metadata_pb = Metadata_PB()
+        metadata_pb.ParseFromString(data)
+        return metadata_pb
+
+    async def async_close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    def send_immediate_msg_with_reply(
+        self, msg: SignedImmediateSyftMessageWithReply
+    ) -> SignedImmediateSyftMessageWithoutReply:
+        return self._run(self.async_send_immediate_msg_with_reply(msg=msg))
+
+    def send_immediate_msg_without_reply(
+        self, msg: SignedImmediateSyftMessageWithoutReply
+    ) -> None:
+        self._run(self.async_send_immediate_msg_without_reply(msg=msg))
+
+    def send_eventual_msg_without_reply(
+        self, msg: SignedEventualSyftMessageWithoutReply
+    ) -> None:
+        self._run(self.async_send_eventual_msg_without_reply(msg=msg))
+
+    def _get_metadata(self) -> Metadata_PB:
+        return self._run(self.async_get_metadata())
+
+    def close(self) -> None:
+        """Close the pooled connections to the node"""
+        self._run(self.async_close())
@@ -1,5 +1,15 @@
+# stdlib
+import gzip
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+import zlib
+
 # third party
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # syft relative
 from ...core.common.message import SignedEventualSyftMessageWithoutReply
@@ -9,12 +19,133 @@ from ...core.common.message import SyftMessage
 from ...core.common.serde.deserialize import _deserialize
 from ...core.common.serde.serialize import _serialize
 from ...core.io.connection import ClientConnection
+from ...logger import traceback_and_raise
 from ...proto.core.node.common.metadata_pb2 import Metadata as Metadata_PB
 
+try:
+    # third party
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# request bodies smaller than this are not worth compressing
+COMPRESSION_MIN_SIZE = 1024
+# the largest request body a node decompresses, bigger ones are rejected
+MAX_DECOMPRESSED_SIZE = 1073741824  # 1GB
+
+Timeout = Optional[Union[float, Tuple[float, float]]]
+
+
+def check_compression(compression: Optional[str]) -> None:
+    """Raise if messages can't be sent with the given Content-Encoding"""
+    if compression == "zstd" and zstandard is None:
+        traceback_and_raise(
+            ImportError("zstd compression requires the zstandard package")
+        )
+    elif compression not in (None, "gzip", "zstd"):
+        traceback_and_raise(ValueError(f"Unsupported Content-Encoding: {compression}"))
+
+
+def compress(data: bytes, encoding: Optional[str]) -> bytes:
+    """Compress a request body with the given Content-Encoding ("gzip" or "zstd")"""
+    if encoding is None:
+        return data
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=1)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor().compress(data)
+    traceback_and_raise(ValueError(f"Unsupported Content-Encoding: {encoding}"))
+
+
+def decompress(
+    data: bytes, encoding: Optional[str], max_size: int = MAX_DECOMPRESSED_SIZE
+) -> bytes:
+    """Decompress a request body sent with the given Content-Encoding, used by nodes
+    serving HTTP requests. Bodies which decompress to more than max_size bytes raise
+    a ValueError, so a small request can't exhaust the memory of the node."""
+    if not encoding or encoding == "identity":
+        return data
+    too_large = ValueError(f"Request body is larger than {max_size} bytes")
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        # at most one byte more than max_size is ever decompressed
+        result = decompressor.decompress(data, max_size + 1)
+        if len(result) > max_size:
+            traceback_and_raise(too_large)
+        if not decompressor.eof:
+            traceback_and_raise(ValueError("Truncated gzip request body"))
+        return result
+    if encoding == "zstd" and zstandard is not None:
+        # max_output_size only bounds the frames which don't declare their size
+        if zstandard.frame_content_size(data) > max_size:
+            traceback_and_raise(too_large)
+        try:
+            return zstandard.ZstdDecompressor().decompress(
+                data, max_output_size=max_size
+            )
+        except zstandard.ZstdError as e:
+            traceback_and_raise(
+                ValueError(
+                    f"zstd request body is invalid or larger than {max_size} bytes. {e}"
+                )
+            )
+    traceback_and_raise(ValueError(f"Unsupported Content-Encoding: {encoding}"))
+
+
+def encode_body(
+    msg: SyftMessage, compression: Optional[str]
+) -> Tuple[bytes, Dict[str, str]]:
+    """Serialize a message into the body of a request, compressed if it is large
+    enough, and return it with the headers of the request"""
+    data_bytes: bytes = _serialize(msg, to_bytes=True)  # type: ignore
+    headers = {"Content-Type": "application/octet-stream"}
+    if compression is not None and len(data_bytes) >= COMPRESSION_MIN_SIZE:
+        data_bytes = compress(data=data_bytes, encoding=compression)
+        headers["Content-Encoding"] = compression
+    return data_bytes, headers
+
 
 class HTTPConnection(ClientConnection):
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 10,
+        timeout: Timeout = None,
+        retries: int = 3,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        The messages are sent through a pool of keep-alive connections to the node.
+
+        :param url: the url of the node.
+        :param pool_size: the number of connections kept open to the node.
+        :param timeout: the timeout of every request in seconds, or a tuple of the
+            connect and read timeouts. None waits forever.
+        :param retries: how many times a request is retried if the node can not be
+            reached. Messages are only sent again if the node did not receive them.
+        :param compression: "gzip" or "zstd" to compress the messages sent, the node
+            must accept this Content-Encoding.
+        """
+        check_compression(compression=compression)
+
         self.base_url = url
+        self.timeout = timeout
+        self.compression = compression
+        self.session = self._create_session(pool_size=pool_size, retries=retries)
+
+    @staticmethod
+    def _create_session(pool_size: int, retries: int) -> requests.Session:
+        # POST requests are only retried on connection errors, a message which
+        # reached the node is never sent twice
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=retries, backoff_factor=0.1),
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def send_immediate_msg_with_reply(
         self, msg: SignedImmediateSyftMessageWithReply
@@ -76,11 +207,12 @@ class HTTPConnection(ClientConnection):
         """
 
         # Perform HTTP request using base_url as a root address
-        data_bytes: bytes = _serialize(msg, to_bytes=True)  # type: ignore
-        r = requests.post(
+        data_bytes, headers = encode_body(msg=msg, compression=self.compression)
+        r = self.session.post(
             url=self.base_url,
             data=data_bytes,
-            headers={"Content-Type": "application/octet-stream"},
+            headers=headers,
+            timeout=self.timeout,
         )
 
         # Return request's response object
@@ -94,7 +226,13 @@ class HTTPConnection(ClientConnection):
         :return: returns node metadata
         :rtype: str of bytes
         """
-        data: bytes = requests.get(self.base_url + "/metadata").content
+        data: bytes = self.session.get(
+            self.base_url + "/metadata", timeout=self.timeout
+        ).content
         metadata_pb = Metadata_PB()
         metadata_pb.ParseFromString(data)
         return metadata_pb
+
+    def close(self) -> None:
+        """Close the pooled connections to the node"""
+        self.session.close()
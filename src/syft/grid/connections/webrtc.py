@@ -79,11 +79,17 @@ Signaling Steps:
 # stdlib
 import asyncio
 import math
+import mmap
 import os
 import secrets
+import tempfile
 import time
 from typing import Any
+from typing import Awaitable
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -96,6 +102,7 @@ from aiortc.contrib.signaling import object_to_string
 # syft relative
 from ... import serialize
 from ...core.common.event_loop import loop
+from ...core.common.event_loop import run_coroutine
 from ...core.common.message import SignedEventualSyftMessageWithoutReply
 from ...core.common.message import SignedImmediateSyftMessageWithReply
 from ...core.common.message import SignedImmediateSyftMessageWithoutReply
@@ -121,6 +128,18 @@ try:
 except KeyError:
     DC_MAX_BUFSIZE = 2 ** 22
 
+# chunked messages larger than this are assembled in a temporary file
+try:
+    DC_SPILL_SIZE = int(os.environ["DC_SPILL_SIZE"])
+except KeyError:
+    DC_SPILL_SIZE = 2 ** 28
+
+# every message is prefixed with the id of the request it replies to, or of the
+# request itself if it expects a reply, so replies can arrive in any order. Peers
+# announce the prefix during signaling, older peers send messages without it.
+DC_REPLY_ID_SIZE = 16
+DC_NO_REPLY_ID = bytes(DC_REPLY_ID_SIZE)
+
 
 class OrderedChunk:
     def __init__(self, idx: int, data: bytes):
@@ -128,13 +147,95 @@ class OrderedChunk:
         self.data = data
 
     def save(self) -> bytes:
+        # data can be a memoryview, it is copied once into the frame
         return self.idx.to_bytes(4, "big") + self.data
 
     @classmethod
     def load(cls, data: bytes) -> "OrderedChunk":
         idx = int.from_bytes(data[:4], "big")
-        data = data[4:]
-        return cls(idx, data)
+        return cls(idx, memoryview(data)[4:])
+
+
+class ChunkedPayload:
+    """
+    Assembles the chunks of a message in a buffer allocated once when the first
+    chunk announces the message, or in a temporary file for messages larger than
+    DC_SPILL_SIZE.
+    """
+
+    def __init__(self, chunk_count: int, header: bytes) -> None:
+        # the reply id is followed by the size of the message and of its chunks
+        self.reply_id = bytes(header[:DC_REPLY_ID_SIZE])
+        size = int.from_bytes(header[DC_REPLY_ID_SIZE:-4], "big")
+        self.chunk_size = int.from_bytes(header[-4:], "big")
+        self.pending = chunk_count
+        self.received = [False] * chunk_count
+
+        self.file: Optional[Any] = None
+        self.mapped: Optional[mmap.mmap] = None
+        if size > DC_SPILL_SIZE:
+            self.file = tempfile.TemporaryFile()
+            self.file.truncate(size)
+            self.mapped = mmap.mmap(self.file.fileno(), size)
+            self.view = memoryview(self.mapped)
+        else:
+            self.view = memoryview(bytearray(size))
+
+    @staticmethod
+    def header(reply_id: bytes, size: int, chunk_size: int) -> bytes:
+        return (
+            DC_CHUNK_START_SIGN
+            + reply_id
+            + size.to_bytes(8, "big")
+            + chunk_size.to_bytes(4, "big")
+        )
+
+    def add(self, chunk: OrderedChunk) -> bool:
+        """
+        Copy a chunk in place.
+
+        Returns:
+            True once all the chunks were added.
+        """
+        if not self.received[chunk.idx]:
+            self.received[chunk.idx] = True
+            self.pending -= 1
+        start = chunk.idx * self.chunk_size
+        end = start + len(chunk.data)
+        self.view[start:end] = chunk.data  # type: ignore
+        return self.pending == 0
+
+    def close(self) -> None:
+        self.view.release()
+        if self.mapped is not None:
+            self.mapped.close()
+        if self.file is not None:
+            self.file.close()
+
+
+class LegacyChunkedPayload:
+    """
+    Assembles the chunks of a message sent by a peer which announces neither the
+    size of the message nor a reply id.
+    """
+
+    def __init__(self, chunk_count: int) -> None:
+        self.reply_id = DC_NO_REPLY_ID
+        self.pending = chunk_count
+        self.chunks: List[Optional[bytes]] = [None] * chunk_count
+        self.view = memoryview(b"")
+
+    def add(self, chunk: OrderedChunk) -> bool:
+        if self.chunks[chunk.idx] is None:
+            self.pending -= 1
+        self.chunks[chunk.idx] = bytes(chunk.data)
+        if self.pending == 0:
+            self.view = memoryview(b"".join(c for c in self.chunks if c is not None))
+            self.chunks = []
+        return self.pending == 0
+
+    def close(self) -> None:
+        self.view.release()
 
 
 class WebRTCConnection(BidirectionalConnection):
@@ -166,7 +267,18 @@ class WebRTCConnection(BidirectionalConnection):
             )  # Request Messages / Request Responses
             self.consumer_pool: asyncio.Queue = asyncio.Queue(
                 loop=self.loop,
-            )  # Request Responses
+            )  # Request Responses which match no pending request
+
+            # Replies awaited by send_sync_message, by request id, so many
+            # requests can be in flight at once
+            self.pending_replies: Dict[bytes, asyncio.Future] = {}
+
+            # The chunked message being received
+            self._incoming: Optional[Union[ChunkedPayload, LegacyChunkedPayload]] = None
+
+            # Prefix the messages with reply ids, the signaling turns it off for
+            # peers which do not announce them
+            self.reply_ids = True
 
             # Initialize a PeerConnection structure
             self.peer_connection = RTCPeerConnection()
@@ -205,32 +317,14 @@ class WebRTCConnection(BidirectionalConnection):
             async def on_open() -> None:  # type : ignore
                 self.__producer_task = asyncio.ensure_future(self.producer())
 
-            chunked_msg = []
-            chunks_pending = 0
-
             # This method is the aioRTC "consumer" task
             # and will be running as long as connection remains.
             # At this point we're just setting the method behavior
             # It'll start running after the connection opens.
             @self.channel.on("message")
             async def on_message(raw: bytes) -> None:
-                nonlocal chunked_msg, chunks_pending
-
-                chunk = OrderedChunk.load(raw)
-                message = chunk.data
-
-                if message == DC_CHUNK_START_SIGN:
-                    chunks_pending = chunk.idx
-                    chunked_msg = [b""] * chunks_pending
-                elif chunks_pending:
-                    if chunked_msg[chunk.idx] == b"":
-                        chunks_pending -= 1
-                    chunked_msg[chunk.idx] = message
-                    if chunks_pending == 0:
-                        await self.consumer(msg=b"".join(chunked_msg))
-                else:
-                    # Forward all received messages to our own consumer method.
-                    await self.consumer(msg=message)
+                # Forward all received messages to our own consumer method.
+                await self._receive(raw=raw)
 
             # Set peer_connection to generate an offer message type.
             await self.peer_connection.setLocalDescription(
@@ -263,28 +357,14 @@ class WebRTCConnection(BidirectionalConnection):
             def on_datachannel(channel: RTCDataChannel) -> None:
                 self.channel = channel
 
-                self.__producer_task = asyncio.ensure_future(self.producer())
+                # Keep send buffer busy with chunks
+                self.channel.bufferedAmountLowThreshold = 4 * DC_MAX_CHUNK_SIZE
 
-                chunked_msg = []
-                chunks_pending = 0
+                self.__producer_task = asyncio.ensure_future(self.producer())
 
                 @self.channel.on("message")
                 async def on_message(raw: bytes) -> None:
-                    nonlocal chunked_msg, chunks_pending
-
-                    chunk = OrderedChunk.load(raw)
-                    message = chunk.data
-                    if message == DC_CHUNK_START_SIGN:
-                        chunks_pending = chunk.idx
-                        chunked_msg = [b""] * chunks_pending
-                    elif chunks_pending:
-                        if chunked_msg[chunk.idx] == b"":
-                            chunks_pending -= 1
-                        chunked_msg[chunk.idx] = message
-                        if chunks_pending == 0:
-                            await self.consumer(msg=b"".join(chunked_msg))
-                    else:
-                        await self.consumer(msg=message)
+                    await self._receive(raw=raw)
 
             result = await self._process_answer(payload=payload)
             return validate_type(result, str)
@@ -342,57 +422,81 @@ class WebRTCConnection(BidirectionalConnection):
             while True:
                 # If self.producer_pool is empty, give up task queue priority
                 # and give computing time to the next task.
-                msg = await self.producer_pool.get()
+                reply_id, msg = await self.producer_pool.get()
 
                 # If self.producer_pool.get() returns a message
                 # send it as a binary using the RTCDataChannel.
-                data = serialize(msg, to_bytes=True)
-                data_len = len(data)
-
-                if DC_CHUNKING_ENABLED and data_len > DC_MAX_CHUNK_SIZE:
-                    chunk_num = 0
-                    done = False
-                    sent: asyncio.Future = asyncio.Future(loop=self.loop)
-
-                    def send_data_chunks() -> None:
-                        nonlocal chunk_num, data_len, done, sent
-                        # Send chunks until buffered amount is big or we're done
-                        while (
-                            self.channel.bufferedAmount <= DC_MAX_BUFSIZE and not done
-                        ):
-                            start_offset = chunk_num * DC_MAX_CHUNK_SIZE
-                            end_offset = min(
-                                (chunk_num + 1) * DC_MAX_CHUNK_SIZE, data_len
-                            )
-                            chunk = data[start_offset:end_offset]
-                            self.channel.send(OrderedChunk(chunk_num, chunk).save())
-                            chunk_num += 1
-                            if chunk_num * DC_MAX_CHUNK_SIZE >= data_len:
-                                done = True
-                                sent.set_result(True)
-
-                        if not done:
-                            # Set listener for next round of sending when buffer is empty
-                            self.channel.once("bufferedamountlow", send_data_chunks)
-
-                    chunk_count = math.ceil(data_len / DC_MAX_CHUNK_SIZE)
-                    self.channel.send(
-                        OrderedChunk(chunk_count, DC_CHUNK_START_SIGN).save()
-                    )
-                    send_data_chunks()
-                    # Wait until all chunks are dispatched
-                    await sent
+                data = validate_type(serialize(msg, to_bytes=True), bytes)
+
+                if DC_CHUNKING_ENABLED and len(data) > DC_MAX_CHUNK_SIZE:
+                    await self._send_chunks(reply_id=reply_id, data=data)
+                elif self.reply_ids:
+                    self.channel.send(OrderedChunk(0, reply_id + data).save())
                 else:
                     self.channel.send(OrderedChunk(0, data).save())
         except Exception as e:
             traceback_and_raise(e)
 
+    async def _send_chunks(self, reply_id: bytes, data: bytes) -> None:
+        """
+        Send a message in chunks of DC_MAX_CHUNK_SIZE, waiting for the buffer of the
+        channel to drain whenever more than DC_MAX_BUFSIZE bytes are in flight.
+        The chunks are views of the message, each is only copied into its frame.
+        """
+        chunk_count = math.ceil(len(data) / DC_MAX_CHUNK_SIZE)
+        header = DC_CHUNK_START_SIGN
+        if self.reply_ids:
+            header = ChunkedPayload.header(
+                reply_id=reply_id, size=len(data), chunk_size=DC_MAX_CHUNK_SIZE
+            )
+        self.channel.send(OrderedChunk(chunk_count, header).save())
+
+        drained = asyncio.Event()
+        self.channel.on("bufferedamountlow", drained.set)
+        try:
+            view = memoryview(data)
+            for chunk_num in range(chunk_count):
+                while self.channel.bufferedAmount > DC_MAX_BUFSIZE:
+                    drained.clear()
+                    await drained.wait()
+                start = chunk_num * DC_MAX_CHUNK_SIZE
+                end = start + DC_MAX_CHUNK_SIZE
+                self.channel.send(OrderedChunk(chunk_num, view[start:end]).save())
+        finally:
+            self.channel.remove_listener("bufferedamountlow", drained.set)
+
+    async def _receive(self, raw: bytes) -> None:
+        chunk = OrderedChunk.load(raw)
+        message = chunk.data
+
+        sign_size = len(DC_CHUNK_START_SIGN)
+        if message[:sign_size] == DC_CHUNK_START_SIGN:
+            if len(message) == sign_size:
+                self._incoming = LegacyChunkedPayload(chunk_count=chunk.idx)
+            else:
+                self._incoming = ChunkedPayload(
+                    chunk_count=chunk.idx, header=message[sign_size:]
+                )
+        elif self._incoming is not None:
+            incoming = self._incoming
+            if incoming.add(chunk=chunk):
+                self._incoming = None
+                try:
+                    await self.consumer(msg=incoming.view, reply_id=incoming.reply_id)
+                finally:
+                    incoming.close()
+        else:
+            await self._consume_payload(payload=message)
+
     def close(self) -> None:
         try:
             # Build Close Message to warn the other peer
             bye_msg = CloseConnectionMessage(address=Address())
 
-            self.channel.send(OrderedChunk(0, serialize(bye_msg, to_bytes=True)).save())
+            data = validate_type(serialize(bye_msg, to_bytes=True), bytes)
+            if self.reply_ids:
+                data = DC_NO_REPLY_ID + data
+            self.channel.send(OrderedChunk(0, data).save())
 
             # Finish async tasks related with this connection
             self._finish_coroutines()
@@ -401,16 +505,42 @@ class WebRTCConnection(BidirectionalConnection):
 
     def _finish_coroutines(self) -> None:
         try:
-            asyncio.run(self.peer_connection.close())
+            # the replies will not arrive anymore
+            for future in self.pending_replies.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebRTC connection closed"))
+            self.pending_replies.clear()
+
+            self._run(self.peer_connection.close())
             self.__producer_task.cancel()
         except Exception as e:
             traceback_and_raise(e)
 
-    async def consumer(self, msg: bytes) -> None:
+    def _run(self, coro: Awaitable) -> Any:
+        """Run a coroutine on the event loop of the connection and wait for its result"""
+        return run_coroutine(coro, event_loop=self.loop)
+
+    def _put_nowait(self, item: Tuple[bytes, Any]) -> None:
+        # asyncio queues are not thread-safe, the loop may run in another thread
+        self.loop.call_soon_threadsafe(self.producer_pool.put_nowait, item)
+
+    async def _consume_payload(self, payload: bytes) -> None:
+        if not self.reply_ids:
+            await self.consumer(msg=payload)
+            return
+        await self.consumer(
+            msg=payload[DC_REPLY_ID_SIZE:], reply_id=bytes(payload[:DC_REPLY_ID_SIZE])
+        )
+
+    async def consumer(self, msg: bytes, reply_id: bytes = DC_NO_REPLY_ID) -> None:
         """
         Async task to receive/process messages sent by the other side.
         These messages will be sent by the other peer as a service requests or responses
         for requests made by this connection previously (ImmediateSyftMessageWithReply).
+
+        Args:
+            msg: The serialized message.
+            reply_id: The id of the request with reply this message belongs to.
         """
         try:
             # Deserialize the received message
@@ -427,7 +557,7 @@ class WebRTCConnection(BidirectionalConnection):
                 # Immediate message with reply
                 if isinstance(_msg, SignedImmediateSyftMessageWithReply):
                     reply = self.recv_immediate_msg_with_reply(msg=_msg)
-                    await self.producer_pool.put(reply)
+                    await self.producer_pool.put((reply_id, reply))
 
                 # Immediate message without reply
                 elif isinstance(_msg, SignedImmediateSyftMessageWithoutReply):
@@ -443,7 +573,11 @@ class WebRTCConnection(BidirectionalConnection):
 
             # If it's true, the message will have the client's address as destination.
             else:
-                await self.consumer_pool.put(_msg)
+                future = self.pending_replies.pop(reply_id, None)
+                if future is not None and not future.done():
+                    future.set_result(_msg)
+                else:
+                    await self.consumer_pool.put(_msg)
 
         except Exception as e:
             traceback_and_raise(e)
@@ -461,11 +595,13 @@ class WebRTCConnection(BidirectionalConnection):
         try:
             r = secrets.randbelow(100000)
             debug(
-                f"> Before recv_immediate_msg_with_reply {r} {msg.message} {type(msg.message)}"
+                lambda: f"> Before recv_immediate_msg_with_reply {r} "
+                + f"{msg.message} {type(msg.message)}"
             )
             reply = self.node.recv_immediate_msg_with_reply(msg=msg)
             debug(
-                f"> After recv_immediate_msg_with_reply {r} {msg.message} {type(msg.message)}"
+                lambda: f"> After recv_immediate_msg_with_reply {r} "
+                + f"{msg.message} {type(msg.message)}"
             )
             return reply
         except Exception as e:
@@ -480,11 +616,13 @@ class WebRTCConnection(BidirectionalConnection):
         try:
             r = secrets.randbelow(100000)
             debug(
-                f"> Before recv_immediate_msg_without_reply {r} {msg.message} {type(msg.message)}"
+                lambda: f"> Before recv_immediate_msg_without_reply {r} "
+                + f"{msg.message} {type(msg.message)}"
             )
             self.node.recv_immediate_msg_without_reply(msg=msg)
             debug(
-                f"> After recv_immediate_msg_without_reply {r} {msg.message} {type(msg.message)}"
+                lambda: f"> After recv_immediate_msg_without_reply {r} "
+                + f"{msg.message} {type(msg.message)}"
             )
         except Exception as e:
             traceback_and_raise(e)
@@ -512,11 +650,7 @@ class WebRTCConnection(BidirectionalConnection):
         :rtype: SignedImmediateSyftMessageWithReply
         """
         try:
-            # properly fix this!
-            return validate_type(
-                asyncio.run(self.send_sync_message(msg=msg)),
-                object,
-            )
+            return validate_type(self._run(self.send_sync_message(msg=msg)), object)
         except Exception as e:
             traceback_and_raise(e)
             raise Exception("mypy workaound: should not get here")
@@ -528,8 +662,7 @@ class WebRTCConnection(BidirectionalConnection):
         Sends high priority messages without waiting for their reply.
         """
         try:
-            # asyncio.run(self.producer_pool.put_nowait(msg))
-            self.producer_pool.put_nowait(msg)
+            self._put_nowait((DC_NO_REPLY_ID, msg))
         except Exception as e:
             traceback_and_raise(e)
 
@@ -540,7 +673,7 @@ class WebRTCConnection(BidirectionalConnection):
         Sends low priority messages without waiting for their reply.
         """
         try:
-            asyncio.run(self.producer_pool.put(msg))
+            self._put_nowait((DC_NO_REPLY_ID, msg))
         except Exception as e:
             traceback_and_raise(e)
 
@@ -554,27 +687,33 @@ class WebRTCConnection(BidirectionalConnection):
         :rtype: SignedImmediateSyftMessageWithoutReply
         """
         try:
-            # To ensure the sequence of sending / receiving messages
-            # it's necessary to keep only a unique reference for reading
-            # inputs (producer) and outputs (consumer).
             r = secrets.randbelow(100000)
-            # To be able to perform this method synchronously (waiting for the reply)
-            # without blocking async methods, we need to use queues.
+            if not self.reply_ids:
+                # older peers reply in the order of the requests, without reply ids
+                await self.producer_pool.put((DC_NO_REPLY_ID, msg))
+                return await self.consumer_pool.get()
+
+            # The reply is matched to this request by its id, other requests can be
+            # sent before it arrives.
+            reply_id = msg.id.value.bytes
+            reply: asyncio.Future = self.loop.create_future()
+            self.pending_replies[reply_id] = reply
 
             # Enqueue the message to be sent to the target.
             debug(f"> Before send_sync_message producer_pool.put blocking {r}")
-            # self.producer_pool.put_nowait(msg)
-            await self.producer_pool.put(msg)
+            await self.producer_pool.put((reply_id, msg))
             debug(f"> After send_sync_message producer_pool.put blocking {r}")
 
-            # Wait for the response checking the consumer queue.
-            debug(f"> Before send_sync_message consumer_pool.get blocking {r} {msg}")
+            # Wait for the response to be matched by the consumer.
             debug(
-                f"> Before send_sync_message consumer_pool.get blocking {r} {msg.message}"
+                lambda: f"> Before send_sync_message reply blocking {r} {msg.message}"
             )
-            response = await self.consumer_pool.get()
+            try:
+                response = await reply
+            finally:
+                self.pending_replies.pop(reply_id, None)
 
-            debug(f"> After send_sync_message consumer_pool.get blocking {r}")
+            debug(f"> After send_sync_message reply blocking {r}")
             return response
         except Exception as e:
             traceback_and_raise(e)
@@ -155,6 +155,7 @@ def duet(
     network_url: str = "",
     loopback: bool = False,
     db_path: Optional[str] = None,
+    memory_budget: Optional[int] = None,
 ) -> Client:
     if target_id is not None:
         return join_duet(
@@ -162,7 +163,11 @@ def duet(
         )
     else:
         return launch_duet(
-            logging=logging, network_url=network_url, loopback=loopback, db_path=db_path
+            logging=logging,
+            network_url=network_url,
+            loopback=loopback,
+            db_path=db_path,
+            memory_budget=memory_budget,
         )
 
 
@@ -172,6 +177,7 @@ def launch_duet(
     loopback: bool = False,
     credential_exchanger: DuetCredentialExchanger = OpenGridTokenManualInputExchanger(),
     db_path: Optional[str] = None,
+    memory_budget: Optional[int] = None,
 ) -> Client:
     if os.path.isfile(LOGO_URL) and is_jupyter:
         display(
@@ -207,7 +213,7 @@ def launch_duet(
 
     info("♫♫♫ > " + bcolors.OKGREEN + "DONE!" + bcolors.ENDC, print=True)
 
-    my_domain = Domain(name="Launcher", db_path=db_path)
+    my_domain = Domain(name="Launcher", db_path=db_path, memory_budget=memory_budget)
 
     if loopback:
         credential_exchanger = OpenGridTokenFileExchanger()
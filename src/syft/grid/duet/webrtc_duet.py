@@ -29,6 +29,7 @@ source code.
 
 # stdlib
 import asyncio
+import time
 from typing import Optional
 
 # third party
@@ -52,6 +53,10 @@ from ..services.signaling_service import SignalingOfferMessage
 
 
 class Duet(DomainClient):
+    # Pull requests wait up to this many seconds on the signaling server for the
+    # offer/answer of the other peer, instead of being retried every half second
+    signaling_pull_timeout = 10.0
+
     def __init__(
         self,
         node: Domain,
@@ -102,6 +107,7 @@ class Duet(DomainClient):
                     target_peer=target_id,
                     host_peer=self.signaling_client.duet_id,
                     reply_to=self.signaling_client.address,
+                    timeout=self.signaling_pull_timeout,
                 )
             )
         else:
@@ -193,6 +199,7 @@ class Duet(DomainClient):
                 # If self.push_msg_queue.get() returned a message (SignalingOfferMessage,SignalingAnswerMessage)
                 # send it to the signaling server.
                 self.signaling_client.send_immediate_msg_without_reply(msg=msg)
+                self._push_msg_queue.task_done()
         except Exception as e:
             log = f"Got an exception in Duet push. {e}"
             error(log)
@@ -210,7 +217,9 @@ class Duet(DomainClient):
                 msg = await self._pull_msg_queue.get()
 
                 # If self.pull_msg_queue.get() returned a message (OfferPullRequestMessage,AnswerPullRequestMessage)
-                # send it to the signaling server.
+                # send it to the signaling server, which holds the request until
+                # a signaling message arrives or the request times out.
+                start = time.monotonic()
                 _response = self.signaling_client.send_immediate_msg_with_reply(msg=msg)
 
                 # If Signaling Offer Message was found
@@ -231,10 +240,16 @@ class Duet(DomainClient):
                 else:
                     # Just enqueue the request to be processed later.
                     self._pull_msg_queue.put_nowait(msg)
+                    # Signaling servers which do not hold pull requests reply
+                    # right away, poll them every half second as before.
+                    elapsed = time.monotonic() - start
+                    await asyncio.sleep(min(0.5, max(0.0, msg.timeout - elapsed)))
+
+                # Wait until the answer, if any, was pushed to the signaling server
+                await self._push_msg_queue.join()
 
                 # Checks if the signaling process is over.
                 self._available = self._update_availability()
-                await asyncio.sleep(0.5)
 
         except Exception as e:
             log = f"Got an exception in Duet pull. {e}"
@@ -259,6 +274,7 @@ class Duet(DomainClient):
                 host_metadata=self.node.get_metadata_for_client(),  # Own Node Metadata
                 target_peer=target_id,
                 host_peer=self.signaling_client.duet_id,  # Own Node ID
+                reply_ids=True,
             )
 
             # Enqueue it in push msg queue to be sent to the signaling server.
@@ -271,6 +287,7 @@ class Duet(DomainClient):
                     target_peer=target_id,
                     host_peer=self.signaling_client.duet_id,
                     reply_to=self.signaling_client.address,
+                    timeout=self.signaling_pull_timeout,
                 )
             )
         except Exception as e:
@@ -280,6 +297,10 @@ class Duet(DomainClient):
         """Process SignalingOfferMessage and create a new
         SignalingAnswerMessage as a response"""
         try:
+            # Frame the messages like the peer does, older peers do not send
+            # reply ids
+            self.connection.reply_ids = msg.reply_ids
+
             # Process received offer message updating target's remote address
             # Generates an answer request payload containing
             # local network description data/metadata (IP, MAC, Mask, etc...)
@@ -295,6 +316,7 @@ class Duet(DomainClient):
                 host_metadata=self.node.get_metadata_for_client(),  # Own Node Metadata
                 target_peer=msg.host_peer,  # Remote Node ID
                 host_peer=self.signaling_client.duet_id,
+                reply_ids=True,
             )
 
             # Enqueue it in the push msg queue to be sent to the signaling server.
@@ -310,6 +332,10 @@ class Duet(DomainClient):
             # Save remote node's metadata in roder to create a SoloRoute.
             self._client_metadata = msg.host_metadata
 
+            # Frame the messages like the peer does, older peers do not send
+            # reply ids
+            self.connection.reply_ids = msg.reply_ids
+
             # Process received offer message updating target's remote address
             await self.connection._process_answer(payload=msg.payload)
         except Exception as e:
@@ -23,6 +23,7 @@ from syft.core.common.message import SignedImmediateSyftMessageWithReply
 from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
 from syft.core.common.serde.deserialize import _deserialize
 from syft.core.node.network.network import Network
+from syft.grid.connections.http_connection import decompress
 from syft.grid.services.signaling_service import PullSignalingService
 from syft.grid.services.signaling_service import PushSignalingService
 from syft.grid.services.signaling_service import RegisterDuetPeerService
@@ -52,7 +53,13 @@ def get_metadata() -> flask.Response:
 
 @app.route("/", methods=["POST"])
 def process_network_msgs() -> flask.Response:
-    data = flask.request.get_data()
+    try:
+        data = decompress(
+            data=flask.request.get_data(),
+            encoding=flask.request.headers.get("Content-Encoding", None),
+        )
+    except ValueError as e:
+        return Response(response=str(e), status=400)
     obj_msg = _deserialize(blob=data, from_bytes=True)
     if isinstance(obj_msg, SignedImmediateSyftMessageWithReply):
         info(
@@ -1,7 +1,13 @@
 # stdlib
+from collections import deque
 import secrets
+import threading
+import time
+from typing import Deque
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -63,10 +69,14 @@ class OfferPullRequestMessage(ImmediateSyftMessageWithReply):
         host_peer: str,
         reply_to: Address,
         msg_id: Optional[UID] = None,
+        timeout: float = 0,
     ):
         super().__init__(address=address, msg_id=msg_id, reply_to=reply_to)
         self.target_peer = target_peer
         self.host_peer = host_peer
+        # seconds the signaling server waits for a message before replying
+        # SignalingRequestsNotFound
+        self.timeout = timeout
 
     def _object2proto(self) -> OfferPullRequestMessage_PB:
         """Returns a protobuf serialization of self.
@@ -89,6 +99,7 @@ class OfferPullRequestMessage(ImmediateSyftMessageWithReply):
             target_peer=self.target_peer,
             host_peer=self.host_peer,
             reply_to=serialize(self.reply_to),
+            timeout=self.timeout,
         )
 
     @staticmethod
@@ -112,6 +123,7 @@ class OfferPullRequestMessage(ImmediateSyftMessageWithReply):
             target_peer=proto.target_peer,
             host_peer=proto.host_peer,
             reply_to=_deserialize(blob=proto.reply_to),
+            timeout=proto.timeout,
         )
 
     @staticmethod
@@ -146,10 +158,14 @@ class AnswerPullRequestMessage(ImmediateSyftMessageWithReply):
         host_peer: str,
         reply_to: Address,
         msg_id: Optional[UID] = None,
+        timeout: float = 0,
     ):
         super().__init__(address=address, msg_id=msg_id, reply_to=reply_to)
         self.target_peer = target_peer
         self.host_peer = host_peer
+        # seconds the signaling server waits for a message before replying
+        # SignalingRequestsNotFound
+        self.timeout = timeout
 
     def _object2proto(self) -> AnswerPullRequestMessage_PB:
         """Returns a protobuf serialization of self.
@@ -172,6 +188,7 @@ class AnswerPullRequestMessage(ImmediateSyftMessageWithReply):
             target_peer=self.target_peer,
             host_peer=self.host_peer,
             reply_to=serialize(self.reply_to),
+            timeout=self.timeout,
         )
 
     @staticmethod
@@ -195,6 +212,7 @@ class AnswerPullRequestMessage(ImmediateSyftMessageWithReply):
             target_peer=proto.target_peer,
             host_peer=proto.host_peer,
             reply_to=_deserialize(blob=proto.reply_to),
+            timeout=proto.timeout,
         )
 
     @staticmethod
@@ -383,12 +401,16 @@ class SignalingOfferMessage(ImmediateSyftMessageWithoutReply):
         target_peer: str,
         host_peer: str,
         msg_id: Optional[UID] = None,
+        reply_ids: bool = False,
     ):
         super().__init__(address=address, msg_id=msg_id)
         self.payload = payload
         self.host_metadata = host_metadata
         self.target_peer = target_peer
         self.host_peer = host_peer
+        # if the host prefixes the frames of its data channel with reply ids,
+        # peers older than this flag do not set it
+        self.reply_ids = reply_ids
 
     def _object2proto(self) -> SignalingOfferMessage_PB:
         """Returns a protobuf serialization of self.
@@ -412,6 +434,7 @@ class SignalingOfferMessage(ImmediateSyftMessageWithoutReply):
             host_metadata=serialize(self.host_metadata),
             target_peer=self.target_peer,
             host_peer=self.host_peer,
+            reply_ids=self.reply_ids,
         )
 
     @staticmethod
@@ -436,6 +459,7 @@ class SignalingOfferMessage(ImmediateSyftMessageWithoutReply):
             host_metadata=_deserialize(blob=proto.host_metadata),
             target_peer=proto.target_peer,
             host_peer=proto.host_peer,
+            reply_ids=proto.reply_ids,
         )
 
     @staticmethod
@@ -471,12 +495,16 @@ class SignalingAnswerMessage(ImmediateSyftMessageWithoutReply):
         target_peer: str,
         host_peer: str,
         msg_id: Optional[UID] = None,
+        reply_ids: bool = False,
     ):
         super().__init__(address=address, msg_id=msg_id)
         self.payload = payload
         self.host_metadata = host_metadata
         self.target_peer = target_peer
         self.host_peer = host_peer
+        # if the host prefixes the frames of its data channel with reply ids,
+        # peers older than this flag do not set it
+        self.reply_ids = reply_ids
 
     def _object2proto(self) -> SignalingAnswerMessage_PB:
         """Returns a protobuf serialization of self.
@@ -501,6 +529,7 @@ class SignalingAnswerMessage(ImmediateSyftMessageWithoutReply):
             host_metadata=serialize(self.host_metadata),
             target_peer=self.target_peer,
             host_peer=self.host_peer,
+            reply_ids=self.reply_ids,
         )
 
     @staticmethod
@@ -525,6 +554,7 @@ class SignalingAnswerMessage(ImmediateSyftMessageWithoutReply):
             host_metadata=_deserialize(blob=proto.host_metadata),
             target_peer=proto.target_peer,
             host_peer=proto.host_peer,
+            reply_ids=proto.reply_ids,
         )
 
     @staticmethod
@@ -766,6 +796,24 @@ class CloseConnectionMessage(ImmediateSyftMessageWithoutReply):
         return CloseConnectionMessage_PB
 
 
+class SignalingQueues:
+    """
+    FIFO queues of the ids of the signaling messages pushed to a peer, one for each
+    sending peer and message type, so pulls dequeue them in constant time instead of
+    scanning every message pushed to the peer. Pulls wait on the condition for new
+    messages.
+    """
+
+    def __init__(self) -> None:
+        self.queues: Dict[Tuple[str, type], Deque[UID]] = {}
+        self.condition = threading.Condition()
+
+    def push(self, key: Tuple[str, type], msg_id: UID) -> None:
+        with self.condition:
+            self.queues.setdefault(key, deque()).append(msg_id)
+            self.condition.notify_all()
+
+
 class RegisterDuetPeerService(ImmediateNodeServiceWithReply):
     @staticmethod
     @service_auth(guests_welcome=True)
@@ -775,7 +823,11 @@ class RegisterDuetPeerService(ImmediateNodeServiceWithReply):
         verify_key: VerifyKey,
     ) -> PeerSuccessfullyRegistered:
         peer_id = secrets.token_hex(nbytes=16)
-        node.signaling_msgs[peer_id] = {VerifyKey: verify_key, SyftMessage: {}}
+        node.signaling_msgs[peer_id] = {
+            VerifyKey: verify_key,
+            SyftMessage: {},
+            SignalingQueues: SignalingQueues(),
+        }
         return PeerSuccessfullyRegistered(address=msg.reply_to, peer_id=peer_id)
 
     @staticmethod
@@ -797,6 +849,9 @@ class PushSignalingService(ImmediateNodeServiceWithoutReply):
         if msg.host_peer != msg.target_peer and _peer_signaling:
             # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
             _peer_signaling[SyftMessage][msg.id] = msg
+            _peer_signaling[SignalingQueues].push(
+                key=(msg.host_peer, type(msg)), msg_id=msg.id
+            )
 
     @staticmethod
     def message_handler_types() -> List[Type[ImmediateSyftMessageWithoutReply]]:
@@ -810,6 +865,9 @@ class PullSignalingService(ImmediateNodeServiceWithReply):
         AnswerPullRequestMessage: SignalingAnswerMessage,
     }
 
+    # the longest a pull request can wait for a signaling message, in seconds
+    max_pull_timeout = 30.0
+
     @staticmethod
     @service_auth(guests_welcome=True)
     def process(
@@ -827,35 +885,32 @@ class PullSignalingService(ImmediateNodeServiceWithReply):
         if msg.host_peer == msg.target_peer:
             return InvalidLoopBackRequest(address=msg.reply_to)
 
-        try:
-            sig_requests_for_me = (
-                lambda push_msg: push_msg.target_peer == msg.host_peer
-                and push_msg.host_peer == msg.target_peer
-                and node.signaling_msgs[msg.host_peer][VerifyKey] == verify_key
-                and isinstance(
-                    push_msg, PullSignalingService._pull_push_mapping[type(msg)]
-                )
-            )
-
-            # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
-            results = list(
-                filter(
-                    sig_requests_for_me,
-                    node.signaling_msgs[msg.host_peer][SyftMessage].values(),
-                )
-            )
+        # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
+        _peer_signaling = node.signaling_msgs.get(msg.host_peer, None)
+        if _peer_signaling is None or _peer_signaling[VerifyKey] != verify_key:
+            return SignalingRequestsNotFound(address=msg.reply_to)
 
-            if results:
-                result_msg = results.pop(0)  # FIFO
+        messages = _peer_signaling[SyftMessage]
+        signaling_queues = _peer_signaling[SignalingQueues]
+        key = (msg.target_peer, PullSignalingService._pull_push_mapping[type(msg)])
+        deadline = time.monotonic() + min(
+            msg.timeout, PullSignalingService.max_pull_timeout
+        )
 
-                # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
-                return node.signaling_msgs[msg.host_peer][SyftMessage].pop(
-                    result_msg.id
-                )  # Retrieve and remove it from storage
-            else:
-                return SignalingRequestsNotFound(address=msg.reply_to)
-        except KeyError:
-            return SignalingRequestsNotFound(address=msg.reply_to)
+        with signaling_queues.condition:
+            while True:
+                queue = signaling_queues.queues.get(key, deque())
+                while queue:
+                    # messages already removed from the storage are skipped
+                    result_msg = messages.pop(queue.popleft(), None)
+                    if result_msg is not None:
+                        return result_msg
+
+                # Wait until a message is pushed or the request times out
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return SignalingRequestsNotFound(address=msg.reply_to)
+                signaling_queues.condition.wait(timeout=remaining)
 
     @staticmethod
     def message_handler_types() -> List[Type[ImmediateSyftMessageWithReply]]:
@@ -136,14 +136,10 @@ def _load_lib(*, lib: str, options: TypeDict[str, TypeAny] = {}) -> None:
         vendor_requirements=PACKAGE_SUPPORT
     ):
         global lib_ast
+        # clients see the shared lib_ast through views, so it is updated only once
         _add_lib(vendor_ast=vendor_ast, ast_or_client=lib_ast)
-        # cache the constructor for future created clients
-        lib_ast.loaded_lib_constructors[lib] = getattr(vendor_ast, "update_ast", None)
         _regenerate_unions(lib_ast=lib_ast)
-
-        for _, client in lib_ast.registered_clients.items():
-            _add_lib(vendor_ast=vendor_ast, ast_or_client=client)
-            _regenerate_unions(lib_ast=lib_ast, client=client)
+        lib_ast.clear_path_cache()
 
 
 def load(
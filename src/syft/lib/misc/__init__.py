@@ -1,10 +1,10 @@
 # stdlib
 from collections import defaultdict
 import sys
+from typing import AbstractSet
 from typing import Any as TypeAny
 from typing import Callable
 from typing import Dict
-from typing import KeysView
 from typing import List as TypeList
 from typing import Set
 
@@ -13,6 +13,7 @@ from ...ast import add_classes
 from ...ast import add_methods
 from ...ast import add_modules
 from ...ast import globals
+from ...ast.klass import Class
 from ...logger import traceback_and_raise
 from .union import lazy_pairing
 
@@ -37,10 +38,13 @@ def get_allowed_functions(
     """
     allowed_functions: Dict[str, bool] = defaultdict(lambda: True)
 
-    def solve_ast_type_functions(path: str) -> KeysView:
-        root = lib_ast
+    def solve_ast_type_functions(path: str) -> AbstractSet[str]:
+        root: TypeAny = lib_ast
         for path_element in path.split("."):
             root = getattr(root, path_element)
+        # lazily built classes are not expanded just to list their attributes
+        if isinstance(root, Class):
+            return root.attr_names
         return root.attrs.keys()
 
     def solve_real_type_functions(path: str) -> Set[str]:
@@ -1,11 +1,12 @@
+# stdlib
+import ast
+
 # third party
 import numpy as np
-import torch
 
 # syft relative
 from ...generate_wrapper import GenerateWrapper
 from ...lib.torch.tensor_util import protobuf_tensor_deserializer
-from ...lib.torch.tensor_util import protobuf_tensor_serializer
 from ...proto.lib.numpy.array_pb2 import NumpyProto
 
 SUPPORTED_BOOL_TYPES = [np.bool_]
@@ -26,41 +27,53 @@ SUPPORTED_FLOAT_TYPES = [
     np.float64,
 ]
 
-SUPPORTED_DTYPES = SUPPORTED_BOOL_TYPES + SUPPORTED_INT_TYPES + SUPPORTED_FLOAT_TYPES
+SUPPORTED_COMPLEX_TYPES = [
+    np.complex64,
+    np.complex128,
+]
 
-DTYPE_REFACTOR = {
-    np.dtype("uint16"): np.int16,
-    np.dtype("uint32"): np.int32,
-    np.dtype("uint64"): np.int64,
-}
+SUPPORTED_DTYPES = (
+    SUPPORTED_BOOL_TYPES
+    + SUPPORTED_INT_TYPES
+    + SUPPORTED_FLOAT_TYPES
+    + SUPPORTED_COMPLEX_TYPES
+)
 
 
 def object2proto(obj: np.ndarray) -> NumpyProto:
-    original_dtype = obj.dtype
-    if original_dtype not in SUPPORTED_DTYPES:
-        raise NotImplementedError(f"{original_dtype} is not supported")
+    if obj.dtype.hasobject:
+        raise NotImplementedError(f"{obj.dtype} is not supported")
 
-    if original_dtype in DTYPE_REFACTOR:
-        # store as a signed int, the negative wrap around values convert back to the
-        # same original unsigned values on the other side
-        obj = obj.astype(DTYPE_REFACTOR[original_dtype])
+    # same layout rules as the .npy format, fortran ordered arrays are written
+    # transposed so neither ordering needs a copy before tobytes
+    fortran_order = obj.flags.f_contiguous and not obj.flags.c_contiguous
+    data = obj.tobytes(order="F" if fortran_order else "C")
 
-    tensor = torch.from_numpy(obj).clone()
-    tensor_proto = protobuf_tensor_serializer(tensor)
-    dtype = original_dtype.name
-
-    return NumpyProto(tensor=tensor_proto, dtype=dtype)
+    return NumpyProto(
+        data=data,
+        shape=obj.shape,
+        descr=repr(np.lib.format.dtype_to_descr(obj.dtype)),
+        fortran_order=fortran_order,
+    )
 
 
 def proto2object(proto: NumpyProto) -> np.ndarray:
-    tensor = protobuf_tensor_deserializer(proto.tensor)
-    array = tensor.to("cpu").detach().numpy().copy()
-
-    str_dtype = proto.dtype
-    original_dtype = np.dtype(str_dtype)
-
-    obj = array.astype(original_dtype)
-    return obj
+    if proto.HasField("tensor"):
+        # torch encoded arrays from older versions
+        tensor = protobuf_tensor_deserializer(proto.tensor)
+        array = tensor.to("cpu").detach().numpy().copy()
+        return array.astype(np.dtype(proto.dtype))
+
+    dtype = np.lib.format.descr_to_dtype(ast.literal_eval(proto.descr))
+    array = np.frombuffer(proto.data, dtype=dtype)
+    order = "F" if proto.fortran_order else "C"
+    array = array.reshape(tuple(proto.shape), order=order)
+
+    # frombuffer maps the immutable message bytes without copying, but arrays
+    # received by a node can be mutated in place so they need one writeable copy
+    if not array.flags.writeable:
+        array = array.copy(order="K")
+    return array
 
 
 GenerateWrapper(
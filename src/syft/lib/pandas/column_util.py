@@ -0,0 +1,163 @@
+# stdlib
+from typing import Any
+from typing import Union
+
+# third party
+import numpy as np
+import pandas as pd
+
+# syft relative
+from ...lib.numpy.array import object2proto as numpy_object2proto
+from ...lib.numpy.array import proto2object as numpy_proto2object
+from ...lib.python.list import List
+from ...proto.lib.pandas.column_pb2 import PandasColumn as PandasColumn_PB
+from ...proto.lib.pandas.column_pb2 import PandasIndex as PandasIndex_PB
+
+# extension dtypes that are a numpy array plus a boolean NA mask
+MASKED_DTYPES = (
+    pd.BooleanDtype,
+    pd.Int8Dtype,
+    pd.Int16Dtype,
+    pd.Int32Dtype,
+    pd.Int64Dtype,
+    pd.UInt8Dtype,
+    pd.UInt16Dtype,
+    pd.UInt32Dtype,
+    pd.UInt64Dtype,
+) + tuple(
+    getattr(pd, name) for name in ["Float32Dtype", "Float64Dtype"] if hasattr(pd, name)
+)
+
+
+def column_serializer(column: Union[pd.Series, pd.Index]) -> PandasColumn_PB:
+    """Strategy to serialize one column of values into typed buffers"""
+    dtype = column.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        categorical = column.array
+        return PandasColumn_PB(
+            kind="category",
+            values=numpy_object2proto(categorical.codes),
+            categories=column_serializer(categorical.categories),
+            ordered=bool(dtype.ordered),
+        )
+
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        utc_values = pd.DatetimeIndex(column).tz_convert(None).to_numpy()
+        return PandasColumn_PB(
+            kind="datetimetz",
+            values=numpy_object2proto(utc_values),
+            tz=str(dtype.tz),
+        )
+
+    if isinstance(dtype, MASKED_DTYPES):
+        mask = np.asarray(column.isna())
+        values = column.to_numpy(dtype=dtype.numpy_dtype, na_value=0)
+        return PandasColumn_PB(
+            kind="masked",
+            dtype=dtype.name,
+            values=numpy_object2proto(values),
+            mask=numpy_object2proto(mask),
+        )
+
+    if isinstance(dtype, np.dtype) and not dtype.hasobject:
+        return PandasColumn_PB(
+            kind="numpy", values=numpy_object2proto(column.to_numpy())
+        )
+
+    # everything else is dictionary encoded, None gets the code -1 and the other
+    # NA values the code -2
+    values = np.asarray(column, dtype=object)
+    try:
+        codes, uniques = pd.factorize(values)
+        missing = np.flatnonzero(codes == -1)
+        codes[[i for i in missing if values[i] is not None]] = -2
+        uniques = uniques.tolist()
+    except TypeError:
+        # unhashable values, like lists, are sent one by one
+        codes, uniques = np.arange(len(values)), values.tolist()
+
+    proto = PandasColumn_PB(
+        kind="object",
+        dtype=dtype.name if not isinstance(dtype, np.dtype) else "",
+        values=numpy_object2proto(codes),
+    )
+    if all(type(value) is str for value in uniques):
+        proto.dictionary.extend(uniques)
+    else:
+        proto.objects.CopyFrom(List(value=uniques)._object2proto())
+    return proto
+
+
+def column_deserializer(proto: PandasColumn_PB) -> Any:
+    """Strategy to deserialize one column into an array pandas can wrap"""
+    values = numpy_proto2object(proto.values)
+
+    if proto.kind == "numpy":
+        return values
+
+    if proto.kind == "category":
+        categories = column_deserializer(proto.categories)
+        return pd.Categorical.from_codes(
+            values, categories=categories, ordered=proto.ordered
+        )
+
+    if proto.kind == "datetimetz":
+        return pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(proto.tz).array
+
+    if proto.kind == "masked":
+        array = pd.array(values, dtype=proto.dtype)
+        array[numpy_proto2object(proto.mask)] = pd.NA
+        return array
+
+    if proto.HasField("objects"):
+        dictionary = List._proto2object(proto=proto.objects).upcast()
+    else:
+        dictionary = list(proto.dictionary)
+    # the extra slots at the end are picked by the negative codes of missing values
+    dictionary_array = np.empty(len(dictionary) + 2, dtype=object)
+    dictionary_array[:-2] = dictionary
+    dictionary_array[-2] = np.nan
+    dictionary_array[-1] = None
+    array = dictionary_array[values]
+
+    if proto.dtype:
+        return pd.array(array, dtype=proto.dtype)
+    return array
+
+
+def index_serializer(index: pd.Index) -> PandasIndex_PB:
+    """Strategy to serialize a (Multi)Index, RangeIndex only keeps its bounds"""
+    proto = PandasIndex_PB(names=List(value=list(index.names))._object2proto())
+
+    if isinstance(index, pd.RangeIndex):
+        proto.is_range = True
+        proto.start = index.start
+        proto.stop = index.stop
+        proto.step = index.step
+    elif isinstance(index, pd.MultiIndex):
+        for level in range(index.nlevels):
+            proto.levels.append(column_serializer(index.get_level_values(level)))
+    else:
+        proto.levels.append(column_serializer(index))
+        freq = getattr(index, "freqstr", None)
+        if freq is not None:
+            proto.freq = freq
+
+    return proto
+
+
+def index_deserializer(proto: PandasIndex_PB) -> pd.Index:
+    """Strategy to deserialize a (Multi)Index"""
+    names = List._proto2object(proto=proto.names).upcast()
+
+    if proto.is_range:
+        return pd.RangeIndex(proto.start, proto.stop, proto.step, name=names[0])
+
+    levels = [column_deserializer(level) for level in proto.levels]
+    if len(levels) > 1:
+        return pd.MultiIndex.from_arrays(levels, names=names)
+    index = pd.Index(levels[0], name=names[0], tupleize_cols=False)
+    if proto.freq:
+        index = type(index)(index, freq=proto.freq)
+    return index
@@ -4,23 +4,34 @@ import pandas as pd
 # syft relative
 from ...generate_wrapper import GenerateWrapper
 from ...lib.python.dict import Dict
-from ...lib.python.primitive_factory import PrimitiveFactory
 from ...proto.lib.pandas.frame_pb2 import PandasDataFrame as PandasDataFrame_PB
+from .column_util import column_deserializer
+from .column_util import column_serializer
+from .column_util import index_deserializer
+from .column_util import index_serializer
 
 
 def object2proto(obj: pd.DataFrame) -> PandasDataFrame_PB:
-    pd_dict = PrimitiveFactory.generate_primitive(value=obj.to_dict())
-    dict_proto = pd_dict._object2proto()
+    columns = [column_serializer(obj.iloc[:, i]) for i in range(obj.shape[1])]
 
     return PandasDataFrame_PB(
-        id=dict_proto.id,
-        dataframe=dict_proto,
+        columns=columns,
+        column_labels=index_serializer(obj.columns),
+        index=index_serializer(obj.index),
     )
 
 
 def proto2object(proto: PandasDataFrame_PB) -> pd.DataFrame:
-    dataframe_dict = Dict._proto2object(proto=proto.dataframe)
-    return pd.DataFrame.from_dict(dataframe_dict.upcast())
+    if proto.HasField("dataframe"):
+        # to_dict encoded frames from older versions
+        dataframe_dict = Dict._proto2object(proto=proto.dataframe)
+        return pd.DataFrame.from_dict(dataframe_dict.upcast())
+
+    # build with positional labels first so duplicate column labels survive
+    columns = {i: column_deserializer(column) for i, column in enumerate(proto.columns)}
+    dataframe = pd.DataFrame(columns, index=index_deserializer(proto.index))
+    dataframe.columns = index_deserializer(proto.column_labels)
+    return dataframe
 
 
 GenerateWrapper(
@@ -4,23 +4,34 @@ import pandas as pd
 # syft relative
 from ...generate_wrapper import GenerateWrapper
 from ...lib.python.dict import Dict
-from ...lib.python.primitive_factory import PrimitiveFactory
+from ...lib.python.list import List
 from ...proto.lib.pandas.series_pb2 import PandasSeries as PandasSeries_PB
+from .column_util import column_deserializer
+from .column_util import column_serializer
+from .column_util import index_deserializer
+from .column_util import index_serializer
 
 
 def object2proto(obj: pd.Series) -> PandasSeries_PB:
-    series_dict = PrimitiveFactory.generate_primitive(value=obj.to_dict())
-    dict_proto = series_dict._object2proto()
-
     return PandasSeries_PB(
-        id=dict_proto.id,
-        series=dict_proto,
+        values=column_serializer(obj),
+        index=index_serializer(obj.index),
+        name=List(value=[obj.name])._object2proto(),
     )
 
 
 def proto2object(proto: PandasSeries_PB) -> pd.Series:
-    series_dict = Dict._proto2object(proto=proto.series)
-    return pd.Series(series_dict.upcast())
+    if proto.HasField("series"):
+        # to_dict encoded series from older versions
+        series_dict = Dict._proto2object(proto=proto.series)
+        return pd.Series(series_dict.upcast())
+
+    name = List._proto2object(proto=proto.name).upcast()[0]
+    return pd.Series(
+        column_deserializer(proto.values),
+        index=index_deserializer(proto.index),
+        name=name,
+    )
 
 
 GenerateWrapper(
@@ -21,6 +21,8 @@ from ...logger import traceback_and_raise
 from ...logger import warning
 from ...proto.lib.python.dict_pb2 import Dict as Dict_PB
 from .iterator import Iterator
+from .packed import pack
+from .packed import unpack
 from .primitive_factory import PrimitiveFactory
 from .primitive_factory import isprimitive
 from .primitive_interface import PyPrimitive
@@ -197,32 +199,49 @@ class Dict(UserDict, PyPrimitive):
 
     def _object2proto(self) -> Dict_PB:
         id_ = serialize(obj=self.id)
+        proto = Dict_PB(id=id_)
 
-        keys = [
-            serialize(obj=downcast(value=element), to_bytes=True)
-            for element in self.data.keys()
-        ]
+        # keys and values are packed separately, a dict of str to object still
+        # packs its keys
+        packed_keys = pack(values=self.data.keys())
+        if packed_keys is not None:
+            proto.packed_keys.CopyFrom(packed_keys)
+        else:
+            proto.keys.extend(
+                serialize(obj=downcast(value=element), to_bytes=True)
+                for element in self.data.keys()
+            )
 
-        values = [
-            serialize(obj=downcast(value=element), to_bytes=True)
-            for element in self.data.values()
-        ]
+        packed_values = pack(values=self.data.values())
+        if packed_values is not None:
+            proto.packed_values.CopyFrom(packed_values)
+        else:
+            proto.values.extend(
+                serialize(obj=downcast(value=element), to_bytes=True)
+                for element in self.data.values()
+            )
 
-        return Dict_PB(id=id_, keys=keys, values=values)
+        return proto
 
     @staticmethod
     def _proto2object(proto: Dict_PB) -> "Dict":
         id_: UID = deserialize(blob=proto.id)
 
-        values = [
-            upcast(value=deserialize(blob=element, from_bytes=True))
-            for element in proto.values
-        ]
+        if proto.HasField("packed_values"):
+            values = unpack(proto=proto.packed_values)
+        else:
+            values = [
+                upcast(value=deserialize(blob=element, from_bytes=True))
+                for element in proto.values
+            ]
 
-        keys = [
-            upcast(value=deserialize(blob=element, from_bytes=True))
-            for element in proto.keys
-        ]
+        if proto.HasField("packed_keys"):
+            keys = unpack(proto=proto.packed_keys)
+        else:
+            keys = [
+                upcast(value=deserialize(blob=element, from_bytes=True))
+                for element in proto.keys
+            ]
         new_dict = Dict(dict(zip(keys, values)))
         new_dict._id = id_
         return new_dict
@@ -15,6 +15,8 @@ from ...core.common import UID
 from ...core.common.serde.serializable import bind_protobuf
 from ...proto.lib.python.list_pb2 import List as List_PB
 from .iterator import Iterator
+from .packed import pack
+from .packed import unpack
 from .primitive_factory import PrimitiveFactory
 from .primitive_factory import isprimitive
 from .primitive_interface import PyPrimitive
@@ -149,6 +151,10 @@ class List(UserList, PyPrimitive):
 
     def _object2proto(self) -> List_PB:
         id_ = serialize(obj=self.id)
+        packed = pack(values=self.data)
+        if packed is not None:
+            return List_PB(id=id_, packed=packed)
+
         downcasted = [downcast(value=element) for element in self.data]
         data = [serialize(obj=element, to_bytes=True) for element in downcasted]
         return List_PB(id=id_, data=data)
@@ -156,11 +162,14 @@ class List(UserList, PyPrimitive):
     @staticmethod
     def _proto2object(proto: List_PB) -> "List":
         id_: UID = deserialize(blob=proto.id)
-        value = []
-        # list comprehension doesn't work since it results in a
-        # [generator()] which is not equal to an empty list
-        for element in proto.data:
-            value.append(upcast(deserialize(blob=element, from_bytes=True)))
+        if proto.HasField("packed"):
+            value = unpack(proto=proto.packed)
+        else:
+            value = []
+            # list comprehension doesn't work since it results in a
+            # [generator()] which is not equal to an empty list
+            for element in proto.data:
+                value.append(upcast(deserialize(blob=element, from_bytes=True)))
         new_list = List(value=value)
         new_list._id = id_
         return new_list
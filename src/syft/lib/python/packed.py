@@ -0,0 +1,51 @@
+# stdlib
+from typing import Any
+from typing import Collection
+from typing import List
+from typing import Optional
+
+# syft relative
+from ...logger import traceback_and_raise
+from ...proto.lib.python.packed_pb2 import PackedValues as PackedValues_PB
+
+# primitive types which can be packed and the field holding them, bool has to be
+# checked with an exact type match since it is a subclass of int
+PACKED_FIELDS = {int: "ints", float: "floats", bool: "bools", str: "strings"}
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+def pack(values: Collection[Any]) -> Optional[PackedValues_PB]:
+    """Pack the values of a container if they all share one primitive type
+
+    Args:
+        values: the elements of a List, Tuple, Set or the keys or values of a Dict
+
+    Returns:
+        the packed values or None when they need the generic encoding
+    """
+    if len(values) == 0:
+        return None
+
+    value_type = type(next(iter(values)))
+    field = PACKED_FIELDS.get(value_type, None)
+    if field is None:
+        return None
+
+    if any(type(value) is not value_type for value in values):
+        return None
+
+    if value_type is int and (min(values) < INT64_MIN or max(values) > INT64_MAX):
+        return None
+
+    proto = PackedValues_PB(kind=field)
+    getattr(proto, field).extend(values)
+    return proto
+
+
+def unpack(proto: PackedValues_PB) -> List[Any]:
+    """Unpack values packed with pack into a list of python primitives"""
+    if proto.kind not in PACKED_FIELDS.values():
+        traceback_and_raise(ValueError(f"Unknown packed values kind {proto.kind}"))
+    return list(getattr(proto, proto.kind))
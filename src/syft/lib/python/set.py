@@ -13,6 +13,8 @@ from ... import serialize
 from ...core.common.serde.serializable import bind_protobuf
 from ...core.common.uid import UID
 from ...proto.lib.python.set_pb2 import Set as Set_PB
+from .packed import pack
+from .packed import unpack
 from .primitive_factory import PrimitiveFactory
 from .primitive_interface import PyPrimitive
 from .types import SyPrimitiveRet
@@ -172,6 +174,10 @@ class Set(set, PyPrimitive):
 
     def _object2proto(self) -> Set_PB:
         id_ = serialize(obj=self.id)
+        packed = pack(values=self)
+        if packed is not None:
+            return Set_PB(id=id_, packed=packed)
+
         downcasted = [downcast(value=element) for element in self]
         data = [serialize(obj=element, to_bytes=True) for element in downcasted]
         return Set_PB(id=id_, data=data)
@@ -179,9 +185,13 @@ class Set(set, PyPrimitive):
     @staticmethod
     def _proto2object(proto: Set_PB) -> "Set":
         id_: UID = deserialize(blob=proto.id)
-        value = [
-            upcast(deserialize(blob=element, from_bytes=True)) for element in proto.data
-        ]
+        if proto.HasField("packed"):
+            value = unpack(proto=proto.packed)
+        else:
+            value = [
+                upcast(deserialize(blob=element, from_bytes=True))
+                for element in proto.data
+            ]
         new_list = Set(value)
         new_list._id = id_
         return new_list
@@ -13,6 +13,8 @@ from ...core.common import UID
 from ...core.common.serde.serializable import bind_protobuf
 from ...proto.lib.python.tuple_pb2 import Tuple as Tuple_PB
 from .iterator import Iterator
+from .packed import pack
+from .packed import unpack
 from .primitive_factory import PrimitiveFactory
 from .primitive_factory import isprimitive
 from .primitive_interface import PyPrimitive
@@ -108,6 +110,10 @@ class Tuple(tuple, PyPrimitive):
 
     def _object2proto(self) -> Tuple_PB:
         id_ = serialize(obj=self.id)
+        packed = pack(values=self)
+        if packed is not None:
+            return Tuple_PB(id=id_, packed=packed)
+
         downcasted = [downcast(value=element) for element in self]
         data = [serialize(obj=element, to_bytes=True) for element in downcasted]
         return Tuple_PB(id=id_, data=data)
@@ -115,9 +121,13 @@ class Tuple(tuple, PyPrimitive):
     @staticmethod
     def _proto2object(proto: Tuple_PB) -> "Tuple":
         id_: UID = deserialize(blob=proto.id)
-        value = [
-            upcast(deserialize(blob=element, from_bytes=True)) for element in proto.data
-        ]
+        if proto.HasField("packed"):
+            value = unpack(proto=proto.packed)
+        else:
+            value = [
+                upcast(deserialize(blob=element, from_bytes=True))
+                for element in proto.data
+            ]
         new_list = Tuple(value)
         new_list._id = id_
         return new_list
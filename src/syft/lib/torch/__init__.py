@@ -1,6 +1,13 @@
 # stdlib
+import json
+import os
+from pathlib import Path
+import tempfile
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -8,16 +15,28 @@ from packaging import version
 import torch
 
 # syft relative
+from . import allowlist as allowlist_module
 from . import device  # noqa: 401
 from . import parameter  # noqa: 401
 from . import return_types  # noqa: 401
 from . import uppercase_tensor  # noqa: 401
 from ...ast.globals import Globals
+from ...ast.klass import Class
 from ...logger import info
+from ...logger import warning
+from ...util import get_root_cache_path
 from .allowlist import allowlist
 
 TORCH_VERSION = version.parse(torch.__version__.split("+")[0])
 
+# the nodes below the torch classes and their pointer classes are built on first use,
+# set SYFT_LAZY_AST=0 to build the whole torch AST when syft is imported
+lazy_env = str(os.environ.get("SYFT_LAZY_AST", "1")).lower()
+SYFT_LAZY_AST = lazy_env not in {"0", "false"}
+
+# bump when the format of the cached allowlist changes
+ALLOWLIST_CACHE_VERSION = 1
+
 
 def get_return_type(support_dict: Union[str, Dict[str, str]]) -> str:
     if isinstance(support_dict, str):
@@ -42,9 +61,18 @@ def version_supported(support_dict: Union[str, Dict[str, str]]) -> bool:
         return True
 
 
-def create_torch_ast(client: Any = None) -> Globals:
-    ast = Globals(client)
+def _allowlist_cache_key() -> Dict[str, Any]:
+    # the allowlist module changes on disk whenever the allowlist is edited
+    stat = os.stat(allowlist_module.__file__)
+    return {
+        "version": ALLOWLIST_CACHE_VERSION,
+        "torch": torch.__version__,
+        "allowlist": [stat.st_mtime_ns, stat.st_size],
+    }
+
 
+def _filter_allowlist() -> List[Tuple[str, str]]:
+    supported = []
     # most methods work in all versions and have a single return type
     # for the more complicated ones we pass a dict with keys like return_type and
     # min_version
@@ -54,21 +82,109 @@ def create_torch_ast(client: Any = None) -> Globals:
             if return_type == "unknown":
                 # this allows us to import them for testing
                 continue
-            ast.add_path(
-                path=method, framework_reference=torch, return_type_name=return_type
-            )
+            supported.append((method, return_type))
             # add all the torch.nn.Parameter hooks
             if method.startswith("torch.Tensor."):
                 method = method.replace("torch.Tensor.", "torch.nn.Parameter.")
                 return_type = return_type.replace("torch.Tensor", "torch.nn.Parameter")
-                ast.add_path(
-                    path=method, framework_reference=torch, return_type_name=return_type
-                )
+                supported.append((method, return_type))
         else:
             info(f"Skipping {method} not supported in {TORCH_VERSION}")
+    return supported
+
+
+def supported_allowlist(cache_dir: Optional[Path] = None) -> List[Tuple[str, str]]:
+    """
+    The paths of the allowlist supported by the installed torch version, together with
+    their return types, including the torch.nn.Parameter mirrors of the torch.Tensor
+    methods.
+
+    Filtering by version parses the version bounds of the entries, so the result is
+    cached on disk for each torch version and edit of the allowlist.
+
+    Args:
+        cache_dir: The directory of the cache, by default ~/.syft/cache.
+
+    Returns:
+        The (path, return type name) pairs in the order of the allowlist.
+    """
+    try:
+        if cache_dir is None:
+            cache_dir = get_root_cache_path()
+        cache_path = cache_dir / f"torch_allowlist_{torch.__version__}.json"
+        key = _allowlist_cache_key()
+    except OSError as e:
+        warning(f"Unable to use the torch allowlist cache. {e}")
+        return _filter_allowlist()
+
+    try:
+        with open(cache_path) as cache_file:
+            cached = json.load(cache_file)
+        if cached["key"] == key:
+            return [(method, return_type) for method, return_type in cached["paths"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    supported = _filter_allowlist()
+    try:
+        # write and rename so concurrent imports never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump({"key": key, "paths": supported}, tmp_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        warning(f"Unable to write the torch allowlist cache {cache_path}. {e}")
+    return supported
+
+
+def create_torch_ast(client: Any = None, lazy: Optional[bool] = None) -> Globals:
+    """
+    Create the AST of the supported torch paths.
+
+    Args:
+        client: The client for which all computation is being executed.
+        lazy: Record the paths below the torch classes instead of adding their nodes
+            and create the pointer classes on first use, by default SYFT_LAZY_AST.
+
+    Returns:
+        The AST of torch.
+    """
+    if lazy is None:
+        lazy = SYFT_LAZY_AST
+
+    ast = Globals(client)
+    # the node each path is added below, or None if it is not a class
+    owners: Dict[str, Optional[Class]] = {}
+
+    for method, return_type in supported_allowlist():
+        if not lazy:
+            ast.add_path(
+                path=method, framework_reference=torch, return_type_name=return_type
+            )
+            continue
+
+        owner_path, _, _ = method.rpartition(".")
+        if owner_path not in owners:
+            # the nodes above the path are added like add_path would
+            ast.add_path(
+                path=owner_path,
+                framework_reference=torch,
+                return_type_name=return_type,
+            )
+            node = ast.query(owner_path)
+            owners[owner_path] = node if isinstance(node, Class) else None
+
+        owner = owners[owner_path]
+        if owner is not None:
+            owner.add_lazy_path(path=method.split("."), return_type_name=return_type)
+        else:
+            ast.add_path(
+                path=method, framework_reference=torch, return_type_name=return_type
+            )
 
     for klass in ast.classes:
-        klass.create_pointer_class()
+        if not lazy:
+            klass.create_pointer_class()
         klass.create_send_method()
         klass.create_storable_object_attr_convenience_methods()
     return ast
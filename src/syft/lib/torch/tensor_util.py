@@ -1,4 +1,9 @@
+# stdlib
+import sys
+from typing import Tuple
+
 # third party
+import numpy as np
 import torch as th
 
 # syft relative
@@ -25,9 +30,41 @@ TORCH_DTYPE_STR = {
 }
 TORCH_STR_DTYPE = {name: cls for cls, name in TORCH_DTYPE_STR.items()}
 
+# numpy has no bfloat16 so its raw bits are moved around as int16
+BUFFER_VIEW_DTYPE = {th.bfloat16: th.int16}
+
+# the numpy dtype used to read the raw buffer of each torch dtype string
+BUFFER_NP_DTYPE = {
+    "uint8": np.uint8,
+    "int8": np.int8,
+    "int16": np.int16,
+    "int32": np.int32,
+    "int64": np.int64,
+    "float16": np.float16,
+    "float32": np.float32,
+    "float64": np.float64,
+    "complex64": np.complex64,
+    "complex128": np.complex128,
+    "bool": np.bool_,
+    "bfloat16": np.int16,
+}
+
+
+def _contiguous_strides(size: Tuple[int, ...]) -> Tuple[int, ...]:
+    strides = []
+    stride = 1
+    for dim in reversed(size):
+        strides.append(stride)
+        stride *= max(dim, 1)
+    return tuple(reversed(strides))
+
 
 def protobuf_tensor_serializer(tensor: th.Tensor) -> TensorData:
-    """Strategy to serialize a tensor using Protobuf"""
+    """Strategy to serialize a tensor using Protobuf
+
+    The contiguous storage of the tensor is written as a single bytes field so
+    there is no per element Python work on either side of the wire.
+    """
     dtype = TORCH_DTYPE_STR[tensor.dtype]
 
     protobuf_tensor = TensorData()
@@ -36,30 +73,65 @@ def protobuf_tensor_serializer(tensor: th.Tensor) -> TensorData:
         protobuf_tensor.is_quantized = True
         protobuf_tensor.scale = tensor.q_scale()
         protobuf_tensor.zero_point = tensor.q_zero_point()
-        data = th.flatten(tensor).int_repr().tolist()
+        data = tensor.int_repr()
     else:
-        data = th.flatten(tensor).tolist()
+        data = tensor
+
+    data = data.detach().cpu().contiguous()
+    if data.dtype in BUFFER_VIEW_DTYPE:
+        data = data.view(BUFFER_VIEW_DTYPE[data.dtype])
 
     protobuf_tensor.dtype = dtype
     protobuf_tensor.shape.extend(tensor.size())
-    getattr(protobuf_tensor, "contents_" + dtype).extend(data)
+    protobuf_tensor.strides.extend(data.stride())
+    protobuf_tensor.byte_order = sys.byteorder
+    protobuf_tensor.data = data.numpy().tobytes()
 
     return protobuf_tensor
 
 
+def _buffer_to_tensor(protobuf_tensor: TensorData, dtype_name: str) -> th.Tensor:
+    np_dtype = np.dtype(BUFFER_NP_DTYPE[dtype_name])
+    if protobuf_tensor.byte_order != sys.byteorder:
+        np_dtype = np_dtype.newbyteorder(
+            "<" if protobuf_tensor.byte_order == "little" else ">"
+        )
+    array = np.frombuffer(protobuf_tensor.data, dtype=np_dtype)
+    # frombuffer views the immutable proto bytes so we need exactly one copy to
+    # get a writeable tensor, swapping the byte order at the same time if needed
+    array = array.astype(np_dtype.newbyteorder("="))
+
+    flat = th.from_numpy(array)
+    if dtype_name == "bfloat16":
+        flat = flat.view(th.bfloat16)
+
+    size = tuple(protobuf_tensor.shape)
+    strides = tuple(protobuf_tensor.strides)
+    if not strides or strides == _contiguous_strides(size):
+        return flat.reshape(size)
+    return th.as_strided(flat, size, strides)
+
+
 def protobuf_tensor_deserializer(protobuf_tensor: TensorData) -> th.Tensor:
     """Strategy to deserialize a binary input using Protobuf"""
     size = tuple(protobuf_tensor.shape)
-    data = getattr(protobuf_tensor, "contents_" + protobuf_tensor.dtype)
 
     if protobuf_tensor.is_quantized:
         # Drop the 'q' from the beginning of the quantized dtype to get the int type
-        dtype = TORCH_STR_DTYPE[protobuf_tensor.dtype[1:]]
-        int_tensor = th.tensor(data, dtype=dtype).reshape(size)
+        dtype_name = protobuf_tensor.dtype[1:]
+    else:
+        dtype_name = protobuf_tensor.dtype
+
+    if protobuf_tensor.data:
+        tensor = _buffer_to_tensor(protobuf_tensor, dtype_name)
+    else:
+        # list encoded payloads from older versions, also used for empty tensors
+        data = getattr(protobuf_tensor, "contents_" + protobuf_tensor.dtype)
+        tensor = th.tensor(data, dtype=TORCH_STR_DTYPE[dtype_name]).reshape(size)
+
+    if protobuf_tensor.is_quantized:
         # Automatically converts int types to quantized types
         return th._make_per_tensor_quantized_tensor(
-            int_tensor, protobuf_tensor.scale, protobuf_tensor.zero_point
+            tensor, protobuf_tensor.scale, protobuf_tensor.zero_point
         )
-    else:
-        dtype = TORCH_STR_DTYPE[protobuf_tensor.dtype]
-        return th.tensor(data, dtype=dtype).reshape(size)
+    return tensor
@@ -4,34 +4,26 @@ from types import ModuleType
 from typing import Callable
 from typing import Optional
 from typing import Union
-from typing import Union as TypeUnion
 
 # syft relative
 from ..ast.globals import Globals
-from ..core.node.abstract.node import AbstractNodeClient
+from ..logger import traceback_and_raise
 
-# this gets called on global ast as well as clients
-# anything which wants to have its ast updated and has an add_attr method
+# this gets called on the global ast when a library is loaded
 
 
 def generic_update_ast(
     lib_name: str,
     create_ast: Callable,
-    ast_or_client: TypeUnion[Globals, AbstractNodeClient],
+    ast_or_client: Globals,
 ) -> None:
-    if isinstance(ast_or_client, Globals):
-        ast = ast_or_client
-        new_lib_ast = create_ast(None)
-        ast.add_attr(attr_name=lib_name, attr=new_lib_ast.attrs[lib_name])
-    elif isinstance(ast_or_client, AbstractNodeClient):
-        client = ast_or_client
-        new_lib_ast = create_ast(client)
-        client.lib_ast.attrs[lib_name] = new_lib_ast.attrs[lib_name]
-        setattr(client, lib_name, new_lib_ast.attrs[lib_name])
-    else:
-        raise ValueError(
-            f"Expected param of type (Globals, AbstractNodeClient), but got {type(ast_or_client)}"
+    # clients see the frameworks of the global ast through a ClientView
+    if not isinstance(ast_or_client, Globals):
+        traceback_and_raise(
+            ValueError(f"Expected param of type Globals, but got {type(ast_or_client)}")
         )
+    new_lib_ast = create_ast(None)
+    ast_or_client.add_attr(attr_name=lib_name, attr=new_lib_ast.attrs[lib_name])
 
 
 def is_static_method(klass: type, attr: str) -> bool:
@@ -1,9 +1,12 @@
 # stdlib
 import logging
 import os
+from types import FunctionType
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import NoReturn
+from typing import Optional
 from typing import TextIO
 from typing import Union
 
@@ -15,18 +18,46 @@ LOG_FORMAT = "[{time}][{level}][{module}]][{process.id}] {message}"
 logger.remove()
 DEFAULT_SINK = "syft_{time}.log"
 
+# the severity of the messages logged by each function below, exceptions are errors
+LEVEL_NO = {
+    "trace": 5,
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "error": 40,
+    "exception": 40,
+    "critical": 50,
+}
 
-def remove() -> None:
-    logger.remove()
+# the severity of the sinks added with add, by their handler id
+_sink_levels: Dict[int, int] = {}
+# the lowest severity recorded by any sink
+_min_level = float("inf")
+
+
+def _set_sink_level(handler_id: Optional[int], level: Optional[str] = None) -> None:
+    global _min_level
+    if handler_id is None:
+        _sink_levels.clear()
+    elif level is None:
+        _sink_levels.pop(handler_id, None)
+    else:
+        _sink_levels[handler_id] = logger.level(level).no
+    _min_level = min(_sink_levels.values(), default=float("inf"))
+
+
+def remove(handler_id: Optional[int] = None) -> None:
+    logger.remove(handler_id)
+    _set_sink_level(handler_id=handler_id)
 
 
 def add(
     sink: Union[None, str, os.PathLike, TextIO, logging.Handler] = None,
     level: str = "ERROR",
-) -> None:
+) -> int:
     sink = DEFAULT_SINK if sink is None else sink
     try:
-        logger.add(
+        handler_id = logger.add(
             sink=sink,
             format=LOG_FORMAT,
             enqueue=True,
@@ -38,7 +69,7 @@ def add(
             level=level,
         )
     except BaseException:
-        logger.add(
+        handler_id = logger.add(
             sink=sink,
             format=LOG_FORMAT,
             colorize=False,
@@ -46,6 +77,26 @@ def add(
             backtrace=True,
             level=level,
         )
+    _set_sink_level(handler_id=handler_id, level=level)
+    return handler_id
+
+
+def enabled(level: str) -> bool:
+    """
+    Check if any sink records messages of the given level, so debug and trace
+    messages which are expensive to build can be skipped when they would be
+    dropped anyway. Messages of higher levels are always handed to loguru, which
+    also knows the sinks added to it directly.
+
+    Args:
+        level: The name of the log function, e.g. "debug".
+
+    Returns:
+        False for debug and trace if all the sinks added with add are set to a
+        higher level.
+    """
+    level_no = LEVEL_NO.get(level, 0)
+    return level_no > LEVEL_NO["debug"] or level_no >= _min_level
 
 
 def traceback_and_raise(e: Any, verbose: bool = False) -> NoReturn:
@@ -63,6 +114,14 @@ def traceback_and_raise(e: Any, verbose: bool = False) -> NoReturn:
 
 def create_log_and_print_function(level: str) -> Callable:
     def log_and_print(*args: Any, **kwargs: Any) -> None:
+        if not kwargs.get("print", False) and not enabled(level=level):
+            return
+
+        # a function passed instead of the message is only called to build the
+        # message once it is known to be recorded
+        if len(args) > 0 and isinstance(args[0], FunctionType):
+            args = (args[0](),) + args[1:]
+
         try:
             method = getattr(logger.opt(lazy=True), level, None)
             if "print" in kwargs and kwargs["print"] is True:
@@ -86,29 +145,34 @@ def create_log_and_print_function(level: str) -> Callable:
     return log_and_print
 
 
+_log_and_print = {
+    level: create_log_and_print_function(level=level) for level in LEVEL_NO
+}
+
+
 def traceback(*args: Any, **kwargs: Any) -> None:
-    return create_log_and_print_function(level="exception")(*args, **kwargs)
+    return _log_and_print["exception"](*args, **kwargs)
 
 
 def critical(*args: Any, **kwargs: Any) -> None:
-    return create_log_and_print_function(level="critical")(*args, **kwargs)
+    return _log_and_print["critical"](*args, **kwargs)
 
 
 def error(*args: Any, **kwargs: Any) -> None:
-    return create_log_and_print_function(level="error")(*args, **kwargs)
+    return _log_and_print["error"](*args, **kwargs)
 
 
 def warning(*args: Any, **kwargs: Any) -> None:
-    return create_log_and_print_function(level="warning")(*args, **kwargs)
+    return _log_and_print["warning"](*args, **kwargs)
 
 
 def info(*args: Any, **kwargs: Any) -> None:
-    return create_log_and_print_function(level="info")(*args, **kwargs)
+    return _log_and_print["info"](*args, **kwargs)
 
 
 def debug(*args: Any, **kwargs: Any) -> None:
-    return create_log_and_print_function(level="debug")(*args, **kwargs)
+    return _log_and_print["debug"](*args, **kwargs)
 
 
 def trace(*args: Any, **kwargs: Any) -> None:
-    return create_log_and_print_function(level="trace")(*args, **kwargs)
+    return _log_and_print["trace"](*args, **kwargs)
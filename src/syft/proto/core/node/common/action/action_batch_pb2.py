@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/core/node/common/action/action_batch.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+# syft absolute
+from syft.proto.core.common import (
+    common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
+)
+from syft.proto.core.io import address_pb2 as proto_dot_core_dot_io_dot_address__pb2
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+    name="proto/core/node/common/action/action_batch.proto",
+    package="syft.core.node.common.action",
+    syntax="proto3",
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+    serialized_pb=b'\n0proto/core/node/common/action/action_batch.proto\x12\x1csyft.core.node.common.action\x1a%proto/core/common/common_object.proto\x1a\x1bproto/core/io/address.proto"m\n\x0b\x41\x63tionBatch\x12\x0f\n\x07\x61\x63tions\x18\x01 \x03(\x0c\x12&\n\x07\x61\x64\x64ress\x18\x02 \x01(\x0b\x32\x15.syft.core.io.Address\x12%\n\x06msg_id\x18\x03 \x01(\x0b\x32\x15.syft.core.common.UIDb\x06proto3',
+    dependencies=[
+        proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
+        proto_dot_core_dot_io_dot_address__pb2.DESCRIPTOR,
+    ],
+)
+
+
+_ACTIONBATCH = _descriptor.Descriptor(
+    name="ActionBatch",
+    full_name="syft.core.node.common.action.ActionBatch",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="actions",
+            full_name="syft.core.node.common.action.ActionBatch.actions",
+            index=0,
+            number=1,
+            type=12,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="address",
+            full_name="syft.core.node.common.action.ActionBatch.address",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="msg_id",
+            full_name="syft.core.node.common.action.ActionBatch.msg_id",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=150,
+    serialized_end=259,
+)
+
+_ACTIONBATCH.fields_by_name[
+    "address"
+].message_type = proto_dot_core_dot_io_dot_address__pb2._ADDRESS
+_ACTIONBATCH.fields_by_name[
+    "msg_id"
+].message_type = proto_dot_core_dot_common_dot_common__object__pb2._UID
+DESCRIPTOR.message_types_by_name["ActionBatch"] = _ACTIONBATCH
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ActionBatch = _reflection.GeneratedProtocolMessageType(
+    "ActionBatch",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _ACTIONBATCH,
+        "__module__": "proto.core.node.common.action.action_batch_pb2"
+        # @@protoc_insertion_point(class_scope:syft.core.node.common.action.ActionBatch)
+    },
+)
+_sym_db.RegisterMessage(ActionBatch)
+
+
+# @@protoc_insertion_point(module_scope)
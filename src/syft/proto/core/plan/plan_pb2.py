@@ -14,6 +14,9 @@ _sym_db = _symbol_database.Default()
 
 
 # syft absolute
+from syft.proto.core.common import (
+    common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
+)
 from syft.proto.core.node.common.action import (
     action_pb2 as proto_dot_core_dot_node_dot_common_dot_action_dot_action__pb2,
 )
@@ -27,8 +30,9 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x1aproto/core/plan/plan.proto\x12\x0esyft.core.plan\x1a*proto/core/node/common/action/action.proto\x1a proto/core/pointer/pointer.proto"\xe7\x01\n\x04Plan\x12\x35\n\x07\x61\x63tions\x18\x01 \x03(\x0b\x32$.syft.core.node.common.action.Action\x12\x30\n\x06inputs\x18\x02 \x03(\x0b\x32 .syft.core.plan.Plan.InputsEntry\x12+\n\x07outputs\x18\x03 \x03(\x0b\x32\x1a.syft.core.pointer.Pointer\x1aI\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer:\x02\x38\x01\x62\x06proto3',
+    serialized_pb=b'\n\x1aproto/core/plan/plan.proto\x12\x0esyft.core.plan\x1a%proto/core/common/common_object.proto\x1a*proto/core/node/common/action/action.proto\x1a proto/core/pointer/pointer.proto"\xa6\x02\n\x04Plan\x12\x35\n\x07\x61\x63tions\x18\x01 \x03(\x0b\x32$.syft.core.node.common.action.Action\x12\x30\n\x06inputs\x18\x02 \x03(\x0b\x32 .syft.core.plan.Plan.InputsEntry\x12+\n\x07outputs\x18\x03 \x03(\x0b\x32\x1a.syft.core.pointer.Pointer\x12\x10\n\x08\x63ompiled\x18\x04 \x01(\x08\x12+\n\nfree_after\x18\x05 \x03(\x0b\x32\x17.syft.core.plan.FreeIds\x1aI\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer:\x02\x38\x01"-\n\x07\x46reeIds\x12"\n\x03ids\x18\x01 \x03(\x0b\x32\x15.syft.core.common.UIDb\x06proto3',
     dependencies=[
+        proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
         proto_dot_core_dot_node_dot_common_dot_action_dot_action__pb2.DESCRIPTOR,
         proto_dot_core_dot_pointer_dot_pointer__pb2.DESCRIPTOR,
     ],
@@ -90,8 +94,8 @@ _PLAN_INPUTSENTRY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=283,
-    serialized_end=356,
+    serialized_start=385,
+    serialized_end=458,
 )
 
 _PLAN = _descriptor.Descriptor(
@@ -159,6 +163,44 @@ _PLAN = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="compiled",
+            full_name="syft.core.plan.Plan.compiled",
+            index=3,
+            number=4,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="free_after",
+            full_name="syft.core.plan.Plan.free_after",
+            index=4,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[
@@ -170,8 +212,49 @@ _PLAN = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=125,
-    serialized_end=356,
+    serialized_start=164,
+    serialized_end=458,
+)
+
+
+_FREEIDS = _descriptor.Descriptor(
+    name="FreeIds",
+    full_name="syft.core.plan.FreeIds",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="ids",
+            full_name="syft.core.plan.FreeIds.ids",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=460,
+    serialized_end=505,
 )
 
 _PLAN_INPUTSENTRY.fields_by_name[
@@ -185,7 +268,12 @@ _PLAN.fields_by_name["inputs"].message_type = _PLAN_INPUTSENTRY
 _PLAN.fields_by_name[
     "outputs"
 ].message_type = proto_dot_core_dot_pointer_dot_pointer__pb2._POINTER
+_PLAN.fields_by_name["free_after"].message_type = _FREEIDS
+_FREEIDS.fields_by_name[
+    "ids"
+].message_type = proto_dot_core_dot_common_dot_common__object__pb2._UID
 DESCRIPTOR.message_types_by_name["Plan"] = _PLAN
+DESCRIPTOR.message_types_by_name["FreeIds"] = _FREEIDS
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 Plan = _reflection.GeneratedProtocolMessageType(
@@ -209,6 +297,17 @@ Plan = _reflection.GeneratedProtocolMessageType(
 _sym_db.RegisterMessage(Plan)
 _sym_db.RegisterMessage(Plan.InputsEntry)
 
+FreeIds = _reflection.GeneratedProtocolMessageType(
+    "FreeIds",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _FREEIDS,
+        "__module__": "proto.core.plan.plan_pb2"
+        # @@protoc_insertion_point(class_scope:syft.core.plan.FreeIds)
+    },
+)
+_sym_db.RegisterMessage(FreeIds)
+
 
 _PLAN_INPUTSENTRY._options = None
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/federated/model_diff.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+    name="proto/federated/model_diff.proto",
+    package="syft.federated",
+    syntax="proto3",
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+    serialized_pb=b'\n proto/federated/model_diff.proto\x12\x0esyft.federated"L\n\rEncodedTensor\x12\r\n\x05shape\x18\x01 \x03(\x03\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\x12\x0f\n\x07indices\x18\x03 \x01(\x0c\x12\r\n\x05scale\x18\x04 \x01(\x02"L\n\x0b\x45ncodedDiff\x12\r\n\x05\x63odec\x18\x01 \x01(\t\x12.\n\x07tensors\x18\x02 \x03(\x0b\x32\x1d.syft.federated.EncodedTensorb\x06proto3',
+)
+
+
+_ENCODEDTENSOR = _descriptor.Descriptor(
+    name="EncodedTensor",
+    full_name="syft.federated.EncodedTensor",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="shape",
+            full_name="syft.federated.EncodedTensor.shape",
+            index=0,
+            number=1,
+            type=3,
+            cpp_type=2,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="data",
+            full_name="syft.federated.EncodedTensor.data",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="indices",
+            full_name="syft.federated.EncodedTensor.indices",
+            index=2,
+            number=3,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="scale",
+            full_name="syft.federated.EncodedTensor.scale",
+            index=3,
+            number=4,
+            type=2,
+            cpp_type=6,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=52,
+    serialized_end=128,
+)
+
+
+_ENCODEDDIFF = _descriptor.Descriptor(
+    name="EncodedDiff",
+    full_name="syft.federated.EncodedDiff",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="codec",
+            full_name="syft.federated.EncodedDiff.codec",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="tensors",
+            full_name="syft.federated.EncodedDiff.tensors",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=130,
+    serialized_end=206,
+)
+
+_ENCODEDDIFF.fields_by_name["tensors"].message_type = _ENCODEDTENSOR
+DESCRIPTOR.message_types_by_name["EncodedTensor"] = _ENCODEDTENSOR
+DESCRIPTOR.message_types_by_name["EncodedDiff"] = _ENCODEDDIFF
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+EncodedTensor = _reflection.GeneratedProtocolMessageType(
+    "EncodedTensor",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _ENCODEDTENSOR,
+        "__module__": "proto.federated.model_diff_pb2"
+        # @@protoc_insertion_point(class_scope:syft.federated.EncodedTensor)
+    },
+)
+_sym_db.RegisterMessage(EncodedTensor)
+
+EncodedDiff = _reflection.GeneratedProtocolMessageType(
+    "EncodedDiff",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _ENCODEDDIFF,
+        "__module__": "proto.federated.model_diff_pb2"
+        # @@protoc_insertion_point(class_scope:syft.federated.EncodedDiff)
+    },
+)
+_sym_db.RegisterMessage(EncodedDiff)
+
+
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/lib/pandas/column.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+# syft absolute
+from syft.proto.lib.numpy import array_pb2 as proto_dot_lib_dot_numpy_dot_array__pb2
+from syft.proto.lib.python import list_pb2 as proto_dot_lib_dot_python_dot_list__pb2
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+    name="proto/lib/pandas/column.proto",
+    package="syft.lib.pandas",
+    syntax="proto3",
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+    serialized_pb=b'\n\x1dproto/lib/pandas/column.proto\x12\x0fsyft.lib.pandas\x1a\x1bproto/lib/numpy/array.proto\x1a\x1bproto/lib/python/list.proto"\x8d\x02\n\x0cPandasColumn\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\r\n\x05\x64type\x18\x02 \x01(\t\x12*\n\x06values\x18\x03 \x01(\x0b\x32\x1a.syft.lib.numpy.NumpyProto\x12(\n\x04mask\x18\x04 \x01(\x0b\x32\x1a.syft.lib.numpy.NumpyProto\x12\x12\n\ndictionary\x18\x05 \x03(\t\x12&\n\x07objects\x18\x06 \x01(\x0b\x32\x15.syft.lib.python.List\x12\x31\n\ncategories\x18\x07 \x01(\x0b\x32\x1d.syft.lib.pandas.PandasColumn\x12\x0f\n\x07ordered\x18\x08 \x01(\x08\x12\n\n\x02tz\x18\t \x01(\t"\xad\x01\n\x0bPandasIndex\x12\x10\n\x08is_range\x18\x01 \x01(\x08\x12\r\n\x05start\x18\x02 \x01(\x03\x12\x0c\n\x04stop\x18\x03 \x01(\x03\x12\x0c\n\x04step\x18\x04 \x01(\x03\x12-\n\x06levels\x18\x05 \x03(\x0b\x32\x1d.syft.lib.pandas.PandasColumn\x12$\n\x05names\x18\x06 \x01(\x0b\x32\x15.syft.lib.python.List\x12\x0c\n\x04\x66req\x18\x07 \x01(\tb\x06proto3',
+    dependencies=[
+        proto_dot_lib_dot_numpy_dot_array__pb2.DESCRIPTOR,
+        proto_dot_lib_dot_python_dot_list__pb2.DESCRIPTOR,
+    ],
+)
+
+
+_PANDASCOLUMN = _descriptor.Descriptor(
+    name="PandasColumn",
+    full_name="syft.lib.pandas.PandasColumn",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="kind",
+            full_name="syft.lib.pandas.PandasColumn.kind",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="dtype",
+            full_name="syft.lib.pandas.PandasColumn.dtype",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="values",
+            full_name="syft.lib.pandas.PandasColumn.values",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="mask",
+            full_name="syft.lib.pandas.PandasColumn.mask",
+            index=3,
+            number=4,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="dictionary",
+            full_name="syft.lib.pandas.PandasColumn.dictionary",
+            index=4,
+            number=5,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="objects",
+            full_name="syft.lib.pandas.PandasColumn.objects",
+            index=5,
+            number=6,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="categories",
+            full_name="syft.lib.pandas.PandasColumn.categories",
+            index=6,
+            number=7,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="ordered",
+            full_name="syft.lib.pandas.PandasColumn.ordered",
+            index=7,
+            number=8,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="tz",
+            full_name="syft.lib.pandas.PandasColumn.tz",
+            index=8,
+            number=9,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=109,
+    serialized_end=378,
+)
+
+
+_PANDASINDEX = _descriptor.Descriptor(
+    name="PandasIndex",
+    full_name="syft.lib.pandas.PandasIndex",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="is_range",
+            full_name="syft.lib.pandas.PandasIndex.is_range",
+            index=0,
+            number=1,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="start",
+            full_name="syft.lib.pandas.PandasIndex.start",
+            index=1,
+            number=2,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="stop",
+            full_name="syft.lib.pandas.PandasIndex.stop",
+            index=2,
+            number=3,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="step",
+            full_name="syft.lib.pandas.PandasIndex.step",
+            index=3,
+            number=4,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="levels",
+            full_name="syft.lib.pandas.PandasIndex.levels",
+            index=4,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="names",
+            full_name="syft.lib.pandas.PandasIndex.names",
+            index=5,
+            number=6,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="freq",
+            full_name="syft.lib.pandas.PandasIndex.freq",
+            index=6,
+            number=7,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=381,
+    serialized_end=554,
+)
+
+_PANDASCOLUMN.fields_by_name[
+    "values"
+].message_type = proto_dot_lib_dot_numpy_dot_array__pb2._NUMPYPROTO
+_PANDASCOLUMN.fields_by_name[
+    "mask"
+].message_type = proto_dot_lib_dot_numpy_dot_array__pb2._NUMPYPROTO
+_PANDASCOLUMN.fields_by_name[
+    "objects"
+].message_type = proto_dot_lib_dot_python_dot_list__pb2._LIST
+_PANDASCOLUMN.fields_by_name["categories"].message_type = _PANDASCOLUMN
+_PANDASINDEX.fields_by_name["levels"].message_type = _PANDASCOLUMN
+_PANDASINDEX.fields_by_name[
+    "names"
+].message_type = proto_dot_lib_dot_python_dot_list__pb2._LIST
+DESCRIPTOR.message_types_by_name["PandasColumn"] = _PANDASCOLUMN
+DESCRIPTOR.message_types_by_name["PandasIndex"] = _PANDASINDEX
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+PandasColumn = _reflection.GeneratedProtocolMessageType(
+    "PandasColumn",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _PANDASCOLUMN,
+        "__module__": "proto.lib.pandas.column_pb2"
+        # @@protoc_insertion_point(class_scope:syft.lib.pandas.PandasColumn)
+    },
+)
+_sym_db.RegisterMessage(PandasColumn)
+
+PandasIndex = _reflection.GeneratedProtocolMessageType(
+    "PandasIndex",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _PANDASINDEX,
+        "__module__": "proto.lib.pandas.column_pb2"
+        # @@protoc_insertion_point(class_scope:syft.lib.pandas.PandasIndex)
+    },
+)
+_sym_db.RegisterMessage(PandasIndex)
+
+
+# @@protoc_insertion_point(module_scope)
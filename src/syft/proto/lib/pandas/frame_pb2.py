@@ -17,6 +17,7 @@ _sym_db = _symbol_database.Default()
 from syft.proto.core.common import (
     common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
 )
+from syft.proto.lib.pandas import column_pb2 as proto_dot_lib_dot_pandas_dot_column__pb2
 from syft.proto.lib.python import dict_pb2 as proto_dot_lib_dot_python_dot_dict__pb2
 
 DESCRIPTOR = _descriptor.FileDescriptor(
@@ -25,9 +26,10 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x1cproto/lib/pandas/frame.proto\x12\x0fsyft.lib.pandas\x1a%proto/core/common/common_object.proto\x1a\x1bproto/lib/python/dict.proto"^\n\x0fPandasDataFrame\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12(\n\tdataframe\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dictb\x06proto3',
+    serialized_pb=b'\n\x1cproto/lib/pandas/frame.proto\x12\x0fsyft.lib.pandas\x1a%proto/core/common/common_object.proto\x1a\x1dproto/lib/pandas/column.proto\x1a\x1bproto/lib/python/dict.proto"\xf0\x01\n\x0fPandasDataFrame\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12(\n\tdataframe\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dict\x12.\n\x07\x63olumns\x18\x03 \x03(\x0b\x32\x1d.syft.lib.pandas.PandasColumn\x12\x33\n\rcolumn_labels\x18\x04 \x01(\x0b\x32\x1c.syft.lib.pandas.PandasIndex\x12+\n\x05index\x18\x05 \x01(\x0b\x32\x1c.syft.lib.pandas.PandasIndexb\x06proto3',
     dependencies=[
         proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
+        proto_dot_lib_dot_pandas_dot_column__pb2.DESCRIPTOR,
         proto_dot_lib_dot_python_dot_dict__pb2.DESCRIPTOR,
     ],
 )
@@ -79,6 +81,63 @@ _PANDASDATAFRAME = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="columns",
+            full_name="syft.lib.pandas.PandasDataFrame.columns",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="column_labels",
+            full_name="syft.lib.pandas.PandasDataFrame.column_labels",
+            index=3,
+            number=4,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="index",
+            full_name="syft.lib.pandas.PandasDataFrame.index",
+            index=4,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -88,8 +147,8 @@ _PANDASDATAFRAME = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=117,
-    serialized_end=211,
+    serialized_start=149,
+    serialized_end=389,
 )
 
 _PANDASDATAFRAME.fields_by_name[
@@ -98,6 +157,15 @@ _PANDASDATAFRAME.fields_by_name[
 _PANDASDATAFRAME.fields_by_name[
     "dataframe"
 ].message_type = proto_dot_lib_dot_python_dot_dict__pb2._DICT
+_PANDASDATAFRAME.fields_by_name[
+    "columns"
+].message_type = proto_dot_lib_dot_pandas_dot_column__pb2._PANDASCOLUMN
+_PANDASDATAFRAME.fields_by_name[
+    "column_labels"
+].message_type = proto_dot_lib_dot_pandas_dot_column__pb2._PANDASINDEX
+_PANDASDATAFRAME.fields_by_name[
+    "index"
+].message_type = proto_dot_lib_dot_pandas_dot_column__pb2._PANDASINDEX
 DESCRIPTOR.message_types_by_name["PandasDataFrame"] = _PANDASDATAFRAME
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -17,7 +17,9 @@ _sym_db = _symbol_database.Default()
 from syft.proto.core.common import (
     common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
 )
+from syft.proto.lib.pandas import column_pb2 as proto_dot_lib_dot_pandas_dot_column__pb2
 from syft.proto.lib.python import dict_pb2 as proto_dot_lib_dot_python_dot_dict__pb2
+from syft.proto.lib.python import list_pb2 as proto_dot_lib_dot_python_dot_list__pb2
 
 DESCRIPTOR = _descriptor.FileDescriptor(
     name="proto/lib/pandas/series.proto",
@@ -25,10 +27,12 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x1dproto/lib/pandas/series.proto\x12\x0fsyft.lib.pandas\x1a%proto/core/common/common_object.proto\x1a\x1bproto/lib/python/dict.proto"X\n\x0cPandasSeries\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12%\n\x06series\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dictb\x06proto3',
+    serialized_pb=b'\n\x1dproto/lib/pandas/series.proto\x12\x0fsyft.lib.pandas\x1a%proto/core/common/common_object.proto\x1a\x1dproto/lib/pandas/column.proto\x1a\x1bproto/lib/python/dict.proto\x1a\x1bproto/lib/python/list.proto"\xd9\x01\n\x0cPandasSeries\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12%\n\x06series\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dict\x12-\n\x06values\x18\x03 \x01(\x0b\x32\x1d.syft.lib.pandas.PandasColumn\x12+\n\x05index\x18\x04 \x01(\x0b\x32\x1c.syft.lib.pandas.PandasIndex\x12#\n\x04name\x18\x05 \x01(\x0b\x32\x15.syft.lib.python.Listb\x06proto3',
     dependencies=[
         proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
+        proto_dot_lib_dot_pandas_dot_column__pb2.DESCRIPTOR,
         proto_dot_lib_dot_python_dot_dict__pb2.DESCRIPTOR,
+        proto_dot_lib_dot_python_dot_list__pb2.DESCRIPTOR,
     ],
 )
 
@@ -79,6 +83,63 @@ _PANDASSERIES = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="values",
+            full_name="syft.lib.pandas.PandasSeries.values",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="index",
+            full_name="syft.lib.pandas.PandasSeries.index",
+            index=3,
+            number=4,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="name",
+            full_name="syft.lib.pandas.PandasSeries.name",
+            index=4,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -88,8 +149,8 @@ _PANDASSERIES = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=118,
-    serialized_end=206,
+    serialized_start=179,
+    serialized_end=396,
 )
 
 _PANDASSERIES.fields_by_name[
@@ -98,6 +159,15 @@ _PANDASSERIES.fields_by_name[
 _PANDASSERIES.fields_by_name[
     "series"
 ].message_type = proto_dot_lib_dot_python_dot_dict__pb2._DICT
+_PANDASSERIES.fields_by_name[
+    "values"
+].message_type = proto_dot_lib_dot_pandas_dot_column__pb2._PANDASCOLUMN
+_PANDASSERIES.fields_by_name[
+    "index"
+].message_type = proto_dot_lib_dot_pandas_dot_column__pb2._PANDASINDEX
+_PANDASSERIES.fields_by_name[
+    "name"
+].message_type = proto_dot_lib_dot_python_dot_list__pb2._LIST
 DESCRIPTOR.message_types_by_name["PandasSeries"] = _PANDASSERIES
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
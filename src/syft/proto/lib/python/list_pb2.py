@@ -17,6 +17,7 @@ _sym_db = _symbol_database.Default()
 from syft.proto.core.common import (
     common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
 )
+from syft.proto.lib.python import packed_pb2 as proto_dot_lib_dot_python_dot_packed__pb2
 
 DESCRIPTOR = _descriptor.FileDescriptor(
     name="proto/lib/python/list.proto",
@@ -24,9 +25,10 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x1bproto/lib/python/list.proto\x12\x0fsyft.lib.python\x1a%proto/core/common/common_object.proto"7\n\x04List\x12\x0c\n\x04\x64\x61ta\x18\x01 \x03(\x0c\x12!\n\x02id\x18\x02 \x01(\x0b\x32\x15.syft.core.common.UIDb\x06proto3',
+    serialized_pb=b'\n\x1bproto/lib/python/list.proto\x12\x0fsyft.lib.python\x1a%proto/core/common/common_object.proto\x1a\x1dproto/lib/python/packed.proto"f\n\x04List\x12\x0c\n\x04\x64\x61ta\x18\x01 \x03(\x0c\x12!\n\x02id\x18\x02 \x01(\x0b\x32\x15.syft.core.common.UID\x12-\n\x06packed\x18\x03 \x01(\x0b\x32\x1d.syft.lib.python.PackedValuesb\x06proto3',
     dependencies=[
         proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
+        proto_dot_lib_dot_python_dot_packed__pb2.DESCRIPTOR,
     ],
 )
 
@@ -77,6 +79,25 @@ _LIST = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="packed",
+            full_name="syft.lib.python.List.packed",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -86,13 +107,16 @@ _LIST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=87,
-    serialized_end=142,
+    serialized_start=118,
+    serialized_end=220,
 )
 
 _LIST.fields_by_name[
     "id"
 ].message_type = proto_dot_core_dot_common_dot_common__object__pb2._UID
+_LIST.fields_by_name[
+    "packed"
+].message_type = proto_dot_lib_dot_python_dot_packed__pb2._PACKEDVALUES
 DESCRIPTOR.message_types_by_name["List"] = _LIST
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
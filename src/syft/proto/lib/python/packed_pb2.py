@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/lib/python/packed.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+    name="proto/lib/python/packed.proto",
+    package="syft.lib.python",
+    syntax="proto3",
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+    serialized_pb=b'\n\x1dproto/lib/python/packed.proto\x12\x0fsyft.lib.python"Z\n\x0cPackedValues\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x0c\n\x04ints\x18\x02 \x03(\x12\x12\x0e\n\x06\x66loats\x18\x03 \x03(\x01\x12\r\n\x05\x62ools\x18\x04 \x03(\x08\x12\x0f\n\x07strings\x18\x05 \x03(\tb\x06proto3',
+)
+
+
+_PACKEDVALUES = _descriptor.Descriptor(
+    name="PackedValues",
+    full_name="syft.lib.python.PackedValues",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="kind",
+            full_name="syft.lib.python.PackedValues.kind",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="ints",
+            full_name="syft.lib.python.PackedValues.ints",
+            index=1,
+            number=2,
+            type=18,
+            cpp_type=2,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="floats",
+            full_name="syft.lib.python.PackedValues.floats",
+            index=2,
+            number=3,
+            type=1,
+            cpp_type=5,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bools",
+            full_name="syft.lib.python.PackedValues.bools",
+            index=3,
+            number=4,
+            type=8,
+            cpp_type=7,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="strings",
+            full_name="syft.lib.python.PackedValues.strings",
+            index=4,
+            number=5,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=50,
+    serialized_end=140,
+)
+
+DESCRIPTOR.message_types_by_name["PackedValues"] = _PACKEDVALUES
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+PackedValues = _reflection.GeneratedProtocolMessageType(
+    "PackedValues",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _PACKEDVALUES,
+        "__module__": "proto.lib.python.packed_pb2"
+        # @@protoc_insertion_point(class_scope:syft.lib.python.PackedValues)
+    },
+)
+_sym_db.RegisterMessage(PackedValues)
+
+
+# @@protoc_insertion_point(module_scope)
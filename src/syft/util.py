@@ -600,3 +600,14 @@ def get_root_data_path() -> Path:
 
     os.makedirs(data_dir, exist_ok=True)
     return data_dir
+
+
+def get_root_cache_path() -> Path:
+    # get the PySyft / cache directory for files derived from the installed packages
+    # on Linux and MacOS the directory is: ~/.syft/cache"
+    # on Windows the directory is: C:/Users/$USER/.syft/cache
+
+    cache_dir = Path.home() / ".syft" / "cache"
+
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
@@ -3,19 +3,36 @@ Define benchmark tests
 """
 # stdlib
 import atexit
+import io
 from multiprocessing import Process
 from multiprocessing import set_start_method
 import os
+from pathlib import Path
+import statistics
 import time
 from typing import Any
 
 # third party
+from nacl.signing import SigningKey
 import pytest
+import torch as th
+import torchvision
 
 # syft absolute
 import syft as sy
+from syft.core.common.event_loop import loop
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.store import DiskObjectStore
+from syft.core.store.storeable_object import StorableObject
+from syft.federated.model_centric_fl_worker import ModelCentricFLWorker
+from syft.grid.connections.http_connection import HTTPConnection
 
 # syft relative
+from ...syft.federated.model_centric_fl_test import serve_fl
+from ...syft.grid.connections.http_connection_test import http_client
+from ...syft.grid.connections.http_connection_test import serve_node
 from ...syft.grid.duet.signaling_server_test import run
 from ..pytest_benchmarks.benchmark_send_get_local_test import send_get_list_local
 from ..pytest_benchmarks.benchmark_send_get_local_test import send_get_string_local
@@ -26,8 +43,32 @@ from ..pytest_benchmarks.benchmark_send_get_multiprocess_test import (
     send_get_string_multiprocess,
 )
 from ..pytest_benchmarks.benchmark_send_get_multiprocess_test import PORT
+from ..pytest_benchmarks.benchmarks_functions_test import SqliteDictStore
+from ..pytest_benchmarks.benchmarks_functions_test import approval_latencies
+from ..pytest_benchmarks.benchmarks_functions_test import batched_tensor_ops
+from ..pytest_benchmarks.benchmarks_functions_test import client_memory
+from ..pytest_benchmarks.benchmarks_functions_test import create_clients
+from ..pytest_benchmarks.benchmarks_functions_test import dataframe_serde
+from ..pytest_benchmarks.benchmarks_functions_test import dataframe_to_dict_serde
+from ..pytest_benchmarks.benchmarks_functions_test import duet_peers
+from ..pytest_benchmarks.benchmarks_functions_test import duet_signaling
+from ..pytest_benchmarks.benchmarks_functions_test import encode_model_diff
+from ..pytest_benchmarks.benchmarks_functions_test import fl_connection_speed
+from ..pytest_benchmarks.benchmarks_functions_test import fl_get_model
+from ..pytest_benchmarks.benchmarks_functions_test import fl_report
 from ..pytest_benchmarks.benchmarks_functions_test import list_serde
+from ..pytest_benchmarks.benchmarks_functions_test import mlp_training_plan
+from ..pytest_benchmarks.benchmarks_functions_test import object_store_workload
+from ..pytest_benchmarks.benchmarks_functions_test import plan_store_memory
+from ..pytest_benchmarks.benchmarks_functions_test import run_plan
+from ..pytest_benchmarks.benchmarks_functions_test import send_actions
+from ..pytest_benchmarks.benchmarks_functions_test import signed_message_hop
 from ..pytest_benchmarks.benchmarks_functions_test import string_serde
+from ..pytest_benchmarks.benchmarks_functions_test import tensor_add_actions
+from ..pytest_benchmarks.benchmarks_functions_test import tensor_method_loop
+from ..pytest_benchmarks.benchmarks_functions_test import webrtc_loopback
+from ..pytest_benchmarks.benchmarks_functions_test import webrtc_requests
+from ..pytest_benchmarks.benchmarks_functions_test import webrtc_stream
 
 set_start_method("spawn", force=True)
 
@@ -66,6 +107,314 @@ def test_list_serde(list_size: int, benchmark: Any) -> None:
     benchmark.pedantic(list_serde, args=(data,))
 
 
+@pytest.mark.benchmark
+@pytest.mark.parametrize("list_size", [10_000, 100_000, 1_000_000])
+def test_primitive_list_serde(list_size: int, benchmark: Any) -> None:
+    data = list(range(list_size))
+    benchmark.pedantic(list_serde, args=(data,))
+
+
+def make_dataframe(rows: int) -> Any:
+    # third party
+    import numpy as np
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "int": np.arange(rows),
+            "float": np.random.rand(rows),
+            "str": np.random.choice(["a", "b", "c"], rows),
+        }
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("rows", [10_000, 100_000, 1_000_000])
+def test_dataframe_serde(rows: int, benchmark: Any) -> None:
+    sy.load("pandas")
+    data = make_dataframe(rows)
+    benchmark.pedantic(dataframe_serde, args=(data,), rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("rows", [10_000, 100_000, 1_000_000])
+def test_dataframe_to_dict_serde(rows: int, benchmark: Any) -> None:
+    data = make_dataframe(rows)
+    benchmark.pedantic(dataframe_to_dict_serde, args=(data,), rounds=1, iterations=1)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("byte_size", [KB, 100 * KB, 10 * MB, 100 * MB])
+def test_signed_message_hop(byte_size: int, benchmark: Any) -> None:
+    tensor = th.rand(byte_size // 4)
+    obj = StorableObject(id=UID(), data=tensor)
+    msg = SaveObjectAction(obj=obj, address=Address())
+
+    benchmark.pedantic(
+        signed_message_hop, args=(msg, SigningKey.generate()), rounds=3, iterations=1
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("store_type", ["sqlitedict", "disk"])
+@pytest.mark.parametrize("objects", [100, 1000])
+def test_disk_object_store(
+    store_type: str, objects: int, benchmark: Any, tmp_path: Path
+) -> None:
+    data = [
+        StorableObject(id=UID(), data=th.rand(256), tags=["bench"])
+        for _ in range(objects)
+    ]
+
+    def setup() -> Any:
+        db_path = str(tmp_path / f"{UID().value}.sqlite")
+        if store_type == "sqlitedict":
+            store = SqliteDictStore(db_path=db_path)
+        else:
+            store = DiskObjectStore(db_path=db_path)
+        return (store, data), {}
+
+    benchmark.pedantic(object_store_workload, setup=setup, rounds=3)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("per_client_ast", [False, True])
+@pytest.mark.parametrize("clients", [1, 10])
+def test_client_creation(per_client_ast: bool, clients: int, benchmark: Any) -> None:
+    node = sy.VirtualMachine(name="bench")
+    benchmark.extra_info["bytes_per_client"] = client_memory(
+        node, clients=3, per_client_ast=per_client_ast
+    )
+    benchmark.pedantic(
+        create_clients, args=(node, clients, per_client_ast), rounds=3, iterations=1
+    )
+
+
+@pytest.mark.benchmark
+def test_tensor_method_loop(benchmark: Any) -> None:
+    client = sy.VirtualMachine(name="bench").get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+    benchmark.pedantic(tensor_method_loop, args=(ptr, 100), rounds=3, iterations=1)
+    benchmark.extra_info.update(sy.lib_ast.path_cache_stats())
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "connection_type,concurrency", [("http", 1), ("async", 1), ("async", 16)]
+)
+def test_http_actions(connection_type: str, concurrency: int, benchmark: Any) -> None:
+    # against a stand-in HTTP server of a node in this process
+    vm = sy.VirtualMachine(name="bench")
+    server = serve_node(node=vm)
+    if connection_type == "async":
+        pytest.importorskip("aiohttp")
+        # syft absolute
+        from syft.grid.connections.async_http_connection import AsyncHTTPConnection
+
+        connection: Any = AsyncHTTPConnection(url=server.url, pool_size=concurrency)
+    else:
+        connection = HTTPConnection(url=server.url)
+
+    try:
+        client = http_client(node=vm, connection=connection)
+        msgs = tensor_add_actions(ptr=th.tensor([1, 2, 3]).send(client), calls=500)
+        benchmark.pedantic(
+            send_actions, args=(connection, msgs, concurrency), rounds=3, iterations=1
+        )
+        benchmark.extra_info["msgs_per_sec"] = 500 / benchmark.stats.stats.mean
+        benchmark.extra_info["connections"] = len(server.connections)
+    finally:
+        connection.close()
+        server.shutdown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("concurrency", [1, 8, 64])
+def test_webrtc_concurrent_requests(concurrency: int, benchmark: Any) -> None:
+    offer, answer = loop.run_until_complete(webrtc_loopback())
+    try:
+        benchmark.pedantic(
+            webrtc_requests,
+            args=(offer, answer.node.address, 200, concurrency),
+            rounds=3,
+            iterations=1,
+        )
+        benchmark.extra_info["requests_per_sec"] = 200 / benchmark.stats.stats.mean
+    finally:
+        loop.run_until_complete(offer.peer_connection.close())
+        loop.run_until_complete(answer.peer_connection.close())
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("byte_size", [10 * MB, 100 * MB])
+def test_webrtc_stream(byte_size: int, benchmark: Any) -> None:
+    offer, answer = loop.run_until_complete(webrtc_loopback())
+    try:
+        benchmark.pedantic(
+            webrtc_stream,
+            args=(offer, answer, byte_size, False),
+            rounds=1,
+            iterations=1,
+        )
+        benchmark.extra_info["mb_per_sec"] = byte_size / MB / benchmark.stats.stats.mean
+        # tracing slows the transfer down, the memory is measured separately
+        peak = webrtc_stream(offer, answer, byte_size, trace=True)
+        benchmark.extra_info["peak_mb"] = peak / MB
+    finally:
+        loop.run_until_complete(offer.peer_connection.close())
+        loop.run_until_complete(answer.peer_connection.close())
+
+
+@pytest.mark.benchmark
+def test_request_approval_latency(benchmark: Any) -> None:
+    latencies = benchmark.pedantic(
+        approval_latencies, args=(100,), rounds=1, iterations=1
+    )
+    percentiles = statistics.quantiles(latencies, n=100)
+    benchmark.extra_info["p50_ms"] = percentiles[49] * 1000
+    benchmark.extra_info["p99_ms"] = percentiles[98] * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("connection_type", ["virtual", "http"])
+@pytest.mark.parametrize("batch_size", [1, 10, 100, 1000])
+def test_batched_actions(connection_type: str, batch_size: int, benchmark: Any) -> None:
+    vm = sy.VirtualMachine(name="bench")
+    server = None
+    if connection_type == "http":
+        server = serve_node(node=vm)
+        connection = HTTPConnection(url=server.url)
+        client = http_client(node=vm, connection=connection)
+    else:
+        client = vm.get_root_client()
+
+    try:
+        ptr = th.tensor([1, 2, 3]).send(client)
+        benchmark.pedantic(
+            batched_tensor_ops, args=(ptr, 1000, batch_size), rounds=3, iterations=1
+        )
+        benchmark.extra_info["ops_per_sec"] = 1000 / benchmark.stats.stats.mean
+    finally:
+        if server is not None:
+            connection.close()
+            server.shutdown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("byte_size", [MB, 10 * MB, 100 * MB])
+def test_fl_report(binary: bool, byte_size: int, benchmark: Any) -> None:
+    # against a stand-in PyGrid node in this process
+    server = serve_fl(params=[th.zeros(1)])
+    worker = ModelCentricFLWorker(address=server.address, binary=binary)
+    diff = [th.rand(byte_size // 4)]
+    try:
+        benchmark.pedantic(fl_report, args=(worker, diff), rounds=3, iterations=1)
+        benchmark.extra_info["MB_per_sec"] = byte_size / MB / benchmark.stats.stats.mean
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("byte_size", [MB, 10 * MB, 100 * MB])
+def test_fl_get_model(binary: bool, byte_size: int, benchmark: Any) -> None:
+    # over HTTP, or streamed over the websocket in binary mode
+    server = serve_fl(params=[th.rand(byte_size // 4)])
+    worker = ModelCentricFLWorker(address=server.address, binary=binary)
+    try:
+        benchmark.pedantic(fl_get_model, args=(worker,), rounds=3, iterations=1)
+        benchmark.extra_info["MB_per_sec"] = byte_size / MB / benchmark.stats.stats.mean
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["sequential", "concurrent", "cached"])
+def test_fl_connection_speed(mode: str, benchmark: Any) -> None:
+    server = serve_fl(params=[th.zeros(1)])
+    worker = ModelCentricFLWorker(address=server.address)
+    try:
+        benchmark.pedantic(fl_connection_speed, args=(worker, mode), rounds=5)
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("codec_name", ["dense", "fp16", "int8", "int4", "topk"])
+def test_diff_codecs(codec_name: str, benchmark: Any) -> None:
+    # the diff of the parameters of a ResNet-18, 11.7M floats
+    diff = [
+        th.randn(p.shape) * 1e-3 for p in torchvision.models.resnet18().parameters()
+    ]
+    blob = benchmark.pedantic(
+        encode_model_diff, args=(diff, codec_name), rounds=3, iterations=1
+    )
+    benchmark.extra_info["bytes"] = len(blob)
+    benchmark.extra_info["bytes_per_param"] = len(blob) / sum(t.numel() for t in diff)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("compiled", [False, True])
+def test_mlp_plan_execution(compiled: bool, benchmark: Any) -> None:
+    node = sy.VirtualMachine(name="alice")
+    client = node.get_root_client()
+    plan, params = mlp_training_plan()
+    if compiled:
+        plan.compile()
+    kwargs = {
+        "xs": th.rand([64, 1, 28, 28]).send(client),
+        "ys": th.randint(0, 10, [64, 10]).send(client),
+        "params": params.send(client),
+    }
+    benchmark.pedantic(
+        run_plan,
+        args=(plan, node, client.verify_key, kwargs, 10),
+        rounds=3,
+        iterations=1,
+    )
+    benchmark.extra_info["actions"] = len(plan.actions)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("free", [False, True])
+def test_mlp_plan_memory(free: bool, benchmark: Any) -> None:
+    node = sy.VirtualMachine(name="alice")
+    client = node.get_root_client()
+    plan, params = mlp_training_plan()
+    if not free:
+        plan.free_after = []
+    kwargs = {
+        "xs": th.rand([64, 1, 28, 28]).send(client),
+        "ys": th.randint(0, 10, [64, 10]).send(client),
+        "params": params.send(client),
+    }
+    store_size = len(node.store)
+    peak_store_size, rss = benchmark.pedantic(
+        plan_store_memory,
+        args=(plan, node, client.verify_key, kwargs, 20),
+        rounds=1,
+        iterations=1,
+    )
+    benchmark.extra_info["peak_store_size"] = peak_store_size - store_size
+    benchmark.extra_info["rss_growth"] = rss
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("level", ["CRITICAL", "DEBUG"])
+def test_tensor_method_loop_logging(level: str, benchmark: Any) -> None:
+    client = sy.VirtualMachine(name="bench").get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+    sink_id = sy.logger.add(io.StringIO(), level=level)
+    try:
+        benchmark.pedantic(tensor_method_loop, args=(ptr, 100), rounds=3, iterations=1)
+    finally:
+        sy.logger.remove(sink_id)
+
+
 @pytest.mark.benchmark
 @pytest.mark.parametrize("byte_size", [10 * KB, 100 * KB, MB, 10 * MB])
 def test_duet_string_local(
@@ -90,6 +439,18 @@ def test_duet_list_local(
     )
 
 
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pairs", [1, 100])
+def test_duet_signaling(pairs: int, benchmark: Any, signaling_server: Process) -> None:
+    time.sleep(3)
+
+    benchmark.pedantic(
+        duet_signaling,
+        setup=lambda: (duet_peers(url=f"http://127.0.0.1:{PORT}/", pairs=pairs), {}),
+        rounds=3,
+    )
+
+
 @pytest.mark.benchmark
 @pytest.mark.parametrize("byte_size", [10 * KB, 100 * KB, MB, 10 * MB])
 def test_duet_string_multiprocess(
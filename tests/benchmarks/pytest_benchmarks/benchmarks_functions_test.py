@@ -1,7 +1,46 @@
 # stdlib
+import asyncio
+import threading
+import time
+import tracemalloc
+from typing import Any
 from typing import List
+from typing import Tuple
+
+# third party
+from nacl.signing import SigningKey
+from nacl.signing import VerifyKey
+import psutil
+from sqlitedict import SqliteDict
+import torch as th
 
 # syft absolute
+import syft as sy
+from syft.core.common.event_loop import loop
+from syft.core.common.message import SignedImmediateSyftMessageWithReply
+from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.io.connection import ClientConnection
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.node.common.node import Node
+from syft.core.node.domain.domain import Domain
+from syft.core.node.domain.service import RequestAnswerMessage
+from syft.core.plan import Plan
+from syft.core.plan.plan_builder import ROOT_CLIENT
+from syft.core.plan.plan_builder import make_plan
+from syft.core.store import ObjectStore
+from syft.core.store.storeable_object import StorableObject
+from syft.federated.model_centric_fl_worker import ModelCentricFLWorker
+from syft.federated.model_serialization import wrap_model_params
+from syft.federated.model_serialization.diff_codec import encode_diff
+from syft.federated.model_serialization.diff_codec import get_diff_codec
+from syft.grid.connections.webrtc import WebRTCConnection
+from syft.grid.duet.om_signaling_client import register
+from syft.grid.duet.webrtc_duet import Duet
+from syft.lib import create_lib_ast
+from syft.lib.python import Dict as SyDict
 from syft.lib.python import List as SyList
 from syft.lib.python.string import String
 
@@ -13,8 +52,330 @@ def string_serde(data: str) -> None:
     String._proto2object(proto=serialized)
 
 
-def list_serde(data: List[str]) -> None:
+def list_serde(data: List[Any]) -> None:
     syft_list = SyList(data)
 
     serialized = syft_list._object2proto()
     SyList._proto2object(proto=serialized)
+
+
+def dataframe_serde(data: Any) -> None:
+    serialized = sy.serialize(data, to_bytes=True)
+    sy.deserialize(serialized, from_bytes=True)
+
+
+def dataframe_to_dict_serde(data: Any) -> None:
+    # the encoding used before the columnar format, kept as a reference
+    syft_dict = SyDict(data.to_dict())
+
+    serialized = syft_dict._object2proto()
+    type(data).from_dict(SyDict._proto2object(proto=serialized).upcast())
+
+
+def signed_message_hop(msg: SaveObjectAction, signing_key: SigningKey) -> None:
+    # one hop: sign and send, then parse, verify and dispatch on the other side
+    blob = sy.serialize(msg.sign(signing_key=signing_key), to_bytes=True)
+    signed_msg = sy.deserialize(blob, from_bytes=True)
+
+    assert signed_msg.is_valid
+    assert signed_msg.message.obj.id == msg.obj.id
+
+
+class SqliteDictStore(ObjectStore):
+    # the DiskObjectStore before the indexed sqlite tables, kept as a reference
+    def __init__(self, db_path: str) -> None:
+        self.db = SqliteDict(db_path)
+
+    def __setitem__(self, key: UID, value: StorableObject) -> None:
+        self.db[str(key.value)] = sy.serialize(value, to_bytes=True)
+        self.db.commit(blocking=False)
+
+    def __getitem__(self, key: UID) -> StorableObject:
+        return sy.deserialize(self.db[str(key.value)], from_bytes=True)
+
+    def get_objects_of_type(self, obj_type: type) -> List[StorableObject]:
+        values = [sy.deserialize(blob, from_bytes=True) for blob in self.db.values()]
+        return [value for value in values if isinstance(value.data, obj_type)]
+
+
+def object_store_workload(store: ObjectStore, objects: List[StorableObject]) -> None:
+    # write everything, read everything twice and filter by type once
+    for obj in objects:
+        store[obj.id] = obj
+    for _ in range(2):
+        for obj in objects:
+            store[obj.id]
+    assert len(store.get_objects_of_type(th.nn.Parameter)) == 0
+
+
+def create_clients(node: Node, clients: int, per_client_ast: bool) -> List[Any]:
+    # per_client_ast rebuilds the AST for every client like clients used to
+    created = []
+    for _ in range(clients):
+        client = node.get_root_client()
+        if per_client_ast:
+            client.lib_ast = create_lib_ast(client=client)
+        created.append(client)
+    return created
+
+
+def client_memory(node: Node, clients: int, per_client_ast: bool) -> int:
+    # the bytes allocated per client which are still alive after creating them
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        created = create_clients(node, clients=clients, per_client_ast=per_client_ast)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) // len(created)
+
+
+def tensor_method_loop(ptr: Any, calls: int) -> None:
+    # elementwise ops resolve their path on the client and again on the node
+    for _ in range(calls):
+        ptr = ptr.add(1)
+
+
+def approval_latencies(requests: int) -> List[float]:
+    # a blocking request on an object matched by an accept handler
+    domain = sy.Domain(name="bench")
+    client = domain.get_root_client()
+    client.requests.add_handler(action="accept")
+    ptrs = [th.tensor([1, 2, 3]).send(client) for _ in range(requests)]
+
+    latencies = []
+    for ptr in ptrs:
+        start = time.perf_counter()
+        ptr.request(block=True)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def webrtc_loopback() -> Tuple[WebRTCConnection, WebRTCConnection]:
+    # two connections in this process, without a signaling server
+    offer = WebRTCConnection(node=Domain(name="offer"))
+    answer = WebRTCConnection(node=Domain(name="answer"))
+
+    opened = asyncio.Event()
+    offer_payload = await offer._set_offer()
+    offer.channel.on("open", opened.set)
+    answer_payload = await answer._set_answer(payload=offer_payload)
+    await offer._process_answer(payload=answer_payload)
+    await asyncio.wait_for(opened.wait(), timeout=10)
+
+    offer._client_address = Address()
+    return offer, answer
+
+
+def webrtc_requests(
+    connection: WebRTCConnection, address: Address, requests: int, concurrency: int
+) -> None:
+    # at most concurrency requests are waiting for their reply at any time
+    signing_key = SigningKey.generate()
+    msgs = [
+        RequestAnswerMessage(
+            request_id=UID(), address=address, reply_to=connection._client_address
+        ).sign(signing_key=signing_key)
+        for _ in range(requests)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(msg: SignedImmediateSyftMessageWithReply) -> None:
+        async with semaphore:
+            await connection.send_sync_message(msg=msg)
+
+    loop.run_until_complete(asyncio.gather(*[send(msg=msg) for msg in msgs]))
+
+
+def webrtc_stream(
+    offer: WebRTCConnection, answer: WebRTCConnection, size: int, trace: bool
+) -> int:
+    # send a message of size bytes and return the peak of the memory allocated
+    # meanwhile if it is traced
+    obj = StorableObject(id=UID(), data=String("a" * size))
+    msg = SaveObjectAction(obj=obj, address=answer.node.address).sign(
+        signing_key=SigningKey.generate()
+    )
+
+    async def stored() -> None:
+        while obj.id not in answer.node.store:
+            await asyncio.sleep(0.01)
+
+    peak = 0
+    if trace:
+        tracemalloc.start()
+    try:
+        offer.send_immediate_msg_without_reply(msg=msg)
+        del msg
+        loop.run_until_complete(stored())
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if trace:
+            tracemalloc.stop()
+    answer.node.store.delete(key=obj.id)
+    return peak
+
+
+def duet_peers(url: str, pairs: int) -> Tuple[List[Any], List[Domain]]:
+    # the signaling clients of both sides of every duet, and a node for each side
+    clients = [(register(url=url), register(url=url)) for _ in range(pairs)]
+    domains = [Domain(name="duet") for _ in range(2 * pairs)]
+    return clients, domains
+
+
+def duet_signaling(clients: List[Any], domains: List[Domain]) -> None:
+    # both sides of every duet run the signaling process at the same time, each
+    # in its own thread as if it was a different notebook
+    errors: List[Exception] = []
+
+    def connect(host: Any, target: Any, offer: bool) -> None:
+        try:
+            Duet(
+                node=domains.pop(),
+                target_id=target.duet_id,
+                signaling_client=host,
+                offer=offer,
+            )
+        except Exception as e:
+            errors.append(e)
+
+    threads = []
+    for launcher, joiner in clients:
+        threads.append(threading.Thread(target=connect, args=(launcher, joiner, True)))
+        threads.append(threading.Thread(target=connect, args=(joiner, launcher, False)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def tensor_add_actions(
+    ptr: Any, calls: int
+) -> List[SignedImmediateSyftMessageWithoutReply]:
+    # the small actions a client sends when calling a method of a pointer
+    client = ptr.client
+    return [
+        RunClassMethodAction(
+            path="torch.Tensor.add",
+            _self=ptr,
+            args=[ptr],
+            kwargs={},
+            id_at_location=UID(),
+            address=client.address,
+        ).sign(signing_key=client.signing_key)
+        for _ in range(calls)
+    ]
+
+
+def send_actions(
+    connection: ClientConnection,
+    msgs: List[SignedImmediateSyftMessageWithoutReply],
+    concurrency: int,
+) -> None:
+    # one at a time through the ClientConnection interface, or concurrently
+    # through the coroutines of an AsyncHTTPConnection
+    if concurrency == 1:
+        for msg in msgs:
+            connection.send_immediate_msg_without_reply(msg=msg)
+        return
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(msg: SignedImmediateSyftMessageWithoutReply) -> None:
+        async with semaphore:
+            await connection.async_send_immediate_msg_without_reply(msg=msg)
+
+    loop.run_until_complete(asyncio.gather(*[send(msg=msg) for msg in msgs]))
+
+
+def batched_tensor_ops(ptr: Any, calls: int, batch_size: int) -> None:
+    # the actions are sent in batches, the get waits for the node to run them all
+    with ptr.client.batch_actions(max_size=batch_size, max_delay=None):
+        for _ in range(calls):
+            ptr = ptr.add(1)
+        ptr.get()
+
+
+def fl_report(worker: ModelCentricFLWorker, diff: List[th.Tensor]) -> None:
+    worker.report(worker_id="bench", request_key="bench", diff=diff)
+
+
+def fl_get_model(worker: ModelCentricFLWorker) -> None:
+    worker.get_model(worker_id="bench", request_key="bench", model_id=1)
+
+
+def encode_model_diff(diff: List[th.Tensor], codec_name: str) -> bytes:
+    # the report of a diff, dense or with one of the diff codecs
+    if codec_name == "dense":
+        return wrap_model_params(diff)._object2proto().SerializeToString()
+    return encode_diff(diff=diff, codec=get_diff_codec(codec_name))
+
+
+def fl_connection_speed(worker: ModelCentricFLWorker, mode: str) -> None:
+    # the speed tests run before every cycle
+    if mode == "sequential":
+        worker._get_ping("bench", 1)
+        worker._get_upload_speed("bench", 1)
+        worker._get_download_speed("bench", 1)
+    else:
+        worker.get_connection_speed("bench", refresh=mode == "concurrent")
+
+
+class MLP(sy.Module):
+    def __init__(self, torch_ref: Any) -> None:
+        super().__init__(torch_ref=torch_ref)
+        self.l1 = self.torch_ref.nn.Linear(784, 100)
+        self.a1 = self.torch_ref.nn.ReLU()
+        self.l2 = self.torch_ref.nn.Linear(100, 10)
+
+    def forward(self, x: Any) -> Any:
+        return self.l2(self.a1(self.l1(x.view(-1, 28 * 28))))
+
+
+def mlp_training_plan() -> Tuple[Plan, SyList]:
+    # the forward and backward pass of an MLP on a batch, which returns the loss
+    # and the gradients, and the parameters of the MLP
+    local_model = MLP(th)
+
+    @make_plan
+    def train(  # type: ignore
+        xs=th.rand([64, 1, 28, 28]),
+        ys=th.randint(0, 10, [64, 10]),
+        params=SyList(local_model.parameters()),
+    ):
+        model = local_model.send(ROOT_CLIENT)
+        for p, p_new in zip(model.parameters(), params):
+            p.data = p_new.data
+        logits = model(xs)
+        norm_logits = logits - logits.max()
+        log_probs = norm_logits - norm_logits.exp().sum(dim=1, keepdim=True).log()
+        loss = -(ys * log_probs).sum() / 64
+        loss.backward()
+        return [loss] + [p.grad for p in model.parameters()]
+
+    return train, SyList(local_model.parameters())
+
+
+def run_plan(
+    plan: Plan, node: Node, verify_key: VerifyKey, kwargs: Any, calls: int
+) -> None:
+    # the plan is called by the node, like it is in a training loop
+    for _ in range(calls):
+        plan(node=node, verify_key=verify_key, **kwargs)
+
+
+def plan_store_memory(
+    plan: Plan, node: Node, verify_key: VerifyKey, kwargs: Any, calls: int
+) -> Tuple[int, int]:
+    # the peak size of the store and the growth of the RSS over repeated calls
+    process = psutil.Process()
+    rss = process.memory_info().rss
+    peak_store_size = 0
+    for _ in range(calls):
+        plan(node=node, verify_key=verify_key, **kwargs)
+        peak_store_size = max(peak_store_size, len(node.store))
+    return peak_store_size, process.memory_info().rss - rss
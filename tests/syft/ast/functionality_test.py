@@ -3,7 +3,6 @@ The following test suit serves as a set of examples of how to integrate differen
 into our AST and use them.
 """
 # stdlib
-from functools import partial
 from importlib import reload
 import sys
 from typing import List
@@ -19,7 +18,6 @@ import syft
 from syft.ast.globals import Globals
 from syft.core.node.abstract.node import AbstractNodeClient
 from syft.core.node.common.client import Client
-from syft.lib import lib_ast
 
 # syft relative
 from . import module_test
@@ -88,11 +86,6 @@ def register_module_test() -> None:
     # Make lib_ast contain the specific methods/attributes
     update_ast_test(ast_or_client=syft.lib_ast, methods=module_test_methods)
 
-    # Make sure that when we register a new client it would update the specific AST
-    lib_ast.loaded_lib_constructors["module_test"] = partial(
-        update_ast_test, methods=module_test_methods
-    )
-
 
 @pytest.fixture()
 def custom_client() -> Client:
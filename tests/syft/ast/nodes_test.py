@@ -1,5 +1,8 @@
 # stdlib
-from functools import partial
+import threading
+from typing import Any
+from typing import List
+from typing import Set
 
 # third party
 import pytest
@@ -8,6 +11,7 @@ from pytest import CaptureFixture
 # syft absolute
 import syft
 from syft.ast.globals import Globals
+from syft.ast.view import ClientView
 from syft.core.node.common.client import Client
 from syft.lib import lib_ast
 
@@ -28,11 +32,6 @@ def register_module_test_iter_without_len() -> None:
     # Make lib_ast contain the specific methods/attributes
     update_ast_test(ast_or_client=syft.lib_ast, methods=iter_without_len_methods)
 
-    # Make sure that when we register a new client it would update the specific AST
-    lib_ast.loaded_lib_constructors["module_test"] = partial(
-        update_ast_test, methods=iter_without_len_methods
-    )
-
 
 @pytest.fixture()
 def custom_client() -> Client:
@@ -62,6 +61,54 @@ def test_module_repr() -> None:
     assert ast.__repr__() == expected_repr
 
 
+# -------------------- Globals Tests --------------------
+
+
+def test_globals_path_cache() -> None:
+    ast = Globals(None)
+
+    for method, return_type in module_test_methods:
+        ast.add_path(
+            path=method, framework_reference=module_test, return_type_name=return_type
+        )
+    for klass in ast.classes:
+        klass.create_pointer_class()
+
+    node = ast.query("module_test.A.test_method")
+    assert ast.query("module_test.A.test_method") is node
+    assert ast("module_test.A.test_method") is module_test.A.test_method
+    assert ast("module_test.A.test_method") is module_test.A.test_method
+    assert (
+        ast.return_pointer_type("module_test.A")
+        is ast.query("module_test.A").pointer_type
+    )
+
+    stats = ast.path_cache_stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 3
+    assert stats["size"] == 4
+
+    # adding paths to the AST forgets the resolved ones
+    ast.add_path(
+        path="module_test.C", framework_reference=module_test, return_type_name="C"
+    )
+    assert ast.path_cache_stats()["size"] == 0
+
+
+def test_globals_path_cache_follows_changes() -> None:
+    update_ast_test(ast_or_client=syft.lib_ast, methods=module_test_methods)
+
+    original = module_test.C.dummy_reloadable_func
+    assert lib_ast("module_test.C.dummy_reloadable_func") is original
+
+    # objects replaced after their path was resolved are picked up
+    module_test.C.dummy_reloadable_func = module_test.C.func_1  # type: ignore
+    try:
+        assert lib_ast("module_test.C.dummy_reloadable_func") is module_test.C.func_1
+    finally:
+        module_test.C.dummy_reloadable_func = original  # type: ignore
+
+
 # -------------------- Klass Tests --------------------
 
 
@@ -103,6 +150,60 @@ def test_klass_get_and_set_request_config() -> None:
         }
 
 
+def test_klass_lazy_paths() -> None:
+    ast = Globals(None)
+    ast.add_path(
+        path="module_test.A",
+        framework_reference=module_test,
+        return_type_name="module_test.A",
+    )
+    klass = ast.query("module_test.A")
+
+    for method, return_type in module_test_methods[1:5]:
+        klass.add_lazy_path(path=method.split("."), return_type_name=return_type)
+
+    # nothing is added until the class is used
+    assert len(klass.__dict__["_lazy_paths"]) == 4
+    assert klass.attr_names == {"__len__", "__iter__", "__next__", "test_method"}
+    assert klass.pointer_name not in klass.__dict__
+
+    # the pointer class is created on first use, with all the lazy paths
+    assert hasattr(klass.pointer_type, "test_method")
+    assert klass.__dict__["_lazy_paths"] == []
+    assert (
+        ast.query("module_test.A.test_method").return_type_name == "syft.lib.python.Int"
+    )
+
+
+def test_klass_lazy_paths_added_once_for_all_threads() -> None:
+    ast = Globals(None)
+    ast.add_path(
+        path="module_test.A",
+        framework_reference=module_test,
+        return_type_name="module_test.A",
+    )
+    klass = ast.query("module_test.A")
+    for method, return_type in module_test_methods[1:5]:
+        klass.add_lazy_path(path=method.split("."), return_type_name=return_type)
+
+    # another thread reads the class while its first lazy path is added
+    seen: List[Set[str]] = []
+    reader = threading.Thread(target=lambda: seen.append(set(klass.attrs)))
+    add_path = klass.add_path
+
+    def add_path_and_read(**kwargs: Any) -> None:
+        if reader.ident is None:
+            reader.start()
+            reader.join(timeout=0.1)
+        add_path(**kwargs)
+
+    # set through __dict__, as setting an attribute of a class reads its attrs
+    klass.__dict__["add_path"] = add_path_and_read
+    assert set(klass.attrs) == {"__len__", "__iter__", "__next__", "test_method"}
+    reader.join()
+    assert seen == [set(klass.attrs)]
+
+
 def test_klass_wrap_iterator_raises_exception(
     register_module_test_iter_without_len: CaptureFixture, custom_client: Client
 ) -> None:
@@ -113,3 +214,36 @@ def test_klass_wrap_iterator_raises_exception(
         str(exception_info.value)
         == "Can't build a remote iterator on an object with no __len__."
     )
+
+
+# -------------------- ClientView Tests --------------------
+
+
+def test_clients_share_ast() -> None:
+    alice = syft.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    bob_client = alice.get_client()
+
+    assert isinstance(alice_client.lib_ast, ClientView)
+    assert alice_client.torch.Tensor.pointer_type is lib_ast.torch.Tensor.pointer_type
+    assert (
+        alice_client.lib_ast.query("torch.Tensor").pointer_type
+        is bob_client.lib_ast.query("torch.Tensor").pointer_type
+    )
+
+    # both clients run their calls on the node through their own view
+    ptr = alice_client.torch.Tensor([1, 2, 3])
+    assert ptr.client is alice_client
+    assert bob_client.torch.Tensor([1, 2, 3]).client is bob_client
+
+
+def test_client_view_copy_on_write() -> None:
+    alice = syft.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    bob_client = alice.get_client()
+
+    alice_client.torch.custom_attr = 1
+
+    assert alice_client.torch.custom_attr == 1
+    assert not hasattr(bob_client.torch, "custom_attr")
+    assert "custom_attr" not in lib_ast.torch.attrs
@@ -0,0 +1,33 @@
+# stdlib
+import asyncio
+import threading
+
+# syft absolute
+from syft.core.common.event_loop import loop_in_thread
+from syft.core.common.event_loop import run_coroutine
+
+
+async def get_thread_id() -> int:
+    return threading.get_ident()
+
+
+def test_run_coroutine() -> None:
+    event_loop = asyncio.new_event_loop()
+    try:
+        # a loop which is not running is run from here
+        assert run_coroutine(get_thread_id(), event_loop=event_loop) == (
+            threading.get_ident()
+        )
+
+        # a loop running in another thread runs the coroutine in that thread
+        thread = threading.Thread(target=loop_in_thread, args=(event_loop,))
+        thread.start()
+        try:
+            assert run_coroutine(get_thread_id(), event_loop=event_loop) == (
+                thread.ident
+            )
+        finally:
+            event_loop.call_soon_threadsafe(event_loop.stop)
+            thread.join()
+    finally:
+        event_loop.close()
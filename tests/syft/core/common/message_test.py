@@ -1,12 +1,15 @@
 # third party
 from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
+import pytest
 
 # syft absolute
 import syft as sy
 from syft import ReprMessage
 from syft import serialize
 from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
+from syft.core.io.address import Address
+from syft.core.io.location import SpecificLocation
 from syft.util import get_fully_qualified_name
 
 
@@ -18,6 +21,26 @@ def get_signing_key() -> SigningKey:
 
 def get_signed_message_bytes() -> bytes:
     # return a signed message fixture containing the uid from get_uid
+    blob = (
+        b"\n?syft.core.common.message.SignedImmediateSyftMessageWithoutReply"
+        + b"\x12\xda\x02\n\x12\n\x10\x8c3\x19,\xcd\xd3\xf3N\xe2\xb0\xc6\tU\xdf\x02u\x12"
+        + b"6syft.core.node.common.service.repr_service.ReprMessage"
+        + b"\x1a@@\x82\x13\xfaC\xfb=\x01H\x853\x1e\xceE+\xc6\xb5\rX\x16Z\xb8l\x02\x10"
+        + b"\x8algj\xd6U\x11]\xe9R\x0ei\xd8\xca\xb9\x00=\xa1\xeeoEa\xe2C\xa0\x960\xf7A"
+        + b'\xfad<(9\xe1\x8c\x93\xf1\x0b" \x81\xff\xcc\xfc7\xc4U.\x8a*\x1f"=0\x10\xc4'
+        + b"\xef\x88\xc80\x01\xf0}3\x0b\xd4\x97\xad/P\x8f\x0f*{\n6"
+        + b"syft.core.node.common.service.repr_service.ReprMessage\x12A\n\x12\n\x10"
+        + b"\x8c3\x19,\xcd\xd3\xf3N\xe2\xb0\xc6\tU\xdf\x02u\x12+\n\x0bGoofy KirchH\x01R"
+        + b"\x1a\n\x12\n\x10\xfb\x1b\xb0g[\xb7LI\xbe\xce\xe7\x00\xab\n\x15\x14\x12\x04Test"
+        + b"2+\n\x0bGoofy KirchH\x01R"
+        + b"\x1a\n\x12\n\x10\xfb\x1b\xb0g[\xb7LI\xbe\xce\xe7\x00\xab\n\x15\x14\x12\x04Test"
+    )
+    return blob
+
+
+def get_legacy_signed_message_bytes() -> bytes:
+    # return a signed message fixture from before the envelope carried its own
+    # address, the address then has to be read from the signed message
     blob = (
         b"\n?syft.core.common.message.SignedImmediateSyftMessageWithoutReply"
         + b"\x12\xad\x02\n\x12\n\x10\x8c3\x19,\xcd\xd3\xf3N\xe2\xb0\xc6\tU\xdf\x02u\x12"
@@ -131,6 +154,28 @@ def test_serde_matches() -> None:
     assert sig_msg_comp == sig_msg
 
 
+def test_deserialize_legacy_signed_message() -> None:
+    """Tests that SignedMessage without its own address can be deserialized"""
+
+    sig_msg = sy.deserialize(blob=get_legacy_signed_message_bytes(), from_bytes=True)
+    sig_msg_comp = sy.deserialize(blob=get_signed_message_bytes(), from_bytes=True)
+
+    assert type(sig_msg) == SignedImmediateSyftMessageWithoutReply
+    assert sig_msg.address == sig_msg_comp.address
+    assert sig_msg.message == get_repr_message()
+    assert sig_msg.is_valid is True
+
+
+def test_signed_message_address_must_match() -> None:
+    """Tests that the unsigned envelope address can't redirect a signed message"""
+
+    sig_msg = sy.deserialize(blob=get_signed_message_bytes(), from_bytes=True)
+    sig_msg.address = Address(vm=SpecificLocation())
+
+    with pytest.raises(ValueError):
+        sig_msg.message
+
+
 def test_verify_message() -> None:
     """Tests that SignedMessage can be verified"""
 
@@ -0,0 +1,49 @@
+# syft absolute
+import syft as sy
+from syft.core.common.serde.type_registry import TYPE_REGISTRY
+from syft.core.common.serde.type_registry import lookup_type
+from syft.core.common.serde.type_registry import reset_type_registry_stats
+from syft.core.common.serde.type_registry import type_registry_stats
+from syft.core.common.uid import UID
+from syft.lib.python.list import List
+
+
+def test_bound_types_are_registered_at_import() -> None:
+    entry = TYPE_REGISTRY["syft.core.common.uid.UID"]
+
+    assert entry.obj_type is UID
+    assert entry.protobuf_schema is UID.get_protobuf_schema()
+
+
+def test_wrappers_are_registered_under_their_final_name() -> None:
+    entry = TYPE_REGISTRY["syft.wrappers.nacl.signing.VerifyKeyWrapper"]
+
+    assert entry.obj_type is sy.wrappers.nacl.signing.VerifyKeyWrapper
+    assert not any("<locals>" in name for name in TYPE_REGISTRY)
+    assert "syft.generate_wrapper.Wrapper" not in TYPE_REGISTRY
+
+
+def test_lookup_caches_misses() -> None:
+    name = "syft.lib.python.List"
+    TYPE_REGISTRY.pop(name, None)
+    reset_type_registry_stats()
+
+    assert lookup_type(name).obj_type is List
+    assert lookup_type(name).obj_type is List
+
+    stats = type_registry_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_deserialize_uses_registry() -> None:
+    blob = sy.serialize(List([1, 2.0, "three"]), to_bytes=True)
+    sy.deserialize(blob=blob, from_bytes=True)
+    reset_type_registry_stats()
+
+    assert sy.deserialize(blob=blob, from_bytes=True) == [1, 2.0, "three"]
+
+    stats = type_registry_stats()
+    assert stats["misses"] == 0
+    assert stats["hits"] > 0
@@ -0,0 +1,103 @@
+# stdlib
+import time
+
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft import serialize
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.io.location import SpecificLocation
+from syft.core.node.common.action.action_batch import ActionBatch
+from syft.core.node.common.action.garbage_collect_object_action import (
+    GarbageCollectObjectAction,
+)
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.store.storeable_object import StorableObject
+
+
+def test_action_batch_serde() -> None:
+    addr = Address(network=SpecificLocation(), device=SpecificLocation())
+    storable = StorableObject(id=UID(), data=th.tensor([1, 2, 3]))
+    actions = [
+        SaveObjectAction(obj=storable, address=addr),
+        GarbageCollectObjectAction(id_at_location=storable.id, address=addr),
+    ]
+    msg = ActionBatch(actions=actions, address=addr)
+
+    msg2 = sy.deserialize(blob=serialize(msg))
+
+    assert msg2.id == msg.id
+    assert msg2.address == msg.address
+    assert [type(action) for action in msg2.actions] == [
+        SaveObjectAction,
+        GarbageCollectObjectAction,
+    ]
+    assert (msg2.actions[0].obj.data == storable.data).all()
+    assert msg2.actions[1].id_at_location == storable.id
+
+
+def test_action_batch_executes_in_order() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    x = th.tensor([1, 2, 3]).send(alice_client)
+
+    count = alice.message_counter
+    with alice_client.batch_actions(max_size=50, max_delay=None) as batcher:
+        y = x
+        for _ in range(25):
+            y = y + 1
+        # the pointers of the intermediate results are deleted in the batches too
+        assert len(batcher.actions) > 0
+        assert (y.get() == th.tensor([26, 27, 28])).all()
+
+    assert alice_client.action_batcher is None
+    # each addition sends the 1 and the add, then deletes the previous result, so
+    # 75 actions are sent in two batches before the get
+    assert alice.message_counter - count == 3
+
+
+def test_action_batch_flushes_on_timer() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    x = th.tensor([1, 2, 3]).send(alice_client)
+
+    batcher = alice_client.batch_actions(max_size=100, max_delay=0.01)
+    try:
+        y = x * 2
+        assert len(batcher.actions) > 0
+        time.sleep(0.5)
+        assert batcher.actions == []
+        assert y.id_at_location in alice.store
+    finally:
+        batcher.close()
+
+
+def test_action_batch_permissions() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    bob_client = alice.get_client()
+
+    with bob_client.batch_actions():
+        ptr = th.tensor([1, 2, 3]).send(bob_client)
+
+    # the objects are owned by the sender of the batch
+    obj = alice.store[ptr.id_at_location]
+    assert bob_client.verify_key in obj.read_permissions
+    assert (ptr.get() == th.tensor([1, 2, 3])).all()
+
+
+def test_action_batch_rejects_actions_for_other_nodes() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    bob = sy.VirtualMachine(name="bob")
+    alice_client = alice.get_root_client()
+
+    storable = StorableObject(id=UID(), data=th.tensor([1, 2, 3]))
+    save = SaveObjectAction(obj=storable, address=bob.address)
+    msg = ActionBatch(actions=[save], address=alice_client.address)
+
+    with pytest.raises(ValueError):
+        alice_client.send_immediate_msg_without_reply(msg=msg)
+    assert storable.id not in alice.store
@@ -0,0 +1,116 @@
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.node.common.service.obj_search_service import (
+    ImmediateObjectSearchService,
+)
+from syft.core.node.common.service.obj_search_service import ObjectSearchMessage
+from syft.core.node.common.service.obj_search_service import ObjectSearchReplyMessage
+from syft.lib.python.string import String
+
+
+def test_object_search_message_serde() -> None:
+    bob_phone = sy.Device(name="Bob's iPhone")
+    bob_phone_client = bob_phone.get_client()
+
+    msg = ObjectSearchMessage(
+        address=bob_phone_client.address,
+        reply_to=bob_phone_client.address,
+        tag="data",
+        obj_type="torch.Tensor",
+        offset=2,
+        limit=0,
+        count_only=True,
+    )
+
+    blob = sy.serialize(msg)
+    msg2 = sy.deserialize(blob=blob)
+
+    assert msg.id == msg2.id
+    assert msg.address == msg2.address
+    assert msg2.tag == "data"
+    assert msg2.obj_type == "torch.Tensor"
+    assert msg2.description is None
+    assert msg2.offset == 2
+    assert msg2.limit == 0
+    assert msg2.count_only
+
+
+def test_object_search_reply_message_serde() -> None:
+    bob_phone = sy.Device(name="Bob's iPhone")
+    bob_phone_client = bob_phone.get_client()
+
+    msg = ObjectSearchReplyMessage(
+        address=bob_phone_client.address, results=[], count=3
+    )
+
+    blob = sy.serialize(msg)
+    msg2 = sy.deserialize(blob=blob)
+
+    assert msg.id == msg2.id
+    assert msg2.results == []
+    assert msg2.count == 3
+
+
+def test_object_search_filters() -> None:
+    bob_phone = sy.Device(name="Bob's iPhone")
+    root_client = bob_phone.get_root_client()
+
+    x = th.tensor([1, 2, 3]).tag("a").describe("first tensor").send(root_client)
+    y = th.tensor([4, 5, 6]).tag("a", "b").send(root_client)
+    z = String("three").tag("a").send(root_client)
+
+    def search(**kwargs: object) -> ObjectSearchReplyMessage:
+        msg = ObjectSearchMessage(
+            address=bob_phone.address, reply_to=bob_phone.address, **kwargs
+        )
+        return ImmediateObjectSearchService.process(
+            node=bob_phone, msg=msg, verify_key=bob_phone.root_verify_key
+        )
+
+    def ids(reply: ObjectSearchReplyMessage) -> list:
+        return [ptr.id_at_location for ptr in reply.results]
+
+    assert ids(search()) == [x.id_at_location, y.id_at_location, z.id_at_location]
+    assert ids(search(tag="b")) == [y.id_at_location]
+    assert ids(search(tag="a", obj_type="torch.Tensor")) == [
+        x.id_at_location,
+        y.id_at_location,
+    ]
+    assert ids(search(description="first")) == [x.id_at_location]
+
+    reply = search(tag="a", offset=1, limit=1)
+    assert ids(reply) == [y.id_at_location]
+    assert reply.count == 3
+
+    reply = search(obj_type="torch.Tensor", count_only=True)
+    assert reply.results == []
+    assert reply.count == 2
+
+
+def test_store_client() -> None:
+    bob_phone = sy.Device(name="Bob's iPhone")
+    root_client = bob_phone.get_root_client()
+    guest_client = bob_phone.get_client()
+
+    x = th.tensor([1, 2, 3]).tag("x").send(root_client, pointable=True)
+    y = th.tensor([4, 5, 6]).tag("y").send(root_client, pointable=False)
+
+    assert len(root_client.store) == 2
+    assert root_client.store["y"].id_at_location == y.id_at_location
+    assert root_client.store[0].id_at_location == x.id_at_location
+    assert root_client.store[-1].id_at_location == y.id_at_location
+    assert root_client.store.search(obj_type=th.Tensor, limit=1)[0].id_at_location == (
+        x.id_at_location
+    )
+    with pytest.raises(IndexError):
+        root_client.store[2]
+
+    # guests only find the objects they were allowed to search for
+    assert len(guest_client.store) == 1
+    assert guest_client.store["x"].id_at_location == x.id_at_location
+    with pytest.raises(KeyError):
+        guest_client.store["y"]
@@ -1,3 +1,6 @@
+# stdlib
+import asyncio
+
 # third party
 import pytest
 import torch as th
@@ -119,3 +122,60 @@ def test_domain_is_for_me_exception() -> None:
     with pytest.raises(Exception):
         msg = SyftMessage()
         domain_1.message_is_for_me(msg)
+
+
+def test_domain_request_handled_on_arrival() -> None:
+    domain_1 = Domain(name="remote domain")
+    domain_1_client = domain_1.get_root_client()
+    domain_1_client.requests.add_handler(action="accept", tags=["accept"])
+    domain_1_client.requests.add_handler(action="deny", tags=["deny"])
+
+    accepted_ptr = th.tensor([1, 2, 3]).tag("accept").send(domain_1_client)
+    denied_ptr = th.tensor([1, 2, 3]).tag("deny").send(domain_1_client)
+
+    # the handlers run as soon as the requests arrive, without the handlers loop
+    assert accepted_ptr.request(block=True) == RequestStatus.Accepted
+    assert denied_ptr.request(block=True) == RequestStatus.Rejected
+    assert domain_1.requests == []
+
+
+def test_domain_request_handled_when_handler_added() -> None:
+    domain_1 = Domain(name="remote domain")
+    domain_1_client = domain_1.get_root_client()
+    data_ptr_domain_1 = th.tensor([1, 2, 3]).send(domain_1_client)
+
+    data_ptr_domain_1.request(reason="I'd lke to see this pointer")
+    assert len(domain_1.requests) == 1
+
+    domain_1_client.requests.add_handler(action="accept")
+    assert domain_1.requests == []
+
+
+def test_domain_expiries() -> None:
+    domain_1 = Domain(name="remote domain")
+    domain_1_client = domain_1.get_root_client()
+    data_ptr_domain_1 = th.tensor([1, 2, 3]).send(domain_1_client)
+
+    domain_1_client.requests.add_handler(action="accept", tags=["x"], timeout_secs=0)
+    assert domain_1.request_handlers != []
+    data_ptr_domain_1.request(timeout_secs=0)
+
+    # expired handlers and requests are removed at their deadline
+    domain_1.expire_handlers_and_requests()
+    assert domain_1.request_handlers == []
+    assert domain_1.requests == []
+
+
+@pytest.mark.asyncio
+async def test_domain_expiries_wake_up_handlers_loop() -> None:
+    domain_1 = Domain(name="remote domain")
+    domain_1_client = domain_1.get_root_client()
+    data_ptr_domain_1 = th.tensor([1, 2, 3]).send(domain_1_client)
+    # let the handlers loop start, it has no deadline to wait for
+    await asyncio.sleep(0.01)
+
+    data_ptr_domain_1.request(timeout_secs=0)
+    assert len(domain_1.requests) == 1
+
+    await asyncio.sleep(0.05)
+    assert domain_1.requests == []
@@ -31,6 +31,7 @@ from syft.core.node.common.action.get_or_set_static_attribute_action import (
 )
 from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
 from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.plan.plan_builder import PLAN_BUILDER_VM
 from syft.core.plan.plan_builder import ROOT_CLIENT
 from syft.core.store.storeable_object import StorableObject
 from syft.lib.python.list import List
@@ -344,3 +345,219 @@ def test_planbuilder() -> None:
 
     res = model(x=th.tensor([4, 5, 6]))
     assert th.equal(*res.get(), th.tensor([4, 10, 18]))
+
+
+def test_compiled_plan_serde() -> None:
+    @make_plan
+    def add_plan(inp=th.zeros((3))) -> th.Tensor:  # type: ignore
+        return inp + inp
+
+    assert add_plan.compile() is add_plan
+    plan2 = sy.deserialize(blob=serialize(add_plan))
+    assert plan2.compiled
+
+
+def test_compiled_plan_execution(node: sy.VirtualMachine) -> None:
+    client = node.get_client()
+
+    @make_plan
+    def model(x=th.zeros(2), y=th.zeros(2)) -> th.Tensor:  # type: ignore
+        return ((x * th.tensor([1, 2])) + th.tensor([3, 4])) == y
+
+    model.compile()
+    written = len(node.store)
+    for i in range(2):
+        x = (th.tensor([1, 1]) + i).send(client)
+        y = ((th.tensor([1, 1]) + i) * th.tensor([1, 2]) + th.tensor([3, 4])).send(
+            client
+        )
+        (result,) = model(node=node, verify_key=client.verify_key, x=x, y=y)
+        assert all(result)
+
+    # the inputs of the two calls, and the output
+    assert len(node.store) - written == 5
+    output = node.store[model.outputs[0].id_at_location]
+    assert output.data is result
+    assert client.verify_key in output.read_permissions
+
+    # remote calls run compiled too
+    model_ptr = model.send(client)
+    res_ptr = model_ptr(x=th.tensor([2, 2]), y=th.tensor([5, 8]))
+    assert all(res_ptr.get()[0])
+
+
+def test_compiled_plan_reads_store_objects_after_dead_intermediates() -> None:
+    w = th.tensor([10, 20, 30]).send(ROOT_CLIENT)
+
+    @make_plan
+    def model(x=th.zeros(3)) -> th.Tensor:  # type: ignore
+        a = x + 1
+        b = a * 2
+        return b + w
+
+    x = th.tensor([1, 2, 3]).send(ROOT_CLIENT)
+    vm = PLAN_BUILDER_VM
+    (expected,) = model(node=vm, verify_key=ROOT_CLIENT.verify_key, x=x)
+    assert th.equal(expected, th.tensor([14, 26, 38]))
+
+    model.compile()
+    (result,) = model(node=vm, verify_key=ROOT_CLIENT.verify_key, x=x)
+    assert th.equal(result, expected)
+
+
+def test_compiled_plan_inherits_tags(node: sy.VirtualMachine) -> None:
+    client = node.get_client()
+
+    @make_plan
+    def model(x=th.zeros(2), y=th.zeros(2)) -> th.Tensor:  # type: ignore
+        return (x * th.tensor([1, 2])).sum() + y.abs()
+
+    x = th.tensor([1, 1]).send(client, tags=["x"])
+    y = th.tensor([-1, 2]).send(client, tags=["y"])
+    output_id = model.outputs[0].id_at_location
+
+    tags = []
+    for compiled in [False, True]:
+        model.compiled = compiled
+        model(node=node, verify_key=client.verify_key, x=x, y=y)
+        tags.append(node.store[output_id].tags)
+
+    assert tags[0] == ["x", "__mul__", "sum", "y", "abs", "__add__"]
+    assert tags[1] == tags[0]
+
+
+def test_compiled_mlp_plan(root_client: sy.VirtualMachineClient) -> None:
+    class MLP(sy.Module):
+        def __init__(self, torch_ref):  # type: ignore
+            super().__init__(torch_ref=torch_ref)
+            self.l1 = self.torch_ref.nn.Linear(784, 100)
+            self.a1 = self.torch_ref.nn.ReLU()
+            self.l2 = self.torch_ref.nn.Linear(100, 10)
+
+        def forward(self, x):  # type: ignore
+            return self.l2(self.a1(self.l1(x.view(-1, 28 * 28))))
+
+    local_model = MLP(th)  # type: ignore
+
+    @make_plan
+    def train(  # type: ignore
+        xs=th.rand([64, 1, 28, 28]),
+        ys=th.randint(0, 10, [64, 10]),
+        params=List(local_model.parameters()),
+    ):
+        model = local_model.send(ROOT_CLIENT)
+        for p, p_new in zip(model.parameters(), params):
+            p.data = p_new.data
+        logits = model(xs)
+        norm_logits = logits - logits.max()
+        log_probs = norm_logits - norm_logits.exp().sum(dim=1, keepdim=True).log()
+        loss = -(ys * log_probs).sum() / 64
+        loss.backward()
+        return [logits, loss]
+
+    kwargs = {
+        "xs": th.rand([64, 1, 28, 28]),
+        "ys": th.randint(0, 10, [64, 10]),
+        "params": local_model.parameters(),
+    }
+    logits, loss = train.send(root_client)(**kwargs).get()
+    compiled_logits, compiled_loss = train.compile().send(root_client)(**kwargs).get()
+
+    assert th.equal(logits, compiled_logits)
+    assert th.equal(loss, compiled_loss)
+
+
+def test_compiled_plan_runs_nested_plans(
+    node: sy.VirtualMachine, client: sy.VirtualMachineClient
+) -> None:
+    @make_plan
+    def double(inp=th.zeros(3)) -> th.Tensor:  # type: ignore
+        return inp * 2
+
+    x = th.tensor([1, 2, 3]).send(client)
+    model_tensor = th.tensor([4, 5, 6]).send(client)
+    double_ptr = double.send(client)
+    intermediate = th.zeros(3).send(client)
+    output = th.zeros(3).send(client)
+
+    a1 = RunClassMethodAction(
+        path="torch.Tensor.add",
+        _self=x,
+        args=[model_tensor],
+        kwargs={},
+        id_at_location=intermediate.id_at_location,
+        address=Address(),
+        msg_id=UID(),
+    )
+    # executed against the store, after the intermediate result is stored
+    a2 = RunClassMethodAction(
+        path="syft.core.plan.Plan.__call__",
+        _self=double_ptr,
+        args=[],
+        kwargs={"inp": intermediate},
+        id_at_location=output.id_at_location,
+        address=Address(),
+        msg_id=UID(),
+    )
+    plan = Plan([a1, a2], inputs={"x": x}, outputs=[output]).compile()
+
+    y = th.tensor([1, 1, 1]).send(client)
+    ((result,),) = plan(node=node, verify_key=client.verify_key, x=y)
+    assert th.equal(result, th.tensor([10, 12, 14]))
+
+
+def test_find_dead_intermediates(client: sy.VirtualMachineClient) -> None:
+    x = th.tensor([1, 2, 3]).send(client)
+    model_tensor = th.tensor([4, 5, 6]).send(client)
+    r1, r2, r3 = [th.zeros(3).send(client) for _ in range(3)]
+
+    actions = [
+        RunClassMethodAction(
+            path="torch.Tensor.add",
+            _self=_self,
+            args=[model_tensor],
+            kwargs={},
+            id_at_location=result.id_at_location,
+            address=Address(),
+            msg_id=UID(),
+        )
+        for _self, result in [(x, r1), (r1, r2), (r2, r3)]
+    ]
+    plan = Plan(actions, inputs={"x": x}, outputs=[r3])
+
+    # r1 and r2 are dead once they are read, the input, the output and the
+    # objects of the store are kept
+    assert plan.find_dead_intermediates() == [
+        [],
+        [r1.id_at_location],
+        [r2.id_at_location],
+    ]
+
+
+def test_plan_frees_intermediates(node: sy.VirtualMachine) -> None:
+    client = node.get_client()
+
+    @make_plan
+    def chain(x=th.zeros(3)) -> th.Tensor:  # type: ignore
+        for _ in range(10):
+            x = x * 2 + 1
+        return x
+
+    # the constants and results of the 20 operations, but the output
+    assert sum(len(ids) for ids in chain.free_after) == 39
+    plan2 = sy.deserialize(blob=serialize(chain))
+    assert plan2.free_after == chain.free_after
+
+    x = th.tensor([0, 1, 2]).send(client)
+    written = len(node.store)
+    for compiled in [False, True]:
+        chain.compiled = compiled
+        for _ in range(3):
+            (result,) = chain(node=node, verify_key=client.verify_key, x=x)
+            assert th.equal(result, th.tensor([1023, 2047, 3071]))
+        # only the output of the plan is stored, under the same id every call
+        assert len(node.store) - written == 1
+
+    # the input, a constant, the operand and the result of each operation, instead
+    # of a register for each of the 41 objects
+    assert chain._get_compiled_plan(node).n_registers == 4
@@ -0,0 +1,281 @@
+"""In this test suite, we evaluate the DiskObjectStore class. For more info
+on the DiskObjectStore class and its purpose, please see the documentation
+in the class itself.
+
+Table of Contents:
+    - INITIALIZATION: tests for ways DiskObjectStore can be initialized
+    - CLASS METHODS: tests for the use of DiskObjectStore's class methods
+    - CACHING: tests for the read cache and the write queue
+    - INDEXES: tests for the queries on the metadata tables
+"""
+
+# stdlib
+from pathlib import Path
+import sqlite3
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+from nacl.signing import SigningKey
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common import UID
+from syft.core.common.group import VERIFYALL
+from syft.core.node.domain.service import RequestStatus
+from syft.core.store import DiskObjectStore
+from syft.core.store import ObjectStore
+from syft.core.store.storeable_object import StorableObject
+from syft.lib.python.string import String
+
+
+def generate_id_obj(
+    data: th.Tensor, description: str = "", tags: Optional[List[str]] = None
+) -> Tuple[UID, StorableObject]:
+    id = UID()
+    obj = StorableObject(id=id, data=data, description=description, tags=tags)
+
+    return id, obj
+
+
+def make_store(tmp_path: Path, **kwargs: int) -> DiskObjectStore:
+    return DiskObjectStore(db_path=str(tmp_path / "store.sqlite"), **kwargs)
+
+
+# --------------------- INITIALIZATION ---------------------
+
+
+def test_create_disk_storage(tmp_path: Path) -> None:
+    """Test that creating DiskObjectStore() does in fact create an ObjectStore."""
+
+    store = make_store(tmp_path=tmp_path)
+    assert isinstance(store, ObjectStore)
+
+
+def test_reopen_disk_storage(tmp_path: Path) -> None:
+    """Test that objects survive closing and reopening the database."""
+
+    store = make_store(tmp_path=tmp_path)
+    id1, obj1 = generate_id_obj(data=th.Tensor([1, 2, 3]), tags=["tensor"])
+    store[id1] = obj1
+    store.close()
+
+    store = make_store(tmp_path=tmp_path)
+    assert id1 in store
+    assert (store[id1].data == obj1.data).all()
+    assert store[id1].tags == ["tensor"]
+
+
+def test_node_disk_storage(tmp_path: Path) -> None:
+    """Test that a Node with a db_path can store and search objects."""
+
+    node = sy.Domain(name="alice", db_path=str(tmp_path / "node.sqlite"))
+    assert isinstance(node.store, DiskObjectStore)
+
+    client = node.get_root_client()
+    ptr = th.Tensor([1, 2, 3]).tag("data").send(client, searchable=True)
+
+    assert len(client.store) == 1
+    assert client.store["data"].id_at_location == ptr.id_at_location
+    assert (ptr.get() == th.Tensor([1, 2, 3])).all()
+
+
+# --------------------- CLASS METHODS ---------------------
+
+
+def test_set_get_delete(tmp_path: Path) -> None:
+    """Tests that __setitem__, __getitem__ and delete work intuitively."""
+
+    store = make_store(tmp_path=tmp_path)
+    id1, obj1 = generate_id_obj(data=th.Tensor([1, 2, 3, 4]))
+    id2, _ = generate_id_obj(data=th.Tensor([1, 2]))
+
+    store[id1] = obj1
+    assert id1 in store
+    assert id2 not in store
+    assert len(store) == 1
+    assert store.get_object(id2) is None
+
+    store.delete(id1)
+    assert id1 not in store
+    assert len(store) == 0
+
+
+def test_get_objects_of_type(tmp_path: Path) -> None:
+    """Tests that get_objects_of_type() filters by the stored data types."""
+
+    store = make_store(tmp_path=tmp_path)
+    id1, obj1 = generate_id_obj(data=th.Tensor([1, 2, 3, 4]))
+    id2, obj2 = generate_id_obj(data=th.nn.Parameter(th.Tensor([1, 2, 3])))
+    id3, obj3 = generate_id_obj(data=String("three"))
+
+    store[id1] = obj1
+    store[id2] = obj2
+    store[id3] = obj3
+
+    assert [obj.id for obj in store.get_objects_of_type(th.Tensor)] == [id1, id2]
+    assert [obj.id for obj in store.get_objects_of_type(th.nn.Parameter)] == [id2]
+    assert [obj.id for obj in store.get_objects_of_type(String)] == [id3]
+    assert len(store.get_objects_of_type(object)) == 3
+
+
+def test_keys_values(tmp_path: Path) -> None:
+    """Tests that keys() and values() iterate lazily in insertion order."""
+
+    store = make_store(tmp_path=tmp_path, cache_bytes=0)
+    ids = []
+    for i in range(5):
+        id, obj = generate_id_obj(data=th.Tensor([i]))
+        store[id] = obj
+        ids.append(id)
+
+    assert not isinstance(store.keys(), list)
+    assert list(store.keys()) == ids
+    assert [obj.data.item() for obj in store.values()] == [0, 1, 2, 3, 4]
+
+
+def test_metadata_tables(tmp_path: Path) -> None:
+    """Tests that tags and permissions are kept in their own tables."""
+
+    store = make_store(tmp_path=tmp_path)
+    verify_key = SigningKey.generate().verify_key
+    request_id = UID()
+    id1, obj1 = generate_id_obj(data=th.Tensor([1]), tags=["a", "b"])
+    obj1.read_permissions = {verify_key: request_id}
+    obj1.search_permissions = {VERIFYALL: None}
+
+    store[id1] = obj1
+    store.flush()
+
+    conn = sqlite3.connect(store.db_path)
+    tags = conn.execute("SELECT tag FROM tags WHERE key = ?", (str(id1.value),))
+    assert sorted(tag for tag, in tags) == ["a", "b"]
+
+    permissions = conn.execute(
+        "SELECT kind, verify_key, request_id FROM permissions ORDER BY kind"
+    ).fetchall()
+    assert permissions == [
+        ("read", bytes(verify_key).hex(), str(request_id.value)),
+        ("search", "all", "None"),
+    ]
+
+    # replacing the object replaces its metadata
+    obj1.tags = ["c"]
+    store[id1] = obj1
+    store.flush()
+    tags = conn.execute("SELECT tag FROM tags WHERE key = ?", (str(id1.value),))
+    assert [tag for tag, in tags] == ["c"]
+
+
+def test_clear_len(tmp_path: Path) -> None:
+    """Tests that clear() empties the store."""
+
+    store = make_store(tmp_path=tmp_path)
+    for i in range(3):
+        id, obj = generate_id_obj(data=th.Tensor([i]))
+        store[id] = obj
+
+    assert len(store) == 3
+    store.clear()
+    assert len(store) == 0
+    assert list(store.keys()) == []
+
+
+# --------------------- CACHING ---------------------
+
+
+def test_group_commit(tmp_path: Path) -> None:
+    """Tests that writes are queued until commit_batch_size is reached."""
+
+    store = make_store(tmp_path=tmp_path, commit_batch_size=3)
+    conn = sqlite3.connect(store.db_path)
+
+    def committed() -> int:
+        return conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+    for i in range(2):
+        id, obj = generate_id_obj(data=th.Tensor([i]))
+        store[id] = obj
+    assert committed() == 0
+    assert store.cache_info()["pending_writes"] == 2
+
+    id, obj = generate_id_obj(data=th.Tensor([2]))
+    store[id] = obj
+    assert committed() == 3
+    assert store.cache_info()["pending_writes"] == 0
+
+
+def test_read_cache_eviction(tmp_path: Path) -> None:
+    """Tests that the read cache keeps decoded objects up to its byte budget."""
+
+    store = make_store(tmp_path=tmp_path, cache_bytes=1000)
+    id1, obj1 = generate_id_obj(data=th.zeros(100))
+    id2, obj2 = generate_id_obj(data=th.zeros(100))
+
+    store[id1] = obj1
+    assert store[id1] is obj1
+
+    store[id2] = obj2
+    assert store.cache_info()["cached_objects"] == 1
+    assert store.cache_info()["cached_bytes"] <= 1000
+
+    # the evicted object is decoded again and cached in place of the other one
+    reloaded = store[id1]
+    assert reloaded is not obj1
+    assert (reloaded.data == obj1.data).all()
+    assert store[id1] is reloaded
+
+
+# --------------------- INDEXES ---------------------
+
+
+def test_indexes(tmp_path: Path) -> None:
+    """Tests that the index queries follow __setitem__ and delete."""
+
+    store = make_store(tmp_path=tmp_path)
+    verify_key = SigningKey.generate().verify_key
+    request_id = UID()
+    id1, obj1 = generate_id_obj(data=th.Tensor([1]), tags=["a"])
+    id2, obj2 = generate_id_obj(data=String("two"), tags=["a", "b"])
+    obj1.read_permissions = {verify_key: request_id}
+    obj2.search_permissions = {VERIFYALL: None}
+
+    store[id1] = obj1
+    store[id2] = obj2
+
+    assert store.get_keys_with_tag("a") == [id1, id2]
+    assert store.get_keys_with_tag("c") == []
+    assert store.get_keys_of_type(th.Tensor) == [id1]
+    assert store.get_keys_of_type(String) == [id2]
+    assert store.get_keys_readable_by(verify_key) == [id1]
+    assert store.get_keys_searchable_by(verify_key) == [id2]
+    assert store.get_keys_with_request_id(request_id) == [id1]
+
+    obj1.tags = ["c"]
+    obj1.search_permissions = {verify_key: None}
+    store[id1] = obj1
+    assert store.get_keys_with_tag("a") == [id2]
+    assert store.get_keys_with_tag("c") == [id1]
+    assert set(store.get_keys_searchable_by(verify_key)) == {id1, id2}
+
+    store.delete(id2)
+    assert store.get_keys_with_tag("b") == []
+    assert store.get_keys_searchable_by(verify_key) == [id1]
+
+
+def test_node_request_status(tmp_path: Path) -> None:
+    """Tests that a Domain finds accepted requests through the store."""
+
+    node = sy.Domain(name="alice", db_path=str(tmp_path / "node.sqlite"))
+    client = node.get_root_client()
+    ptr = th.Tensor([1, 2, 3]).send(client)
+
+    request_id = UID()
+    assert node.get_request_status(request_id) == RequestStatus.Rejected
+
+    obj = node.store[ptr.id_at_location]
+    obj.read_permissions[SigningKey.generate().verify_key] = request_id
+    node.store[ptr.id_at_location] = obj
+    assert node.get_request_status(request_id) == RequestStatus.Accepted
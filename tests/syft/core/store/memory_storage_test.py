@@ -5,6 +5,7 @@ in the class itself.
 Table of Contents:
     - INITIALIZATION: tests for ways MemoryStore can be initialized
     - CLASS METHODS: tests for the use of MemoryStore's class methods
+    - INDEXES: tests for the secondary indexes of MemoryStore
 """
 
 # stdlib
@@ -13,14 +14,17 @@ from typing import List
 from typing import Tuple
 
 # third party
+from nacl.signing import SigningKey
 import torch as th
 
 # syft absolute
 from syft.core.common import UID
+from syft.core.common.group import VERIFYALL
 from syft.core.common.object import ObjectWithID
 from syft.core.store import ObjectStore
 from syft.core.store.store_memory import MemoryStore
 from syft.core.store.storeable_object import StorableObject
+from syft.lib.python.string import String
 
 
 def generate_id_obj(
@@ -166,3 +170,44 @@ def test_str() -> None:
         + r"{12}>, <Storable: tensor\(\[1\., 2\., 3\., 4\.\]\)>\)\]\)$"
     )
     assert store_regex.match(str(store))
+
+
+# --------------------- INDEXES ---------------------
+
+
+def test_indexes() -> None:
+    """Tests that the indexes follow __setitem__, delete and clear."""
+
+    store = MemoryStore()
+    verify_key = SigningKey.generate().verify_key
+    request_id = UID()
+    id1, obj1 = generate_id_obj(data=th.Tensor([1]), description="", tags=["a"])
+    id2, obj2 = generate_id_obj(data=String("two"), description="", tags=["a", "b"])
+    obj1.read_permissions = {verify_key: request_id}
+    obj2.search_permissions = {VERIFYALL: None}
+
+    store[id1] = obj1
+    store[id2] = obj2
+
+    assert store.get_keys_with_tag("a") == [id1, id2]
+    assert store.get_keys_with_tag("c") == []
+    assert store.get_keys_of_type(th.Tensor) == [id1]
+    assert store.get_keys_of_type(String) == [id2]
+    assert store.get_keys_readable_by(verify_key) == [id1]
+    assert store.get_keys_searchable_by(verify_key) == [id2]
+    assert store.get_keys_with_request_id(request_id) == [id1]
+
+    # replacing an object replaces its index entries
+    obj1.tags = ["c"]
+    obj1.search_permissions = {verify_key: None}
+    store[id1] = obj1
+    assert store.get_keys_with_tag("a") == [id2]
+    assert store.get_keys_with_tag("c") == [id1]
+    assert set(store.get_keys_searchable_by(verify_key)) == {id1, id2}
+
+    store.delete(id2)
+    assert store.get_keys_with_tag("b") == []
+    assert store.get_keys_searchable_by(verify_key) == [id1]
+
+    store.clear()
+    assert store.get_keys_of_type(object) == []
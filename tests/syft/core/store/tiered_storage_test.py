@@ -0,0 +1,201 @@
+"""In this test suite, we evaluate the TieredStore class. For more info
+on the TieredStore class and its purpose, please see the documentation
+in the class itself.
+
+Table of Contents:
+    - INITIALIZATION: tests for ways TieredStore can be initialized
+    - SPILLING: tests for moving objects between memory and disk
+    - INDEXES: tests for the secondary indexes over both tiers
+"""
+
+# stdlib
+from pathlib import Path
+from typing import Tuple
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common import UID
+from syft.core.store import ObjectStore
+from syft.core.store import TieredStore
+from syft.core.store.storeable_object import StorableObject
+
+# a float32 tensor of this many elements is 400 bytes
+ELEMENTS = 100
+
+
+def generate_id_obj(value: float = 1.0) -> Tuple[UID, StorableObject]:
+    id = UID()
+    obj = StorableObject(
+        id=id, data=th.full((ELEMENTS,), value, dtype=th.float32), tags=["tensor"]
+    )
+
+    return id, obj
+
+
+def make_store(tmp_path: Path, max_resident_bytes: int) -> TieredStore:
+    return TieredStore(
+        max_resident_bytes=max_resident_bytes,
+        spill_path=str(tmp_path / "spill.sqlite"),
+    )
+
+
+# --------------------- INITIALIZATION ---------------------
+
+
+def test_create_tiered_storage(tmp_path: Path) -> None:
+    """Test that creating TieredStore() does in fact create an ObjectStore."""
+
+    store = make_store(tmp_path=tmp_path, max_resident_bytes=1000)
+    assert isinstance(store, ObjectStore)
+
+
+def test_node_memory_budget() -> None:
+    """Test that a Node with a memory budget uses a TieredStore."""
+
+    node = sy.Domain(name="alice", memory_budget=1000)
+    assert isinstance(node.store, TieredStore)
+    assert node.store.max_resident_bytes == 1000
+
+
+def test_remove_temporary_spill_path() -> None:
+    """Test that the spill database of a TieredStore without a spill_path is
+    removed with the store."""
+
+    store = TieredStore(max_resident_bytes=0)
+    for _ in range(2):
+        key, obj = generate_id_obj()
+        store[key] = obj
+    spill_dir = Path(store._disk.db_path).parent
+    assert spill_dir.exists()
+
+    store.close()
+    assert not spill_dir.exists()
+
+    store = TieredStore(max_resident_bytes=0)
+    spill_dir = Path(store._disk.db_path).parent
+    del store
+    assert not spill_dir.exists()
+
+
+# --------------------- SPILLING ---------------------
+
+
+def test_spill_least_recently_used(tmp_path: Path) -> None:
+    """Tests that objects over the budget are spilled in LRU order."""
+
+    store = make_store(tmp_path=tmp_path, max_resident_bytes=1000)
+    id1, obj1 = generate_id_obj(value=1)
+    id2, obj2 = generate_id_obj(value=2)
+    id3, obj3 = generate_id_obj(value=3)
+
+    store[id1] = obj1
+    store[id2] = obj2
+    # touch the first object so the second one is the least recently used
+    assert store[id1] is obj1
+    store[id3] = obj3
+
+    summary = store.stats_summary()
+    assert summary["spills"] == 1
+    assert summary["resident_objects"] == 2
+    assert summary["spilled_objects"] == 1
+    assert summary["resident_bytes"] == 800
+    assert len(store) == 3
+    assert all(key in store for key in [id1, id2, id3])
+    assert set(store.keys()) == {id1, id2, id3}
+
+
+def test_reload_spilled_object(tmp_path: Path) -> None:
+    """Tests that spilled objects are transparently read back from disk."""
+
+    store = make_store(tmp_path=tmp_path, max_resident_bytes=1000)
+    id1, obj1 = generate_id_obj(value=1)
+    id2, obj2 = generate_id_obj(value=2)
+    id3, obj3 = generate_id_obj(value=3)
+
+    store[id1] = obj1
+    store[id2] = obj2
+    store[id3] = obj3
+
+    reloaded = store[id1]
+    assert reloaded.id == id1
+    assert reloaded.tags == ["tensor"]
+    assert (reloaded.data == obj1.data).all()
+    assert store.get_object(id1) is reloaded
+
+    assert store.stats == {"hits": 1, "misses": 1, "spills": 2}
+    assert store.resident_bytes <= store.max_resident_bytes
+
+
+def test_keep_most_recent_object(tmp_path: Path) -> None:
+    """Tests that an object larger than the budget stays in memory."""
+
+    store = make_store(tmp_path=tmp_path, max_resident_bytes=100)
+    id1, obj1 = generate_id_obj()
+
+    store[id1] = obj1
+    assert store[id1] is obj1
+    assert store.stats["spills"] == 0
+
+
+def test_delete_and_clear(tmp_path: Path) -> None:
+    """Tests that delete() and clear() remove objects from both tiers."""
+
+    store = make_store(tmp_path=tmp_path, max_resident_bytes=500)
+    id1, obj1 = generate_id_obj()
+    id2, obj2 = generate_id_obj()
+    id3, obj3 = generate_id_obj()
+
+    store[id1] = obj1
+    store[id2] = obj2
+    store[id3] = obj3
+
+    store.delete(id1)
+    store.delete(id3)
+    assert id1 not in store
+    assert id3 not in store
+    assert list(store.keys()) == [id2]
+    assert [obj.id for obj in store.get_objects_of_type(th.Tensor)] == [id2]
+
+    store.clear()
+    assert len(store) == 0
+    assert store.resident_bytes == 0
+
+
+def test_node_spills_sent_objects() -> None:
+    """Tests that a client can get back objects a node has spilled."""
+
+    node = sy.Domain(name="alice", memory_budget=1000)
+    client = node.get_root_client()
+
+    tensors = [th.full((ELEMENTS,), float(i)) for i in range(5)]
+    pointers = [tensor.send(client) for tensor in tensors]
+
+    assert node.store.stats["spills"] > 0
+    for pointer, tensor in zip(pointers, tensors):
+        assert (pointer.get() == tensor).all()
+
+
+# --------------------- INDEXES ---------------------
+
+
+def test_indexes_cover_spilled_objects(tmp_path: Path) -> None:
+    """Tests that spilled objects stay in the indexes until they are deleted."""
+
+    store = make_store(tmp_path=tmp_path, max_resident_bytes=500)
+    id1, obj1 = generate_id_obj()
+    id2, obj2 = generate_id_obj()
+    store[id1] = obj1
+    store[id2] = obj2
+    assert store.stats["spills"] == 1
+
+    assert store.get_keys_with_tag("tensor") == [id1, id2]
+    assert store.get_keys_of_type(th.Tensor) == [id1, id2]
+    assert [obj.id for obj in store.get_objects_of_type(th.Tensor)] == [id1, id2]
+    # reading through the index does not move spilled objects back into memory
+    assert store.stats["misses"] == 0
+
+    store.delete(id1)
+    assert store.get_keys_with_tag("tensor") == [id2]
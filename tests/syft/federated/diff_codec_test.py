@@ -0,0 +1,75 @@
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+from syft.federated.model_serialization.diff_codec import DiffCodec
+from syft.federated.model_serialization.diff_codec import decode_diff
+from syft.federated.model_serialization.diff_codec import diff_codec_from_config
+from syft.federated.model_serialization.diff_codec import encode_diff
+from syft.federated.model_serialization.diff_codec import get_diff_codec
+
+
+@pytest.mark.parametrize(
+    "name,max_error", [("fp16", 1e-3), ("int8", 1 / 254), ("int4", 1 / 14)]
+)
+def test_dense_codecs(name: str, max_error: float) -> None:
+    th.manual_seed(0)
+    # the largest magnitude of every tensor is 1
+    diff = [th.rand(1001) * 2 - 1, th.rand(3, 5, 7) * 2 - 1, th.zeros(4)]
+    for tensor in diff[:2]:
+        tensor.view(-1)[0] = 1.0
+
+    decoded = decode_diff(encode_diff(diff=diff, codec=get_diff_codec(name)))
+
+    for tensor, decoded_tensor in zip(diff, decoded):
+        assert decoded_tensor.shape == tensor.shape
+        assert decoded_tensor.dtype == th.float32
+        assert (decoded_tensor - tensor).abs().max() <= max_error + 1e-6
+
+
+def test_quantized_sizes() -> None:
+    diff = [th.rand(1000)]
+    sizes = {
+        name: len(encode_diff(diff=diff, codec=get_diff_codec(name)))
+        for name in ["fp16", "int8", "int4"]
+    }
+    # with a few bytes for the shape and the scale
+    assert 2000 < sizes["fp16"] < 2030
+    assert 1000 < sizes["int8"] < 1030
+    assert 500 < sizes["int4"] < 530
+
+
+def test_topk_codec() -> None:
+    diff = [th.tensor([[0.1, -5.0, 0.2], [3.0, 0.0, -0.3]])]
+
+    decoded = decode_diff(
+        encode_diff(diff=diff, codec=get_diff_codec("topk", ratio=0.34))
+    )
+
+    assert (decoded[0] == th.tensor([[0.0, -5.0, 0.0], [3.0, 0.0, 0.0]])).all()
+
+    with pytest.raises(ValueError):
+        get_diff_codec("topk", ratio=0)
+
+
+def test_diff_codec_from_config() -> None:
+    assert diff_codec_from_config({}) is None
+
+    codec = diff_codec_from_config(
+        {"diff_codec": "topk", "diff_codec_args": {"ratio": 0.5}}
+    )
+    assert codec is not None and codec.name == "topk"
+    assert codec.ratio == 0.5
+
+    with pytest.raises(ValueError):
+        diff_codec_from_config({"diff_codec": "int2"})
+
+
+def test_diff_codec_registry() -> None:
+    assert set(DiffCodec.REGISTERED_DIFF_CODECS) >= {"fp16", "int8", "int4", "topk"}
+
+    with pytest.raises(ValueError):
+
+        class DuplicateCodec(DiffCodec):
+            name = "fp16"
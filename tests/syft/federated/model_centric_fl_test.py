@@ -0,0 +1,334 @@
+# stdlib
+import base64
+import hashlib
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import struct
+import threading
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+from syft.core.common.event_loop import loop
+from syft.federated import model_centric_fl_base
+from syft.federated import model_centric_fl_worker
+from syft.federated.fl_job import FLJob
+from syft.federated.model_centric_fl_base import GridError
+from syft.federated.model_centric_fl_base import join_frame
+from syft.federated.model_centric_fl_base import split_frames
+from syft.federated.model_centric_fl_worker import ModelCentricFLWorker
+from syft.federated.model_serialization import deserialize_model_params
+from syft.federated.model_serialization import wrap_model_params
+from syft.federated.model_serialization.diff_codec import decode_diff
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+SPEED_TEST_SIZE = 1048576  # 1MB
+
+
+class FLServer(ThreadingHTTPServer):
+    """A stand-in for the websocket and HTTP API of a PyGrid node, which serves a
+    single model and records the reports it receives"""
+
+    daemon_threads = True
+
+    def __init__(self, model: bytes) -> None:
+        super().__init__(("127.0.0.1", 0), FLRequestHandler)
+        self.model = model
+        self.reports: List[bytes] = []
+        self.report_codecs: List[Optional[str]] = []
+        # the number of websocket frames of every binary message received
+        self.frame_counts: List[int] = []
+        # the speed tests served, and the connections they were served on
+        self.speed_tests: List[str] = []
+        self.connections: Set[Tuple[str, int]] = set()
+
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.server_port}"
+
+
+class FLRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FLServer
+
+    def do_GET(self) -> None:
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            self._accept_websocket()
+            self._serve_websocket()
+            self.close_connection = True
+        elif self.path.startswith("/model-centric/speed-test"):
+            self._record_speed_test()
+            if "is_ping=1" in self.path:
+                self._reply(body=b"")
+            else:
+                self._reply(body=b"x" * SPEED_TEST_SIZE)
+        elif self.path.startswith("/model-centric/get-model"):
+            self._reply(body=self.server.model)
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.startswith("/model-centric/speed-test"):
+            self._record_speed_test()
+            self._reply(body=b"")
+        else:
+            self.send_error(404)
+
+    def _record_speed_test(self) -> None:
+        self.server.speed_tests.append(self.command)
+        self.server.connections.add(self.client_address)
+
+    def _reply(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _accept_websocket(self) -> None:
+        key = self.headers["Sec-WebSocket-Key"] + WS_GUID
+        accept = base64.b64encode(hashlib.sha1(key.encode()).digest()).decode()
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+
+    def _recv_frame(self) -> Optional[Tuple[bool, int, bytes]]:
+        head = self.rfile.read(2)
+        if len(head) < 2:
+            return None
+        fin, opcode = bool(head[0] & 0x80), head[0] & 0x0F
+        length = head[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self.rfile.read(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self.rfile.read(8))[0]
+        mask = self.rfile.read(4)
+        payload = self.rfile.read(length)
+        # the frames of clients are always masked
+        key = int.from_bytes((mask * (length // 4 + 1))[:length], "big")
+        payload = (int.from_bytes(payload, "big") ^ key).to_bytes(length, "big")
+        return fin, opcode, payload
+
+    def _recv_message(self) -> Optional[Tuple[int, bytes]]:
+        frame = self._recv_frame()
+        if frame is None or frame[1] == OPCODE_CLOSE:
+            return None
+        fin, opcode, payload = frame
+        frames = [payload]
+        while not fin:
+            frame = self._recv_frame()
+            if frame is None:
+                return None
+            fin, _, payload = frame
+            frames.append(payload)
+        if opcode == OPCODE_BINARY:
+            self.server.frame_counts.append(len(frames))
+        return opcode, b"".join(frames)
+
+    def _send_message(self, payload: bytes, opcode: int) -> None:
+        length = len(payload)
+        if length < 126:
+            head = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 2 ** 16:
+            head = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            head = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        self.wfile.write(head + payload)
+
+    def _send_json(self, message: dict) -> None:
+        self._send_message(json.dumps(message).encode(), opcode=OPCODE_TEXT)
+
+    def _serve_websocket(self) -> None:
+        while True:
+            msg = self._recv_message()
+            if msg is None:
+                return
+            message = json.loads(msg[1])
+            data = message["data"]
+            for path in message.get("frames", []):
+                frame = self._recv_message()
+                if frame is None:
+                    return
+                join_frame(data=data, path=path, frame=frame[1])
+
+            if message["type"] == "model-centric/report":
+                diff = data["diff"]
+                if isinstance(diff, str):
+                    diff = base64.b64decode(diff)
+                self.server.reports.append(diff)
+                self.server.report_codecs.append(data.get("diff_codec", None))
+                self._send_json({"type": message["type"], "data": {"status": "ok"}})
+            elif message["type"] == "model-centric/get-model":
+                self._send_json(
+                    {
+                        "type": message["type"],
+                        "data": {"model": None},
+                        "frames": [["model"]],
+                    }
+                )
+                self._send_message(self.server.model, opcode=OPCODE_BINARY)
+            else:
+                self._send_json({"error": f"Unknown message {message['type']}"})
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def serve_fl(params: List[th.Tensor]) -> FLServer:
+    model = wrap_model_params(params)._object2proto().SerializeToString()
+    server = FLServer(model=model)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_split_and_join_frames() -> None:
+    data = {"worker_id": "w", "diff": b"\x00\x01", "plans": {"training": b"\x02"}}
+
+    header, frames = split_frames(data=data)
+
+    assert header == {"worker_id": "w", "diff": None, "plans": {"training": None}}
+    assert frames == [(["diff"], b"\x00\x01"), (["plans", "training"], b"\x02")]
+    json.dumps(header)
+
+    for path, frame in frames:
+        join_frame(data=header, path=path, frame=frame)
+    assert header == data
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_report(binary: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    # stream the diff in many small frames
+    monkeypatch.setattr(model_centric_fl_base, "FRAME_CHUNK_SIZE", 1024)
+    server = serve_fl(params=[th.zeros(10)])
+    worker = ModelCentricFLWorker(address=server.address, binary=binary)
+    try:
+        diff = [th.rand(1000), th.rand(10, 10)]
+        response = worker.report(worker_id="w", request_key="k", diff=diff)
+        assert response["data"]["status"] == "ok"
+
+        reported = deserialize_model_params(server.reports[0]).upcast()
+        assert all((a == b).all() for a, b in zip(reported, diff))
+        if binary:
+            assert server.frame_counts[0] > 1
+        else:
+            assert server.frame_counts == []
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_fl_job_report_with_codec(binary: bool) -> None:
+    server = serve_fl(params=[th.zeros(10)])
+    worker = ModelCentricFLWorker(address=server.address, binary=binary)
+    job = FLJob(worker_id="w", grid_worker=worker, model_name="m", model_version="1")
+    job.model = [th.zeros(100), th.zeros(10, 10)]
+    job.cycle_params = {"request_key": "k"}
+    job.client_config = {"diff_codec": "topk", "diff_codec_args": {"ratio": 0.1}}
+    try:
+        updated = [th.arange(100.0), th.ones(10, 10)]
+        job.report(updated_model_params=updated)
+
+        assert server.report_codecs == ["topk"]
+        reported = decode_diff(server.reports[0])
+        # the 10 values of the largest magnitude of every diff
+        assert (reported[0][90:] == -th.arange(90.0, 100.0)).all()
+        assert (reported[0][:90] == 0).all()
+        assert (reported[1] != 0).sum() == 10
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_get_model(binary: bool) -> None:
+    params = [th.rand(100), th.rand(3, 3)]
+    server = serve_fl(params=params)
+    worker = ModelCentricFLWorker(address=server.address, binary=binary)
+    try:
+        for _ in range(2):
+            model = worker.get_model(worker_id="w", request_key="k", model_id=1)
+            assert all((a == b).all() for a, b in zip(model, params))
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+def test_binary_error() -> None:
+    server = serve_fl(params=[th.zeros(1)])
+    worker = ModelCentricFLWorker(address=server.address, binary=True)
+    try:
+        with pytest.raises(GridError):
+            worker.authenticate(auth_token="t", model_name="m", model_version="1")
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+@pytest.fixture
+def small_speed_tests(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(model_centric_fl_worker, "CHUNK_SIZE", 1024)
+    monkeypatch.setattr(model_centric_fl_worker, "MAX_BUFFER_SIZE", 100 * 1024)
+
+
+def test_connection_speed(small_speed_tests: None) -> None:
+    server = serve_fl(params=[th.zeros(1)])
+    worker = ModelCentricFLWorker(address=server.address)
+    try:
+        speed_info = worker.get_connection_speed(worker_id="w")
+        assert set(speed_info) == {"ping", "download", "upload"}
+        assert all(speed > 0 for speed in speed_info.values())
+        # 3 pings, 3 uploads and a download
+        assert sorted(server.speed_tests) == ["GET"] * 4 + ["POST"] * 3
+        # the three measurements run at the same time on pooled connections
+        assert len(server.connections) <= 3
+
+        # the next cycles reuse the measurement
+        assert worker.get_connection_speed(worker_id="w") is speed_info
+        assert len(server.speed_tests) == 7
+        assert (
+            worker.get_connection_speed(worker_id="w", refresh=True) is not speed_info
+        )
+        assert len(server.speed_tests) == 14
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+def test_connection_speed_ttl(small_speed_tests: None) -> None:
+    server = serve_fl(params=[th.zeros(1)])
+    worker = ModelCentricFLWorker(address=server.address, speed_test_ttl=0)
+    try:
+        worker.get_connection_speed(worker_id="w")
+        worker.get_connection_speed(worker_id="w")
+        assert len(server.speed_tests) == 14
+    finally:
+        worker.close()
+        server.shutdown()
+
+
+def test_async_connection_speed(small_speed_tests: None) -> None:
+    server = serve_fl(params=[th.zeros(1)])
+    worker = ModelCentricFLWorker(address=server.address)
+    try:
+        speed_info = loop.run_until_complete(
+            worker.async_get_connection_speed(worker_id="w")
+        )
+        assert set(speed_info) == {"ping", "download", "upload"}
+        assert len(server.speed_tests) == 7
+        assert worker.get_connection_speed(worker_id="w") is speed_info
+    finally:
+        worker.close()
+        server.shutdown()
@@ -0,0 +1,205 @@
+# stdlib
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import threading
+from typing import List
+from typing import Set
+from typing import Tuple
+
+# third party
+import pytest
+import requests
+
+# syft absolute
+import syft as sy
+from syft import serialize
+from syft.core.common.event_loop import loop
+from syft.core.common.message import SignedImmediateSyftMessageWithReply
+from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
+from syft.core.common.serde.deserialize import _deserialize
+from syft.core.io.connection import ClientConnection
+from syft.core.io.route import SoloRoute
+from syft.core.node.common.node import Node
+from syft.grid.connections.http_connection import HTTPConnection
+from syft.grid.connections.http_connection import compress
+from syft.grid.connections.http_connection import decompress
+
+
+class NodeHTTPServer(ThreadingHTTPServer):
+    """A stand-in for the HTTP server of a node, which records the connections
+    and encodings of the requests it serves"""
+
+    daemon_threads = True
+
+    def __init__(self, node: Node) -> None:
+        super().__init__(("127.0.0.1", 0), NodeRequestHandler)
+        self.node = node
+        self.connections: Set[Tuple[str, int]] = set()
+        self.encodings: List[str] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class NodeRequestHandler(BaseHTTPRequestHandler):
+    # keep the connections alive, every response has a Content-Length
+    protocol_version = "HTTP/1.1"
+    server: NodeHTTPServer
+
+    def _reply(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        metadata = serialize(self.server.node.get_metadata_for_client())
+        self._reply(body=metadata.SerializeToString())
+
+    def do_POST(self) -> None:
+        self.server.connections.add(self.client_address)
+        encoding = self.headers.get("Content-Encoding", "identity")
+        self.server.encodings.append(encoding)
+
+        data = self.rfile.read(int(self.headers["Content-Length"]))
+        msg = _deserialize(
+            blob=decompress(data=data, encoding=encoding), from_bytes=True
+        )
+
+        node = self.server.node
+        if isinstance(msg, SignedImmediateSyftMessageWithReply):
+            reply = node.recv_immediate_msg_with_reply(msg=msg)
+            self._reply(body=serialize(reply, to_bytes=True))
+        elif isinstance(msg, SignedImmediateSyftMessageWithoutReply):
+            node.recv_immediate_msg_without_reply(msg=msg)
+            self._reply(body=b"")
+        else:
+            node.recv_eventual_msg_without_reply(msg=msg)
+            self._reply(body=b"")
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def serve_node(node: Node) -> NodeHTTPServer:
+    server = NodeHTTPServer(node=node)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def http_client(node: Node, connection: ClientConnection) -> sy.VirtualMachineClient:
+    route = SoloRoute(destination=node.target_id, connection=connection)
+    return node.get_root_client(routes=[route])
+
+
+def test_http_connection_keep_alive() -> None:
+    vm = sy.VirtualMachine(name="alice")
+    server = serve_node(node=vm)
+    connection = HTTPConnection(url=server.url, pool_size=2, timeout=10)
+    try:
+        client = http_client(node=vm, connection=connection)
+        assert connection._get_metadata().name == "alice"
+
+        ptr = sy.lib.python.List([1, 2, 3]).send(client)
+        for _ in range(5):
+            ptr.append(4)
+        assert ptr.get() == [1, 2, 3, 4, 4, 4, 4, 4]
+
+        # all the messages were sent over the same connection
+        assert len(server.connections) == 1
+    finally:
+        connection.close()
+        server.shutdown()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_http_connection_compression(compression: str) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    vm = sy.VirtualMachine(name="alice")
+    server = serve_node(node=vm)
+    connection = HTTPConnection(url=server.url, compression=compression)
+    try:
+        client = http_client(node=vm, connection=connection)
+        text = sy.lib.python.String("a" * 10_000)
+        assert text.send(client).get() == text
+
+        # small messages are sent as they are
+        assert set(server.encodings) == {compression, "identity"}
+    finally:
+        connection.close()
+        server.shutdown()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_decompress_max_size(compression: str) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    data = compress(data=b"x" * 10_000, encoding=compression)
+    assert decompress(data=data, encoding=compression, max_size=10_000) == b"x" * 10_000
+    # a body that expands past the limit is never fully decompressed
+    with pytest.raises(ValueError):
+        decompress(data=data, encoding=compression, max_size=9_999)
+
+
+def test_decompress_max_size_without_content_size() -> None:
+    zstandard = pytest.importorskip("zstandard")
+
+    compressor = zstandard.ZstdCompressor(write_content_size=False)
+    data = compressor.compress(b"x" * 10_000)
+    assert decompress(data=data, encoding="zstd", max_size=10_000) == b"x" * 10_000
+    with pytest.raises(ValueError):
+        decompress(data=data, encoding="zstd", max_size=9_999)
+
+
+def test_http_connection_unsupported_compression() -> None:
+    with pytest.raises(ValueError):
+        HTTPConnection(url="http://127.0.0.1:1", compression="br")
+
+
+def test_async_http_connection_unsupported_compression() -> None:
+    pytest.importorskip("aiohttp")
+    # syft absolute
+    from syft.grid.connections.async_http_connection import AsyncHTTPConnection
+
+    with pytest.raises(ValueError):
+        AsyncHTTPConnection(url="http://127.0.0.1:1", compression="br")
+
+
+def test_http_connection_retries() -> None:
+    # nothing listens on this port
+    server = NodeHTTPServer(node=sy.VirtualMachine())
+    url = server.url
+    server.server_close()
+
+    connection = HTTPConnection(url=url, retries=1)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        connection._get_metadata()
+
+
+def test_async_http_connection() -> None:
+    pytest.importorskip("aiohttp")
+    # syft absolute
+    from syft.grid.connections.async_http_connection import AsyncHTTPConnection
+
+    vm = sy.VirtualMachine(name="alice")
+    server = serve_node(node=vm)
+    connection = AsyncHTTPConnection(url=server.url, pool_size=4)
+    try:
+        client = http_client(node=vm, connection=connection)
+        ptr = sy.lib.python.List([1, 2, 3]).send(client)
+        assert ptr.get() == [1, 2, 3]
+
+        metadata = loop.run_until_complete(
+            asyncio.gather(*[connection.async_get_metadata() for _ in range(8)])
+        )
+        assert {m.name for m in metadata} == {"alice"}
+        assert len(server.connections) <= 4
+    finally:
+        connection.close()
+        server.shutdown()
@@ -2,6 +2,7 @@
 import asyncio
 import json
 from typing import Any
+from typing import List
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -16,10 +17,16 @@ from pytest import MonkeyPatch
 
 # syft absolute
 from syft import serialize
+from syft.core.common.uid import UID
 from syft.core.node.common.service.repr_service import ReprMessage
 from syft.core.node.domain.domain import Domain
+from syft.core.node.domain.service import RequestAnswerMessage
+from syft.core.node.domain.service import RequestAnswerResponse
+from syft.core.node.domain.service import RequestStatus
+from syft.grid.connections.webrtc import ChunkedPayload
 from syft.grid.connections.webrtc import DC_CHUNK_START_SIGN
 from syft.grid.connections.webrtc import DC_MAX_CHUNK_SIZE
+from syft.grid.connections.webrtc import DC_NO_REPLY_ID
 from syft.grid.connections.webrtc import OrderedChunk
 from syft.grid.connections.webrtc import WebRTCConnection
 
@@ -47,6 +54,7 @@ async def test_init() -> None:
     assert webrtc.loop is not None
     assert isinstance(webrtc.producer_pool, asyncio.Queue)
     assert isinstance(webrtc.consumer_pool, asyncio.Queue)
+    assert webrtc.pending_replies == {}
     assert isinstance(webrtc.peer_connection, RTCPeerConnection)
     assert not webrtc._client_address
 
@@ -122,7 +130,10 @@ async def test_set_offer_on_message() -> None:
         "syft.grid.connections.webrtc.WebRTCConnection.consumer",
         return_value=coro_mock(),
     ) as consumer_mock:
-        await on_message(OrderedChunk(1, DC_CHUNK_START_SIGN).save())
+        header = ChunkedPayload.header(
+            reply_id=DC_NO_REPLY_ID, size=1, chunk_size=DC_MAX_CHUNK_SIZE
+        )
+        await on_message(OrderedChunk(1, header).save())
         assert consumer_mock.call_count == 0
 
         await on_message(OrderedChunk(0, b"a").save())
@@ -192,7 +203,10 @@ async def test_set_answer_on_message() -> None:
         channel_methods = list(answer_webrtc.channel._events.values())
         on_message = list(channel_methods[1].values())[0]
 
-        await on_message(OrderedChunk(1, DC_CHUNK_START_SIGN).save())
+        header = ChunkedPayload.header(
+            reply_id=DC_NO_REPLY_ID, size=1, chunk_size=DC_MAX_CHUNK_SIZE
+        )
+        await on_message(OrderedChunk(1, header).save())
         assert consumer_mock.call_count == 0
 
         await on_message(OrderedChunk(0, b"a").save())
@@ -241,6 +255,103 @@ async def test_close() -> None:
             assert finish_mock.call_count == 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spill_size", [2 ** 20, 8])
+async def test_receive_chunks(spill_size: int, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr("syft.grid.connections.webrtc.DC_SPILL_SIZE", spill_size)
+    domain = Domain(name="test")
+    webrtc = WebRTCConnection(node=domain)
+    data = bytes(range(10))
+    reply_id = bytes(range(16))
+
+    received = []
+
+    async def consumer(msg: bytes, reply_id: bytes) -> None:
+        received.append((bytes(msg), reply_id))
+
+    monkeypatch.setattr(webrtc, "consumer", consumer)
+
+    header = ChunkedPayload.header(reply_id=reply_id, size=len(data), chunk_size=4)
+    await webrtc._receive(OrderedChunk(3, header).save())
+    assert webrtc._incoming is not None
+    assert (webrtc._incoming.mapped is not None) == (len(data) > spill_size)
+
+    # chunks can arrive in any order and more than once
+    for idx, chunk in [(2, data[8:]), (0, data[:4]), (0, data[:4]), (1, data[4:8])]:
+        await webrtc._receive(OrderedChunk(idx, chunk).save())
+
+    assert received == [(data, reply_id)]
+    assert webrtc._incoming is None
+
+    # messages sent in a single frame
+    await webrtc._receive(OrderedChunk(0, reply_id + data).save())
+    assert received[-1] == (data, reply_id)
+    assert type(received[-1][1]) is bytes
+
+
+@pytest.mark.asyncio
+async def test_legacy_framing(monkeypatch: MonkeyPatch) -> None:
+    domain = Domain(name="test")
+    webrtc = WebRTCConnection(node=domain)
+    # the signaling turns the reply ids off for peers which do not announce them
+    webrtc.reply_ids = False
+    data = bytes(range(10))
+
+    received = []
+
+    async def consumer(msg: bytes, reply_id: bytes = DC_NO_REPLY_ID) -> None:
+        received.append((bytes(msg), reply_id))
+
+    monkeypatch.setattr(webrtc, "consumer", consumer)
+
+    # messages sent in a single frame carry no reply id
+    await webrtc._receive(OrderedChunk(0, data).save())
+    assert received == [(data, DC_NO_REPLY_ID)]
+
+    # chunked messages start with the sign alone
+    await webrtc._receive(OrderedChunk(3, DC_CHUNK_START_SIGN).save())
+    for idx, chunk in [(2, data[8:]), (0, data[:4]), (1, data[4:8])]:
+        await webrtc._receive(OrderedChunk(idx, chunk).save())
+    assert received[-1] == (data, DC_NO_REPLY_ID)
+    assert webrtc._incoming is None
+
+    # the frames sent to the peer carry no reply id either
+    sent: List[bytes] = []
+    monkeypatch.setattr(webrtc, "channel", Mock(send=sent.append), raising=False)
+    msg = ReprMessage(address=domain.address).sign(signing_key=SigningKey.generate())
+    producer = asyncio.ensure_future(webrtc.producer())
+    await webrtc.producer_pool.put((msg.id.value.bytes, msg))
+    await asyncio.sleep(0)
+    producer.cancel()
+    assert sent == [OrderedChunk(0, serialize(msg, to_bytes=True)).save()]
+
+
+@pytest.mark.asyncio
+async def test_legacy_send_sync_message() -> None:
+    domain = Domain(name="test")
+    webrtc = WebRTCConnection(node=domain)
+    webrtc._client_address = domain.address
+    webrtc.reply_ids = False
+    signing_key = SigningKey.generate()
+
+    msg = RequestAnswerMessage(
+        request_id=UID(), address=domain.address, reply_to=domain.address
+    ).sign(signing_key=signing_key)
+    task = asyncio.ensure_future(webrtc.send_sync_message(msg=msg))
+    await asyncio.sleep(0)
+    assert webrtc.producer_pool.get_nowait() == (DC_NO_REPLY_ID, msg)
+    assert webrtc.pending_replies == {}
+
+    # older peers reply in the order of the requests, without reply ids
+    reply = RequestAnswerResponse(
+        status=RequestStatus.Pending,
+        request_id=msg.message.request_id,
+        address=domain.address,
+    ).sign(signing_key=signing_key)
+    await webrtc.consumer(msg=serialize(reply, to_bytes=True))
+    assert (await task).message.request_id == msg.message.request_id
+
+
 # --------------------- INTEGRATION ---------------------
 
 
@@ -294,3 +405,39 @@ async def test_consumer_request() -> None:
     msg_bin = serialize(signed_msg, to_bytes=True)
 
     await webrtc_node.consumer(msg=msg_bin)
+
+
+@pytest.mark.asyncio
+async def test_send_sync_message_matches_replies() -> None:
+    domain = Domain(name="test")
+    webrtc = WebRTCConnection(node=domain)
+    webrtc._client_address = domain.address
+    signing_key = SigningKey.generate()
+
+    msgs = [
+        RequestAnswerMessage(
+            request_id=UID(), address=domain.address, reply_to=domain.address
+        ).sign(signing_key=signing_key)
+        for _ in range(3)
+    ]
+    tasks = [asyncio.ensure_future(webrtc.send_sync_message(msg=msg)) for msg in msgs]
+    await asyncio.sleep(0)
+
+    # all the requests are sent before any reply arrives
+    assert webrtc.producer_pool.qsize() == 3
+    assert len(webrtc.pending_replies) == 3
+
+    # replies arriving out of order are matched to their requests
+    for msg in reversed(msgs):
+        reply = RequestAnswerResponse(
+            status=RequestStatus.Pending,
+            request_id=msg.message.request_id,
+            address=domain.address,
+        ).sign(signing_key=signing_key)
+        await webrtc.consumer(
+            msg=serialize(reply, to_bytes=True), reply_id=msg.id.value.bytes
+        )
+
+    for msg, task in zip(msgs, tasks):
+        assert (await task).message.request_id == msg.message.request_id
+    assert webrtc.pending_replies == {}
@@ -13,6 +13,7 @@ from syft.core.common.message import SignedImmediateSyftMessageWithReply
 from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
 from syft.core.common.serde.deserialize import _deserialize
 from syft.core.node.network.network import Network
+from syft.grid.connections.http_connection import decompress
 from syft.grid.services.signaling_service import PullSignalingService
 from syft.grid.services.signaling_service import PushSignalingService
 from syft.grid.services.signaling_service import RegisterDuetPeerService
@@ -43,7 +44,10 @@ def metadata() -> flask.Response:
 
 @app.route("/", methods=["POST"])
 def post() -> flask.Response:
-    data = flask.request.get_data()
+    data = decompress(
+        data=flask.request.get_data(),
+        encoding=flask.request.headers.get("Content-Encoding", None),
+    )
     obj_msg = _deserialize(blob=data, from_bytes=True)
     if isinstance(obj_msg, SignedImmediateSyftMessageWithReply):
         reply = network.recv_immediate_msg_with_reply(msg=obj_msg)
@@ -1,7 +1,12 @@
 # stdlib
 import secrets
+import threading
+import time
 from typing import Tuple
 
+# third party
+import pytest
+
 # syft absolute
 import syft as sy
 from syft import serialize
@@ -95,6 +100,23 @@ def test_signaling_answer_message_serde(node: sy.VirtualMachine) -> None:
     assert msg_metadata.id == msg2_metadata.id
 
 
+@pytest.mark.parametrize("msg_type", [SignalingOfferMessage, SignalingAnswerMessage])
+def test_signaling_message_reply_ids_serde(
+    msg_type: type, node: sy.VirtualMachine
+) -> None:
+    kwargs = dict(
+        address=Address(name="Alice"),
+        payload="SDP",
+        host_metadata=node.get_metadata_for_client(),
+        target_peer=secrets.token_hex(nbytes=16),
+        host_peer=secrets.token_hex(nbytes=16),
+    )
+
+    # messages of peers which do not announce reply ids
+    assert not sy.deserialize(blob=serialize(msg_type(**kwargs))).reply_ids
+    assert sy.deserialize(blob=serialize(msg_type(reply_ids=True, **kwargs))).reply_ids
+
+
 def test_signaling_answer_pull_request_message_serde(node: sy.VirtualMachine) -> None:
     target = Address(name="Alice")
 
@@ -106,6 +128,7 @@ def test_signaling_answer_pull_request_message_serde(node: sy.VirtualMachine) ->
         target_peer=target_id,
         host_peer=host_id,
         reply_to=node.address,
+        timeout=2.5,
     )
 
     blob = serialize(msg)
@@ -116,6 +139,7 @@ def test_signaling_answer_pull_request_message_serde(node: sy.VirtualMachine) ->
     assert msg == msg2
     assert msg2.host_peer == host_id
     assert msg2.target_peer == target_id
+    assert msg2.timeout == 2.5
 
 
 def test_signaling_offer_pull_request_message_serde(node: sy.VirtualMachine) -> None:
@@ -129,6 +153,7 @@ def test_signaling_offer_pull_request_message_serde(node: sy.VirtualMachine) ->
         target_peer=target_id,
         host_peer=host_id,
         reply_to=node.address,
+        timeout=2.5,
     )
 
     blob = serialize(msg)
@@ -139,6 +164,7 @@ def test_signaling_offer_pull_request_message_serde(node: sy.VirtualMachine) ->
     assert msg == msg2
     assert msg2.host_peer == host_id
     assert msg2.target_peer == target_id
+    assert msg2.timeout == 2.5
 
 
 def test_push_offer_signaling_service() -> None:
@@ -380,3 +406,93 @@ def test_not_found_pull_ans_requests_signaling_service() -> None:
     response = om_network_client.send_immediate_msg_with_reply(msg=ans_pull_req)
 
     assert isinstance(response, SignalingRequestsNotFound)
+
+
+def test_pull_signaling_service_fifo_per_peer() -> None:
+    om_network, bob_vm, alice_vm = get_preset_nodes()
+    om_network_client = om_network.get_root_client()
+
+    msg = RegisterNewPeerMessage(
+        address=om_network.address, reply_to=om_network_client.address
+    )
+
+    target_id = om_network_client.send_immediate_msg_with_reply(msg=msg).peer_id
+    host_id = om_network_client.send_immediate_msg_with_reply(msg=msg).peer_id
+    other_id = om_network_client.send_immediate_msg_with_reply(msg=msg).peer_id
+
+    def offer(host_peer: str) -> SignalingOfferMessage:
+        offer_msg = SignalingOfferMessage(
+            address=om_network.address,
+            payload="SDP",
+            host_metadata=alice_vm.get_metadata_for_client(),
+            target_peer=target_id,
+            host_peer=host_peer,
+        )
+        om_network_client.send_immediate_msg_without_reply(msg=offer_msg)
+        return offer_msg
+
+    first, other, second = offer(host_id), offer(other_id), offer(host_id)
+
+    def pull(target_peer: str) -> SignalingOfferMessage:
+        offer_pull_req = OfferPullRequestMessage(
+            address=om_network.address,
+            target_peer=target_peer,
+            host_peer=target_id,
+            reply_to=om_network_client.address,
+        )
+        return om_network_client.send_immediate_msg_with_reply(msg=offer_pull_req)
+
+    # each peer's offers are pulled in the order they were pushed
+    assert pull(host_id) == first
+    assert pull(host_id) == second
+    assert isinstance(pull(host_id), SignalingRequestsNotFound)
+    assert pull(other_id) == other
+    assert len(om_network.signaling_msgs[target_id][SyftMessage]) == 0
+
+
+def test_pull_signaling_service_waits_for_push() -> None:
+    om_network, bob_vm, alice_vm = get_preset_nodes()
+    om_network_client = om_network.get_root_client()
+
+    msg = RegisterNewPeerMessage(
+        address=om_network.address, reply_to=om_network_client.address
+    )
+
+    target_id = om_network_client.send_immediate_msg_with_reply(msg=msg).peer_id
+    host_id = om_network_client.send_immediate_msg_with_reply(msg=msg).peer_id
+
+    answer_msg = SignalingAnswerMessage(
+        address=om_network.address,
+        payload="SDP",
+        host_metadata=alice_vm.get_metadata_for_client(),
+        target_peer=target_id,
+        host_peer=host_id,
+    )
+    ans_pull_req = AnswerPullRequestMessage(
+        address=om_network.address,
+        target_peer=host_id,
+        host_peer=target_id,
+        reply_to=om_network_client.address,
+        timeout=0.1,
+    )
+
+    # the request times out if nothing is pushed
+    start = time.monotonic()
+    response = om_network_client.send_immediate_msg_with_reply(msg=ans_pull_req)
+    assert isinstance(response, SignalingRequestsNotFound)
+    assert time.monotonic() - start >= 0.1
+
+    # and is answered as soon as a message is pushed
+    ans_pull_req.timeout = 30
+    pusher = threading.Timer(
+        0.1,
+        om_network_client.send_immediate_msg_without_reply,
+        kwargs={"msg": answer_msg},
+    )
+    pusher.start()
+    start = time.monotonic()
+    response = om_network_client.send_immediate_msg_with_reply(msg=ans_pull_req)
+    pusher.join()
+
+    assert response == answer_msg
+    assert time.monotonic() - start < 10
@@ -1,4 +1,5 @@
 # stdlib
+from typing import Any
 from typing import List
 
 # third party
@@ -15,6 +16,7 @@ def test_remote_numpy_array(root_client: sy.VirtualMachineClient) -> None:
 
     # syft absolute
     from syft.lib.numpy.array import SUPPORTED_BOOL_TYPES
+    from syft.lib.numpy.array import SUPPORTED_COMPLEX_TYPES
     from syft.lib.numpy.array import SUPPORTED_DTYPES
     from syft.lib.numpy.array import SUPPORTED_FLOAT_TYPES
     from syft.lib.numpy.array import SUPPORTED_INT_TYPES
@@ -23,6 +25,9 @@ def test_remote_numpy_array(root_client: sy.VirtualMachineClient) -> None:
 
     test_arrays: List[np.ndarray] = []
     for dtype in SUPPORTED_DTYPES:
+        lower: Any
+        upper: Any
+        mid: Any
 
         # test their bounds
         if dtype in SUPPORTED_BOOL_TYPES:
@@ -33,14 +38,18 @@ def test_remote_numpy_array(root_client: sy.VirtualMachineClient) -> None:
             bounds = np.iinfo(dtype)
             lower = bounds.min
             upper = bounds.max
-            mid = upper + lower  # type: ignore
+            mid = upper + lower
             if lower == 0:
-                mid = round(mid / 2)  # type: ignore
+                mid = round(mid / 2)
         elif dtype in SUPPORTED_FLOAT_TYPES:
             bounds = np.finfo(dtype)
             lower = bounds.min
             upper = bounds.max
-            mid = upper + lower  # type: ignore
+            mid = upper + lower
+        elif dtype in SUPPORTED_COMPLEX_TYPES:
+            lower = complex(-1, 2)
+            upper = complex(2, -1)
+            mid = complex(0, 0)
 
         test_arrays.append(np.array([lower, mid, upper], dtype=dtype))
 
@@ -50,3 +59,42 @@ def test_remote_numpy_array(root_client: sy.VirtualMachineClient) -> None:
 
         assert all(test_array == received_array)
         assert test_array.dtype == received_array.dtype
+
+
+@pytest.mark.vendor(lib="numpy")
+def test_numpy_array_layouts_serde() -> None:
+    # third party
+    import numpy as np
+
+    sy.load("numpy")
+
+    test_arrays = [
+        np.asfortranarray(np.arange(12, dtype=np.float32).reshape(3, 4)),
+        np.arange(10)[::2],
+        np.array(3.5),
+        np.zeros((0, 2)),
+        np.array(["syft", "duet"]),
+        np.array(["2021-01-01"], dtype="datetime64[D]"),
+        np.array([(1, 2.0)], dtype=[("a", "<i4"), ("b", ">f8")]),
+    ]
+
+    for test_array in test_arrays:
+        received_array = sy.deserialize(
+            sy.serialize(test_array, to_bytes=True), from_bytes=True
+        )
+
+        assert received_array.dtype == test_array.dtype
+        assert received_array.shape == test_array.shape
+        assert (received_array == test_array).all()
+        assert received_array.flags.writeable
+
+
+@pytest.mark.vendor(lib="numpy")
+def test_numpy_object_array_not_supported() -> None:
+    # third party
+    import numpy as np
+
+    sy.load("numpy")
+
+    with pytest.raises(NotImplementedError):
+        sy.serialize(np.array([object()]))
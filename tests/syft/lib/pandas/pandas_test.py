@@ -54,3 +54,89 @@ def test_slice_dataframe(root_client: sy.VirtualMachineClient) -> None:
     assert OrderedDict(data_reverse["col_2"]) == OrderedDict(
         reversed(list(data["col_2"].items()))
     )
+
+
+@pytest.mark.vendor(lib="pandas")
+def test_dataframe_dtypes_serde() -> None:
+    sy.load("pandas")
+    # third party
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, np.nan, 3.0],
+            "str": ["a", None, "c"],
+            "mixed": [1, "a", 2.5],
+            "datetime": pd.to_datetime(["2021-01-01", "2021-01-02", None]),
+            "datetimetz": pd.date_range("2021-01-01", periods=3, tz="Europe/Berlin"),
+            "timedelta": pd.to_timedelta([1, 2, 3], unit="s"),
+            "category": pd.Categorical(["x", "y", "x"], ordered=True),
+            "nullable_int": pd.array([1, None, 3], dtype="Int64"),
+            "nullable_bool": pd.array([True, None, False], dtype="boolean"),
+            "string": pd.array(["a", None, "b"], dtype="string"),
+        },
+        index=pd.Index(["r1", "r2", "r3"], name="rows"),
+    )
+
+    df2 = sy.deserialize(sy.serialize(df, to_bytes=True), from_bytes=True)
+    pd.testing.assert_frame_equal(df2, df)
+
+
+@pytest.mark.vendor(lib="pandas")
+def test_dataframe_index_serde() -> None:
+    sy.load("pandas")
+    # third party
+    import pandas as pd
+
+    multi_index = pd.MultiIndex.from_tuples([("a", 1), ("b", 2)], names=["x", None])
+    dataframes = [
+        pd.DataFrame({"a": [1, 2]}, index=multi_index),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({0: [1.0], 1: [2.0]}),
+        pd.DataFrame(),
+    ]
+
+    for df in dataframes:
+        df2 = sy.deserialize(sy.serialize(df, to_bytes=True), from_bytes=True)
+        pd.testing.assert_frame_equal(df2, df)
+
+
+@pytest.mark.vendor(lib="pandas")
+def test_series_serde() -> None:
+    sy.load("pandas")
+    # third party
+    import pandas as pd
+
+    series = [
+        pd.Series([1, 2, 3], name="s", index=pd.date_range("2021", periods=3)),
+        pd.Series(["a", "b"], name=("a", 1)),
+        pd.Series(pd.Categorical([1, 2, None])),
+        pd.Series([], dtype=float),
+    ]
+
+    for s in series:
+        s2 = sy.deserialize(sy.serialize(s, to_bytes=True), from_bytes=True)
+        pd.testing.assert_series_equal(s2, s)
+
+
+@pytest.mark.vendor(lib="pandas")
+def test_object_series_serde() -> None:
+    sy.load("pandas")
+    # third party
+    import numpy as np
+    import pandas as pd
+
+    series = [
+        pd.Series([[1, 2], [3, 4]]),
+        pd.Series([[1], None, {"a": 1}]),
+        pd.Series(["a", None, "b"]),
+        pd.Series(["a", np.nan, 1, None]),
+    ]
+
+    for s in series:
+        s2 = sy.deserialize(sy.serialize(s, to_bytes=True), from_bytes=True)
+        pd.testing.assert_series_equal(s2, s)
+        # None and nan are both missing values to pandas, but they are kept apart
+        assert [v is None for v in s2] == [v is None for v in s]
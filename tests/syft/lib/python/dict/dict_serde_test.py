@@ -63,6 +63,31 @@ def test_dict_serde() -> None:
         assert deserialized_el == original_el
 
 
+def test_dict_serde_packed() -> None:
+    t1 = th.tensor([1, 2])
+
+    syft_dict = Dict({"a": t1, "b": t1})
+    serialized = syft_dict._object2proto()
+
+    # str keys are packed even though the values are not
+    assert serialized.HasField("packed_keys")
+    assert not serialized.HasField("packed_values")
+
+    deserialized = Dict._proto2object(proto=serialized)
+    assert list(deserialized.keys()) == ["a", "b"]
+    assert (deserialized["b"] == t1).all()
+
+    syft_dict = Dict({1: 0.5, 2: 1.5})
+    serialized = syft_dict._object2proto()
+
+    assert serialized.HasField("packed_keys")
+    assert serialized.HasField("packed_values")
+
+    deserialized = Dict._proto2object(proto=serialized)
+    assert deserialized.id == syft_dict.id
+    assert deserialized == {1: 0.5, 2: 1.5}
+
+
 def test_list_send(client: sy.VirtualMachineClient) -> None:
     syft_list = Dict({String("t1"): String("test"), String("t2"): String("test")})
     ptr = syft_list.send(client)
@@ -1,4 +1,9 @@
+# stdlib
+from typing import Any
+from typing import List as TypeList
+
 # third party
+import pytest
 import torch as th
 
 # syft absolute
@@ -25,6 +30,44 @@ def test_list_serde() -> None:
         assert (deserialized_el == original_el).all()
 
 
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, -2, 2 ** 63 - 1, -(2 ** 63)],
+        [1.5, float("inf"), -0.0],
+        [True, False, True],
+        ["a", "", "ünïcode"],
+    ],
+)
+def test_list_serde_packed(values: TypeList[Any]) -> None:
+    syft_list = List(values)
+
+    serialized = syft_list._object2proto()
+
+    assert serialized.HasField("packed")
+    assert len(serialized.data) == 0
+
+    deserialized = List._proto2object(proto=serialized)
+
+    assert deserialized.id == syft_list.id
+    assert deserialized == values
+    assert [type(el) for el in deserialized.data] == [type(el) for el in values]
+
+
+@pytest.mark.parametrize("values", [[1, 2.0], [1, True], [None], []])
+def test_list_serde_not_packed(values: TypeList[Any]) -> None:
+    syft_list = List(values)
+
+    serialized = syft_list._object2proto()
+
+    assert not serialized.HasField("packed")
+
+    deserialized = List._proto2object(proto=serialized)
+
+    assert deserialized == values
+    assert [type(el) for el in deserialized.data] == [type(el) for el in values]
+
+
 def test_list_send(client: sy.VirtualMachineClient) -> None:
     t1 = th.tensor([1, 2])
     t2 = th.tensor([1, 3])
@@ -10,6 +10,7 @@ def test_serde() -> None:
     serialized = syft_int._object2proto()
 
     assert isinstance(serialized, Set_PB)
+    assert serialized.HasField("packed")
 
     deserialized = Set._proto2object(proto=serialized)
 
@@ -0,0 +1,60 @@
+# stdlib
+import json
+from pathlib import Path
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.lib.torch import create_torch_ast
+from syft.lib.torch import supported_allowlist
+
+
+def test_supported_allowlist_cache(tmp_path: Path) -> None:
+    supported = supported_allowlist(cache_dir=tmp_path)
+    assert ("torch.Tensor.add", "torch.Tensor") in supported
+    assert ("torch.nn.Parameter.add", "torch.nn.Parameter") in supported
+
+    cache_path = tmp_path / f"torch_allowlist_{th.__version__}.json"
+    assert cache_path.exists()
+
+    # the cached paths are used as long as the key matches
+    cached = json.loads(cache_path.read_text())
+    cached["paths"] = [["torch.Tensor.add", "torch.Tensor"]]
+    cache_path.write_text(json.dumps(cached))
+    assert supported_allowlist(cache_dir=tmp_path) == [
+        ("torch.Tensor.add", "torch.Tensor")
+    ]
+
+    # and rebuilt once it does not
+    cached["key"]["torch"] = "0.0.0"
+    cache_path.write_text(json.dumps(cached))
+    assert supported_allowlist(cache_dir=tmp_path) == supported
+
+
+def test_lazy_torch_ast_matches_eager() -> None:
+    eager_ast = create_torch_ast(lazy=False)
+    lazy_ast = create_torch_ast(lazy=True)
+
+    tensor = lazy_ast.query("torch.Tensor")
+    assert len(tensor.__dict__["_lazy_paths"]) > 0
+    assert tensor.pointer_name not in tensor.__dict__
+
+    for method, return_type in supported_allowlist():
+        assert lazy_ast.query(method).return_type_name == return_type
+        assert eager_ast.query(method).return_type_name == return_type
+
+    assert set(tensor.pointer_type.__dict__) == set(
+        eager_ast.query("torch.Tensor").pointer_type.__dict__
+    )
+
+
+def test_lazy_torch_ast_remote_calls(client: sy.VirtualMachineClient) -> None:
+    x = th.tensor([1.0, 2.0, 3.0]).send(client)
+    assert (x.mul(2).get() == th.tensor([2.0, 4.0, 6.0])).all()
+
+    y = th.nn.Parameter(th.tensor([1.0, 2.0])).send(client)
+    assert y.sum().get().item() == 3.0
+
+    assert type(client.torch.nn.Linear(2, 1)).__name__ == "LinearPointer"
@@ -22,3 +22,47 @@ def test_protobuf_tensor_serializer_deserializer(tensor: th.Tensor) -> None:
     tensor2_serial = sy.lib.torch.tensor_util.protobuf_tensor_deserializer(tensor2)
     assert tensor2_serial.is_quantized is True
     assert tuple(tensor2_serial.shape) == tuple(tensor.shape)
+
+
+@pytest.mark.parametrize(
+    "tensor",
+    [
+        th.tensor([[1.0, -1.0], [1.0, -1.0]]),
+        th.tensor([[1, 2], [3, 4]]).t(),
+        th.tensor([1.5, 2.5], dtype=th.float16),
+        th.tensor([1.5, 2.5], dtype=th.bfloat16),
+        th.tensor([True, False]),
+        th.tensor([1 + 2j], dtype=th.complex64),
+        th.tensor(3),
+        th.zeros(0, 3),
+    ],
+)
+def test_protobuf_tensor_raw_buffer_roundtrip(tensor: th.Tensor) -> None:
+    tensor_proto = sy.lib.torch.tensor_util.protobuf_tensor_serializer(tensor)
+    assert len(tensor_proto.contents_float32) == 0
+
+    tensor2 = sy.lib.torch.tensor_util.protobuf_tensor_deserializer(tensor_proto)
+    assert tensor2.dtype == tensor.dtype
+    assert tensor2.shape == tensor.shape
+    assert th.equal(tensor2, tensor)
+
+
+def test_protobuf_tensor_deserializer_list_encoded() -> None:
+    tensor_proto = sy.lib.torch.tensor_util.TensorData(dtype="float32", shape=[2, 2])
+    tensor_proto.contents_float32.extend([1.0, 2.0, 3.0, 4.0])
+
+    tensor = sy.lib.torch.tensor_util.protobuf_tensor_deserializer(tensor_proto)
+    assert th.equal(tensor, th.tensor([[1.0, 2.0], [3.0, 4.0]]))
+
+
+def test_protobuf_tensor_deserializer_byte_order() -> None:
+    tensor_proto = sy.lib.torch.tensor_util.TensorData(
+        dtype="int32",
+        shape=[3],
+        strides=[1],
+        byte_order="big",
+        data=b"\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03",
+    )
+
+    tensor = sy.lib.torch.tensor_util.protobuf_tensor_deserializer(tensor_proto)
+    assert th.equal(tensor, th.tensor([1, 2, 3], dtype=th.int32))
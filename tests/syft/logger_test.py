@@ -0,0 +1,76 @@
+# stdlib
+import io
+from typing import Generator
+from typing import List
+
+# third party
+from loguru import logger as loguru_logger
+import pytest
+
+# syft absolute
+from syft import logger
+from syft.logger import critical
+from syft.logger import debug
+from syft.logger import enabled
+from syft.logger import error
+from syft.logger import warning
+
+
+@pytest.fixture
+def debug_sink() -> Generator:
+    sink = io.StringIO()
+    sink_id = logger.add(sink, level="DEBUG")
+    yield sink
+    logger.remove(sink_id)
+
+
+def test_lazy_message_not_built_when_disabled() -> None:
+    calls: List[int] = []
+
+    def message() -> str:
+        calls.append(1)
+        return "built"
+
+    assert not enabled(level="debug")
+    debug(message)
+    assert calls == []
+
+
+def test_lazy_message_built_when_enabled(debug_sink: io.StringIO) -> None:
+    assert enabled(level="debug")
+    assert not enabled(level="trace")
+
+    debug(lambda: f"> lazy {1 + 1}")
+    debug("> eager")
+    lines = debug_sink.getvalue().splitlines()
+    assert [line.split("] ")[-1] for line in lines] == ["> lazy 2", "> eager"]
+
+
+def test_enabled_follows_added_sinks() -> None:
+    info_id = logger.add(io.StringIO(), level="INFO")
+    debug_id = logger.add(io.StringIO(), level="DEBUG")
+    assert enabled(level="debug")
+
+    logger.remove(debug_id)
+    assert not enabled(level="debug")
+
+    logger.remove(info_id)
+    assert not enabled(level="trace")
+    assert enabled(level="warning")
+
+
+def test_sinks_added_to_loguru_get_errors() -> None:
+    sink = io.StringIO()
+    sink_id = loguru_logger.add(sink, level="DEBUG", format="{level} {message}")
+    try:
+        error("> error")
+        warning("> warning")
+        critical("> critical")
+    finally:
+        loguru_logger.remove(sink_id)
+
+    assert sink.getvalue().splitlines() == [
+        "ERROR > error",
+        "WARNING > warning",
+        "CRITICAL > critical",
+    ]